@@ -0,0 +1,140 @@
+import asyncio
+import importlib
+import threading
+import time
+from typing import Callable, Optional
+
+from autogen_core.tools import FunctionTool
+
+# Specialist agents the planners can delegate to: name -> (module, entry point)
+AGENT_MODULES = {
+    "drift_vaults_agent": (
+        "agents.drift.drift_vaults_agent",
+        "call_drift_vaults_agent",
+    ),
+    "drift_perps_agent": ("agents.drift.drift_perps_agent", "call_drift_perps_agent"),
+    "scheduler_agent": (
+        "agents.scheduler_agent.scheduler_agent",
+        "call_scheduler_agent",
+    ),
+    "dex_agent": ("agents.dex_agent.dex_agent", "call_dex_agent"),
+    "lp_specialist_agent": ("agents.liquidity_pool_agent.lp_agent", "call_lp_agent"),
+    "solana_yield_agent": (
+        "agents.solana_yield_agent.solana_yield_agent",
+        "call_solana_yield_agent",
+    ),
+    "enso_agent": ("agents.enso.enso_agent", "call_enso_agent"),
+    "copy_trading_agent": (
+        "agents.copy_trading.copy_trading_agent",
+        "call_copy_trading_agent",
+    ),
+    "transfer_assistant": (
+        "agents.unified_transfer.unified_transfer_agent",
+        "call_unified_transfer_agent",
+    ),
+    "researcher_assistant": (
+        "agents.researcher_agent.researcher_agent",
+        "call_researcher_agent",
+    ),
+    "orbit_rag_agent": (
+        "agents.orbit_rag_agent.orbit_rag_agent",
+        "call_orbit_rag_agent",
+    ),
+    "liquidation_agent": (
+        "agents.liquidation_agent.liquidation_agent",
+        "call_liquidation_agent",
+    ),
+}
+
+
+class AgentRegistry:
+    """
+    Resolves agent names to their entry points, importing each agent module once per instance.
+
+    The agent modules build their tools at import time (see `agent_tools`), so `preload`
+    moves both the heavy imports and the tool schema compilation off the request path.
+    `load_ms` keeps how long each agent took to load, for the cold vs warm numbers.
+    """
+
+    def __init__(self, agent_modules: dict[str, tuple[str, str]]):
+        self.agent_modules = agent_modules
+        self._entry_points: dict[str, Callable] = {}
+        self._locks = {name: threading.Lock() for name in agent_modules}
+        self.load_ms: dict[str, float] = {}
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._entry_points
+
+    def resolve(self, name: str) -> Optional[Callable]:
+        """Returns the entry point of the agent, None for unknown agents."""
+        entry_point = self._entry_points.get(name)
+        if entry_point is not None or name not in self.agent_modules:
+            return entry_point
+        with self._locks[name]:
+            if name not in self._entry_points:
+                module_name, function_name = self.agent_modules[name]
+                start = time.perf_counter()
+                module = importlib.import_module(module_name)
+                self._entry_points[name] = getattr(module, function_name)
+                self.load_ms[name] = round((time.perf_counter() - start) * 1000, 1)
+        return self._entry_points[name]
+
+    async def resolve_async(self, name: str) -> Optional[Callable]:
+        """Same as `resolve`, a cold load runs in a thread so the event loop keeps streaming."""
+        if self.is_loaded(name) or name not in self.agent_modules:
+            return self._entry_points.get(name)
+        return await asyncio.to_thread(self.resolve, name)
+
+    def preload(self, names: Optional[list[str]] = None) -> threading.Thread:
+        """Loads the given agents (all of them by default) in a background thread."""
+        names = [name for name in (names or self.agent_modules) if name in self.agent_modules]
+
+        def load():
+            for name in names:
+                try:
+                    self.resolve(name)
+                except Exception as e:
+                    print(f"Error preloading agent {name}: {e}")
+
+        thread = threading.Thread(target=load, name="agent-preload", daemon=True)
+        thread.start()
+        return thread
+
+
+agent_registry = AgentRegistry(AGENT_MODULES)
+
+_tools: dict[tuple, FunctionTool] = {}
+_tools_lock = threading.Lock()
+
+
+def agent_tool(
+    func: Callable,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    strict: bool = False,
+) -> FunctionTool:
+    """
+    FunctionTool for `func`, built once per instance.
+    Building one generates a pydantic model and JSON schema from the signature, and tools
+    hold no per-request state, so every agent instance can share them.
+    """
+    key = (func, name, description, strict)
+    tool = _tools.get(key)
+    if tool is None:
+        with _tools_lock:
+            tool = _tools.get(key)
+            if tool is None:
+                tool = FunctionTool(
+                    func,
+                    # same default as AssistantAgent for plain callables
+                    description=description if description is not None else (func.__doc__ or ""),
+                    name=name,
+                    strict=strict,
+                )
+                _tools[key] = tool
+    return tool
+
+
+def agent_tools(tools: list) -> list:
+    """Wraps the plain callables of an agent's tool list with cached FunctionTools."""
+    return [tool if isinstance(tool, FunctionTool) else agent_tool(tool) for tool in tools]
@@ -11,6 +11,17 @@ from agents.copy_trading.copy_trading_functions import (
 )
 from agents.dex_agent.dex_agent import call_dex_agent
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+COPY_TRADING_AGENT_TOOLS = agent_tools(
+    [
+        copy_trading,
+        get_swaps_by_wallet_address,
+        call_dex_agent,
+    ]
+)
 
 
 @tracer.start_as_current_span("copy_trading_agent")
@@ -59,11 +70,7 @@ async def call_copy_trading_agent(
         ),
         model_client=gpt_4o_client,
         reflect_on_tool_use=True,
-        tools=[
-            copy_trading,
-            get_swaps_by_wallet_address,
-            call_dex_agent,
-        ],
+        tools=COPY_TRADING_AGENT_TOOLS,
     )
 
     updated_task = f"""
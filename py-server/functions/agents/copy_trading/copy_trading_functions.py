@@ -1,7 +1,7 @@
 from typing import Annotated, Any
 from config import MORALIS_API_KEY
 from utils.firebase import save_ui_message, save_agent_thought
-import requests
+from services.http_client import http_session
 from utils.blockchain_utils import is_solana
 
 
@@ -123,7 +123,7 @@ def get_swaps_by_wallet_address(
         }
         params = {k: v for k, v in params.items() if v is not None and v != ""}
 
-        response = requests.get(
+        response = http_session.get(
             base_url,
             headers={"X-API-KEY": MORALIS_API_KEY},
             params=params,
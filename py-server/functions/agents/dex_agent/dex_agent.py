@@ -1,11 +1,15 @@
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_core import CancellationToken
+from autogen_core.tools import FunctionTool
 from typing import Annotated
 
 from services.llm import gpt_4o_client
-from agents.dex_agent.jupiter_functions import jupiter_get_quotes
-from agents.dex_agent.lifi_functions import lifi_get_quote
+from agents.dex_agent.jupiter_functions import (
+    jupiter_get_quotes,
+    jupiter_get_quotes_async,
+)
+from agents.dex_agent.lifi_functions import lifi_get_quote, lifi_get_quote_async
 from utils.firebase import get_request_ctx
 import services.analytics as analytics
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
@@ -13,6 +17,26 @@ from agents.dex_agent.stake_functions import (
     get_user_staked_balances,
     supported_pools_and_tickers,
 )
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+DEX_AGENT_TOOLS = agent_tools(
+    [
+        # async versions under the same name and description, so they run on the event loop
+        FunctionTool(
+            jupiter_get_quotes_async,
+            name=jupiter_get_quotes.__name__,
+            description=jupiter_get_quotes.__doc__,
+        ),
+        FunctionTool(
+            lifi_get_quote_async,
+            name=lifi_get_quote.__name__,
+            description=lifi_get_quote.__doc__,
+        ),
+        get_user_staked_balances,
+    ]
+)
 
 
 @tracer.start_as_current_span("dex_agent")
@@ -55,11 +79,7 @@ async def call_dex_agent(
             ),
             model_client=gpt_4o_client,
             reflect_on_tool_use=False,
-            tools=[
-                jupiter_get_quotes,
-                lifi_get_quote,
-                get_user_staked_balances,
-            ],
+            tools=DEX_AGENT_TOOLS,
         )
 
         updated_task = (
@@ -1,6 +1,8 @@
 import traceback
 from typing import Annotated, Optional
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from requests.exceptions import RequestException
 from utils.firebase import get_request_ctx
 import services.prices as prices_service
@@ -9,7 +11,9 @@ from utils.firebase import save_ui_message
 from services.tokens import tokens_service
 from config import FIREBASE_SERVER_ENDPOINT
 from utils.firebase import save_agent_thought
+from utils.io_mode import ASYNC_IO, SYNC_IO, IOMode, run_sync
 from agents.unified_transfer.transfer_functions import SOL_USDC_ADDRESS
+from agents.dex_agent.jupiter_token_registry import jupiter_token_registry
 
 
 # used in memecoin trader, conservative, jupiter agent, solana stake
@@ -51,6 +55,59 @@ def jupiter_get_quotes(
 
     """
 
+    return run_sync(
+        _get_quotes(
+            SYNC_IO,
+            input_token,
+            output_token,
+            amount,
+            is_usd,
+            chat_id,
+            transaction_type,
+            use_frontend_quoting,
+        )
+    )
+
+
+async def jupiter_get_quotes_async(
+    input_token: Annotated[str, "Input token address/symbol"],
+    output_token: Annotated[str, "Output token address/symbol"],
+    amount: Annotated[float, "Input amount"],
+    is_usd: Annotated[bool, "True if amount is in USD or $1, not USDC"],
+    chat_id: Annotated[str, "The current chat id"],
+    transaction_type: Annotated[Optional[str], "swap/stake/unstake"] = "swap",
+    use_frontend_quoting: Annotated[
+        bool, "Whether to use frontend quoting or not."
+    ] = True,
+) -> str:
+    """
+    Async version of jupiter_get_quotes, registered as the agent tool so parallel tool calls
+    run concurrently on the event loop. Both tokens are resolved at the same time.
+    """
+    return await _get_quotes(
+        ASYNC_IO,
+        input_token,
+        output_token,
+        amount,
+        is_usd,
+        chat_id,
+        transaction_type,
+        use_frontend_quoting,
+    )
+
+
+async def _get_quotes(
+    io: IOMode,
+    input_token: str,
+    output_token: str,
+    amount: float,
+    is_usd: bool,
+    chat_id: str,
+    transaction_type: Optional[str],
+    use_frontend_quoting: bool,
+) -> str:
+    """Body of jupiter_get_quotes and jupiter_get_quotes_async, `io` makes the calls."""
+    response = None
     try:
         if not amount or amount == 0:
             if transaction_type == "stake" or transaction_type == "unstake":
@@ -58,20 +115,28 @@ def jupiter_get_quotes(
             else:
                 return "Please specify the amount you want to swap"
 
-        save_agent_thought(
+        await io.call(
+            save_agent_thought,
             chat_id=chat_id,
             thought=(f"Validating input and output tokens..."),
         )
 
-        from_token_info = tokens_service.get_token_metadata(
-            chain=str("SOLANA"), token=input_token
+        from_token_info, to_token_info = await io.gather(
+            io.either(
+                tokens_service.get_token_metadata,
+                tokens_service.get_token_metadata_async,
+                chain="SOLANA",
+                token=input_token,
+            ),
+            io.either(
+                tokens_service.get_token_metadata,
+                tokens_service.get_token_metadata_async,
+                chain="SOLANA",
+                token=output_token,
+            ),
         )
         if not from_token_info:
             return f"The input token {input_token} is not supported. Try again with a different token."
-
-        to_token_info = tokens_service.get_token_metadata(
-            chain=str("SOLANA"), token=output_token
-        )
         if not to_token_info:
             return f"The output token {output_token} is not supported. Try again with a different token."
 
@@ -80,17 +145,22 @@ def jupiter_get_quotes(
             return "No Solana wallet address found"
         token_amount = amount
         if is_usd:
-            token_amount = get_token_amount_from_usd(
-                usd_amount=amount, token_address=from_token_info["contract_address"]
+            token_amount = await io.either(
+                get_token_amount_from_usd,
+                get_token_amount_from_usd_async,
+                usd_amount=amount,
+                token_address=from_token_info["contract_address"],
             )
             # Save thought about converting USD amount
-            save_agent_thought(
+            await io.call(
+                save_agent_thought,
                 chat_id=chat_id,
                 thought=(f"Converting {amount} USD to {token_amount} {input_token}"),
             )
 
         if use_frontend_quoting:
-            save_ui_message(
+            await io.call(
+                save_ui_message,
                 chat_id=chat_id,
                 component="bridge",
                 renderData={
@@ -120,12 +190,16 @@ def jupiter_get_quotes(
                 "swapMode": "ExactIn",
                 "transactionType": transaction_type,
             }
-            response = requests.post(url, json=params)
+            response = await io.either(
+                lambda: http_session.post(url, json=params),
+                lambda: get_async_http_client().post(url, json=params),
+            )
             response.raise_for_status()
-            result = response.json()
-            return result
-    except requests.exceptions.HTTPError as http_err:
-        error_message = response.content.decode() if response.content else str(http_err)
+            return response.json()
+    except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as http_err:
+        error_message = (
+            response.content.decode() if response is not None and response.content else str(http_err)
+        )
         return f"There was an error building the {transaction_type} quote on Solana: {error_message}"
     except Exception as e:
         traceback.print_exc()
@@ -136,46 +210,14 @@ def jupiter_get_quotes(
 
 # used in solana stake
 def get_jupiter_supported_tokens():
-    try:
-        url = "https://lite-api.jup.ag/tokens/v2/tag?query=verified"
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        tokens = response.json()
-        return tokens
-    except RequestException as e:
-        print("Error:", e)
-        return None
+    # Served from the process-wide registry, downloaded once per instance
+    return jupiter_token_registry.get_tokens()
 
 
 # used in meteora, lulo
 def get_jupiter_token_by_address(token_address: str):
     try:
-        url = f"https://lite-api.jup.ag/tokens/v2/search?query={token_address}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        if not isinstance(data, list) or len(data) == 0:
-            return None
-        token = data[0]
-        # Map v2 response to v1 format
-        v1_token = {
-            "address": token.get("id"),
-            "name": token.get("name"),
-            "symbol": token.get("symbol"),
-            "decimals": token.get("decimals"),
-            "logoURI": token.get("icon"),
-            "tags": token.get("tags", []),
-            "daily_volume": None,  # Not available in v2
-            "created_at": None,  # Not available in v2
-            "freeze_authority": None,  # Not available in v2
-            "mint_authority": token.get("mintAuthority"),
-            "permanent_delegate": None,  # Not available in v2
-            "minted_at": None,  # Not available in v2
-            "extensions": {
-                # v2 does not provide coingeckoId directly
-            },
-        }
-        return v1_token
+        return jupiter_token_registry.get_by_address(token_address)
     except RequestException as e:
         print("Error: ", e)
         return None
@@ -191,16 +233,14 @@ def get_jupiter_supported_token_by_symbol(
 
     # Parameters:
     - token_symbol (str): The symbol of the token to get the info from.
-    - supported_tokens (list): The list of supported tokens. If not provided, it will be fetched from the Jupiter supported tokens list.
+    - supported_tokens (list): The list of supported tokens. If not provided, the indexed Jupiter verified tokens list is used.
 
     # Returns:
     - dict: The token info/metadata.
     """
     try:
         if not supported_tokens:
-            supported_tokens = get_jupiter_supported_tokens()
-        if not supported_tokens:
-            return None
+            return jupiter_token_registry.get_by_symbol(token_symbol)
         for token in supported_tokens:
             # Check both the raw symbol and the symbol with a "$" prefix as some tokens have it
             if token["symbol"].lower() in [
@@ -228,10 +268,31 @@ def get_token_amount_from_usd(
     # Returns:
     - float: The token amount.
     """
+    return run_sync(_get_token_amount_from_usd(SYNC_IO, usd_amount, token_address))
+
+
+async def get_token_amount_from_usd_async(
+    usd_amount: float,
+    token_address: str,
+) -> float:
+    """Async version of get_token_amount_from_usd."""
+    return await _get_token_amount_from_usd(ASYNC_IO, usd_amount, token_address)
+
+
+async def _get_token_amount_from_usd(
+    io: IOMode,
+    usd_amount: float,
+    token_address: str,
+) -> float:
+    """Body of get_token_amount_from_usd and get_token_amount_from_usd_async, `io` makes the calls."""
     if token_address.lower() == SOL_USDC_ADDRESS.lower():
         return usd_amount
-    token_price_response = prices_service.get_token_price_from_provider(
-        "SOLANA", token_address, PriceProviderType.JUPITER
+    token_price_response = await io.either(
+        prices_service.get_token_price_from_provider,
+        prices_service.get_token_price_from_provider_async,
+        "SOLANA",
+        token_address,
+        PriceProviderType.JUPITER,
     )
     price = float(token_price_response["price"])
     if price == 0:
@@ -284,14 +345,14 @@ def build_jupiter_quote(
 ):
     url = f"https://lite-api.jup.ag/swap/v1/quote?inputMint={input_token_address}&outputMint={output_token_address}&amount={parsed_amount}&slippageBps={slippage}&swapMode={swap_mode}&onlyDirectRoutes=false&asLegacyTransaction=false&experimentalDexes=Jupiter%20LO{dexes if dexes else ''}"
     headers = {"Accept-Encoding": "gzip,deflate,compress"}
-    response = requests.get(url, headers=headers)
+    response = http_session.get(url, headers=headers)
     response.raise_for_status()  # Raise an exception for HTTP errors
     return response.json()
 
 
 # used in meteora
 def build_jupiter_swap_transaction(swap_quote, wallet_address):
-    swap_transaction_response = requests.post(
+    swap_transaction_response = http_session.post(
         "https://lite-api.jup.ag/swap/v1/swap",
         headers={
             "Content-Type": "application/json",
@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from services.http_client import http_session
+from requests.exceptions import RequestException
+
+JUPITER_VERIFIED_TOKENS_URL = "https://lite-api.jup.ag/tokens/v2/tag?query=verified"
+JUPITER_TOKEN_SEARCH_URL = "https://lite-api.jup.ag/tokens/v2/search"
+
+# The verified list changes rarely, refresh it in the background every 30 minutes
+DEFAULT_TTL_SECONDS = 30 * 60
+REQUEST_TIMEOUT_SECONDS = 15
+# Addresses found through the search endpoint kept per instance, least recently used first out
+MAX_SEARCHED_ADDRESSES = 1000
+
+
+def map_v2_token_to_v1(token: dict) -> dict:
+    """Maps a Jupiter tokens v2 entry to the v1 format used across the agents."""
+    return {
+        "address": token.get("id"),
+        "name": token.get("name"),
+        "symbol": token.get("symbol"),
+        "decimals": token.get("decimals"),
+        "logoURI": token.get("icon"),
+        "tags": token.get("tags", []),
+        "daily_volume": None,  # Not available in v2
+        "created_at": None,  # Not available in v2
+        "freeze_authority": None,  # Not available in v2
+        "mint_authority": token.get("mintAuthority"),
+        "permanent_delegate": None,  # Not available in v2
+        "minted_at": None,  # Not available in v2
+        "extensions": {
+            # v2 does not provide coingeckoId directly
+        },
+    }
+
+
+class JupiterTokenRegistry:
+    """
+    Process-wide registry of the Jupiter verified token list.
+
+    The list is downloaded once per instance and indexed by lowercased symbol and by
+    mint address, so lookups are dict hits instead of a multi-megabyte download and a
+    linear scan. Once the TTL expires, the stale list keeps being served while a
+    background thread refreshes it. Addresses that are not in the verified list fall
+    back to the search endpoint, and the result is kept for the next call, up to
+    `max_searched` addresses and until the verified list is refreshed.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_searched: int = MAX_SEARCHED_ADDRESSES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._tokens: list[dict] = []
+        # symbol -> (position in the list, token), the position keeps the list order on ties
+        self._by_symbol: dict[str, tuple[int, dict]] = {}
+        self._by_address: dict[str, dict] = {}
+        self.max_searched = max_searched
+        self._searched_addresses: "OrderedDict[str, dict]" = OrderedDict()
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+
+    def _fetch_verified_tokens(self) -> Optional[list]:
+        try:
+            response = http_session.get(
+                JUPITER_VERIFIED_TOKENS_URL, timeout=REQUEST_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+            tokens = response.json()
+            return tokens if isinstance(tokens, list) else None
+        except RequestException as e:
+            print("Error fetching Jupiter verified tokens:", e)
+            return None
+
+    def _index(self, tokens: list[dict]):
+        by_symbol = {}
+        by_address = {}
+        for position, token in enumerate(tokens):
+            symbol = (token.get("symbol") or "").lower()
+            if symbol and symbol not in by_symbol:
+                by_symbol[symbol] = (position, token)
+            address = token.get("id") or token.get("address")
+            if address and address not in by_address:
+                by_address[address] = token
+
+        with self._lock:
+            self._tokens = tokens
+            self._by_symbol = by_symbol
+            self._by_address = by_address
+            # Searched tokens follow the same TTL as the verified list
+            self._searched_addresses.clear()
+            self._loaded_at = time.monotonic()
+
+    def _refresh(self):
+        try:
+            tokens = self._fetch_verified_tokens()
+            if tokens:
+                self._index(tokens)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _ensure_loaded(self):
+        if self._loaded_at is None:
+            # First access on this instance: nothing to serve yet, load synchronously.
+            # Concurrent first callers wait for a single download.
+            with self._load_lock:
+                if self._loaded_at is None:
+                    tokens = self._fetch_verified_tokens()
+                    if tokens:
+                        self._index(tokens)
+            return
+
+        with self._lock:
+            is_stale = time.monotonic() - self._loaded_at >= self.ttl_seconds
+            if not is_stale or self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh, daemon=True).start()
+
+    def get_tokens(self) -> Optional[list]:
+        """Returns the full verified token list, or None if it could not be loaded."""
+        self._ensure_loaded()
+        return self._tokens or None
+
+    def get_by_symbol(self, token_symbol: str) -> Optional[dict]:
+        """
+        Returns the first verified token whose symbol matches the given one, checking the
+        raw symbol and the "$" prefixed variant as some tokens have it.
+        """
+        self._ensure_loaded()
+        symbol = token_symbol.lower()
+        matches = [
+            match
+            for match in (self._by_symbol.get(symbol), self._by_symbol.get(f"${symbol}"))
+            if match
+        ]
+        if not matches:
+            return None
+        _, token = min(matches, key=lambda match: match[0])
+        # Callers mutate the result (e.g. SOL -> native address), never hand out the indexed dict
+        return {"address": token.get("id"), **token}
+
+    def get_by_address(self, token_address: str) -> Optional[dict]:
+        """Returns the token for the given mint address in the v1 format."""
+        self._ensure_loaded()
+        token = self._by_address.get(token_address)
+        if token is not None:
+            return map_v2_token_to_v1(token)
+
+        with self._lock:
+            token = self._searched_addresses.get(token_address)
+            if token is not None:
+                self._searched_addresses.move_to_end(token_address)
+        if token is not None:
+            return map_v2_token_to_v1(token)
+
+        token = self._search_token(token_address)
+        if token is not None:
+            with self._lock:
+                self._searched_addresses[token_address] = token
+                self._searched_addresses.move_to_end(token_address)
+                while len(self._searched_addresses) > self.max_searched:
+                    self._searched_addresses.popitem(last=False)
+            return map_v2_token_to_v1(token)
+        return None
+
+    def _search_token(self, token_address: str) -> Optional[dict]:
+        response = http_session.get(
+            f"{JUPITER_TOKEN_SEARCH_URL}?query={token_address}",
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, list) or len(data) == 0:
+            return None
+        return data[0]
+
+
+jupiter_token_registry = JupiterTokenRegistry()
@@ -1,9 +1,12 @@
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from typing_extensions import Annotated
 from decimal import Decimal
 
 # utils
 from utils.firebase import get_request_ctx, save_ui_message, save_agent_thought
+from utils.io_mode import ASYNC_IO, SYNC_IO, IOMode, run_sync
 from config import FIREBASE_SERVER_ENDPOINT
 
 # services
@@ -101,6 +104,66 @@ def lifi_get_quote(
         - Bridge 0.01 SOL  Solana to USDC on Base
         - Bridge $1 of SOL on Solana to USDC on Base
     """
+    return run_sync(
+        _get_quote(
+            SYNC_IO,
+            from_chain,
+            to_chain,
+            from_token_symbol,
+            to_token_symbol,
+            from_amount,
+            is_usd,
+            chat_id,
+            use_frontend_quoting,
+        )
+    )
+
+
+async def lifi_get_quote_async(
+    from_chain: Annotated[str, "The name of the origin chain"],
+    to_chain: Annotated[str, "The name of the destination chain"],
+    from_token_symbol: Annotated[str, "The symbol of the origin token"],
+    to_token_symbol: Annotated[str, "The symbol of the destination token"],
+    from_amount: Annotated[str, "The amount of tokens to bridge in a float format"],
+    is_usd: Annotated[
+        bool,
+        "Should only be true if from_amount is like (only for $ inputs or like 1 USD). Otherwise, it is false.",
+    ],
+    chat_id: Annotated[str, "The current chat id"],
+    use_frontend_quoting: Annotated[
+        bool, "Whether to use frontend quoting or not."
+    ] = True,
+):
+    """
+    Async version of lifi_get_quote, registered as the agent tool so parallel tool calls
+    run concurrently on the event loop. Both tokens are resolved at the same time.
+    """
+    return await _get_quote(
+        ASYNC_IO,
+        from_chain,
+        to_chain,
+        from_token_symbol,
+        to_token_symbol,
+        from_amount,
+        is_usd,
+        chat_id,
+        use_frontend_quoting,
+    )
+
+
+async def _get_quote(
+    io: IOMode,
+    from_chain: str,
+    to_chain: str,
+    from_token_symbol: str,
+    to_token_symbol: str,
+    from_amount: str,
+    is_usd: bool,
+    chat_id: str,
+    use_frontend_quoting: bool,
+):
+    """Body of lifi_get_quote and lifi_get_quote_async, `io` makes the calls."""
+    response = None
     # check if chains are supported
     try:
         transaction_type = (
@@ -112,7 +175,7 @@ def lifi_get_quote(
             if transaction_type == TransactionType.SWAP
             else f"Validating chains: {from_chain} and {to_chain}..."
         )
-        save_agent_thought(chat_id=chat_id, thought=thought_message)
+        await io.call(save_agent_thought, chat_id=chat_id, thought=thought_message)
 
         if not supports_bridge(from_chain) or not supports_bridge(to_chain):
             raise ValueError(
@@ -123,30 +186,43 @@ def lifi_get_quote(
         if not from_amount or float(from_amount) == 0:
             return "Please specify the amount you want to bridge or swap"
 
-        save_agent_thought(
+        await io.call(
+            save_agent_thought,
             chat_id=chat_id,
             thought=f"Validating {from_token_symbol} and {to_token_symbol}...",
         )
 
-        from_token_info = tokens_service.get_token_metadata(
-            chain=str(from_chain), token=from_token_symbol
+        from_token_info, to_token_info = await io.gather(
+            io.either(
+                tokens_service.get_token_metadata,
+                tokens_service.get_token_metadata_async,
+                chain=str(from_chain),
+                token=from_token_symbol,
+            ),
+            io.either(
+                tokens_service.get_token_metadata,
+                tokens_service.get_token_metadata_async,
+                chain=str(to_chain),
+                token=to_token_symbol,
+            ),
         )
         if not from_token_info:
             return f"The input token {from_token_symbol} on {from_chain} is not supported. Try again with a different token."
-
-        to_token_info = tokens_service.get_token_metadata(
-            chain=str(to_chain), token=to_token_symbol
-        )
         if not to_token_info:
             return f"The output token {to_token_symbol} on {to_chain} is not supported. Try again with a different token."
 
         if is_usd:
-            save_agent_thought(
+            await io.call(
+                save_agent_thought,
                 chat_id=chat_id,
                 thought=f"Converting {from_amount} USD to {from_token_symbol}...",
             )
-            from_amount = get_token_amount_from_usd(
-                chain=from_chain, token=from_token_info, usd_amount=from_amount
+            from_amount = await io.either(
+                get_token_amount_from_usd,
+                get_token_amount_from_usd_async,
+                chain=from_chain,
+                token=from_token_info,
+                usd_amount=from_amount,
             )
 
         evm_wallet_address = get_request_ctx(
@@ -161,7 +237,8 @@ def lifi_get_quote(
         )  # 0.5 -> 0.005
 
         if use_frontend_quoting:
-            save_ui_message(
+            await io.call(
+                save_ui_message,
                 chat_id=chat_id,
                 component=TransactionType.BRIDGE.value,
                 renderData={
@@ -182,7 +259,6 @@ def lifi_get_quote(
             if not evm_wallet_address and not solana_wallet_address:
                 return "No wallet address found."
 
-            from_token_amount = from_amount
             url = f"{FIREBASE_SERVER_ENDPOINT}/quote"
             params = {
                 "chatId": chat_id,
@@ -194,18 +270,22 @@ def lifi_get_quote(
                 "toChainName": to_chain,
                 "fromTokenSymbolOrAddress": from_token_info["contract_address"],
                 "toTokenSymbolOrAddress": to_token_info["contract_address"],
-                "fromAmount": from_token_amount,
+                "fromAmount": from_amount,
                 "slippage": slippage,
                 "allowanceType": allowance_type,
                 "transactionType": transaction_type.value,
             }
 
-            response = requests.post(url, json=params)
-            if response.status_code != 200:
-                response.raise_for_status()
+            response = await io.either(
+                lambda: http_session.post(url, json=params),
+                lambda: get_async_http_client().post(url, json=params),
+            )
+            response.raise_for_status()
             return response.json()
-    except requests.exceptions.HTTPError as http_err:
-        error_message = response.content.decode() if response.content else str(http_err)
+    except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as http_err:
+        error_message = (
+            response.content.decode() if response is not None and response.content else str(http_err)
+        )
         return f"There was an error building the exchange quote between {from_token_symbol} on {from_chain} and {to_token_symbol} on {to_chain}: {error_message}"
     except Exception as e:
         return f"There was an error building the exchange quote between {from_token_symbol} on {from_chain} and {to_token_symbol} on {to_chain}: {e}"
@@ -228,10 +308,34 @@ def get_token_amount_from_usd(
     # Returns:
     - str: The amount of the token
     """
+    return run_sync(_get_token_amount_from_usd(SYNC_IO, chain, token, usd_amount))
+
+
+# used internally
+async def get_token_amount_from_usd_async(
+    chain: Annotated[str, "The name of the chain"],
+    token: Annotated[dict, "The token metadata"],
+    usd_amount: Annotated[str, "The amount in USD"],
+):
+    """Async version of get_token_amount_from_usd."""
+    return await _get_token_amount_from_usd(ASYNC_IO, chain, token, usd_amount)
+
+
+async def _get_token_amount_from_usd(
+    io: IOMode,
+    chain: str,
+    token: dict,
+    usd_amount: str,
+):
+    """Body of get_token_amount_from_usd and get_token_amount_from_usd_async, `io` makes the calls."""
     try:
         token_symbol = token.get("symbol", "")
-        token_price_response = prices_service.get_token_price_from_provider(
-            chain, token.get("contract_address", ""), PriceProviderType.LIFI
+        token_price_response = await io.either(
+            prices_service.get_token_price_from_provider,
+            prices_service.get_token_price_from_provider_async,
+            chain,
+            token.get("contract_address", ""),
+            PriceProviderType.LIFI,
         )
         price = float(token_price_response["price"])
         if price == 0:
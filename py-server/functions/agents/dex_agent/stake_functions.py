@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from config import SOL_VALIDATORS_API_KEY
 from services.balances import get_wallet_balance, BalanceServiceType
 from services.tokens import tokens_service
@@ -90,7 +90,7 @@ def get_stake_pools_information():
             "authorization": SOL_VALIDATORS_API_KEY,
         }
 
-        response = requests.get(url, headers=headers)
+        response = http_session.get(url, headers=headers)
         response.raise_for_status()
 
         if response.json()["stake_pools"] == []:
@@ -121,7 +121,7 @@ def get_stake_pools_information():
         url = "https://extra-api.sanctum.so/v1/apy/latest?" + "&".join(
             [f"lst={token}" for token in additional_tokens]
         )
-        response = requests.get(url)
+        response = http_session.get(url)
         response.raise_for_status()
         apys = response.json()["apys"]
 
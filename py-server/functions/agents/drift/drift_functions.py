@@ -1,10 +1,12 @@
+import asyncio
 from typing import Annotated
 from utils.firebase import save_ui_message, get_request_ctx, save_agent_thought
+from utils.io_mode import ASYNC_IO, SYNC_IO, IOMode, run_sync
 from services.transactions import TransactionType
 from services.prices import get_token_price_from_provider, PriceProviderType
 from services.tokens import tokens_service
 from config import FIREBASE_SERVER_ENDPOINT
-import requests
+from services.http_client import get_async_http_client, http_session
 from enum import Enum
 from solders.pubkey import Pubkey
 from services.balances import get_single_token_balance
@@ -201,7 +203,7 @@ def generate_drift_vault_transaction(
                 "transactionType": transaction_type,
             }
 
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -262,7 +264,7 @@ def select_vault_to_withdraw_from(
                 return "No wallet address found."
 
             url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.USER_ACTIVE_VAULTS.value}&userWalletAddress={solana_wallet_address}"
-            response = requests.get(url)
+            response = http_session.get(url)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -318,7 +320,7 @@ def select_vault_to_deposit_to(
                 # Hardcode one to intitialize the skd
 
             url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.USDC_VAULTS_INFO.value}&userWalletAddress={solana_wallet_address}"
-            response = requests.get(url)
+            response = http_session.get(url)
             if response.status_code != 200:
                 response.raise_for_status()
             usdc_vaults_info = response.json()
@@ -376,7 +378,7 @@ def get_user_vaults(
 
             url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.USER_ACTIVE_VAULTS.value}&userWalletAddress={solana_wallet_address}"
 
-            response = requests.get(url)
+            response = http_session.get(url)
             if response.status_code != 200:
                 response.raise_for_status()
             user_vaults = response.json()
@@ -410,7 +412,7 @@ def check_if_user_has_drift_account(
             )
 
         url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.CHECK_USER_HAS_DRIFT_USER_ACCOUNT.value}&userWalletAddress={solana_wallet_address}"
-        response = requests.get(url)
+        response = http_session.get(url)
         response.raise_for_status()
         user_has_drift_account = response.json()
         return user_has_drift_account
@@ -423,6 +425,39 @@ def check_if_user_has_drift_account(
         return f"Error checking if user has drift account because: {e}"
 
 
+async def check_if_user_has_drift_account_async(
+    chat_id: Annotated[str, "The current chat id"],
+    solana_wallet_address: Annotated[str, "The wallet address of the user"],
+    skip_drift_account_thought: Annotated[
+        bool, "Whether to skip the drift account thought."
+    ] = False,
+):
+    """
+    Async version of check_if_user_has_drift_account.
+    """
+    try:
+        if not skip_drift_account_thought:
+            await asyncio.to_thread(
+                save_agent_thought,
+                chat_id=chat_id,
+                thought=f"Checking if user has drift account...",
+            )
+
+        url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.CHECK_USER_HAS_DRIFT_USER_ACCOUNT.value}&userWalletAddress={solana_wallet_address}"
+        response = await get_async_http_client().get(url)
+        response.raise_for_status()
+        user_has_drift_account = response.json()
+        return user_has_drift_account
+    except Exception as e:
+        await asyncio.to_thread(
+            save_agent_thought,
+            chat_id=chat_id,
+            thought=f"Error checking if user has drift account",
+            isFinalThought=True,
+        )
+        return f"Error checking if user has drift account because: {e}"
+
+
 def create_drift_account(
     chat_id: Annotated[str, "The current chat id"],
     token_symbol: Annotated[
@@ -551,7 +586,7 @@ def create_drift_account(
                 "perpsTransactionType": "create_account",
             }
 
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -625,7 +660,7 @@ def get_drift_perps_account_info(
             return f"I've initiated the process to fetch your account information."
         else:
             url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.GET_USER_ACCOUNT_INFO.value}&userWalletAddress={solana_wallet_address}"
-            response = requests.get(url)
+            response = http_session.get(url)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -748,7 +783,7 @@ def deposit_or_withdraw_collateral(
                 "perpsTransactionType": f"{transaction_type}_collateral",
             }
 
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -772,7 +807,7 @@ def is_valid_market_symbol(symbol: str) -> bool:
     )  # Generate a random Solana address using Solders
     url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.GET_PERPS_MARKETS.value}&userWalletAddress={solana_wallet_address}"
 
-    response = requests.get(url)
+    response = http_session.get(url)
     response.raise_for_status()
     perp_markets = response.json()
     is_valid_market = True
@@ -782,6 +817,21 @@ def is_valid_market_symbol(symbol: str) -> bool:
     return {"is_valid_market": is_valid_market, "perp_markets": perp_markets}
 
 
+async def is_valid_market_symbol_async(symbol: str) -> dict:
+    """
+    Async version of is_valid_market_symbol.
+    """
+    solana_wallet_address = str(
+        Pubkey(bytes([1] * 32))
+    )  # Generate a random Solana address using Solders
+    url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.GET_PERPS_MARKETS.value}&userWalletAddress={solana_wallet_address}"
+
+    response = await get_async_http_client().get(url)
+    response.raise_for_status()
+    perp_markets = response.json()
+    return {"is_valid_market": symbol in perp_markets, "perp_markets": perp_markets}
+
+
 def open_perps_position(
     symbol: Annotated[str, "The symbol of the market to open a position on."],
     amount: Annotated[str, "The amount of the token to open a position on."],
@@ -818,6 +868,74 @@ def open_perps_position(
     - A message indicating the transaction to create an account is initiated or an error occurred.
 
     """
+    return run_sync(
+        _open_perps_position(
+            SYNC_IO,
+            symbol,
+            amount,
+            order_type,
+            chat_id,
+            trade_direction,
+            slippage,
+            limit_price,
+            take_profit_percentage,
+            stop_loss_percentage,
+            use_frontend_quoting,
+        )
+    )
+
+
+async def open_perps_position_async(
+    symbol: Annotated[str, "The symbol of the market to open a position on."],
+    amount: Annotated[str, "The amount of the token to open a position on."],
+    order_type: Annotated[ORDER_TYPE, "The type of the order to open a position on."],
+    chat_id: Annotated[str, "The current chat id"],
+    trade_direction: Annotated[POSITION_TYPE, "The direction of the position to open."],
+    slippage: Annotated[float, "The slippage of the position."] = None,
+    limit_price: Annotated[float, "The limit price of the position."] = None,
+    take_profit_percentage: Annotated[
+        float, "The take profit percentage of the position."
+    ] = None,
+    stop_loss_percentage: Annotated[
+        float, "The stop loss percentage of the position."
+    ] = None,
+    use_frontend_quoting: Annotated[
+        bool, "Whether to use frontend quoting or not."
+    ] = True,
+):
+    """
+    Async version of open_perps_position, registered as the agent tool so parallel tool calls
+    run concurrently on the event loop. The market is fetched while the drift account is checked.
+    """
+    return await _open_perps_position(
+        ASYNC_IO,
+        symbol,
+        amount,
+        order_type,
+        chat_id,
+        trade_direction,
+        slippage,
+        limit_price,
+        take_profit_percentage,
+        stop_loss_percentage,
+        use_frontend_quoting,
+    )
+
+
+async def _open_perps_position(
+    io: IOMode,
+    symbol: str,
+    amount: str,
+    order_type: ORDER_TYPE,
+    chat_id: str,
+    trade_direction: POSITION_TYPE,
+    slippage: float,
+    limit_price: float,
+    take_profit_percentage: float,
+    stop_loss_percentage: float,
+    use_frontend_quoting: bool,
+):
+    """Body of open_perps_position and open_perps_position_async, `io` makes the calls."""
     try:
         solana_wallet_address = get_request_ctx(
             parentKey=chat_id, key="solana_wallet_address"
@@ -826,51 +944,68 @@ def open_perps_position(
         if not solana_wallet_address:
             return "No wallet address found."
 
-        user_has_drift_account = check_if_user_has_drift_account(
-            chat_id=chat_id,
-            solana_wallet_address=solana_wallet_address,
+        # Only read once the account is checked, a user without one gets that message
+        # whatever happens to the market lookup
+        market_lookup = io.start(
+            io.either(is_valid_market_symbol, is_valid_market_symbol_async, symbol)
         )
+        try:
+            user_has_drift_account = await io.either(
+                check_if_user_has_drift_account,
+                check_if_user_has_drift_account_async,
+                chat_id=chat_id,
+                solana_wallet_address=solana_wallet_address,
+            )
 
-        if not user_has_drift_account:
-            save_agent_thought(
+            if not user_has_drift_account:
+                await io.call(
+                    save_agent_thought,
+                    chat_id=chat_id,
+                    thought=f"User doesn't have drift account.",
+                    isFinalThought=True,
+                )
+                return "You don't have a drift account. You can create one and start depositing collateral or opening positions."
+
+            await io.call(
+                save_agent_thought,
                 chat_id=chat_id,
-                thought=f"User doesn't have drift account.",
-                isFinalThought=True,
+                thought=f"Initiating process to open a new {trade_direction.value.upper()} position on {symbol}...",
             )
-            return "You don't have a drift account. You can create one and start depositing collateral or opening positions."
 
-        save_agent_thought(
-            chat_id=chat_id,
-            thought=f"Initiating process to open a new {trade_direction.value.upper()} position on {symbol}...",
-        )
+            await io.call(
+                save_agent_thought,
+                chat_id=chat_id,
+                thought=f"Checking slippage and amount...",
+            )
 
-        save_agent_thought(
-            chat_id=chat_id,
-            thought=f"Checking slippage and amount...",
-        )
+            if not slippage:
+                slippage = 0.25
 
-        if not slippage:
-            slippage = 0.25
+            if not amount or amount == 0:
+                return "Please specify the amount you want to open a position on."
 
-        if not amount or amount == 0:
-            return "Please specify the amount you want to open a position on."
+            if order_type == ORDER_TYPE.LIMIT:
+                if not limit_price:
+                    return "Please specify the limit price for the position."
 
-        if order_type == ORDER_TYPE.LIMIT:
-            if not limit_price:
-                return "Please specify the limit price for the position."
+            await io.call(
+                save_agent_thought,
+                chat_id=chat_id,
+                thought=f"Checking if market is valid...",
+            )
 
-        save_agent_thought(
-            chat_id=chat_id,
-            thought=f"Checking if market is valid...",
-        )
+            market = await market_lookup
+        finally:
+            io.discard(market_lookup)
 
-        if not is_valid_market_symbol(symbol)["is_valid_market"]:
-            save_agent_thought(
+        if not market["is_valid_market"]:
+            await io.call(
+                save_agent_thought,
                 chat_id=chat_id,
                 thought=f"Market {symbol} is not valid.",
                 isFinalThought=True,
             )
-            return f"Market {symbol} not found. Here's a list of available perp markets: {', '.join(is_valid_market_symbol(symbol)['perp_markets'])}"
+            return f"Market {symbol} not found. Here's a list of available perp markets: {', '.join(market['perp_markets'])}"
 
         if use_frontend_quoting:
             renderData = {
@@ -893,7 +1028,8 @@ def open_perps_position(
             if stop_loss_percentage:
                 renderData["stopLossPercentage"] = stop_loss_percentage
 
-            save_ui_message(
+            await io.call(
+                save_ui_message,
                 chat_id=chat_id,
                 component="drift_perp_position",
                 renderData=renderData,
@@ -919,13 +1055,16 @@ def open_perps_position(
                 "perpsTransactionType": "open_perp_position",
             }
 
-            response = requests.post(url, json=params)
-            if response.status_code != 200:
-                response.raise_for_status()
+            response = await io.either(
+                lambda: http_session.post(url, json=params),
+                lambda: get_async_http_client().post(url, json=params),
+            )
+            response.raise_for_status()
             return response.json()
 
     except Exception as e:
-        save_agent_thought(
+        await io.call(
+            save_agent_thought,
             chat_id=chat_id,
             thought=f"Error opening {trade_direction.value.upper()} position on market {symbol}",
             isFinalThought=True,
@@ -1050,7 +1189,7 @@ def close_perps_position(
                 "perpsTransactionType": "close_perp_position",
             }
 
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -1131,7 +1270,7 @@ def get_user_active_orders(
             return f"I've initiated the process to get your active orders."
         else:
             url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.GET_USER_ACTIVE_ORDERS.value}&userWalletAddress={solana_wallet_address}"
-            response = requests.get(url)
+            response = http_session.get(url)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -1230,7 +1369,7 @@ def close_order_by_id_and_symbol(
                 "orderId": order_id,
             }
 
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -1313,7 +1452,7 @@ def close_all_active_orders(
                 "walletAddress": solana_wallet_address,
                 "perpsTransactionType": "cancel_all_active_orders",
             }
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -1386,7 +1525,7 @@ def get_user_active_positions(
             return f"I've initiated the process to get your active positions."
         else:
             url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.GET_USER_ACTIVE_PERPS_POSITIONS.value}&userWalletAddress={solana_wallet_address}"
-            response = requests.get(url)
+            response = http_session.get(url)
             if response.status_code != 200:
                 response.raise_for_status()
             return response.json()
@@ -1432,7 +1571,7 @@ def get_perps_markets(
         )  # Generate a random Solana address using Solders
         url = f"{FIREBASE_SERVER_ENDPOINT}/queryDrift?queryType={QueryType.GET_PERPS_MARKETS.value}&userWalletAddress={solana_wallet_address}"
 
-        response = requests.get(url)
+        response = http_session.get(url)
         response.raise_for_status()
         perp_markets = response.json()
 
@@ -1,12 +1,14 @@
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_core import CancellationToken
+from autogen_core.tools import FunctionTool
 import services.analytics as analytics
 from agents.drift.drift_perps_information import drift_perps_explanation
 from agents.drift.drift_functions import (
     create_drift_account,
     deposit_or_withdraw_collateral,
     open_perps_position,
+    open_perps_position_async,
     close_perps_position,
     get_user_active_orders,
     close_order_by_id_and_symbol,
@@ -17,6 +19,7 @@ from agents.drift.drift_functions import (
 )
 from services.llm import gpt_4o_client
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
+from agents.agent_registry import agent_tools
 
 
 def get_drift_perps_information():
@@ -28,6 +31,29 @@ def get_drift_perps_information():
     return drift_perps_explanation
 
 
+# Built once per instance, every agent created for a request shares them
+DRIFT_PERPS_AGENT_TOOLS = agent_tools(
+    [
+        create_drift_account,
+        deposit_or_withdraw_collateral,
+        # async version under the same name and description, so it runs on the event loop
+        FunctionTool(
+            open_perps_position_async,
+            name=open_perps_position.__name__,
+            description=open_perps_position.__doc__,
+        ),
+        close_perps_position,
+        get_user_active_orders,
+        close_order_by_id_and_symbol,
+        close_all_active_orders,
+        get_user_active_positions,
+        get_drift_perps_information,
+        get_drift_perps_account_info,
+        get_perps_markets,
+    ]
+)
+
+
 @tracer.start_as_current_span("drift_perps_agent")
 async def call_drift_perps_agent(
     task: str, chat_id: str, use_frontend_quoting: bool = True
@@ -61,19 +87,7 @@ async def call_drift_perps_agent(
     drift_perps_agent = AssistantAgent(
         name="drift_perps_agent",
         model_client=gpt_4o_client,
-        tools=[
-            create_drift_account,
-            deposit_or_withdraw_collateral,
-            open_perps_position,
-            close_perps_position,
-            get_user_active_orders,
-            close_order_by_id_and_symbol,
-            close_all_active_orders,
-            get_user_active_positions,
-            get_drift_perps_information,
-            get_drift_perps_account_info,
-            get_perps_markets,
-        ],
+        tools=DRIFT_PERPS_AGENT_TOOLS,
         system_message=(
             "You're a helpful assistant that helps users manage their PERPS positions on DRIFT Protocol.\n"
             "Handle PERPS transactions on DRIFT Protocol using these functions:\n\n"
@@ -11,6 +11,18 @@ from agents.drift.drift_functions import (
 from services.llm import gpt_4o_client
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
 from utils.firebase import save_agent_thought
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+DRIFT_VAULTS_AGENT_TOOLS = agent_tools(
+    [
+        generate_drift_vault_transaction,
+        get_user_vaults,
+        select_vault_to_withdraw_from,
+        select_vault_to_deposit_to,
+    ]
+)
 
 
 @tracer.start_as_current_span("drift_vaults_agent")
@@ -44,12 +56,7 @@ async def call_drift_vaults_agent(
     drift_vaults_agent = AssistantAgent(
         name="drift_vaults_agent",
         model_client=gpt_4o_client,
-        tools=[
-            generate_drift_vault_transaction,
-            get_user_vaults,
-            select_vault_to_withdraw_from,
-            select_vault_to_deposit_to,
-        ],
+        tools=DRIFT_VAULTS_AGENT_TOOLS,
         system_message=(
             "Drift Agent for DRIFT Vaults Protocol.\n"
             "Handle USDC transactions on DRIFT Vaults Protocol using these functions:\n\n"
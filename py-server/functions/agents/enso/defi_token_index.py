@@ -0,0 +1,280 @@
+"""
+Offline index of the Enso defi tokens shipped in assets/defi-tokens.json.
+
+The JSON (chain id -> protocol slug -> tokens) is compiled into assets/defi-tokens.bin, a
+columnar file that is memory-mapped on first use: no parsing at startup and no Firestore
+reads, lookups by (chain, address) and (chain, symbol) go through precomputed hash tables.
+
+Rebuild the file after updating the JSON (tests fail while they are out of sync):
+    python -m agents.enso.defi_token_index
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Optional
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+DEFI_TOKENS_JSON_PATH = os.path.join(ASSETS_DIR, "defi-tokens.json")
+DEFI_TOKENS_INDEX_PATH = os.path.join(ASSETS_DIR, "defi-tokens.bin")
+
+MAGIC = b"ENSODFT1"
+# Column and table sections, in file order. Their offsets are stored in the header.
+SECTIONS = (
+    "chain_ids",  # u32 per token
+    "protocol_ids",  # u16 per token
+    "decimals",  # u8 per token
+    "address_offsets",  # u32 per token + 1, into the string blob
+    "symbol_offsets",  # u32 per token + 1, into the string blob
+    "protocol_offsets",  # u32 per protocol + 1, into the string blob
+    "address_table",  # u32 slots: token row + 1, 0 is empty
+    "symbol_table",  # u32 slots: first token row of the (chain, symbol) run + 1
+    "strings",  # utf-8 blob: addresses, then symbols, then protocol slugs
+)
+# magic, token count, protocol count, table capacity, source size, source sha256, section offsets
+HEADER = struct.Struct(f"<8sIIIQ32s{len(SECTIONS)}I")
+SECTION_ALIGNMENT = 8
+EMPTY_SLOT = 0
+
+
+def _hash_key(chain_id: int, value: str) -> int:
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(f"{chain_id}:{value.lower()}".encode())
+
+
+def _table_capacity(count: int) -> int:
+    # power of two, at most half full so probe sequences stay short
+    capacity = 1
+    while capacity < max(count, 1) * 2:
+        capacity *= 2
+    return capacity
+
+
+def _insert(table: list, key_hash: int, row: int):
+    mask = len(table) - 1
+    slot = key_hash & mask
+    while table[slot] != EMPTY_SLOT:
+        slot = (slot + 1) & mask
+    table[slot] = row + 1
+
+
+def compile_defi_tokens(source: bytes) -> bytes:
+    """Compiles the defi-tokens.json content into the binary index format."""
+    tokens_by_chain = json.loads(source)
+    rows = [
+        (int(chain_id), token["symbol"], protocol_slug, token["address"], int(token["decimals"]))
+        for chain_id, protocols in tokens_by_chain.items()
+        for protocol_slug, tokens in protocols.items()
+        for token in tokens
+    ]
+    # tokens sharing a (chain, symbol) are contiguous, the symbol table points to the first one
+    rows.sort(key=lambda row: (row[0], row[1].lower(), row[2], row[3].lower()))
+
+    protocol_slugs = sorted({row[2] for row in rows})
+    protocol_ids = {slug: index for index, slug in enumerate(protocol_slugs)}
+
+    strings = bytearray()
+
+    def append_strings(values) -> list[int]:
+        offsets = [len(strings)]
+        for value in values:
+            strings.extend(value.encode())
+            offsets.append(len(strings))
+        return offsets
+
+    address_offsets = append_strings(row[3] for row in rows)
+    symbol_offsets = append_strings(row[1] for row in rows)
+    protocol_offsets = append_strings(protocol_slugs)
+
+    capacity = _table_capacity(len(rows))
+    address_table = [EMPTY_SLOT] * capacity
+    symbol_table = [EMPTY_SLOT] * capacity
+    seen_addresses = set()
+    for row_index, (chain_id, symbol, _, address, _) in enumerate(rows):
+        address_key = (chain_id, address.lower())
+        if address_key not in seen_addresses:
+            seen_addresses.add(address_key)
+            _insert(address_table, _hash_key(chain_id, address), row_index)
+        previous = rows[row_index - 1] if row_index else None
+        if previous is None or (previous[0], previous[1].lower()) != (chain_id, symbol.lower()):
+            _insert(symbol_table, _hash_key(chain_id, symbol), row_index)
+
+    sections = {
+        "chain_ids": struct.pack(f"<{len(rows)}I", *(row[0] for row in rows)),
+        "protocol_ids": struct.pack(f"<{len(rows)}H", *(protocol_ids[row[2]] for row in rows)),
+        "decimals": bytes(row[4] for row in rows),
+        "address_offsets": struct.pack(f"<{len(address_offsets)}I", *address_offsets),
+        "symbol_offsets": struct.pack(f"<{len(symbol_offsets)}I", *symbol_offsets),
+        "protocol_offsets": struct.pack(f"<{len(protocol_offsets)}I", *protocol_offsets),
+        "address_table": struct.pack(f"<{capacity}I", *address_table),
+        "symbol_table": struct.pack(f"<{capacity}I", *symbol_table),
+        "strings": bytes(strings),
+    }
+
+    body = bytearray()
+    offsets = []
+    for name in SECTIONS:
+        body.extend(b"\0" * (-(HEADER.size + len(body)) % SECTION_ALIGNMENT))
+        offsets.append(HEADER.size + len(body))
+        body.extend(sections[name])
+
+    header = HEADER.pack(
+        MAGIC,
+        len(rows),
+        len(protocol_slugs),
+        capacity,
+        len(source),
+        hashlib.sha256(source).digest(),
+        *offsets,
+    )
+    return header + bytes(body)
+
+
+class DefiTokenIndex:
+    """Read-only view over a compiled defi tokens index (an mmap or any bytes-like buffer)."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        (
+            magic,
+            self.token_count,
+            self.protocol_count,
+            self.capacity,
+            self.source_size,
+            self.source_sha256,
+            *offsets,
+        ) = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Not a compiled defi tokens index")
+
+        bounds = dict(zip(SECTIONS, offsets))
+        lengths = {
+            "chain_ids": self.token_count * 4,
+            "protocol_ids": self.token_count * 2,
+            "decimals": self.token_count,
+            "address_offsets": (self.token_count + 1) * 4,
+            "symbol_offsets": (self.token_count + 1) * 4,
+            "protocol_offsets": (self.protocol_count + 1) * 4,
+            "address_table": self.capacity * 4,
+            "symbol_table": self.capacity * 4,
+        }
+        formats = {"protocol_ids": "H", "decimals": "B"}
+        for name, length in lengths.items():
+            column = view[bounds[name] : bounds[name] + length].cast(formats.get(name, "I"))
+            setattr(self, f"_{name}", column)
+        self._strings = view[bounds["strings"] :]
+        self._mask = self.capacity - 1
+        self._all_chain_ids = sorted(set(self._chain_ids))
+
+    @classmethod
+    def open(cls, path: str = DEFI_TOKENS_INDEX_PATH) -> "DefiTokenIndex":
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return self.token_count
+
+    def _string(self, offsets, index: int) -> str:
+        return bytes(self._strings[offsets[index] : offsets[index + 1]]).decode()
+
+    def _row(self, row: int) -> dict:
+        return {
+            "chainId": self._chain_ids[row],
+            "protocolSlug": self._string(self._protocol_offsets, self._protocol_ids[row]),
+            "address": self._string(self._address_offsets, row),
+            "symbol": self._string(self._symbol_offsets, row),
+            "decimals": self._decimals[row],
+        }
+
+    def _probe(self, table, chain_id: int, value: str, offsets) -> Optional[int]:
+        value = value.lower()
+        slot = _hash_key(chain_id, value) & self._mask
+        while (entry := table[slot]) != EMPTY_SLOT:
+            row = entry - 1
+            if self._chain_ids[row] == chain_id and self._string(offsets, row).lower() == value:
+                return row
+            slot = (slot + 1) & self._mask
+        return None
+
+    def _chain_ids_to_search(self, chain_id) -> list[int]:
+        if chain_id is not None:
+            return [int(chain_id)]
+        return self._all_chain_ids
+
+    def get_by_address(self, address: str, chain_id: Optional[str] = None) -> Optional[dict]:
+        """Returns the defi token with this address (case insensitive), on any chain if chain_id is None."""
+        for chain in self._chain_ids_to_search(chain_id):
+            row = self._probe(self._address_table, chain, address, self._address_offsets)
+            if row is not None:
+                return self._row(row)
+        return None
+
+    def get_by_symbol(self, symbol: str, chain_id: Optional[str] = None) -> list[dict]:
+        """Returns the defi tokens with exactly this symbol (case insensitive), on any chain if chain_id is None."""
+        tokens = []
+        symbol_lower = symbol.lower()
+        for chain in self._chain_ids_to_search(chain_id):
+            row = self._probe(self._symbol_table, chain, symbol, self._symbol_offsets)
+            while (
+                row is not None
+                and row < self.token_count
+                and self._chain_ids[row] == chain
+                and self._string(self._symbol_offsets, row).lower() == symbol_lower
+            ):
+                tokens.append(self._row(row))
+                row += 1
+        return tokens
+
+
+_defi_token_index: Optional[DefiTokenIndex] = None
+_defi_token_index_lock = threading.Lock()
+
+
+def get_defi_token_index() -> Optional[DefiTokenIndex]:
+    """
+    Returns the process-wide defi token index, mapped on first use.
+    Falls back to compiling the JSON in memory when the compiled file is missing or was built
+    from a different JSON (size check only, the sha256 is verified by the tests).
+    """
+    global _defi_token_index
+    if _defi_token_index is not None:
+        return _defi_token_index
+    with _defi_token_index_lock:
+        if _defi_token_index is None:
+            try:
+                index = DefiTokenIndex.open()
+                if index.source_size != os.path.getsize(DEFI_TOKENS_JSON_PATH):
+                    raise ValueError("compiled index is out of date")
+            except (OSError, ValueError) as e:
+                print(f"Compiling Enso defi tokens index in memory ({e})")
+                try:
+                    with open(DEFI_TOKENS_JSON_PATH, "rb") as file:
+                        index = DefiTokenIndex(compile_defi_tokens(file.read()))
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Error loading Enso defi tokens: {e}")
+                    return None
+            _defi_token_index = index
+    return _defi_token_index
+
+
+def build_index(
+    json_path: str = DEFI_TOKENS_JSON_PATH, output_path: str = DEFI_TOKENS_INDEX_PATH
+) -> DefiTokenIndex:
+    with open(json_path, "rb") as file:
+        compiled = compile_defi_tokens(file.read())
+    with open(output_path, "wb") as file:
+        file.write(compiled)
+    return DefiTokenIndex(compiled)
+
+
+if __name__ == "__main__":
+    index = build_index()
+    print(
+        f"Compiled {len(index)} tokens, {index.protocol_count} protocols "
+        f"into {DEFI_TOKENS_INDEX_PATH} ({os.path.getsize(DEFI_TOKENS_INDEX_PATH)} bytes)"
+    )
@@ -1,6 +1,7 @@
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_core import CancellationToken
+from autogen_core.tools import FunctionTool
 from typing import Annotated
 from utils.firebase import (
     get_enso_supported_chains_and_protocols,
@@ -10,9 +11,23 @@ from services.llm import gpt_4o_client
 
 from agents.enso.enso_functions import (
     defi_quote,
+    defi_quote_async,
 )
 import services.analytics as analytics
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+ENSO_AGENT_TOOLS = agent_tools(
+    [
+        FunctionTool(
+            defi_quote_async,
+            name=defi_quote.__name__,
+            description=defi_quote.__doc__,
+        )
+    ]
+)
 
 
 @tracer.start_as_current_span("enso_agent")
@@ -71,7 +86,8 @@ async def call_enso_agent(
         """,
         model_client=gpt_4o_client,
         reflect_on_tool_use=False,
-        tools=[defi_quote],
+        # async version under the same name and description, so it runs on the event loop
+        tools=ENSO_AGENT_TOOLS,
     )
 
     updated_task = f"""
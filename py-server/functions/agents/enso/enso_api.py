@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from typing import Annotated, Dict, List, Union, Any, Optional
 from config import ENSO_API_KEY
 
@@ -25,7 +25,7 @@ def get_networks(
         params["name"] = name
     if chainId:
         params["chainId"] = chainId
-    response = requests.get(f"{BASE_URL}/v1/networks", headers=HEADERS, params=params)
+    response = http_session.get(f"{BASE_URL}/v1/networks", headers=HEADERS, params=params)
     response.raise_for_status()
     return response.json()
 
@@ -80,7 +80,7 @@ def get_multichain_route(
         params["receiver"] = receiver
     if slippage:
         params["slippage"] = slippage
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/v1/shortcuts/route/multichain", headers=HEADERS, params=params
     )
     response.raise_for_status()
@@ -203,7 +203,7 @@ def get_route(
         params["ignoreAggregators"] = ignoreAggregators
     if ignoreStandards:
         params["ignoreStandards"] = ignoreStandards
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/v1/shortcuts/route", headers=HEADERS, params=params
     )
     response.raise_for_status()
@@ -329,7 +329,7 @@ def post_route(
         data["ignoreAggregators"] = ignoreAggregators
     if ignoreStandards:
         data["ignoreStandards"] = ignoreStandards
-    response = requests.post(
+    response = http_session.post(
         f"{BASE_URL}/v1/shortcuts/route", headers=HEADERS, json=data
     )
     response.raise_for_status()
@@ -360,7 +360,7 @@ def get_wallet(
         params["chainId"] = chainId
     if routingStrategy:
         params["routingStrategy"] = routingStrategy
-    response = requests.get(f"{BASE_URL}/v1/wallet", headers=HEADERS, params=params)
+    response = http_session.get(f"{BASE_URL}/v1/wallet", headers=HEADERS, params=params)
     response.raise_for_status()
     return response.json()
 
@@ -395,7 +395,7 @@ def create_approve_transaction(
         params["chainId"] = chainId
     if routingStrategy:
         params["routingStrategy"] = routingStrategy
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/v1/wallet/approve", headers=HEADERS, params=params
     )
     response.raise_for_status()
@@ -426,7 +426,7 @@ def get_wallet_approvals(
         params["chainId"] = chainId
     if routingStrategy:
         params["routingStrategy"] = routingStrategy
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/v1/wallet/approvals", headers=HEADERS, params=params
     )
     response.raise_for_status()
@@ -462,7 +462,7 @@ def get_wallet_balances(
     if chainId:
         params["chainId"] = chainId
 
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/v1/wallet/balances", headers=HEADERS, params=params
     )
 
@@ -513,7 +513,7 @@ def get_tokens(
         params["type"] = type
     if page:
         params["page"] = page
-    response = requests.get(f"{BASE_URL}/v1/tokens", headers=HEADERS, params=params)
+    response = http_session.get(f"{BASE_URL}/v1/tokens", headers=HEADERS, params=params)
     response.raise_for_status()
     return response.json()
 
@@ -524,7 +524,7 @@ def get_actions() -> List[Dict[str, Union[str, int]]]:
 
     :return: Actions available to use in bundle shortcuts
     """
-    response = requests.get(f"{BASE_URL}/v1/actions", headers=HEADERS)
+    response = http_session.get(f"{BASE_URL}/v1/actions", headers=HEADERS)
     response.raise_for_status()
     return response.json()
 
@@ -535,7 +535,7 @@ def get_standards() -> List[Dict[str, Union[str, int]]]:
 
     :return: Standards and methods available to use in bundle shortcuts
     """
-    response = requests.get(f"{BASE_URL}/v1/standards", headers=HEADERS)
+    response = http_session.get(f"{BASE_URL}/v1/standards", headers=HEADERS)
     response.raise_for_status()
     return response.json()
 
@@ -571,7 +571,7 @@ def bundle_shortcut_transaction(
         params["chainId"] = chainId
     if routingStrategy:
         params["routingStrategy"] = routingStrategy
-    response = requests.post(
+    response = http_session.post(
         f"{BASE_URL}/v1/shortcuts/bundle", headers=HEADERS, json=actions, params=params
     )
     response.raise_for_status()
@@ -665,7 +665,7 @@ def get_quote(
         params["ignoreStandards"] = ignoreStandards
     if priceImpact:
         params["priceImpact"] = priceImpact
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/v1/shortcuts/quote", headers=HEADERS, params=params
     )
     response.raise_for_status()
@@ -739,7 +739,7 @@ def simulate_route(
         data["ignoreAggregators"] = ignoreAggregators
     if blockNumber:
         data["blockNumber"] = blockNumber
-    response = requests.post(
+    response = http_session.post(
         f"{BASE_URL}/v1/shortcuts/quote", headers=HEADERS, json=data
     )
     response.raise_for_status()
@@ -805,7 +805,7 @@ def get_ipor_shortcut_transaction(
         data["slippage"] = slippage
     if simulate:
         data["simulate"] = simulate
-    response = requests.post(
+    response = http_session.post(
         f"{BASE_URL}/v1/shortcuts/static/ipor", headers=HEADERS, json=data
     )
     response.raise_for_status()
@@ -824,6 +824,6 @@ def get_protocols(
     params = {}
     if slug:
         params["slug"] = slug
-    response = requests.get(f"{BASE_URL}/v1/protocols", headers=HEADERS, params=params)
+    response = http_session.get(f"{BASE_URL}/v1/protocols", headers=HEADERS, params=params)
     response.raise_for_status()
     return response.json()
@@ -2,7 +2,7 @@ import json
 from typing import Annotated
 from decimal import Decimal
 from enum import Enum
-import requests
+from services.http_client import get_async_http_client, http_session
 from services.chains import call_chains_service
 
 from utils.firebase import (
@@ -10,9 +10,13 @@ from utils.firebase import (
     set_request_ctx,
     save_agent_thought,
     get_enso_supported_chains_and_protocols,
+    find_enso_supported_protocols,
     get_enso_supported_tokens,
     save_ui_message,
 )
+from agents.enso.defi_token_index import get_defi_token_index
+from utils.blockchain_utils import is_evm
+from utils.io_mode import ASYNC_IO, SYNC_IO, IOMode, run_sync
 import services.prices as prices_service
 from services.prices import PriceProviderType
 from config import FIREBASE_SERVER_ENDPOINT
@@ -44,25 +48,8 @@ def _check_and_record_for_evaluation(function_name: str, params: dict) -> str |
 
 
 def is_protocol_supported(protocol_slug):
-    supported_protocols = get_enso_supported_chains_and_protocols()
-    protocol_slug_lower = protocol_slug.lower()
-
-    for chain_id, chain_data in supported_protocols.items():
-        protocols = chain_data.get("protocols", [])
-        protocols_lower = [p.lower() for p in protocols]
-
-        # Exact match
-        if protocol_slug_lower in protocols_lower:
-            return True
-
-        # Partial match (e.g., "aave" should match "aave-v3", "aave-v2")
-        for protocol in protocols_lower:
-            if protocol_slug_lower in protocol or protocol.startswith(
-                protocol_slug_lower
-            ):
-                return True
-
-    return False
+    # Exact or partial match (e.g., "aave" should match "aave-v3", "aave-v2"), served from the catalog index
+    return bool(find_enso_supported_protocols(protocol_slug))
 
 
 def is_chain_supported(chain):
@@ -140,27 +127,95 @@ def defi_quote(
     - str: The quote for the transaction
     """
 
-    eval_message = _check_and_record_for_evaluation("defi_quote", locals())
+    return run_sync(
+        _defi_quote(
+            SYNC_IO,
+            token,
+            chat_id,
+            is_withdraw,
+            amount,
+            from_chain,
+            protocol,
+            defi_token_symbol,
+            use_frontend_quoting,
+        )
+    )
+
+
+async def defi_quote_async(
+    token: Annotated[
+        str, "The token address or symbol to deposit from or withdraw to."
+    ],
+    chat_id: Annotated[str, "The current chat id"],
+    is_withdraw: Annotated[bool, "Whether to withdraw or deposit"],
+    amount: Annotated[str, "The amount of the token to deposit or withdraw."] = None,
+    from_chain: Annotated[str, "Chain name (optional)"] = None,
+    protocol: Annotated[str, "Protocol name (optional)"] = None,
+    defi_token_symbol: Annotated[
+        str, "Token symbol (optional) to deposit to or withdraw from"
+    ] = None,
+    use_frontend_quoting: Annotated[
+        bool, "Whether to use frontend quoting or not."
+    ] = True,
+):
+    """
+    Async version of defi_quote, registered as the agent tool so parallel tool calls
+    run concurrently on the event loop. Firestore lookups run in a worker thread.
+    """
+    return await _defi_quote(
+        ASYNC_IO,
+        token,
+        chat_id,
+        is_withdraw,
+        amount,
+        from_chain,
+        protocol,
+        defi_token_symbol,
+        use_frontend_quoting,
+    )
+
+
+async def _defi_quote(
+    io: IOMode,
+    token: str,
+    chat_id: str,
+    is_withdraw: bool,
+    amount: str,
+    from_chain: str,
+    protocol: str,
+    defi_token_symbol: str,
+    use_frontend_quoting: bool,
+):
+    """Body of defi_quote and defi_quote_async, `io` makes the calls."""
+    tool_params = dict(locals())
+    del tool_params["io"]
+    eval_message = _check_and_record_for_evaluation("defi_quote", tool_params)
     if eval_message:
         return eval_message
 
-    save_agent_thought(
+    await io.call(
+        save_agent_thought,
         chat_id=chat_id,
         thought=f"Initiating process to get you a quote for your {is_withdraw and 'withdraw' or 'deposit'}...",
     )
 
-    save_agent_thought(
+    await io.call(
+        save_agent_thought,
         chat_id=chat_id,
         thought=f"Getting matching tokens for your request...",
     )
 
     # Find the best matching token using filters
-    matching_tokens = get_matching_defi_tokens(
-        chain_name=from_chain, protocol=protocol, symbol=defi_token_symbol
+    matching_tokens = await io.call(
+        get_matching_defi_tokens,
+        chain_name=from_chain,
+        protocol=protocol,
+        symbol=defi_token_symbol,
     )
 
     if not matching_tokens:
-        save_agent_thought(
+        await io.call(
+            save_agent_thought,
             chat_id=chat_id,
             thought=f"No matching tokens found for the specified criteria",
             isFinalThought=True,
@@ -173,13 +228,15 @@ def defi_quote(
 
     # Validate chain if provided
     if from_chain:
-        save_agent_thought(
+        await io.call(
+            save_agent_thought,
             chat_id=chat_id,
             thought=f"Validating chain {from_chain}...",
         )
 
-        if not is_chain_supported(from_chain):
-            save_agent_thought(
+        if not await io.call(is_chain_supported, from_chain):
+            await io.call(
+                save_agent_thought,
                 chat_id=chat_id,
                 thought=f"Chain {from_chain} is not supported",
                 isFinalThought=True,
@@ -215,9 +272,11 @@ def defi_quote(
             "slippage": slippage,
             "allowanceType": allowance_type,
         }
-        response = requests.post(url, json=params)
-        if response.status_code != 200:
-            response.raise_for_status()
+        response = await io.either(
+            lambda: http_session.post(url, json=params),
+            lambda: get_async_http_client().post(url, json=params),
+        )
+        response.raise_for_status()
 
         return response.json()
 
@@ -227,7 +286,8 @@ def defi_quote(
         if is_withdraw and not defi_token_symbol and not protocol:
             to_defi_token_address = None
 
-        save_ui_message(
+        await io.call(
+            save_ui_message,
             chat_id=chat_id,
             component="enso",
             renderData={
@@ -274,12 +334,28 @@ def get_matching_defi_tokens(
         except:
             # If we can't get chain_id, use None and we pick all tokens
             target_chain_id = None
+
+    # The model sometimes passes the defi token address as the symbol, resolve it offline
+    defi_token_address = None
+    if symbol and is_evm(symbol):
+        defi_token = resolve_defi_token_address(symbol, target_chain_id)
+        if defi_token:
+            defi_token_address = symbol.lower()
+            symbol = defi_token["symbol"]
+            protocol = protocol or defi_token["protocolSlug"]
+
     # Use optimized query with filters applied at DB level
     filtered_tokens = get_enso_supported_tokens(
         chain_id=str(target_chain_id) if target_chain_id else None,
         project=protocol.lower() if protocol else None,
         symbol=symbol,
     )
+    if defi_token_address:
+        filtered_tokens = [
+            token
+            for token in filtered_tokens
+            if token["token"]["address"].lower() == defi_token_address
+        ] or filtered_tokens
 
     # If no results with filters, fallback to highest APY tokens
     if not filtered_tokens:
@@ -290,6 +366,21 @@ def get_matching_defi_tokens(
     return filtered_tokens
 
 
+def resolve_defi_token_address(address: str, chain_id=None):
+    """
+    Resolves a defi token address from the bundled Enso token list (no network or Firestore).
+    Returns: {"chainId", "protocolSlug", "address", "symbol", "decimals"} or None
+    """
+    index = get_defi_token_index()
+    if index is None:
+        return None
+    try:
+        return index.get_by_address(address, chain_id)
+    except ValueError:
+        # chain_id is not numeric
+        return index.get_by_address(address)
+
+
 def get_token_usd_amount(chain: str, token_address: str, token_amount: float):
     token_price_response = prices_service.get_token_price_from_provider(
         chain, token_address, PriceProviderType.LIFI
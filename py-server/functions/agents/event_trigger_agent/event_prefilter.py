@@ -0,0 +1,116 @@
+import hashlib
+import threading
+from typing import Awaitable, Callable, Optional
+
+import numpy as np
+
+from services.llm import create_embeddings
+
+# Candidates sent to the LLM per tweet, two batches of the agent
+PREFILTER_TOP_K = 10
+
+
+def event_text(event: dict) -> str:
+    """Text embedded for an event: its title and description."""
+    return "\n".join(
+        part for part in (event.get("title"), event.get("description")) if part
+    )
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EventEmbeddingIndex:
+    """
+    Semantic pre-filter for tweet-to-event matching.
+
+    Keeps the normalized embeddings of the pending events in one float32 matrix, so scoring a
+    tweet against every event is a single matrix-vector product. `sync` only embeds events
+    that are new or whose text changed and drops the ones that are no longer pending.
+    Candidates are the top-k events only, there is no similarity threshold: none has been
+    measured on real tweets and one can drop true matches.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[list[str]], Awaitable[list[list[float]]]] = create_embeddings,
+        top_k: int = PREFILTER_TOP_K,
+    ):
+        self.embed = embed
+        self.top_k = top_k
+        self._lock = threading.Lock()
+        self._vectors: dict[str, np.ndarray] = {}
+        self._hashes: dict[str, str] = {}
+        self.event_ids: list[str] = []
+        self.matrix: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    async def sync(self, events: list[dict]):
+        """Makes the matrix hold exactly the given events."""
+        texts = {event["eventId"]: event_text(event) for event in events}
+        hashes = {event_id: _text_hash(text) for event_id, text in texts.items()}
+        stale = [
+            event_id
+            for event_id, text_hash in hashes.items()
+            if self._hashes.get(event_id) != text_hash
+        ]
+        vectors = []
+        if stale:
+            embeddings = await self.embed([texts[event_id] for event_id in stale])
+            vectors = self._normalize(np.asarray(embeddings, dtype=np.float32))
+
+        with self._lock:
+            for event_id, vector in zip(stale, vectors):
+                self._vectors[event_id] = vector
+                self._hashes[event_id] = hashes[event_id]
+            for event_id in set(self._vectors) - set(texts):
+                del self._vectors[event_id]
+                del self._hashes[event_id]
+
+            event_ids = list(texts)
+            if stale or event_ids != self.event_ids:
+                self.event_ids = event_ids
+                self.matrix = (
+                    np.stack([self._vectors[event_id] for event_id in event_ids])
+                    if event_ids
+                    else None
+                )
+
+    async def score(self, texts: list[str]) -> tuple[list[str], np.ndarray]:
+        """
+        Indexed event ids and the cosine similarity of each text (rows) with each of them
+        (columns). The texts are embedded in one request and scored with one matrix product.
+        """
+        with self._lock:
+            event_ids, matrix = self.event_ids, self.matrix
+        if matrix is None or not texts:
+            return event_ids, np.zeros((len(texts), len(event_ids)), dtype=np.float32)
+        queries = self._normalize(np.asarray(await self.embed(list(texts)), dtype=np.float32))
+        return event_ids, queries @ matrix.T
+
+    def _rank(self, event_ids: list[str], scores: np.ndarray, events_by_id: dict) -> list[dict]:
+        top = np.arange(len(scores))
+        if len(top) > self.top_k:
+            top = np.argpartition(scores, -self.top_k)[-self.top_k :]
+        ranked = top[np.argsort(scores[top])[::-1]]
+        return [events_by_id[event_ids[i]] for i in ranked if event_ids[i] in events_by_id]
+
+    async def candidates(self, text: str, events: list[dict]) -> list[dict]:
+        """The top-k events most similar to the text, most similar first."""
+        return (await self.candidates_many([text], events))[0]
+
+    async def candidates_many(self, texts: list[str], events: list[dict]) -> list[list[dict]]:
+        """`candidates` of each text, the events are synced once and the texts embedded together."""
+        await self.sync(events)
+        event_ids, scores = await self.score(texts)
+        events_by_id = {event["eventId"]: event for event in events}
+        return [self._rank(event_ids, row, events_by_id) for row in scores]
+
+
+# Shared by every tweet handled by the instance, pending events are only embedded once
+event_prefilter = EventEmbeddingIndex()
@@ -1,13 +1,23 @@
+import asyncio
+import json
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_core import CancellationToken
 from typing import Annotated, TypedDict, Optional
+from pydantic import BaseModel
+from autogen_ext.models.openai import OpenAIChatCompletionClient
 from services.llm import gpt_4o_client
 import services.analytics as analytics
 from utils.firebase import db
 from datetime import datetime, timedelta
 from firebase_admin import firestore
-from utils.firebase import get_request_ctx, set_request_ctx
+from utils.firebase import (
+    append_request_ctx,
+    invalidate_tweet_based_event,
+)
+from agents.event_trigger_agent.event_prefilter import event_prefilter
+from agents.agent_registry import agent_tools
+from config import EVENT_TRIGGER_MAX_CONCURRENCY, OPENAI_API_KEY
 
 from services.tracing import (
     set_status_ok,
@@ -24,6 +34,26 @@ class TweetData(TypedDict):
     id: str
 
 
+class TweetEventMatch(BaseModel):
+    tweetId: str
+    eventId: str
+
+
+class TweetBatchMatches(BaseModel):
+    matches: list[TweetEventMatch]
+
+    class Config:
+        extra = "forbid"
+
+
+tweet_batch_client = OpenAIChatCompletionClient(
+    model="gpt-4o",
+    api_key=OPENAI_API_KEY,
+    temperature=0.0,
+    response_format=TweetBatchMatches,
+)
+
+
 class EventData(TypedDict):
     longTrades: list
     eventTime: Optional[any]
@@ -38,6 +68,10 @@ class EventData(TypedDict):
     eventId: str
 
 
+def _is_triggered(snapshot) -> bool:
+    return snapshot.exists and (snapshot.to_dict() or {}).get("executionTime") is not None
+
+
 def updateExecutionTimeForEvent(
     eventId: Annotated[str, "The ID of the event to update"],
     tweetContent: Annotated[str, "The content of the tweet that triggered the event"],
@@ -62,35 +96,44 @@ def updateExecutionTimeForEvent(
     """
     try:
         if is_evaluation:
-            # Add event information to the context array for evaluation tracking
-            current_events = get_request_ctx(chat_id, "triggered_events") or []
+            # Add event information to the context array for evaluation tracking, in place as
+            # the event batches call this tool concurrently
             event_info = {
                 "eventId": eventId,
                 "tweetContent": tweetContent,
                 "username": username,
                 "tweetId": tweetId,
             }
-            current_events.append(event_info)
-            set_request_ctx(chat_id, "triggered_events", current_events)
+            append_request_ctx(chat_id, "triggered_events", event_info)
             return
         else:
             event_ref = db.collection("rumours_events").document(eventId)
+            snapshot = event_ref.get()
+
+            if not snapshot.exists:
+                return "Event not found"
+            # The pending events snapshot can lag behind, another tweet may have triggered it
+            if _is_triggered(snapshot):
+                invalidate_tweet_based_event(eventId)
+                return "Event already triggered"
 
-            if event_ref.get().exists:
-                # Use current time as base
-                current_time = datetime.now()
-                current_time = current_time.replace(
-                    second=0, microsecond=0
-                )  # Round to minute
+            # Use current time as base
+            current_time = datetime.now()
+            current_time = current_time.replace(
+                second=0, microsecond=0
+            )  # Round to minute
 
-                execution_time = firestore.SERVER_TIMESTAMP
+            execution_time = firestore.SERVER_TIMESTAMP
 
-                # Calculate eventTime (10 minutes after current time)
-                event_time = current_time + timedelta(minutes=10)
+            # Calculate eventTime (10 minutes after current time)
+            event_time = current_time + timedelta(minutes=10)
 
-                # Calculate closingTime (40 minutes after current time)
-                closing_time = current_time + timedelta(minutes=40)
+            # Calculate closingTime (40 minutes after current time)
+            closing_time = current_time + timedelta(minutes=40)
 
+            try:
+                # Only applied if the event is unchanged since it was read, so two invocations
+                # matching the same event can't both trigger it
                 event_ref.update(
                     {
                         "executionTime": execution_time,
@@ -101,17 +144,135 @@ def updateExecutionTimeForEvent(
                             "tweetContent": tweetContent,
                             "username": username,
                         },
-                    }
+                    },
+                    option=db.write_option(last_update_time=snapshot.update_time),
                 )
-                return (
-                    "Execution time, event time, and closing time updated successfully"
-                )
-            else:
-                return "Event not found"
+            except Exception:
+                if not _is_triggered(event_ref.get()):
+                    raise
+                invalidate_tweet_based_event(eventId)
+                return "Event already triggered"
+            # Triggered events are not pending anymore, later tweets must skip them
+            invalidate_tweet_based_event(eventId)
+            return "Execution time, event time, and closing time updated successfully"
     except Exception as e:
         return f"An error occurred: {str(e)}"
 
 
+EVENT_TRIGGER_TOOLS = agent_tools([updateExecutionTimeForEvent])
+
+# Matching rules shared by the per-tweet agent and the tweet batch evaluator
+EVENT_MATCHING_RULES = (
+    "ANALYSIS PROCESS: "
+    "1. Carefully read the tweet content and analyze its meaning "
+    "2. Compare it against each event's title and description "
+    "3. Look for semantic relationships, not just exact word matches "
+    "4. Consider synonyms, related concepts, and contextual relevance "
+    "\n\n"
+    "EXAMPLE SCENARIOS: "
+    "- Event: 'BTC Creator is discovered' + Tweet: 'Satoshi Nakamoto was found. He is John Peter Doe.' → MATCH (call updateExecutionTimeForEvent) "
+    "- Event: 'Ethereum Foundation disappear' + Tweet: 'Vitalik Buterin announces EF shutdown' → MATCH (call updateExecutionTimeForEvent) "
+    "- Event: 'Major crypto exchange hack' + Tweet: 'Binance reports security breach' → MATCH (call updateExecutionTimeForEvent) "
+    "\n\n"
+    "DECISION CRITERIA: "
+    "- Be conservative but thorough in your analysis "
+    "- When in doubt about relevance, err on the side of caution and call the function "
+    "- Consider both direct mentions and implied relationships "
+    "- Look for news, announcements, discoveries, or revelations that match event themes "
+    "\n\n"
+    "ECONOMIC DATA RULE: "
+    "Economic events without country specification (inflation, CPI, unemployment, rates, GDP, trade data, etc.) default to USA. "
+    "Only match tweets that explicitly mention US/American economic data or USA specifically. "
+    "Reject tweets about other countries' economic data unless the event explicitly mentions that country. "
+    "Example if the tweet is about Jamaica indicators, and the event is related to Argentina indicators, it should NOT trigger the event. "
+    "Geographic matching is required - both event and tweet must reference the same country for non-US economic data. "
+    "\n\n"
+    "POTENTIALITY RULE: "
+    "DO NOT CALL updateExecutionTimeForEvent if the tweet describes potential events, future possibilities, or things that might happen. "
+    "Only call the function when the tweet clearly states that the event HAS ALREADY HAPPENED. "
+    "The tweet must confirm the event occurred, not that it's being considered or planned. "
+    "\n\n"
+)
+
+
+def create_event_trigger_agent(
+    tweet_id: Optional[str],
+    tweet_content: Optional[str],
+    username: Optional[str],
+    chat_id: str,
+    is_evaluation: bool,
+) -> AssistantAgent:
+    """Builds an agent with an empty message history, one per batch of events."""
+    return AssistantAgent(
+        name="event_trigger_agent",
+        system_message=(
+            "You are an expert AI agent specialized in analyzing tweets and determining if they are related to specific events. "
+            "Your primary function is to compare tweet content with event titles and descriptions to identify when events have occurred."
+            "\n\n"
+            "CRITICAL RESPONSIBILITY: "
+            "When you detect that a tweet's content indicates an event has happened, you MUST call the 'updateExecutionTimeForEvent' function "
+            "with the corresponding eventID to update the execution time, username, and tweetContent."
+            "ALWAYS call the function 'updateExecutionTimeForEvent when you find a match. Do NEVER skip this step because it's your main responsability."
+            "\n\n"
+            f"{EVENT_MATCHING_RULES}"
+            "FUNCTION CALL: "
+            "When you identify a match, immediately call 'updateExecutionTimeForEvent' with the eventID (not the title, the eventId)"
+            f"The parameter 'is_evaluation' should always be {is_evaluation}"
+            f"The tweet id is: {tweet_id}"
+            f"The chat id is: {chat_id}"
+            f"The tweet content is: {tweet_content} and the username is: {username}"
+            "Only one eventId per function call is allowed. Call the function one time for every matching event using its eventId."
+            "\n\n"
+            "IMPORTANT: Your decisions directly affect automated trading and wallet operations. "
+            "Be precise, thorough, and always err on the side of triggering events when there's reasonable doubt. "
+            "Missing a relevant tweet could mean missing critical trading opportunities. "
+        ),
+        model_client=gpt_4o_client,
+        reflect_on_tool_use=False,
+        tools=EVENT_TRIGGER_TOOLS,
+    )
+
+
+async def evaluate_event_batch(
+    semaphore: asyncio.Semaphore,
+    tweet: TweetData,
+    events_batch: list[EventData],
+    chat_id: str,
+    is_evaluation: bool,
+) -> Optional[str]:
+    """Runs one batch of events through its own agent, returns the error if it failed."""
+    tweet_content = tweet.get("text") or tweet.get("tweet_content")
+    updated_task = f"Analyze the following tweet: {tweet} and compare it against the following events: {events_batch}"
+    async with semaphore:
+        try:
+            event_trigger_agent = create_event_trigger_agent(
+                tweet.get("id", None),
+                tweet_content,
+                tweet.get("author", {}).get("username", None),
+                chat_id,
+                is_evaluation,
+            )
+            await event_trigger_agent.on_messages(
+                messages=[TextMessage(content=updated_task, source="user")],
+                cancellation_token=CancellationToken(),
+            )
+        except Exception as e:
+            print(
+                f"An error occurred processing task:{updated_task} \n Error:{str(e)}"
+            )
+            return str(e)
+    return None
+
+
+def evaluation_completed(result) -> bool:
+    """Whether a call_event_trigger_agent(_batch) result means every event was checked."""
+    return (
+        isinstance(result, str)
+        and result.startswith("I've completed the task")
+        and "could not be checked" not in result
+    )
+
+
 @tracer.start_as_current_span("event_trigger_agent")
 async def call_event_trigger_agent(
     tweet: TweetData,
@@ -119,6 +280,8 @@ async def call_event_trigger_agent(
     chat_id: str = "automated-event-trigger-agent-chat",
     use_frontend_quoting: bool = False,
     is_evaluation: bool = False,
+    prefilter: bool = True,
+    max_concurrency: int = EVENT_TRIGGER_MAX_CONCURRENCY,
 ) -> Annotated[str, "The result of processing the tweet and events."]:
     """
     Compares tweet content with a list of events and updates execution times for matching events.
@@ -132,6 +295,8 @@ async def call_event_trigger_agent(
         events (list[EventData]): List of events to compare against the tweet
         chat_id (str): The current chat id for tracking
         use_frontend_quoting (bool): Whether to use frontend quoting functionality
+        prefilter (bool): Whether to only send the events most similar to the tweet to the LLM
+        max_concurrency (int): How many batches of events are evaluated at the same time
 
     Returns:
         str: Response from the agent indicating the success or failure of processing
@@ -147,86 +312,183 @@ async def call_event_trigger_agent(
         }
     )
 
-    tweet_content = tweet.get("text", None)
-    username = tweet.get("author", {}).get("username", None)
-    tweet_id = tweet.get("id", None)
+    tweet_content = tweet.get("text") or tweet.get("tweet_content")
 
-    event_trigger_agent = AssistantAgent(
-        name="event_trigger_agent",
+    pending_events = len(events)
+    if prefilter and tweet_content and events:
+        try:
+            events = await event_prefilter.candidates(tweet_content, events)
+        except Exception as e:
+            # Without embeddings every pending event goes to the LLM, like before
+            print(f"Error pre-filtering events, checking all of them: {e}")
+    set_attributes(
+        {
+            "pending_events": pending_events,
+            "candidate_events": len(events),
+        }
+    )
+
+    try:
+        # The events are processed in batches of 5, each batch by its own agent so the
+        # prompts don't grow with the previous batches, and the batches run concurrently.
+        batch_size = 5
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        batches = [events[i : i + batch_size] for i in range(0, len(events), batch_size)]
+        errors = await asyncio.gather(
+            *(
+                evaluate_event_batch(
+                    semaphore, tweet, events_batch, chat_id, is_evaluation
+                )
+                for events_batch in batches
+            )
+        )
+    except Exception as e:
+        set_status_error(e)
+        return f"An error occurred: {str(e)}"
+
+    # A failed batch doesn't stop the others, like in the sequential loop before
+    failed = [error for error in errors if error is not None]
+    set_attributes(
+        {"event_batches": len(batches), "failed_event_batches": len(failed)}
+    )
+    set_status_ok()
+    if failed:
+        return (
+            f"I've completed the task. {len(failed)} of {len(batches)} event batches "
+            f"could not be checked: {'; '.join(failed)}"
+        )
+    return f"I've completed the task. All the events were checked"
+
+
+@tracer.start_as_current_span("event_trigger_agent_batch")
+async def call_event_trigger_agent_batch(
+    tweets: list[TweetData],
+    events: list[EventData],
+    chat_id: str = "automated-event-trigger-agent-chat",
+    is_evaluation: bool = False,
+    prefilter: bool = True,
+) -> Annotated[str, "The result of processing the tweets and events."]:
+    """
+    Compares several tweets with the pending events in a single structured LLM call.
+
+    Each tweet is paired with its own candidate events (see event_prefilter), the model
+    returns the (tweetId, eventId) pairs that match and every matched event is triggered
+    once, by the first tweet that matched it, through updateExecutionTimeForEvent.
+
+    Args:
+        tweets (list[TweetData]): The tweets collected during the micro-batching window
+        events (list[EventData]): List of events to compare against the tweets
+        chat_id (str): The current chat id for tracking
+        is_evaluation (bool): Whether it's an Eval of the agent or a real run
+        prefilter (bool): Whether to only send the events most similar to each tweet to the LLM
+
+    Returns:
+        str: Response indicating the success or failure of processing
+    """
+    if not is_evaluation:
+        analytics.increment_agent_used("event_trigger_agent", chat_id)
+    set_attributes(
+        {
+            "chat_id": chat_id,
+            "task": "compare events with a batch of tweets",
+            "tweets": len(tweets),
+            "pending_events": len(events),
+        }
+    )
+
+    tweet_contents = {}
+    for tweet in tweets:
+        tweet_content = tweet.get("text") or tweet.get("tweet_content")
+        if tweet_content and tweet.get("id") is not None:
+            tweet_contents[str(tweet["id"])] = (tweet, tweet_content)
+
+    events_per_tweet = [events] * len(tweet_contents)
+    if prefilter and tweet_contents:
+        try:
+            # Every tweet of the batch is embedded in one request
+            events_per_tweet = await event_prefilter.candidates_many(
+                [tweet_content for _, tweet_content in tweet_contents.values()], events
+            )
+        except Exception as e:
+            print(f"Error pre-filtering events, checking all of them: {e}")
+
+    tweets_by_id = {}
+    candidates = {}
+    for (tweet_id, (tweet, _)), tweet_events in zip(tweet_contents.items(), events_per_tweet):
+        if tweet_events:
+            tweets_by_id[tweet_id] = tweet
+            candidates[tweet_id] = tweet_events
+
+    set_attributes(
+        {
+            "candidate_pairs": sum(len(tweet_events) for tweet_events in candidates.values()),
+        }
+    )
+    if not candidates:
+        set_status_ok()
+        return "I've completed the task. No events to check"
+
+    events_by_id = {
+        event["eventId"]: event
+        for tweet_events in candidates.values()
+        for event in tweet_events
+    }
+    candidate_ids = {
+        tweet_id: [event["eventId"] for event in tweet_events]
+        for tweet_id, tweet_events in candidates.items()
+    }
+    task = (
+        f"Analyze the following tweets: {list(tweets_by_id.values())}\n\n"
+        f"Compare them against these events: {list(events_by_id.values())}\n\n"
+        f"Only compare each tweet with its candidate events (tweet id -> event ids): {candidate_ids}"
+    )
+    evaluator = AssistantAgent(
+        name="event_trigger_batch_agent",
+        model_client=tweet_batch_client,
         system_message=(
             "You are an expert AI agent specialized in analyzing tweets and determining if they are related to specific events. "
-            "Your primary function is to compare tweet content with event titles and descriptions to identify when events have occurred."
-            "\n\n"
-            "CRITICAL RESPONSIBILITY: "
-            "When you detect that a tweet's content indicates an event has happened, you MUST call the 'updateExecutionTimeForEvent' function "
-            "with the corresponding eventID to update the execution time, username, and tweetContent."
-            "ALWAYS call the function 'updateExecutionTimeForEvent when you find a match. Do NEVER skip this step because it's your main responsability."
-            "\n\n"
-            "ANALYSIS PROCESS: "
-            "1. Carefully read the tweet content and analyze its meaning "
-            "2. Compare it against each event's title and description "
-            "3. Look for semantic relationships, not just exact word matches "
-            "4. Consider synonyms, related concepts, and contextual relevance "
-            "\n\n"
-            "EXAMPLE SCENARIOS: "
-            "- Event: 'BTC Creator is discovered' + Tweet: 'Satoshi Nakamoto was found. He is John Peter Doe.' → MATCH (call updateExecutionTimeForEvent) "
-            "- Event: 'Ethereum Foundation disappear' + Tweet: 'Vitalik Buterin announces EF shutdown' → MATCH (call updateExecutionTimeForEvent) "
-            "- Event: 'Major crypto exchange hack' + Tweet: 'Binance reports security breach' → MATCH (call updateExecutionTimeForEvent) "
+            "You receive several tweets at once, each with its own candidate events, and decide which tweets show that an event has happened."
             "\n\n"
-            "DECISION CRITERIA: "
-            "- Be conservative but thorough in your analysis "
-            "- When in doubt about relevance, err on the side of caution and call the function "
-            "- Consider both direct mentions and implied relationships "
-            "- Look for news, announcements, discoveries, or revelations that match event themes "
-            "\n\n"
-            "ECONOMIC DATA RULE: "
-            "Economic events without country specification (inflation, CPI, unemployment, rates, GDP, trade data, etc.) default to USA. "
-            "Only match tweets that explicitly mention US/American economic data or USA specifically. "
-            "Reject tweets about other countries' economic data unless the event explicitly mentions that country. "
-            "Example if the tweet is about Jamaica indicators, and the event is related to Argentina indicators, it should NOT trigger the event. "
-            "Geographic matching is required - both event and tweet must reference the same country for non-US economic data. "
-            "\n\n"
-            "POTENTIALITY RULE: "
-            "DO NOT CALL updateExecutionTimeForEvent if the tweet describes potential events, future possibilities, or things that might happen. "
-            "Only call the function when the tweet clearly states that the event HAS ALREADY HAPPENED. "
-            "The tweet must confirm the event occurred, not that it's being considered or planned. "
-            "\n\n"
-            "FUNCTION CALL: "
-            "When you identify a match, immediately call 'updateExecutionTimeForEvent' with the eventID (not the title, the eventId)"
-            f"The parameter 'is_evaluation' should always be {is_evaluation}"
-            f"The tweet id is: {tweet_id}"
-            f"The chat id is: {chat_id}"
-            f"The tweet content is: {tweet_content} and the username is: {username}"
-            "Only one eventId per function call is allowed. Call the function one time for every matching event using its eventId."
+            f"{EVENT_MATCHING_RULES}"
+            "OUTPUT: "
+            "Wherever the rules above say to call updateExecutionTimeForEvent, add the pair to 'matches' instead. "
+            "Return one entry with the tweetId and the eventId (not the title, the eventId) for every tweet that triggers one of its candidate events. "
+            "Return an empty 'matches' array when no tweet triggers any event."
             "\n\n"
             "IMPORTANT: Your decisions directly affect automated trading and wallet operations. "
             "Be precise, thorough, and always err on the side of triggering events when there's reasonable doubt. "
-            "Missing a relevant tweet could mean missing critical trading opportunities. "
         ),
-        model_client=gpt_4o_client,
-        reflect_on_tool_use=False,
-        tools=[updateExecutionTimeForEvent],
     )
 
     try:
-        # We'll process the events in batches of 5, running the analysis for each batch.
-        batch_size = 5
-        for i in range(0, len(events), batch_size):
-            try:
-                events_batch = events[i : i + batch_size]
-                updated_task = f"Analyze the following tweet: {tweet} and compare it against the following events: {events_batch}"
-
-                await event_trigger_agent.on_messages(
-                    messages=[TextMessage(content=updated_task, source="user")],
-                    cancellation_token=CancellationToken(),
-                )
-            except Exception as e:
-                print(
-                    f"An error occurred processing task:{updated_task} \n Error:{str(e)}"
-                )
+        result = await evaluator.on_messages(
+            messages=[TextMessage(content=task, source="user")],
+            cancellation_token=CancellationToken(),
+        )
+        matches = TweetBatchMatches(**json.loads(result.chat_message.content)).matches
     except Exception as e:
+        print(f"An error occurred evaluating {len(candidates)} tweets: {str(e)}")
         set_status_error(e)
         return f"An error occurred: {str(e)}"
 
+    triggered = set()
+    for match in matches:
+        if (
+            match.eventId not in candidate_ids.get(match.tweetId, [])
+            or match.eventId in triggered
+        ):
+            continue
+        tweet = tweets_by_id[match.tweetId]
+        updateExecutionTimeForEvent(
+            eventId=match.eventId,
+            tweetContent=tweet.get("text") or tweet.get("tweet_content"),
+            username=tweet.get("author", {}).get("username", None),
+            tweetId=match.tweetId,
+            is_evaluation=is_evaluation,
+            chat_id=chat_id,
+        )
+        triggered.add(match.eventId)
+
+    set_attributes({"triggered_events": len(triggered)})
     set_status_ok()
-    return f"I've completed the task. All the events were checked"
+    return f"I've completed the task. {len(tweets_by_id)} tweets were checked and {len(triggered)} events were triggered"
@@ -0,0 +1,143 @@
+import hashlib
+import re
+import threading
+import time
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Tweets whose 64-bit SimHash differ in at most this many bits are the same tweet. Short texts
+# that only differ in one word (another exchange, another country) are ~10 bits apart, so this
+# stays low and only catches copies: retweets, added links, mentions, hashtags or emojis
+MAX_HAMMING_DISTANCE = 3
+# Processed tweets remembered per instance
+DEDUP_WINDOW_SECONDS = 3600
+DEDUP_MAX_TWEETS = 5000
+
+_RETWEET_PREFIX = re.compile(r"^rt @\w+:?\s*")
+_URL = re.compile(r"https?://\S+")
+_MENTION = re.compile(r"@\w+")
+_NON_WORD = re.compile(r"[^\w$%.]+|(?<!\d)\.|\.(?!\d)")
+
+
+def normalize_tweet_text(text: str) -> str:
+    """Lowercased tweet without retweet prefix, links, mentions, hashtag signs and punctuation."""
+    text = _RETWEET_PREFIX.sub("", text.lower().strip())
+    text = _MENTION.sub(" ", _URL.sub(" ", text))
+    return " ".join(_NON_WORD.sub(" ", text.replace("#", " ")).split())
+
+
+def _features(text: str) -> list[str]:
+    words = normalize_tweet_text(text).split()
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of the words and word pairs of the normalized tweet."""
+    return _simhash(_features(text))
+
+
+def _simhash(features: list[str]) -> int:
+    if not features:
+        return 0
+    digests = b"".join(
+        hashlib.blake2b(feature.encode(), digest_size=8).digest() for feature in features
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(len(features), 64)
+    # Each bit of the fingerprint is the majority vote of the features
+    fingerprint = np.packbits(bits.sum(axis=0) * 2 > len(features))
+    return int.from_bytes(fingerprint.tobytes(), "big")
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(values)
+    return np.unpackbits(values.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+class TweetDeduplicator:
+    """
+    Rolling window of the SimHash fingerprints of recently processed tweets.
+
+    `check` returns the id of an earlier tweet of the window that is a near-duplicate
+    (a retweet or a copy of the same headline), otherwise it records the tweet and returns
+    None. Only the first tweet of a story is recorded, so its copies keep being compared
+    against it until it leaves the window. With `record=False` the tweet is only compared,
+    callers `record` it once it was evaluated so a failed evaluation is not suppressed.
+    Tweets without words (only links or mentions) are never deduplicated nor recorded.
+
+    A tweet only stands for its copies against the events it was evaluated with, `track_events`
+    clears the window when the pending events change.
+
+    The fingerprints live in a fixed-size ring buffer, so comparing a tweet with the whole
+    window is a single XOR and popcount over one array.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = MAX_HAMMING_DISTANCE,
+        window_seconds: float = DEDUP_WINDOW_SECONDS,
+        max_tweets: int = DEDUP_MAX_TWEETS,
+    ):
+        self.max_distance = max_distance
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._fingerprints = np.zeros(max_tweets, dtype=np.uint64)
+        self._processed_at = np.zeros(max_tweets, dtype=np.float64)
+        self._valid = np.zeros(max_tweets, dtype=bool)
+        self._tweet_ids: list[Optional[str]] = [None] * max_tweets
+        self._next = 0
+        self._event_ids: Optional[frozenset] = None
+        self.checked = 0
+        self.suppressed = 0
+
+    def track_events(self, event_ids: Iterable[str]):
+        """Forgets every tweet when the pending events differ from the last ones tracked."""
+        event_ids = frozenset(event_ids)
+        with self._lock:
+            if self._event_ids is not None and event_ids != self._event_ids:
+                self._valid[:] = False
+            self._event_ids = event_ids
+
+    def record(self, tweet_id: str, text: str):
+        features = _features(text)
+        if not features:
+            return
+        fingerprint = np.uint64(_simhash(features))
+        with self._lock:
+            self._record(tweet_id, fingerprint, time.monotonic())
+
+    def _record(self, tweet_id: str, fingerprint: np.uint64, now: float):
+        # The oldest slot is overwritten once the window is full
+        self._fingerprints[self._next] = fingerprint
+        self._processed_at[self._next] = now
+        self._valid[self._next] = True
+        self._tweet_ids[self._next] = tweet_id
+        self._next = (self._next + 1) % len(self._tweet_ids)
+
+    def check(self, tweet_id: str, text: str, record: bool = True) -> Optional[str]:
+        features = _features(text)
+        if not features:
+            # Only links or mentions, every such tweet would share the empty fingerprint
+            return None
+        fingerprint = np.uint64(_simhash(features))
+        with self._lock:
+            now = time.monotonic()
+            self._valid &= self._processed_at >= now - self.window_seconds
+            self.checked += 1
+            distances = _popcount(np.bitwise_xor(self._fingerprints, fingerprint))
+            distances[~self._valid] = 64 + 1
+            closest = int(np.argmin(distances))
+            if distances[closest] <= self.max_distance:
+                self.suppressed += 1
+                return self._tweet_ids[closest]
+            if record:
+                self._record(tweet_id, fingerprint, now)
+            return None
+
+    def __len__(self) -> int:
+        return int(self._valid.sum())
+
+
+# Shared by every tweet handled by the instance
+tweet_deduplicator = TweetDeduplicator()
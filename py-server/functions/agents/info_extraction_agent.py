@@ -27,50 +27,69 @@ class ExtractedInformation(BaseModel):
         extra = "forbid"
 
 
+class IndexedExtractedInformation(BaseModel):
+    index: int
+    items: List[ExtractedItem]
+    reasoning: Optional[str] = None
+
+    class Config:
+        extra = "forbid"
+
+
+class BatchExtractedInformation(BaseModel):
+    results: List[IndexedExtractedInformation]
+
+    class Config:
+        extra = "forbid"
+
+
 llm_with_structured_output = OpenAIChatCompletionClient(
     model="gpt-4o",
     api_key=OPENAI_API_KEY,
     response_format=ExtractedInformation,
 )
 
+llm_with_batch_structured_output = OpenAIChatCompletionClient(
+    model="gpt-4o",
+    api_key=OPENAI_API_KEY,
+    response_format=BatchExtractedInformation,
+)
 
-async def extract_information_agent(text: str) -> ExtractedInformation:
-    """
-    Extracts structured information from text using the LLM agent.
-    Args:
-        text (str): The text to extract information from
-    Returns:
-        ExtractedInformation: Structured information extracted from the text
-    """
+
+INFO_EXTRACTION_SYSTEM_MESSAGE = (
+    "You are an expert at extracting structured information from user messages for a blockchain application. "
+    "Your task is to identify and categorize information from the user's input into two types:\n\n"
+    "1. USER_PREFERENCE: User's preferences, habits, or stated behaviors about blockchain/crypto operations.\n"
+    "   Examples:\n"
+    "   - 'I only swap on Solana'\n"
+    "   - 'I prefer staking mSOL'\n"
+    "   - 'I like trading meme coins'\n"
+    "   - 'I'm a conservative trader'\n\n"
+    "2. INTERACTION: Specific actions, queries, or operations the user is performing or asking about.\n"
+    "   Examples:\n"
+    "   - 'Swap 1 USDC for SOL'\n"
+    "   - 'How is the market today?'\n"
+    "   - 'Bridge 100 USDC to Base'\n"
+    "   - 'What's the price of BTC?'\n\n"
+    "IMPORTANT RULES:\n"
+    "1. Each piece of information should be categorized as either a USER_PREFERENCE or INTERACTION.\n"
+    "2. For USER_PREFERENCE, focus on statements that indicate user habits, preferences, or general behaviors.\n"
+    "3. For INTERACTION, focus on specific actions, queries, or operations.\n"
+    "4. If a message contains both types, extract them separately.\n"
+    "5. If no relevant information is found, return an empty items array.\n"
+    "6. Keep the content as close to the original text as possible while maintaining clarity.\n\n"
+    "Respond with a structured JSON object containing:\n"
+    "- items: array of objects with 'content' and 'type' fields\n"
+    "- reasoning: optional explanation for ambiguous cases"
+)
+
+
+async def _extract_information(text: str) -> ExtractedInformation:
+    """extract_information_agent without the error handling, raises when the call fails."""
     info_extractor = AssistantAgent(
         name="info_extractor",
         model_client=llm_with_structured_output,
-        system_message=(
-            "You are an expert at extracting structured information from user messages for a blockchain application. "
-            "Your task is to identify and categorize information from the user's input into two types:\n\n"
-            "1. USER_PREFERENCE: User's preferences, habits, or stated behaviors about blockchain/crypto operations.\n"
-            "   Examples:\n"
-            "   - 'I only swap on Solana'\n"
-            "   - 'I prefer staking mSOL'\n"
-            "   - 'I like trading meme coins'\n"
-            "   - 'I'm a conservative trader'\n\n"
-            "2. INTERACTION: Specific actions, queries, or operations the user is performing or asking about.\n"
-            "   Examples:\n"
-            "   - 'Swap 1 USDC for SOL'\n"
-            "   - 'How is the market today?'\n"
-            "   - 'Bridge 100 USDC to Base'\n"
-            "   - 'What's the price of BTC?'\n\n"
-            "IMPORTANT RULES:\n"
-            "1. Each piece of information should be categorized as either a USER_PREFERENCE or INTERACTION.\n"
-            "2. For USER_PREFERENCE, focus on statements that indicate user habits, preferences, or general behaviors.\n"
-            "3. For INTERACTION, focus on specific actions, queries, or operations.\n"
-            "4. If a message contains both types, extract them separately.\n"
-            "5. If no relevant information is found, return an empty items array.\n"
-            "6. Keep the content as close to the original text as possible while maintaining clarity.\n\n"
-            "Respond with a structured JSON object containing:\n"
-            "- items: array of objects with 'content' and 'type' fields\n"
-            "- reasoning: optional explanation for ambiguous cases"
-        ),
+        system_message=INFO_EXTRACTION_SYSTEM_MESSAGE,
     )
 
     prompt = f"""
@@ -90,26 +109,85 @@ async def extract_information_agent(text: str) -> ExtractedInformation:
     - reasoning: optional explanation for ambiguous cases
     """
 
-    try:
-        chat_result = await info_extractor.on_messages(
-            messages=[TextMessage(content=prompt, source="user")],
-            cancellation_token=CancellationToken(),
-        )
+    chat_result = await info_extractor.on_messages(
+        messages=[TextMessage(content=prompt, source="user")],
+        cancellation_token=CancellationToken(),
+    )
+
+    result_message = chat_result.chat_message.content
+    response_dict = json.loads(result_message)
 
-        result_message = chat_result.chat_message.content
-        response_dict = json.loads(result_message)
+    # Ensure items array is present, even if empty
+    default_response = {
+        "items": [],
+        "reasoning": response_dict.get("reasoning", None),
+    }
 
-        # Ensure items array is present, even if empty
-        default_response = {
-            "items": [],
-            "reasoning": response_dict.get("reasoning", None),
-        }
+    default_response.update(response_dict)
+    return ExtractedInformation(**default_response)
 
-        default_response.update(response_dict)
-        return ExtractedInformation(**default_response)
 
+async def extract_information_agent(text: str) -> ExtractedInformation:
+    """
+    Extracts structured information from text using the LLM agent.
+    Args:
+        text (str): The text to extract information from
+    Returns:
+        ExtractedInformation: Structured information extracted from the text
+    """
+    try:
+        return await _extract_information(text)
     except Exception as e:
         return ExtractedInformation(
             items=[],
             reasoning=f"Extraction failed due to error: {str(e)}",
         )
+
+
+async def extract_information_batch(texts: List[str]) -> List[ExtractedInformation]:
+    """
+    Extracts structured information from several messages of the same user in a single call.
+    Args:
+        texts (List[str]): The messages to extract information from
+    Returns:
+        List[ExtractedInformation]: One result per message, in the same order, empty for a
+        message the response has no result for
+    Raises:
+        Exception: When the call fails, so the caller can retry the messages
+    """
+    if len(texts) <= 1:
+        return [await _extract_information(text) for text in texts]
+
+    info_extractor = AssistantAgent(
+        name="info_extractor",
+        model_client=llm_with_batch_structured_output,
+        system_message=(
+            f"{INFO_EXTRACTION_SYSTEM_MESSAGE}\n\n"
+            "You receive several numbered messages at once. Extract the information of each message "
+            "on its own and return one entry in 'results' per message, with the message number as 'index'."
+        ),
+    )
+    messages = "\n\n".join(f"Message {index}:\n{text}" for index, text in enumerate(texts))
+    prompt = f"""
+    Extract structured information from each of the following messages:
+
+    {messages}
+
+    Respond with a structured JSON object containing:
+    - results: array with one object per message, with 'index', 'items' and an optional 'reasoning'
+    """
+
+    chat_result = await info_extractor.on_messages(
+        messages=[TextMessage(content=prompt, source="user")],
+        cancellation_token=CancellationToken(),
+    )
+    response = BatchExtractedInformation(**json.loads(chat_result.chat_message.content))
+    # Indexes outside of the messages are ignored
+    extracted = {
+        result.index: ExtractedInformation(items=result.items, reasoning=result.reasoning)
+        for result in response.results
+    }
+    return [
+        extracted.get(index, ExtractedInformation(items=[], reasoning=None))
+        for index in range(len(texts))
+    ]
@@ -9,6 +9,15 @@ from services.tracing import set_status_ok, set_status_error, tracer, set_attrib
 from agents.liquidation_agent.liquidation_functions import (
     liquidate_all_assets,
 )
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+LIQUIDATION_AGENT_TOOLS = agent_tools(
+    [
+        liquidate_all_assets,
+    ]
+)
 
 
 @tracer.start_as_current_span("liquidation_agent")
@@ -49,9 +58,7 @@ async def call_liquidation_agent(
             ),
             model_client=gpt_4o_client,
             reflect_on_tool_use=False,
-            tools=[
-                liquidate_all_assets,
-            ],
+            tools=LIQUIDATION_AGENT_TOOLS,
         )
 
         updated_task = (
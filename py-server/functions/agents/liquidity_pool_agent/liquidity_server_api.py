@@ -1,4 +1,5 @@
 import requests
+from services.http_client import http_session
 from typing import Annotated, List, Dict, Union
 from config import FIREBASE_SERVER_ENDPOINT
 from utils.firebase import get_request_ctx
@@ -12,7 +13,7 @@ def get_token_b_needed_amount(
     token_a_address: Annotated[str, "Address of the token A"],
 ):
     url = f"{BASE_URL}/liquidity-pool/token-b-needed-amount?poolAddress={pool_address}&amount={token_a_amount}&tokenAAddress={token_a_address}"
-    response = requests.get(url=url)
+    response = http_session.get(url=url)
     response.raise_for_status()
     return response.json()
 
@@ -22,7 +23,7 @@ def get_user_positions_in_pool_address(
     wallet_address: Annotated[str, "User's Solana Wallet Address"],
 ):
     url = f"{BASE_URL}/liquidity-pool/positions?poolAddress={pool_address}&walletAddress={wallet_address}"
-    response = requests.get(url=url)
+    response = http_session.get(url=url)
     response.raise_for_status()
     return response.json()
 
@@ -56,7 +57,7 @@ def add_liquidity(
 ):
     try:
         url = f"{BASE_URL}/liquidity-pool/add"
-        response = requests.post(
+        response = http_session.post(
             url=url,
             json={
                 "userId": get_request_ctx(chat_id, "user_id") or "",
@@ -105,7 +106,7 @@ def remove_liquidity(
     ] = 100,
 ):
     url = f"{BASE_URL}/liquidity-pool/remove"
-    response = requests.post(
+    response = http_session.post(
         url=url,
         json={
             "poolAddress": pool_address,
@@ -126,7 +127,7 @@ def claim_swap_fees(
 ):
     url = f"{BASE_URL}/liquidity-pool/claim-swap-fee"
     try:
-        response = requests.post(
+        response = http_session.post(
             url=url,
             json={
                 "userId": get_request_ctx(chat_id, "user_id") or "",
@@ -153,7 +154,7 @@ def search_pools_with_user_liquidity(
     ] = False,
 ):
     url = f"{BASE_URL}/liquidity-pool/search-pools-with-user-liquidity"
-    response = requests.post(
+    response = http_session.post(
         url=url,
         json={
             "walletAddress": wallet_address,
@@ -16,6 +16,23 @@ from agents.liquidity_pool_agent.lp_specialist_functions import (
     build_claim_swap_fees_tx,
 )
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+LP_AGENT_TOOLS = agent_tools(
+    [
+        display_user_positions_for_pool_term,
+        search_for_pool,
+        deposit_liquidity,
+        get_user_positions_for_pool_term,
+        get_all_active_positions_on_meteora,
+        withdraw_liquidity,
+        relocate_user_liquidity_to_highest_apy_pool,
+        build_claim_swap_fees_tx,
+        claim_fees_and_reinvest,
+    ]
+)
 
 
 @tracer.start_as_current_span("lp_agent")
@@ -63,17 +80,7 @@ async def call_lp_agent(
         ),
         model_client=gpt_4o_client,
         reflect_on_tool_use=False,
-        tools=[
-            display_user_positions_for_pool_term,
-            search_for_pool,
-            deposit_liquidity,
-            get_user_positions_for_pool_term,
-            get_all_active_positions_on_meteora,
-            withdraw_liquidity,
-            relocate_user_liquidity_to_highest_apy_pool,
-            build_claim_swap_fees_tx,
-            claim_fees_and_reinvest,
-        ],
+        tools=LP_AGENT_TOOLS,
     )
 
     solana_wallet_address = get_request_ctx(chat_id, "solana_wallet_address")
@@ -38,6 +38,17 @@ def get_token_price(token_address: str) -> float:
     return price
 
 
+def get_token_prices(token_addresses: List[str]) -> Dict[str, float]:
+    """Gets the prices of many Solana tokens at once, fetching each distinct token only once."""
+    token_price_responses = prices_service.get_token_prices_from_provider(
+        "SOLANA", token_addresses, PriceProviderType.JUPITER
+    )
+    return {
+        address: float(response["price"])
+        for address, response in token_price_responses.items()
+    }
+
+
 def search_for_pool(
     chat_id: Annotated[str, "The current chat id"],
     search_term: Annotated[
@@ -1482,17 +1493,29 @@ def get_all_active_positions_on_meteora(
         thought="Calculating position values...",
     )
 
+    # Resolve token info once per distinct mint, then price all of them in a single batch
+    token_infos = {}
+    for pos in positions:
+        for token_address in (pos["tokenXAddress"], pos["tokenYAddress"]):
+            if token_address not in token_infos:
+                token_infos[token_address] = get_jupiter_token_by_address(
+                    token_address=token_address
+                )
+    token_prices = get_token_prices(
+        [token_info["address"] for token_info in token_infos.values()]
+    )
+
     # Process all positions at once
     for pos in positions:
         # Get token info for each position using mintX and mintY
-        token_a_info = get_jupiter_token_by_address(token_address=pos["tokenXAddress"])
-        token_b_info = get_jupiter_token_by_address(token_address=pos["tokenYAddress"])
+        token_a_info = token_infos[pos["tokenXAddress"]]
+        token_b_info = token_infos[pos["tokenYAddress"]]
 
         # Pre-calculate conversion factors
         x_decimal_factor = 10 ** token_a_info["decimals"]
         y_decimal_factor = 10 ** token_b_info["decimals"]
-        x_price = get_token_price(token_a_info["address"])
-        y_price = get_token_price(token_b_info["address"])
+        x_price = token_prices[token_a_info["address"]]
+        y_price = token_prices[token_b_info["address"]]
 
         x_amount = int(float(pos["tokenXAmount"])) / x_decimal_factor
         y_amount = int(float(pos["tokenYAmount"])) / y_decimal_factor
@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from typing import Annotated, Dict, List, Union, Any, Optional
 
 BASE_URL = "https://dlmm-api.meteora.ag"
@@ -49,7 +49,7 @@ def get_all_pairs_by_groups(page: Optional[int] = 0,
     }
     params = {k: v for k, v in params.items() if v is not None}
     
-    response = requests.get(f"{BASE_URL}/pair/all_by_groups", params=params)
+    response = http_session.get(f"{BASE_URL}/pair/all_by_groups", params=params)
     response.raise_for_status()
     return response.json()
 
@@ -61,7 +61,7 @@ def get_pair(pair_address: Annotated[str, 'Address of the liquidity pair']) -> A
     :param pair_address: Address of the liquidity pair.
     :returns: Information about the liquidity pair.
     """
-    response = requests.get(f"{BASE_URL}/pair/{pair_address}")
+    response = http_session.get(f"{BASE_URL}/pair/{pair_address}")
     response.raise_for_status()
     return response.json()
 
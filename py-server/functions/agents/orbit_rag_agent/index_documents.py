@@ -1,7 +1,6 @@
 import os
 import sys
-import re
-from typing import List
+from typing import Any, Dict, List
 from firebase_admin import firestore
 from google.cloud.firestore_v1.vector import Vector
 
@@ -10,107 +9,173 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 functions_dir = os.path.abspath(os.path.join(current_dir, "..", ".."))
 sys.path.append(functions_dir)
 
-from services.llm import create_embedding
-
-def get_category(filepath: str) -> str:
-    """Categorize file based on its path."""
-    filename = os.path.basename(filepath).lower()
-    if "token" in filename:
-        return "token"
-    if "company" in filename:
-        return "company"
-    if "roadmap" in filename:
-        return "roadmap"
-    if "tokenomics" in filename:
-        return "tokenomics"
-    if "orbit" in filename:
-        return "orbit"
-    if "protocol" in filename or "network" in filename or "supported" in filename:
-        return "networks"
-    return "other"
-
-def read_file(path: str) -> str:
-    """Read file content as text."""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
-    except Exception as e:
-        raise
-
-def _split_text(text: str, chunk_size: int = 200) -> List[str]:
-    """Split plain text into fixed-size chunks."""
-    text = re.sub(r"\s+", " ", text).strip()  # Normalize whitespace
-    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
-
-async def index_documents(sources: List[str], collection_name: str = "orbit_docs") -> int:
+from services.llm import create_embeddings, EMBEDDING_MODEL
+from agents.orbit_rag_agent.local_index import (
+    LOCAL_INDEX_PATH,
+    OrbitLocalIndex,
+    chunk_documents,
+    chunk_id,
+    doc_sources,
+    docs_fingerprint,
+    plan_reindex,
+)
+
+# Firestore takes at most 500 writes per batch
+MAX_BATCH_WRITES = 500
+
+def print_report(
+    plan: Dict[str, List[str]],
+    chunks: Dict[str, Dict[str, Any]],
+    existing: Dict[str, Dict[str, Any]],
+    dry_run: bool,
+):
+    """Chunks added, kept and removed, in total and per document."""
+    per_source: Dict[str, Dict[str, int]] = {}
+    for action in ("added", "kept", "removed"):
+        for key in plan[action]:
+            metadata = (chunks.get(key) or existing.get(key) or {}).get("metadata") or {}
+            counts = per_source.setdefault(metadata.get("source", "unknown"), {})
+            counts[action] = counts.get(action, 0) + 1
+
+    print(
+        f"{'[dry run] ' if dry_run else ''}{len(plan['added'])} chunks added, "
+        f"{len(plan['kept'])} kept ({len(plan['moved'])} moved), {len(plan['removed'])} removed"
+    )
+    for source, counts in sorted(per_source.items()):
+        print(
+            f"  {source}: +{counts.get('added', 0)} "
+            f"={counts.get('kept', 0)} -{counts.get('removed', 0)}"
+        )
+
+def check_sources(sources: List[str]):
+    """Fails before any work when a document is missing, its chunks would be deleted otherwise."""
+    missing = [source for source in sources if not os.path.exists(source)]
+    if missing:
+        raise FileNotFoundError(f"Missing Orbit docs: {', '.join(missing)}")
+
+async def index_documents(
+    sources: List[str], collection_name: str = "orbit_docs", dry_run: bool = False
+) -> Dict[str, int]:
     """
-    Index multiple documents into Firestore with vector embeddings in chunks.
+    Incrementally index the documents into Firestore with vector embeddings in chunks.
+    Chunks are stored under an id derived from their text, so unchanged chunks are kept as
+    they are, new or changed ones are embedded together in one request and the chunks that
+    are no longer in the documents are deleted.
     """
+    check_sources(sources)
     db = firestore.client()
     collection = db.collection(collection_name)
-    total_chunks = 0
-    batch = db.batch()
-    batch_count = 0
-
-    for source in sources:
-        try:
-            if not os.path.exists(source):
-                continue
-
-            content = read_file(source)
-            category = get_category(source)
-            chunks = _split_text(content, chunk_size=200)
-
-            for i, chunk in enumerate(chunks):
-                embedding = await create_embedding(chunk)
-                doc_data = {
-                    "content": chunk,
-                    "metadata": {
-                        "source": os.path.basename(source),
-                        "category": category,
-                        "chunk_index": i,
-                    },
-                    "embedding_field": Vector(embedding),
-                    "timestamp": firestore.SERVER_TIMESTAMP,
-                }
-
-                doc_ref = collection.document()
-                batch.set(doc_ref, doc_data)
-                batch_count += 1
-                total_chunks += 1
-
-                if batch_count >= 500:
-                    batch.commit()
-                    batch = db.batch()
-                    batch_count = 0
-
-        except Exception as e:
-            print(f"Error indexing {source}: {e}")
-            continue
-
-    if batch_count > 0:
+
+    chunks = chunk_documents(sources, EMBEDDING_MODEL)
+    existing = {
+        doc.id: doc.to_dict() or {}
+        for doc in collection.select(["metadata"]).stream()
+    }
+    plan = plan_reindex(chunks, existing)
+    print_report(plan, chunks, existing, dry_run)
+    if dry_run:
+        return {action: len(ids) for action, ids in plan.items()}
+
+    # Every new or changed chunk in one embeddings request
+    texts = [chunks[key]["content"] for key in plan["added"]]
+    embeddings = await create_embeddings(texts) if texts else []
+
+    writes = [
+        (
+            collection.document(key),
+            {
+                **chunks[key],
+                "embedding_field": Vector(embedding),
+                "timestamp": firestore.SERVER_TIMESTAMP,
+            },
+        )
+        for key, embedding in zip(plan["added"], embeddings)
+    ]
+    # Same text at another position, only the metadata changes
+    writes += [
+        (collection.document(key), {"metadata": chunks[key]["metadata"]})
+        for key in plan["moved"]
+    ]
+    writes += [(collection.document(key), None) for key in plan["removed"]]
+
+    for start in range(0, len(writes), MAX_BATCH_WRITES):
+        batch = db.batch()
+        for doc_ref, data in writes[start:start + MAX_BATCH_WRITES]:
+            if data is None:
+                batch.delete(doc_ref)
+            else:
+                batch.set(doc_ref, data, merge=True)
         batch.commit()
 
-    return total_chunks
+    return {action: len(ids) for action, ids in plan.items()}
 
-async def main():
+async def build_local_index(
+    sources: List[str], path: str = LOCAL_INDEX_PATH, dry_run: bool = False
+) -> Dict[str, int]:
+    """
+    Save the chunks of the documents as the packaged index OrbitDocumentSearcher searches in
+    process. The embeddings of the chunks already in the previous file are reused, only new
+    or changed chunks are embedded.
+    """
+    check_sources(sources)
+    chunks = chunk_documents(sources, EMBEDDING_MODEL)
+    existing: Dict[str, Dict[str, Any]] = {}
+    previous_embeddings = {}
+    if os.path.exists(path):
+        previous = OrbitLocalIndex.load(path)
+        if previous.model == EMBEDDING_MODEL:
+            rows = zip(previous.contents, previous.sources, previous.embeddings)
+            for content, source, embedding in rows:
+                key = chunk_id(EMBEDDING_MODEL, source, content)
+                # The file is rewritten in document order, positions don't need updating
+                metadata = chunks.get(key, {}).get("metadata", {"source": source})
+                existing[key] = {"metadata": metadata}
+                previous_embeddings[key] = embedding.tolist()
+    plan = plan_reindex(chunks, existing)
+    print_report(plan, chunks, existing, dry_run)
+    if dry_run:
+        return {action: len(ids) for action, ids in plan.items()}
+
+    texts = [chunks[key]["content"] for key in plan["added"]]
+    new_embeddings = await create_embeddings(texts) if texts else []
+    embeddings = {**previous_embeddings, **dict(zip(plan["added"], new_embeddings))}
+    OrbitLocalIndex(
+        contents=[chunk["content"] for chunk in chunks.values()],
+        sources=[chunk["metadata"]["source"] for chunk in chunks.values()],
+        embeddings=[embeddings[key] for key in chunks],
+        model=EMBEDDING_MODEL,
+        fingerprint=docs_fingerprint(sources),
+    ).save(path)
+    return {action: len(ids) for action, ids in plan.items()}
+
+async def main(local: bool = False, dry_run: bool = False):
     """Main function to run the indexing process."""
-    # Define document sources
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    sources = [
-        os.path.join(base_path, "docs", "company.txt"),
-        os.path.join(base_path, "docs", "orbit.txt"),
-        os.path.join(base_path, "docs", "roadmap.txt"),
-        os.path.join(base_path, "docs", "token.txt"),
-        os.path.join(base_path, "docs", "tokenomics.txt"),
-        os.path.join(base_path, "docs", "supported_networks.txt"),
-    ]
+    sources = doc_sources()
 
     try:
-        await index_documents(sources)
+        if local:
+            await build_local_index(sources, dry_run=dry_run)
+            if not dry_run:
+                print(f"Saved the docs index to {LOCAL_INDEX_PATH}")
+        else:
+            await index_documents(sources, dry_run=dry_run)
     except Exception as e:
         raise e
 
 if __name__ == "__main__":
+    import argparse
     import asyncio
-    asyncio.run(main()) 
\ No newline at end of file
+
+    parser = argparse.ArgumentParser(description="Index the Orbit docs for the RAG agent.")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Build the packaged in-process index instead of the Firestore collection",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report the chunks that would be added, kept and removed",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(local=args.local, dry_run=args.dry_run))
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+AGENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DOCS_DIR = os.path.join(AGENT_DIR, "docs")
+# Built at deploy time by `python agents/orbit_rag_agent/index_documents.py --local`
+LOCAL_INDEX_PATH = os.path.join(AGENT_DIR, "orbit_docs.npz")
+DOC_FILES = [
+    "company.txt",
+    "orbit.txt",
+    "roadmap.txt",
+    "token.txt",
+    "tokenomics.txt",
+    "supported_networks.txt",
+]
+
+
+def doc_sources() -> List[str]:
+    return [os.path.join(DOCS_DIR, name) for name in DOC_FILES]
+
+
+def get_category(filepath: str) -> str:
+    """Categorize file based on its path."""
+    filename = os.path.basename(filepath).lower()
+    if "token" in filename:
+        return "token"
+    if "company" in filename:
+        return "company"
+    if "roadmap" in filename:
+        return "roadmap"
+    if "tokenomics" in filename:
+        return "tokenomics"
+    if "orbit" in filename:
+        return "orbit"
+    if "protocol" in filename or "network" in filename or "supported" in filename:
+        return "networks"
+    return "other"
+
+
+def split_text(text: str, chunk_size: int = 200) -> List[str]:
+    """Split plain text into fixed-size chunks."""
+    text = re.sub(r"\s+", " ", text).strip()  # Normalize whitespace
+    return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+def chunk_id(model: str, source: str, content: str) -> str:
+    """Deterministic id of a chunk, changes with its text, its doc and the embedding model."""
+    return hashlib.sha256(f"{model}\n{source}\n{content}".encode()).hexdigest()[:40]
+
+
+def chunk_documents(sources: List[str], model: str) -> Dict[str, Dict[str, Any]]:
+    """The chunks of the docs by id, in document order, with the metadata stored with them."""
+    chunks: Dict[str, Dict[str, Any]] = {}
+    for source in sources:
+        with open(source, "r", encoding="utf-8") as f:
+            content = f.read()
+        name = os.path.basename(source)
+        for i, chunk in enumerate(split_text(content, chunk_size=200)):
+            # A chunk repeated in the same doc is stored once
+            chunks.setdefault(
+                chunk_id(model, name, chunk),
+                {
+                    "content": chunk,
+                    "metadata": {
+                        "source": name,
+                        "category": get_category(source),
+                        "chunk_index": i,
+                    },
+                },
+            )
+    return chunks
+
+
+def plan_reindex(
+    chunks: Dict[str, Dict[str, Any]], existing: Dict[str, Dict[str, Any]]
+) -> Dict[str, List[str]]:
+    """
+    Compares the chunks of the docs with the indexed ones (metadata by id):
+    - added: new or changed chunks, the only ones that need an embedding.
+    - kept: unchanged chunks, `moved` lists those whose position in their doc changed.
+    - removed: indexed chunks that are no longer in the docs.
+    """
+    added = [key for key in chunks if key not in existing]
+    kept = [key for key in chunks if key in existing]
+    return {
+        "added": added,
+        "kept": kept,
+        "moved": [
+            key
+            for key in kept
+            if existing[key].get("metadata") != chunks[key]["metadata"]
+        ],
+        "removed": [key for key in existing if key not in chunks],
+    }
+
+
+def docs_fingerprint(sources: List[str]) -> str:
+    """Hash of the names and contents of the docs, to tell whether an index is stale."""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(os.path.basename(source).encode())
+        with open(source, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class OrbitLocalIndex:
+    """
+    The chunks of the Orbit docs and their embeddings, searched in process.
+
+    A few dozen chunks fit in one small matrix, so a search is a single matrix-vector
+    product ranked by Euclidean distance, the same ranking as the Firestore `find_nearest`
+    query over `orbit_docs`.
+    """
+
+    def __init__(
+        self,
+        contents: List[str],
+        sources: List[str],
+        embeddings: np.ndarray,
+        model: str,
+        fingerprint: str,
+    ):
+        self.contents = list(contents)
+        self.sources = list(sources)
+        self.embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(self.contents), -1)
+        self.norms = np.einsum("ij,ij->i", self.embeddings, self.embeddings)
+        self.model = model
+        self.fingerprint = fingerprint
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def save(self, path: str = LOCAL_INDEX_PATH):
+        # Plain arrays only, so the file loads without pickle
+        np.savez(
+            path,
+            contents=np.array(self.contents, dtype=str),
+            sources=np.array(self.sources, dtype=str),
+            embeddings=self.embeddings,
+            model=np.array(self.model),
+            fingerprint=np.array(self.fingerprint),
+        )
+
+    @classmethod
+    def load(cls, path: str = LOCAL_INDEX_PATH) -> "OrbitLocalIndex":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                contents=data["contents"].tolist(),
+                sources=data["sources"].tolist(),
+                embeddings=data["embeddings"],
+                model=str(data["model"]),
+                fingerprint=str(data["fingerprint"]),
+            )
+
+    def search(self, query_embedding: List[float], limit: int = 10) -> List[str]:
+        """Contents of the `limit` chunks closest to the query, closest first."""
+        if not len(self) or limit <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        # |x - q|^2 without the |q|^2 term, which doesn't change the ranking
+        distances = self.norms - 2 * (self.embeddings @ query)
+        nearest = np.argsort(distances, kind="stable")[:limit]
+        return [self.contents[i] for i in nearest]
+
+
+# Loaded indexes by path, None for a missing or unusable file
+_local_indexes: Dict[str, Optional[OrbitLocalIndex]] = {}
+_local_index_lock = threading.Lock()
+
+
+def _load_checked(path: str, model: str) -> Optional[OrbitLocalIndex]:
+    if not os.path.exists(path):
+        return None
+    index = OrbitLocalIndex.load(path)
+    if index.model != model:
+        print(f"Orbit docs index built with {index.model}, not {model}, ignoring it")
+        return None
+    if index.fingerprint != docs_fingerprint(doc_sources()):
+        print("Orbit docs changed since the docs index was built, ignoring it")
+        return None
+    return index
+
+
+def get_local_index(model: str, path: str = LOCAL_INDEX_PATH) -> Optional[OrbitLocalIndex]:
+    """
+    The packaged index, loaded once per instance. None when the file is missing, was built
+    with another embedding model or from other docs, the searcher then uses Firestore.
+    """
+    if path in _local_indexes:
+        return _local_indexes[path]
+    with _local_index_lock:
+        if path not in _local_indexes:
+            try:
+                _local_indexes[path] = _load_checked(path, model)
+            except Exception as e:
+                print(f"Error loading the Orbit docs index: {e}")
+                _local_indexes[path] = None
+    return _local_indexes[path]
@@ -2,21 +2,38 @@ from typing import List
 from firebase_admin import firestore
 from google.cloud.firestore_v1.vector import Vector
 from google.cloud.firestore_v1.base_vector_query import DistanceMeasure
-from services.llm import create_embedding
+from services.llm import create_embedding, EMBEDDING_MODEL
+from agents.orbit_rag_agent.local_index import get_local_index
 
 class OrbitDocumentSearcher:
-    """Simple document indexer that embeds entire files."""
+    """
+    Searches the chunks of the Orbit docs.
+    Uses the index packaged with the function when there is one, otherwise Firestore's
+    vector search over the indexed collection.
+    """
 
-    def __init__(self, collection_name: str = "orbit_docs") -> None:
-        db = firestore.client()
-        self.collection = db.collection(collection_name)
+    def __init__(self, collection_name: str = "orbit_docs", use_local_index: bool = True) -> None:
+        self.collection_name = collection_name
+        self.use_local_index = use_local_index
+        self._collection = None
+
+    @property
+    def collection(self):
+        # Only the Firestore fallback needs a client
+        if self._collection is None:
+            self._collection = firestore.client().collection(self.collection_name)
+        return self._collection
 
     async def search_similar(self, query: str, limit: int = 10) -> List[str]:
-        """Get documents similar to the provided query using Firestore's vector search."""
+        """Get documents similar to the provided query."""
         try:
-            # Generate query embedding
+            # Generate query embedding, repeated questions are served by the embedding cache
             query_embedding = await create_embedding(query)
-            
+
+            local_index = get_local_index(EMBEDDING_MODEL) if self.use_local_index else None
+            if local_index is not None:
+                return local_index.search(query_embedding, limit=limit)
+
             # Use Firestore's vector search with find_nearest
             vector_query = self.collection.find_nearest(
                 vector_field="embedding_field",
@@ -24,11 +41,11 @@ class OrbitDocumentSearcher:
                 distance_measure=DistanceMeasure.EUCLIDEAN,
                 limit=limit,
             )
-            
+
             results = vector_query.get()
-            
+
             # Process results to return only content
             return [doc.to_dict().get("content", "") for doc in results]
-            
+
         except Exception as e:
-            return []
\ No newline at end of file
+            return []
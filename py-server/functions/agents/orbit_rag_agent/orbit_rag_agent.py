@@ -9,6 +9,7 @@ from agents.orbit_rag_agent.orbit_document_searcher import OrbitDocumentSearcher
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
 from utils.firebase import save_ui_message
 from services.tokens import tokens_service
+from agents.agent_registry import agent_tools
 
 
 # Tool function for showing a TokenCard UI
@@ -45,13 +46,17 @@ async def show_token_card_ui(
         return "Here are the supported tokens and chains."
 
 
+# Built once per instance, every agent created for a request shares them
+ORBIT_RAG_AGENT_TOOLS = agent_tools([show_token_card_ui])
+
+
 @tracer.start_as_current_span("orbit_rag_agent")
 async def call_orbit_rag_agent(
     task: str, chat_id: str, use_frontend_quoting: bool = True
 ) -> str:
     """
     A specialized agent for answering questions about Orbit using RAG (Retrieval-Augmented Generation).
-    Uses Firestore for vector storage and retrieval of relevant information.
+    Retrieves from the Orbit docs index packaged with the function, or Firestore vector search without it.
 
 
     Examples:
@@ -99,7 +104,7 @@ async def call_orbit_rag_agent(
                 "Do not mention tool names or implementation details in your response. Never call the tool more than once."
             ),
             model_client=gpt_4o_client,
-            tools=[show_token_card_ui],
+            tools=ORBIT_RAG_AGENT_TOOLS,
         )
 
         updated_task = f"Task: '{task}'.\nChatId is {chat_id}"
@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from typing import Annotated, Dict, List, Optional, TypedDict, Any
 from datetime import datetime, timedelta
 from config import COINMARKETCAP_API_KEY
@@ -106,7 +106,7 @@ def get_cryptocurrency_by_id(
     """
     coinmarketcap_url = f"{coinmarketcap_pro_base_url}/v2/cryptocurrency/info?id={id}"
 
-    response = requests.get(coinmarketcap_url, headers=coinmarketcap_headers)
+    response = http_session.get(coinmarketcap_url, headers=coinmarketcap_headers)
     coinmarketcap_data = response.json()["data"][str(id)]
     return coinmarketcap_data
 
@@ -132,12 +132,12 @@ def get_cryptocurrency_by_symbol(
         )
         coinmarketcap_quote_url = f"{coinmarketcap_pro_base_url}/v2/cryptocurrency/quotes/latest?symbol={symbol}"
 
-        response_info = requests.get(
+        response_info = http_session.get(
             coinmarketcap_info_url, headers=coinmarketcap_headers
         )
         coinmarketcap_info_data = response_info.json()["data"][symbol][0]
 
-        response_quote = requests.get(
+        response_quote = http_session.get(
             coinmarketcap_quote_url, headers=coinmarketcap_headers
         )
         coinmarketcap_quote_data = response_quote.json()["data"][symbol][0]["quote"][
@@ -183,7 +183,7 @@ def get_highest_cryptocurrencies_gainers(
     try:
         coinmarketcap_url = f"{coinmarketcap_pro_base_url}/v1/cryptocurrency/listings/latest?sort=percent_change_{time_frame}&limit={num_results}"
 
-        response = requests.get(coinmarketcap_url, headers=coinmarketcap_headers)
+        response = http_session.get(coinmarketcap_url, headers=coinmarketcap_headers)
         response.raise_for_status()
         coinmarketcap_data = response.json()["data"]
         return coinmarketcap_data[:num_results]
@@ -233,7 +233,7 @@ def get_cryptocurrencies_by_tags(
     try:
         coinmarketcap_url = f"{coinmarketcap_pro_base_url}/v1/cryptocurrency/listings/latest?sort={sort_by}&limit=500&{aux}"
 
-        response = requests.get(coinmarketcap_url, headers=coinmarketcap_headers)
+        response = http_session.get(coinmarketcap_url, headers=coinmarketcap_headers)
         response.raise_for_status()
         coinmarketcap_data = response.json()["data"]
     except Exception as e:
@@ -305,14 +305,14 @@ async def get_comprehensive_market_data(
 
         # Get crypto market data
         crypto_url = f"{coinmarketcap_pro_base_url}/v1/global-metrics/quotes/latest"
-        crypto_response = requests.get(crypto_url, headers=coinmarketcap_headers)
+        crypto_response = http_session.get(crypto_url, headers=coinmarketcap_headers)
         crypto_data = crypto_response.json()["data"]
 
         # Get Solana data
         solana_url = (
             f"{coinmarketcap_pro_base_url}/v2/cryptocurrency/quotes/latest?symbol=SOL"
         )
-        solana_response = requests.get(solana_url, headers=coinmarketcap_headers)
+        solana_response = http_session.get(solana_url, headers=coinmarketcap_headers)
         solana_data = solana_response.json()["data"]["SOL"][0]
         solana_dominance = (
             solana_data["quote"]["USD"]["market_cap"]
@@ -345,7 +345,7 @@ async def get_comprehensive_market_data(
             "interval": "daily",
             "convert": "USD",
         }
-        historical_response = requests.get(
+        historical_response = http_session.get(
             historical_url, headers=coinmarketcap_headers, params=params
         )
         historical_data = historical_response.json()["data"]["quotes"]
@@ -1,4 +1,5 @@
-import json, requests
+import json
+from services.http_client import http_session
 from config import SERPER_API_KEY
 from typing import List, Dict, Optional
 from datetime import datetime, timezone
@@ -51,7 +52,7 @@ def search(search_keyword: str, timeframe: Optional[str]):
         "X-API-KEY": serper_api_key,
         "Content-Type": "application/json",
     }
-    response = requests.post(url, headers=headers, data=payload)
+    response = http_session.post(url, headers=headers, data=payload)
     return response.json()
 
 
@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from utils.firebase import save_agent_thought, save_ui_message
 
 BASE_URL = "https://api.llama.fi"
@@ -22,7 +22,7 @@ def get_top_protocols_by_chain_on_defi_llama(chain: str, chat_id: str, limit: in
             chat_id=chat_id,
             thought=f"Fetching TOP {limit} protocols on {chain}...",
         )
-        response = requests.get(f"{BASE_URL}/protocols")
+        response = http_session.get(f"{BASE_URL}/protocols")
         response.raise_for_status()
         protocols = response.json()
         limit = min(limit, 10)
@@ -79,7 +79,7 @@ def get_top_chains_by_tvl_on_defi_llama(chat_id: str, limit: int = 10):
             chat_id=chat_id,
             thought=f"Fetching TOP {limit} chains by TVL...",
         )
-        response = requests.get(f"{BASE_URL}/v2/chains")
+        response = http_session.get(f"{BASE_URL}/v2/chains")
         response.raise_for_status()
         limit = min(limit, 10)
         data = sorted(
@@ -113,7 +113,7 @@ def get_top_dexs_by_chain_on_defi_llama(chain: str, chat_id: str, limit: int = 1
             chat_id=chat_id,
             thought=f"Fetching TOP {limit} DEXs on {chain}...",
         )
-        response = requests.get(
+        response = http_session.get(
             f"{BASE_URL}/overview/dexs?excludeTotalDataChart=true&excludeTotalDataChartBreakdown=true"
         )
         response.raise_for_status()
@@ -174,7 +174,7 @@ def get_top_yields_pools_by_chain_on_defi_llama(
             chat_id=chat_id,
             thought=f"Fetching TOP {limit} pools on {chain}...",
         )
-        response = requests.get(f"{YIELDS_URL}")
+        response = http_session.get(f"{YIELDS_URL}")
         response.raise_for_status()
         limit = min(limit, 10)
         response = response.json()
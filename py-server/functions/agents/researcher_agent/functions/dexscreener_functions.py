@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from typing import List, Annotated, Dict, Any
 from utils.firebase import save_ui_message
 from services.chains import get_all_native_tokens
@@ -6,7 +6,7 @@ from services.chains import get_all_native_tokens
 
 def get_token_info(token_address: str):
     try:
-        response = requests.get(
+        response = http_session.get(
             f"https://api.dexscreener.io/latest/dex/tokens/{token_address}", headers={}
         )
         return response.json()
@@ -30,7 +30,7 @@ def get_dexscreener_latest_tokens(
     """
 
     try:
-        response = requests.get(
+        response = http_session.get(
             "https://api.dexscreener.com/token-profiles/latest/v1", headers={}
         )
         latest_tokens = response.json()
@@ -112,7 +112,7 @@ def get_dexscreener_latest_boosted_tokens(
     - str: A JSON-formatted response from the AI agent containing the latest boosted tokens on Dexscreener.
     """
     try:
-        response = requests.get(
+        response = http_session.get(
             "https://api.dexscreener.com/token-boosts/latest/v1", headers={}
         )
         boosted_tokens = response.json()
@@ -185,7 +185,7 @@ def get_dexscreener_most_boosted_tokens(
     - str: A JSON-formatted response from the AI agent containing the top 10 most boosted tokens on Dexscreener.
     """
     try:
-        response = requests.get(
+        response = http_session.get(
             "https://api.dexscreener.com/token-boosts/top/v1", headers={}
         )
         most_boosted_tokens = response.json()
@@ -269,7 +269,7 @@ def get_dexscreener_token_pair_info(
             search_term = f"{token_a_symbol}+{token_b_symbol}"
 
         url = f"https://api.dexscreener.com/latest/dex/search?q={search_term}"
-        response = requests.get(url, headers={})
+        response = http_session.get(url, headers={})
 
         pairs_info = response.json()["pairs"]
 
@@ -352,7 +352,7 @@ def get_dexscreener_token_pair_info_by_chain_and_token_address(
     """
     try:
         url = f"https://api.dexscreener.com/token-pairs/v1/{chain_id}/{token_address}"
-        response = requests.get(url, headers={})
+        response = http_session.get(url, headers={})
         pairs = response.json()
 
         if not pairs or len(pairs) == 0:
@@ -434,7 +434,7 @@ def is_possible_rug(token_address: str):
     """Check if a token is marked as 'Good' on rugcheck.xyz."""
     try:
         url = f"https://api.rugcheck.xyz/v1/tokens/{token_address}/report/summary"
-        response = requests.get(url)
+        response = http_session.get(url)
         response.raise_for_status()
         data = response.json()
 
@@ -2,7 +2,7 @@ import pandas as pd
 import json
 from datetime import datetime, timedelta
 from typing import List, Annotated
-import requests
+from services.http_client import http_session
 from agents.researcher_agent.functions import (
     CryptocurrencyInfo,
     coinmarketcap_headers,
@@ -32,7 +32,7 @@ def get_cryptocurrencies_by_tags(
     )
     coinmarketcap_url = f"{coinmarketcap_pro_base_url}/v1/cryptocurrency/listings/latest?sort={sort_by}&limit=500&{aux}"
 
-    response = requests.get(coinmarketcap_url, headers=coinmarketcap_headers)
+    response = http_session.get(coinmarketcap_url, headers=coinmarketcap_headers)
 
     coinmarketcap_data = response.json()["data"]
     coins = [
@@ -175,7 +175,7 @@ def get_24h_prices_history(token_id):
             "interval": "hourly",
         }
 
-        response = requests.get(
+        response = http_session.get(
             base_url, headers=coinmarketcap_headers, params=params
         ).json()
 
@@ -1,4 +1,5 @@
 import json, requests
+from services.http_client import http_session
 from config import FIREBASE_SERVER_ENDPOINT, SERPER_API_KEY
 from typing import List, Dict
 from datetime import datetime, timedelta
@@ -56,7 +57,7 @@ def search(search_keyword: str):
     url = "https://google.serper.dev/search"
     payload = json.dumps({"q": search_keyword})
     headers = {"X-API-KEY": serper_api_key, "Content-Type": "application/json"}
-    response = requests.request("POST", url, headers=headers, data=payload)
+    response = http_session.request("POST", url, headers=headers, data=payload)
     return json.loads(response.text)
 
 
@@ -102,7 +103,7 @@ def get_portfolio_history(chat_id: str) -> dict:
     }
 
     try:
-        response = requests.post(
+        response = http_session.post(
             url, headers=headers, json={"fromServer": True, "userId": user_id}
         )
         response.raise_for_status()
@@ -364,7 +365,7 @@ def analyze_portfolio_history(chat_id: str, detailed: bool = False) -> str:
         )
 
         url = f"{FIREBASE_SERVER_ENDPOINT}/getBalances?skipCache=false"
-        response = requests.get(url, headers=headers)
+        response = http_session.get(url, headers=headers)
         response.raise_for_status()
 
         data = response.json()
@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 import os
 import json
 from config import TWITTER_BEARER_TOKEN
@@ -34,7 +34,7 @@ def search_user_by_usernames(usernames: list[str]):
         if len(cleaned_usernames) > 1
         else cleaned_usernames[0]
     )
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/users/by?usernames={usernameParams}&user.fields=description,profile_image_url",
         headers={"Authorization": f"Bearer {TWITTER_BEARER_TOKEN}"},
     )
@@ -93,7 +93,7 @@ def get_recent_twitter_posts(chat_id: str, username: str, amount: int = 10):
     if amount > 10 and amount <= 20:
         query_params += f"&max_results={amount}"
 
-    response = requests.get(
+    response = http_session.get(
         f"{BASE_URL}/tweets/search/recent?{query_params}",
         headers={"Authorization": f"Bearer {TWITTER_BEARER_TOKEN}"},
     )
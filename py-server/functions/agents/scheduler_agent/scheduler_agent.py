@@ -16,6 +16,18 @@ from services.tracing import (
     tracer,
     set_attributes,
 )
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+SCHEDULER_AGENT_TOOLS = agent_tools(
+    [
+        get_user_scheduled_tasks,
+        create_scheduled_task,
+        delete_scheduled_task,
+        delete_all_scheduled_tasks,
+    ]
+)
 
 
 @tracer.start_as_current_span("scheduler_agent")
@@ -58,12 +70,7 @@ async def call_scheduler_agent(
         ),
         model_client=gpt_4o_client,
         reflect_on_tool_use=False,
-        tools=[
-            get_user_scheduled_tasks,
-            create_scheduled_task,
-            delete_scheduled_task,
-            delete_all_scheduled_tasks,
-        ],
+        tools=SCHEDULER_AGENT_TOOLS,
     )
 
     updated_task = f"The user requested to {task}. Current chat id is: {chat_id}"
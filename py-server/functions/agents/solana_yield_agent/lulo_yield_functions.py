@@ -1,4 +1,5 @@
 import requests
+from services.http_client import http_session
 from typing import Annotated, Dict, Any
 from config import LULO_API_KEY
 
@@ -117,7 +118,7 @@ def fetch_account_info(
             thought="Fetching your account information...",
         )
         headers = {"x-wallet-pubkey": wallet_pubkey, "x-api-key": LULO_API_KEY}
-        response = requests.get("https://api.flexlend.fi/account", headers=headers)
+        response = http_session.get("https://api.flexlend.fi/account", headers=headers)
 
         if response.status_code != 200:
             error_message = response.json().get("message", "Unknown error occurred")
@@ -218,7 +219,7 @@ def get_route_estimate(
     - dict: A dictionary containing the route estimate.
     """
     try:
-        response = requests.get(
+        response = http_session.get(
             "https://api.lulo.fi/v0/routing.getRouteEstimate",
             params={
                 "amount": amount,
@@ -238,7 +239,7 @@ def is_account_created(
 ):
     try:
         headers = {"x-wallet-pubkey": wallet_pubkey, "x-api-key": LULO_API_KEY}
-        response = requests.get(
+        response = http_session.get(
             "https://api.lulo.fi/v0/account.getAccount", headers=headers
         )
         response_json = response.json()
@@ -379,7 +380,7 @@ def generate_deposit_transaction(
 
             ################################################################
             ############ LULO V1 DEPOSITS REGION (PROTECTED) #############
-            # response = requests.post(
+            # response = http_session.post(
             #     f"https://api.lulo.fi/v1/generate.transactions.deposit?priorityFee={priority_fee}",
             #     headers=headers,
             #     json={
@@ -411,7 +412,7 @@ def generate_deposit_transaction(
                 )
                 body["estimateResponse"] = route_estimate
 
-            response = requests.post(
+            response = http_session.post(
                 f"https://api.lulo.fi/v0/generate.transactions.deposit?priorityFee=100000",
                 headers=headers,
                 json=body,
@@ -581,7 +582,7 @@ def generate_withdrawal_transaction(
                 "mintAddress": token_info["address"],
                 "withdrawAmount": float(withdraw_amount),
             }
-            response = requests.post(
+            response = http_session.post(
                 f"https://api.lulo.fi/v0/generate.transactions.withdraw?priorityFee=950000",
                 json=request,
             )
@@ -677,7 +678,7 @@ def generate_withdrawal_transaction(
 #             return "Token not supported by Lulo"
 
 #         try:
-#             response = requests.get(
+#             response = http_session.get(
 #                 f"https://api.lulo.fi/v1/account.getAccount?owner={wallet_pubkey}",
 #                 headers={"Content-Type": "application/json"},
 #             )
@@ -714,7 +715,7 @@ def generate_withdrawal_transaction(
 #             "mintAddress": token_info["address"],
 #             "amount": float(withdraw_amount),
 #         }
-#         response = requests.post(
+#         response = http_session.post(
 #             f"https://api.lulo.fi/v1/generate.transactions.withdrawProtected?priorityFee={priority_fee}",
 #             headers=headers,
 #             json=request,
@@ -749,7 +750,7 @@ def generate_withdrawal_transaction(
 def fetch_protocol_rates_raw() -> Dict[str, Any]:
     try:
         url = "https://api.lulo.fi/v0/pools.getPoolMeta"
-        response = requests.get(url)
+        response = http_session.get(url)
         response.raise_for_status()  # Lanza excepción si hay error HTTP
         yields_pools_information = response.json()
         formatted_rates = format_protocol_rates(yields_pools_information)
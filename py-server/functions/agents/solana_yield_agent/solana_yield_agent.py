@@ -11,6 +11,17 @@ from agents.solana_yield_agent.lulo_yield_functions import (
 )
 from services.llm import gpt_4o_client
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+SOLANA_YIELD_AGENT_TOOLS = agent_tools(
+    [
+        get_user_deposits,
+        generate_deposit_transaction,
+        generate_withdrawal_transaction,
+    ]
+)
 
 
 @tracer.start_as_current_span("solana_yield_agent")
@@ -46,11 +57,7 @@ async def call_solana_yield_agent(
     yield_agent = AssistantAgent(
         name="yield_agent",
         model_client=gpt_4o_client,
-        tools=[
-            get_user_deposits,
-            generate_deposit_transaction,
-            generate_withdrawal_transaction,
-        ],
+        tools=SOLANA_YIELD_AGENT_TOOLS,
         system_message=(
             "Yield Agent for Lulo Protocol on Solana.\n"
             "If the user asks about yield options, best yields, or how to earn yield on Solana (e.g., prompts like 'What yield options are available', 'I would like to know the best yields on solana', 'I want to yield earn', etc), call the 'generate_deposit_transaction' tool with default values and use_frontend_quoting set to True.\n"
@@ -1,4 +1,4 @@
-import requests
+from services.http_client import http_session
 from typing import Annotated
 from config import FIREBASE_SERVER_ENDPOINT
 
@@ -151,7 +151,7 @@ def create_evm_transfer(
                 "render_ui": False,
             }
 
-            response = requests.post(url, json=params)
+            response = http_session.post(url, json=params)
 
             if response.status_code != 200:
                 response.raise_for_status()
@@ -356,7 +356,7 @@ def handle_create_solana_transfer(
             "onlyGetTransaction": False,
             "render_ui": False,
         }
-        response = requests.post(url, json=params)
+        response = http_session.post(url, json=params)
         if response.status_code != 200:
             response.raise_for_status()
 
@@ -497,7 +497,6 @@ def create_bridge_and_transfer(
         # Import required functions
         from services.chains import call_chains_service
         from utils.bignumber import float_to_bignumber_string
-        import requests
 
         from_chain_id = call_chains_service(
             method="getChainId", chainName=from_chain.upper()
@@ -533,7 +532,7 @@ def create_bridge_and_transfer(
         )
 
         # Build bridge transaction using LiFi API
-        response = requests.get(
+        response = http_session.get(
             f'https://li.quest/v1/quote?fromChain={from_chain_id}&toChain={to_chain_id}&fromToken={str(from_token.get("address", ""))}&toToken={str(to_token.get("address", ""))}&fromAddress={from_wallet_address}&toAddress={to_wallet_address}&fromAmount={from_amount_bn}&slippage=0.03&allowBridges=mayan&integrator=sphereone'
         )
 
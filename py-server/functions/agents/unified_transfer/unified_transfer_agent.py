@@ -9,6 +9,11 @@ from agents.unified_transfer.transfer_functions import (
 )
 from services.tracing import set_status_ok, set_status_error, tracer, set_attributes
 import services.analytics as analytics
+from agents.agent_registry import agent_tools
+
+
+# Built once per instance, every agent created for a request shares them
+UNIFIED_TRANSFER_AGENT_TOOLS = agent_tools([create_evm_transfer, create_solana_transfer])
 
 
 @tracer.start_as_current_span("unified_transfer_agent")
@@ -53,7 +58,7 @@ async def call_unified_transfer_agent(
             "-Verify token/chain support"
         ),
         model_client=gpt_4o_client,
-        tools=[create_evm_transfer, create_solana_transfer],
+        tools=UNIFIED_TRANSFER_AGENT_TOOLS,
         reflect_on_tool_use=False,
     )
 
@@ -12,7 +12,7 @@ from utils.firebase import (
     update_message,
     create_message_doc_id,
 )
-from services.voice import encode_audio_to_base64, generate_speech_from_text
+from services.voice import encode_audio_to_base64, generate_speech_from_text_async
 
 import services.analytics as analytics
 from services.tracing import tracer, set_status_ok, set_status_error, set_attributes
@@ -105,7 +105,7 @@ async def call_user_management_agent(
             # then we get final response, which has all the message chunks concatenated together
             # use that to create the voice message
             elif isinstance(message, Response) and use_voice:
-                voice_result = generate_speech_from_text(
+                voice_result = await generate_speech_from_text_async(
                     text=message.chat_message.content.replace("TERMINATE", "")
                 )
                 encoded_voice = encode_audio_to_base64(voice_result)
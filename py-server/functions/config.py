@@ -17,5 +17,47 @@ SERPER_API_KEY = os.getenv("SERPER_API_KEY")
 SOL_VALIDATORS_API_KEY = os.getenv("SOL_VALIDATORS_API_KEY")
 LULO_API_KEY = os.getenv("LULO_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Optional persistent tier for the embedding cache: a Firestore collection or a local directory
+EMBEDDING_CACHE_COLLECTION = os.getenv("EMBEDDING_CACHE_COLLECTION", "")
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "")
+# Shard docs for the global analytics counters, off (0) by default: analytics/global is then
+# written directly. With shards it only gets the totals at each rollup, so enable it only once
+# the readers of analytics/global add the shards (ShardedCounterDoc.read)
+ANALYTICS_GLOBAL_SHARDS = int(os.getenv("ANALYTICS_GLOBAL_SHARDS", "0"))
+# Event batches the event trigger agent evaluates at the same time for one tweet
+EVENT_TRIGGER_MAX_CONCURRENCY = int(os.getenv("EVENT_TRIGGER_MAX_CONCURRENCY", "4"))
+# Seconds new tweets are collected before the event trigger agent checks them together, 0 checks every tweet on its own
+EVENT_TRIGGER_BATCH_WINDOW_SEC = float(os.getenv("EVENT_TRIGGER_BATCH_WINDOW_SEC", "0"))
+# Tweets evaluated in a single LLM call when batching
+EVENT_TRIGGER_BATCH_SIZE = int(os.getenv("EVENT_TRIGGER_BATCH_SIZE", "10"))
+# Seconds queued messages are collected before they are recorded as memories together
+MEMORY_BATCH_WINDOW_SEC = float(os.getenv("MEMORY_BATCH_WINDOW_SEC", "5"))
+# Queued messages recorded per batch
+MEMORY_BATCH_SIZE = int(os.getenv("MEMORY_BATCH_SIZE", "50"))
+# Instance memory for the per-user memory indexes, 6 KB per memory with text-embedding-3-small.
+# Sized for the 512 MB chat functions, the metadata of the memories comes on top of it
+MEMORY_INDEX_MAX_MB = int(os.getenv("MEMORY_INDEX_MAX_MB", "32"))
+# Users with more memories are searched with Firestore's find_nearest, 12 MB per index
+MEMORY_INDEX_MAX_ROWS_PER_USER = int(os.getenv("MEMORY_INDEX_MAX_ROWS_PER_USER", "2000"))
+# Seconds before a user's memory index is reloaded to pick up memories written elsewhere
+MEMORY_INDEX_TTL_SEC = float(os.getenv("MEMORY_INDEX_TTL_SEC", "300"))
+# Interaction memories not used for this many days are deleted by the compaction job
+MEMORY_TTL_DAYS = float(os.getenv("MEMORY_TTL_DAYS", "180"))
+# Days for the decay score of an interaction memory to halve, each repeat of it adds one
+MEMORY_HALF_LIFE_DAYS = float(os.getenv("MEMORY_HALF_LIFE_DAYS", "30"))
+# Interaction memories below this decay score are deleted by the compaction job
+MEMORY_MIN_DECAY_SCORE = float(os.getenv("MEMORY_MIN_DECAY_SCORE", "0.1"))
+# Hours between the starts of two compaction passes over every user's memories
+MEMORY_COMPACTION_INTERVAL_HOURS = float(os.getenv("MEMORY_COMPACTION_INTERVAL_HOURS", "24"))
+# Users with more memories are skipped by the compaction job, 6 KB of embedding per memory
+MEMORY_COMPACTION_MAX_ROWS_PER_USER = int(os.getenv("MEMORY_COMPACTION_MAX_ROWS_PER_USER", "20000"))
+# Agents loaded on instance warm-up, comma separated ("*" or empty for every registered agent)
+PRELOAD_AGENTS = [
+    name.strip()
+    for name in os.getenv(
+        "PRELOAD_AGENTS", "dex_agent,enso_agent,transfer_assistant,researcher_assistant"
+    ).split(",")
+    if name.strip() and name.strip() != "*"
+]
 TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN", "")
 SOLANA_RPC = os.getenv("SOLANA_RPC")
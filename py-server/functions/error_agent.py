@@ -1,11 +1,12 @@
 from autogen_agentchat.agents import AssistantAgent
-from services.voice import encode_audio_to_base64, generate_speech_from_text
+from services.voice import encode_audio_to_base64, generate_speech_from_text_async
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import TextMessage, ModelClientStreamingChunkEvent
 from autogen_core import CancellationToken
 from utils.firebase import (
     update_message,
     create_message_doc_id,
+    create_message_stream_writer,
 )
 from services.llm import gpt_4o_client
 
@@ -41,26 +42,27 @@ async def generate_error_message(
         Please explain the following error message in a clear and simple way, avoiding technical terms: """
     try:
         message_id = create_message_doc_id(chat_id=chat_id)
+        stream_writer = create_message_stream_writer(
+            chat_id=chat_id,
+            user_id=user_id,
+            message_id=message_id,
+            data={
+                "sender": "AI",
+                "voiceContent": "",
+                "useVoice": False,
+                "messageType": "text",
+            },
+        )
         async for message in error_agent.on_messages_stream(
             messages=[TextMessage(content=prompt, source="user")],
             cancellation_token=CancellationToken(),
         ):
             if isinstance(message, ModelClientStreamingChunkEvent):
-                await update_message(
-                    chat_id=chat_id,
-                    user_id=user_id,
-                    message_id=message_id,
-                    data={
-                        "content": message.content,
-                        "sender": "AI",
-                        "voiceContent": "",
-                        "useVoice": False,
-                        "messageType": "text",
-                    },
-                )
+                await stream_writer.write(message.content)
 
             elif isinstance(message, Response) and use_voice:
-                voice_result = generate_speech_from_text(
+                await stream_writer.close()
+                voice_result = await generate_speech_from_text_async(
                     text=message.chat_message.content.replace("TERMINATE", "")
                 )
                 encoded_voice = encode_audio_to_base64(voice_result)
@@ -76,6 +78,7 @@ async def generate_error_message(
                         "messageType": "text",
                     },
                 )
+        await stream_writer.close()
     except Exception as e:
         print(f"Error generating error message: {e}")
 
@@ -0,0 +1,82 @@
+"""
+Agent Registry Benchmark.
+Measures, per specialist agent, what call_agent pays before the agent can start:
+- cold: first resolve in a fresh interpreter (module imports + tool schemas), what a user
+  paid on every new instance before agents were preloaded.
+- warm: resolve on an instance where the agent was preloaded.
+- tools: building the agent's FunctionTools from scratch, which AssistantAgent used to do
+  on every request and is now done once at import.
+Agents whose dependencies are missing in the current environment are reported as such.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.agent_registry_benchmark [--agents dex_agent,enso_agent] [--warm-calls 1000]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from agents.agent_registry import AGENT_MODULES
+
+MEASURE_AGENT = """
+import json, os, sys, time
+for key in ("OPENAI_API_KEY", "SERPER_API_KEY", "LULO_API_KEY"):
+    os.environ.setdefault(key, "benchmark")
+from eval.benchmarks.fake_firestore import install_stub_modules
+install_stub_modules()
+from autogen_core.tools import FunctionTool
+from agents.agent_registry import agent_registry
+
+name, warm_calls = sys.argv[1], int(sys.argv[2])
+start = time.perf_counter()
+agent_registry.resolve(name)
+cold_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+for _ in range(warm_calls):
+    agent_registry.resolve(name)
+warm_us = (time.perf_counter() - start) / warm_calls * 1e6
+
+module = sys.modules[agent_registry.agent_modules[name][0]]
+tools = next((value for key, value in vars(module).items() if key.endswith("_TOOLS")), [])
+start = time.perf_counter()
+for tool in tools:
+    FunctionTool(tool._func, description=tool.description, name=tool.name)
+tools_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"cold_ms": cold_ms, "warm_us": warm_us, "tools_ms": tools_ms, "tools": len(tools)}))
+"""
+
+
+def measure(name: str, warm_calls: int) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", MEASURE_AGENT, name, str(warm_calls)],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"
+        return {"error": error}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(agents: list[str], warm_calls: int):
+    print(f"[START] {len(agents)} agents, each measured in a fresh interpreter")
+    print("\n[REPORT] call_agent resolve latency per agent")
+    for name in agents:
+        result = measure(name, warm_calls)
+        if "error" in result:
+            print(f"   {name:<22} unavailable here: {result['error'][:90]}")
+            continue
+        print(
+            f"   {name:<22} cold={result['cold_ms']:8.1f} ms  warm={result['warm_us']:6.2f} us  "
+            f"tools per request before={result['tools_ms']:6.2f} ms ({result['tools']} tools)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", default=",".join(AGENT_MODULES))
+    parser.add_argument("--warm-calls", type=int, default=1000)
+    args = parser.parse_args()
+    run_benchmark([name for name in args.agents.split(",") if name], args.warm_calls)
@@ -0,0 +1,104 @@
+"""
+Analytics Aggregator Benchmark.
+Replays the analytics writes of a burst of user messages (total_messages plus the agents used,
+each on the global and the per-user analytics docs) against a simulated Firestore:
+- before: increment_field_in_doc reads the doc and then sets or updates it, on the request path.
+- after: CounterAggregator queues the deltas and each invocation ends with one batched flush.
+Both runs must leave the same counters in Firestore.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.analytics_aggregator_benchmark [--messages 50] [--users 5] [--latency-ms 25]
+"""
+
+import argparse
+import random
+import time
+
+from eval.benchmarks.fake_firestore import FakeFirestore, install_stub_modules
+
+install_stub_modules()
+
+from google.cloud.firestore_v1 import SERVER_TIMESTAMP, Increment  # noqa: E402
+
+from services.analytics_aggregator import CounterAggregator  # noqa: E402
+
+AGENTS = ["enso", "dex", "drift_perps", "researcher", "lp_agent"]
+
+
+def legacy_increment_field_in_doc(doc_ref, field: str, key: str | None = None, amount: int = 1):
+    """The previous read-then-write implementation of services.analytics."""
+    doc = doc_ref.get()
+    full_field = f"{field}.{key}" if key else field
+    if not doc.exists:
+        doc_ref.set({field: {key: amount} if key else amount, "updated_at": SERVER_TIMESTAMP})
+    else:
+        doc_ref.update({full_field: Increment(amount), "updated_at": SERVER_TIMESTAMP})
+
+
+def analytics_docs(db, user_id: str):
+    return (
+        db.collection("analytics").document("global"),
+        db.collection("analytics").document("users").collection(user_id).document("analytics"),
+    )
+
+
+def replay(db, messages: list[tuple[str, list[str]]], increment, end_of_invocation):
+    request_path = 0.0
+    start = time.perf_counter()
+    for user_id, agents in messages:
+        request_start = time.perf_counter()
+        for doc_ref in analytics_docs(db, user_id):
+            increment(doc_ref, "total_messages")
+        for agent in agents:
+            for doc_ref in analytics_docs(db, user_id):
+                increment(doc_ref, "agents_used", key=agent)
+        request_path += time.perf_counter() - request_start
+        end_of_invocation()
+    return request_path, time.perf_counter() - start
+
+
+def counters(db) -> dict:
+    return {
+        path: {field: value for field, value in data.items() if field != "updated_at"}
+        for path, data in db.docs.items()
+    }
+
+
+def run_benchmark(messages: int, users: int, latency_ms: float):
+    rng = random.Random(11)
+    burst = [
+        (f"user-{rng.randrange(users)}", rng.sample(AGENTS, rng.randint(1, 2)))
+        for _ in range(messages)
+    ]
+    print(f"[START] {messages} messages from {users} users, {latency_ms} ms per Firestore op")
+
+    legacy_db = FakeFirestore(latency_ms)
+    legacy_path, legacy_total = replay(
+        legacy_db, burst, legacy_increment_field_in_doc, lambda: None
+    )
+
+    aggregated_db = FakeFirestore(latency_ms)
+    aggregator = CounterAggregator(aggregated_db, flush_interval=0)
+    aggregated_path, aggregated_total = replay(
+        aggregated_db, burst, aggregator.increment, aggregator.flush
+    )
+
+    print("\n[REPORT] Analytics writes")
+    for label, db, path, total in (
+        ("before (read-then-write)", legacy_db, legacy_path, legacy_total),
+        ("after (write-behind)", aggregated_db, aggregated_path, aggregated_total),
+    ):
+        print(
+            f"   {label:<26} ops/message={db.total_ops / messages:5.1f} {dict(db.ops)}  "
+            f"request path/message={path / messages * 1000:7.2f} ms  total={total * 1000:8.1f} ms"
+        )
+    print(f"   same counters: {counters(legacy_db) == counters(aggregated_db)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=25.0)
+    args = parser.parse_args()
+    run_benchmark(args.messages, args.users, args.latency_ms)
@@ -0,0 +1,113 @@
+"""
+Global Analytics Counters Load Test.
+Simulates many instances handling messages at once: every invocation increments total_messages
+and one agents_used counter of the global analytics doc and flushes them with CounterAggregator.
+The Firestore stand-in serializes writes to a document at --doc-writes-per-sec (Firestore
+sustains about 1/s, the default is scaled up so the test runs in seconds):
+- single doc: every flush writes analytics/global.
+- sharded: every flush writes a random shard of ShardedCounterDoc, a rollup runs while the
+  writers are busy and once at the end.
+Reports the sustained global counter write rate and checks that no increment was lost.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.analytics_shards_load_test [--instances 20] [--seconds 3] [--shards 10] [--doc-writes-per-sec 20]
+"""
+
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from eval.benchmarks.fake_firestore import FakeFirestore, install_stub_modules
+
+install_stub_modules()
+
+from services.analytics_aggregator import CounterAggregator, ShardedCounterDoc  # noqa: E402
+
+AGENTS = ["enso", "dex", "drift_perps", "researcher", "lp_agent"]
+
+
+def run_instance(aggregator, counter_ref, deadline: float, latencies: list, sent: list, seed: int):
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        aggregator.increment(counter_ref(), "total_messages")
+        aggregator.increment(counter_ref(), "agents_used", key=rng.choice(AGENTS))
+        start = time.perf_counter()
+        aggregator.flush()
+        latencies.append(time.perf_counter() - start)
+        sent.append(1)
+
+
+def run_load(instances: int, seconds: float, shards: int, doc_writes_per_sec: float, latency_ms: float):
+    db = FakeFirestore(latency_ms, max_doc_writes_per_sec=doc_writes_per_sec)
+    global_doc = db.collection("analytics").document("global")
+    counters = ShardedCounterDoc(db, global_doc, shards=shards) if shards > 1 else None
+    counter_ref = counters.shard_ref if counters else (lambda: global_doc)
+    # one aggregator per instance, flushed at the end of every invocation
+    aggregators = [CounterAggregator(db, flush_interval=0) for _ in range(instances)]
+
+    latencies, sent = [], []
+    deadline = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(
+            target=run_instance,
+            args=(aggregator, counter_ref, deadline, latencies, sent, seed),
+        )
+        for seed, aggregator in enumerate(aggregators)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    rollups = 0
+    if counters:
+        while time.perf_counter() < deadline:
+            time.sleep(seconds / 3)
+            counters.rollup()
+            rollups += 1
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    if counters:
+        counters.rollup()
+        rollups += 1
+        total = counters.read()
+    else:
+        total = dict(db.docs.get(global_doc.path, {}))
+    lost = len(sent) - total.get("total_messages", 0)
+    lost += len(sent) - sum(total.get("agents_used", {}).values())
+    latencies.sort()
+    return {
+        "messages/s": len(sent) / elapsed,
+        "flush p50 ms": statistics.median(latencies) * 1000,
+        "flush p95 ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "rollups": rollups,
+        "lost increments": lost,
+    }
+
+
+def run_benchmark(instances: int, seconds: float, shards: int, doc_writes_per_sec: float, latency_ms: float):
+    print(
+        f"[START] {instances} instances for {seconds}s, {doc_writes_per_sec} writes/s per doc, "
+        f"{latency_ms} ms per Firestore op"
+    )
+    print("\n[REPORT] Global counters write rate")
+    for label, shard_count in (("single doc", 1), (f"{shards} shards", shards)):
+        result = run_load(instances, seconds, shard_count, doc_writes_per_sec, latency_ms)
+        print(
+            f"   {label:<12} messages/s={result['messages/s']:7.1f}  "
+            f"flush p50={result['flush p50 ms']:7.1f} ms  p95={result['flush p95 ms']:7.1f} ms  "
+            f"rollups={result['rollups']}  lost increments={result['lost increments']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--shards", type=int, default=10)
+    parser.add_argument("--doc-writes-per-sec", type=float, default=20.0)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    args = parser.parse_args()
+    run_benchmark(args.instances, args.seconds, args.shards, args.doc_writes_per_sec, args.latency_ms)
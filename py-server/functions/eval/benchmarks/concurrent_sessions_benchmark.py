@@ -0,0 +1,166 @@
+"""
+Concurrent Sessions Load Test.
+Fires N planner sessions at once in a single process. Every session runs a few model turns,
+and every turn emits parallel tool calls shaped like the quoting tools (two token lookups,
+one price and one quote request). Tools are executed through autogen's FunctionTool exactly
+like AssistantAgent does: sync tools go through the loop's default executor, async tools are
+awaited on the loop. The backend is a local server with a fixed latency, no network is used.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.concurrent_sessions_benchmark [--sessions 20] [--turns 2] [--latency-ms 150]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from eval.benchmarks.fake_firestore import install_stub_modules
+
+install_stub_modules()
+
+from autogen_core import CancellationToken  # noqa: E402
+from autogen_core.tools import FunctionTool  # noqa: E402
+
+TOOL_CALLS_PER_TURN = 3
+
+
+class BackendHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self, data):
+        time.sleep(self.server.latency)
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/supportedTokens":
+            token = query.get("token", [""])[0]
+            self._reply([{"symbol": token, "contract_address": f"{token}-address"}])
+        else:
+            self._reply({"price": 2.0})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({"quote": "ok"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Backend(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, latency_ms: float):
+        super().__init__(("127.0.0.1", 0), BackendHandler)
+        self.latency = latency_ms / 1000
+
+
+def build_tools():
+    from services.http_client import get_async_http_client, http_session
+    from services.prices import price_service, PriceProviderType
+    from services.tokens import tokens_service
+    from config import FIREBASE_SERVER_ENDPOINT
+
+    def get_quote(input_token: str, output_token: str, amount: float) -> str:
+        from_token = tokens_service.get_token_metadata(chain="SOLANA", token=input_token)
+        to_token = tokens_service.get_token_metadata(chain="SOLANA", token=output_token)
+        price = price_service.get_price("SOLANA", from_token["contract_address"], PriceProviderType.JUPITER)
+        response = http_session.post(
+            f"{FIREBASE_SERVER_ENDPOINT}/quote",
+            json={"from": from_token, "to": to_token, "amount": amount / price["price"]},
+        )
+        return response.json()["quote"]
+
+    async def get_quote_async(input_token: str, output_token: str, amount: float) -> str:
+        from_token, to_token = await asyncio.gather(
+            tokens_service.get_token_metadata_async(chain="SOLANA", token=input_token),
+            tokens_service.get_token_metadata_async(chain="SOLANA", token=output_token),
+        )
+        price = await price_service.get_price_async("SOLANA", from_token["contract_address"], PriceProviderType.JUPITER)
+        response = await get_async_http_client().post(
+            f"{FIREBASE_SERVER_ENDPOINT}/quote",
+            json={"from": from_token, "to": to_token, "amount": amount / price["price"]},
+        )
+        return response.json()["quote"]
+
+    return (
+        FunctionTool(get_quote, description="sync quoting tool"),
+        FunctionTool(get_quote_async, name="get_quote", description="async quoting tool"),
+        price_service,
+    )
+
+
+async def run_session(tool: FunctionTool, session: int, turns: int):
+    for turn in range(turns):
+        # the model emits parallel tool calls, AssistantAgent runs them with asyncio.gather
+        await asyncio.gather(
+            *(
+                tool.run_json(
+                    {
+                        "input_token": f"T{session}-{turn}-{call}",
+                        "output_token": "USDC",
+                        "amount": 10.0,
+                    },
+                    CancellationToken(),
+                )
+                for call in range(TOOL_CALLS_PER_TURN)
+            )
+        )
+
+
+async def run_load(tool: FunctionTool, sessions: int, turns: int) -> float:
+    from services.http_client import close_async_http_client
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(tool, session, turns) for session in range(sessions)))
+    elapsed = time.perf_counter() - start
+    await close_async_http_client()
+    return elapsed
+
+
+def run_benchmark(sessions: int, turns: int, latency_ms: float):
+    backend = Backend(latency_ms)
+    threading.Thread(target=backend.serve_forever, daemon=True).start()
+    os.environ["FB_SERVER_ENDPOINT"] = f"http://127.0.0.1:{backend.server_address[1]}"
+
+    sync_tool, async_tool, price_service = build_tools()
+    tool_calls = sessions * turns * TOOL_CALLS_PER_TURN
+    print(
+        f"[START] {sessions} concurrent sessions x {turns} turns x {TOOL_CALLS_PER_TURN} parallel tool calls, "
+        f"backend latency {latency_ms} ms, default executor workers {min(32, (os.cpu_count() or 1) + 4)}"
+    )
+
+    sync_time = asyncio.run(run_load(sync_tool, sessions, turns))
+    price_service.clear()
+    async_time = asyncio.run(run_load(async_tool, sessions, turns))
+    backend.shutdown()
+
+    print("\n[REPORT] Planner sessions")
+    for label, elapsed in (("before (sync tools)", sync_time), ("after (async tools)", async_time)):
+        print(
+            f"   {label:<22} time={elapsed * 1000:8.1f} ms  "
+            f"throughput={tool_calls / elapsed:7.1f} tool calls/s  "
+            f"sessions/s={sessions / elapsed:6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    args = parser.parse_args()
+    run_benchmark(args.sessions, args.turns, args.latency_ms)
@@ -0,0 +1,126 @@
+"""
+Defi Token Index Benchmark.
+Compares resolving Enso defi tokens from agents/enso/assets/defi-tokens.json with a plain
+json.load (then scanning the chain -> protocol -> tokens lists, or building dict indexes)
+against the memory-mapped compiled index. Cold loads run in a fresh interpreter each time,
+module imports are excluded from the timing.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.defi_token_index_benchmark [--cold-runs 5] [--lookups 2000]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from agents.enso.defi_token_index import (
+    DEFI_TOKENS_INDEX_PATH,
+    DEFI_TOKENS_JSON_PATH,
+    DefiTokenIndex,
+)
+
+# (imports, load): only the load runs under the timer, both run in a fresh interpreter
+COLD_LOAD_SNIPPETS = {
+    "json.load": (
+        "import json\n",
+        f"tokens = json.load(open({DEFI_TOKENS_JSON_PATH!r}))\n",
+    ),
+    "json.load + dict indexes": (
+        "import json\n",
+        f"tokens = json.load(open({DEFI_TOKENS_JSON_PATH!r}))\n"
+        "by_address = {(c, t['address'].lower()): t for c, ps in tokens.items() for ts in ps.values() for t in ts}\n"
+        "by_symbol = {}\n"
+        "for c, ps in tokens.items():\n"
+        "    for ts in ps.values():\n"
+        "        for t in ts:\n"
+        "            by_symbol.setdefault((c, t['symbol'].lower()), []).append(t)\n",
+    ),
+    "mmap compiled index": (
+        "from agents.enso.defi_token_index import DefiTokenIndex\n",
+        f"index = DefiTokenIndex.open({DEFI_TOKENS_INDEX_PATH!r})\n"
+        "index.get_by_address('0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643', '1')\n",
+    ),
+}
+
+
+def cold_load_ms(imports: str, load: str, runs: int) -> float:
+    """Median time of the load step in a fresh interpreter (page cache is warm after the first run)."""
+    timer = "{}import time\n_start = time.perf_counter()\n{}print((time.perf_counter() - _start) * 1000)\n"
+    samples = [
+        float(subprocess.check_output([sys.executable, "-c", timer.format(imports, load)], text=True))
+        for _ in range(runs)
+    ]
+    return statistics.median(samples)
+
+
+def scan_by_address(tokens_by_chain: dict, chain_id: str, address: str):
+    address = address.lower()
+    for tokens in tokens_by_chain.get(chain_id, {}).values():
+        for token in tokens:
+            if token["address"].lower() == address:
+                return token
+    return None
+
+
+def scan_by_symbol(tokens_by_chain: dict, chain_id: str, symbol: str):
+    symbol = symbol.lower()
+    return [
+        token
+        for tokens in tokens_by_chain.get(chain_id, {}).values()
+        for token in tokens
+        if token["symbol"].lower() == symbol
+    ]
+
+
+def lookup_us(fn, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(*query)
+    return (time.perf_counter() - start) / len(queries) * 1_000_000
+
+
+def run_benchmark(cold_runs: int, lookups: int):
+    with open(DEFI_TOKENS_JSON_PATH) as file:
+        tokens_by_chain = json.load(file)
+    index = DefiTokenIndex.open()
+    rng = random.Random(3)
+    all_tokens = [
+        (chain_id, token)
+        for chain_id, protocols in tokens_by_chain.items()
+        for tokens in protocols.values()
+        for token in tokens
+    ]
+    sample = [rng.choice(all_tokens) for _ in range(lookups)]
+    address_queries = [(chain_id, token["address"]) for chain_id, token in sample]
+    symbol_queries = [(chain_id, token["symbol"]) for chain_id, token in sample]
+
+    for chain_id, address in address_queries[:200]:
+        assert index.get_by_address(address, chain_id)["address"] == scan_by_address(tokens_by_chain, chain_id, address)["address"]
+
+    print(f"[START] {len(index)} tokens, {cold_runs} cold runs per loader, {lookups} random lookups")
+
+    print("\n[REPORT] Cold load (fresh interpreter, median)")
+    for label, (imports, load) in COLD_LOAD_SNIPPETS.items():
+        print(f"   {label:<28} {cold_load_ms(imports, load, cold_runs):8.2f} ms")
+
+    print("\n[REPORT] Lookup latency (per call)")
+    rows = (
+        ("by (chain, address)", scan_by_address, lambda chain_id, address: index.get_by_address(address, chain_id), address_queries),
+        ("by (chain, symbol)", scan_by_symbol, lambda chain_id, symbol: index.get_by_symbol(symbol, chain_id), symbol_queries),
+    )
+    for label, scan, indexed, queries in rows:
+        scan_time = lookup_us(lambda *q: scan(tokens_by_chain, *q), queries)
+        index_time = lookup_us(indexed, queries)
+        print(f"   {label:<28} json scan={scan_time:9.1f} us  mmap index={index_time:6.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cold-runs", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+    run_benchmark(args.cold_runs, args.lookups)
@@ -0,0 +1,106 @@
+"""
+Embedding Cache Benchmark.
+Replays the embedding traffic of two flows against a simulated embeddings endpoint (fixed
+latency per request plus a small per-input cost), without and with the EmbeddingCache:
+- Polymarket ingestion: each event title is embedded by check_similar_event_exists and again
+  by save_event_with_embedding, and a share of the events are re-sent in later runs.
+- Orbit indexing: a document split into chunks, embedded one request per chunk before and
+  with a single batched request after.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.embedding_cache_benchmark [--events 40] [--repeat-rate 0.3] [--chunks 60] [--latency-ms 120]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from services.embedding_cache import EmbeddingCache
+
+MODEL = "text-embedding-3-small"
+PER_INPUT_MS = 0.5
+
+
+class SimulatedEmbeddingsEndpoint:
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self.inputs = 0
+
+    async def create(self, texts: list[str]) -> list[list[float]]:
+        self.requests += 1
+        self.inputs += len(texts)
+        await asyncio.sleep(self.latency + len(texts) * PER_INPUT_MS / 1000)
+        return [[float(len(text))] * 8 for text in texts]
+
+
+async def polymarket_flow(titles: list[str], embed) -> None:
+    for title in titles:
+        await embed([title])  # check_similar_event_exists
+        await embed([title])  # save_event_with_embedding
+
+
+async def indexing_flow(chunks: list[str], embed, batched: bool) -> None:
+    if batched:
+        await embed(chunks)
+    else:
+        for chunk in chunks:
+            await embed([chunk])
+
+
+async def run(flow, endpoint: SimulatedEmbeddingsEndpoint, cache: EmbeddingCache | None):
+    async def embed(texts):
+        if cache is None:
+            return await endpoint.create(texts)
+        return await cache.get_or_create(MODEL, texts, endpoint.create)
+
+    start = time.perf_counter()
+    await flow(embed)
+    return time.perf_counter() - start
+
+
+def report(label: str, elapsed: float, endpoint: SimulatedEmbeddingsEndpoint):
+    print(
+        f"   {label:<24} requests={endpoint.requests:>4}  inputs={endpoint.inputs:>4}  "
+        f"time={elapsed * 1000:8.1f} ms"
+    )
+
+
+def run_benchmark(events: int, repeat_rate: float, chunks: int, latency_ms: float):
+    rng = random.Random(5)
+    titles = [f"Will event {i} resolve YES before the deadline?" for i in range(events)]
+    # later runs of the ingestion job see some of the same events again
+    titles += rng.sample(titles, int(events * repeat_rate))
+    document_chunks = [f"Orbit documentation chunk {i} " * 6 for i in range(chunks)]
+    print(
+        f"[START] {len(titles)} Polymarket events ({repeat_rate:.0%} repeated), "
+        f"{chunks} document chunks, {latency_ms} ms per embeddings request"
+    )
+
+    print("\n[REPORT] Polymarket ingestion")
+    for label, cache in (("before (no cache)", None), ("after (cache)", EmbeddingCache())):
+        endpoint = SimulatedEmbeddingsEndpoint(latency_ms)
+        elapsed = asyncio.run(run(lambda embed: polymarket_flow(titles, embed), endpoint, cache))
+        report(label, elapsed, endpoint)
+
+    print("\n[REPORT] Orbit document indexing")
+    for label, cache, batched in (
+        ("before (per chunk)", None, False),
+        ("after (batched)", EmbeddingCache(), True),
+    ):
+        endpoint = SimulatedEmbeddingsEndpoint(latency_ms)
+        elapsed = asyncio.run(
+            run(lambda embed: indexing_flow(document_chunks, embed, batched), endpoint, cache)
+        )
+        report(label, elapsed, endpoint)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--repeat-rate", type=float, default=0.3)
+    parser.add_argument("--chunks", type=int, default=60)
+    parser.add_argument("--latency-ms", type=float, default=120.0)
+    args = parser.parse_args()
+    run_benchmark(args.events, args.repeat_rate, args.chunks, args.latency_ms)
@@ -0,0 +1,156 @@
+"""
+Enso Catalog Benchmark.
+Replays the catalog lookups of a defi_quote call ("deposit USDC into aave on base":
+get_matching_defi_tokens + is_chain_supported) the way utils.firebase used to serve them
+(stream both collections and resolve every chain name per call) and through EnsoCatalog
+on a warm instance. Firestore and the chains service are simulated with a fixed latency.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.enso_catalog_benchmark [--quotes 20] [--chains 12] [--tokens 2000] [--latency-ms 40]
+"""
+
+import argparse
+import random
+import time
+
+from eval.benchmarks.fake_firestore import FakeFirestore, install_stub_modules
+
+install_stub_modules()
+
+from utils.enso_catalog import EnsoCatalog, transform_enso_token  # noqa: E402
+
+PROJECTS = ["aave-v3", "morpho-blue-vaults", "compound-v3", "euler", "fluid", "spark"]
+SYMBOLS = ["USDC", "WETH", "USDT", "DAI", "cbBTC", "wstETH"]
+
+
+class SimulatedChainsService:
+    """Stands in for callChainsService: fixed latency, counts requests."""
+
+    def __init__(self, chain_names: dict, latency_ms: float, memoize: bool):
+        self.chain_names = chain_names
+        self.latency = latency_ms / 1000
+        self.memoize = memoize
+        self.requests = 0
+        self._memo = {}
+
+    def __call__(self, method: str, **params):
+        key = (method, tuple(sorted(params.items())))
+        if self.memoize and key in self._memo:
+            return self._memo[key]
+        self.requests += 1
+        time.sleep(self.latency)
+        if method == "getChainName":
+            result = self.chain_names[params["chainId"]]
+        else:
+            by_name = {name.lower(): chain_id for chain_id, name in self.chain_names.items()}
+            result = by_name.get(params["chainName"].lower())
+        self._memo[key] = result
+        return result
+
+
+def seed(db: FakeFirestore, chains: int, tokens: int) -> dict:
+    rng = random.Random(7)
+    chain_names = {"8453": "Base", **{str(1000 + i): f"Chain{i}" for i in range(chains - 1)}}
+    for chain_id in chain_names:
+        db.docs[f"enso_supported_protocols/{chain_id}"] = {"protocols": PROJECTS}
+    for i in range(tokens):
+        chain_id = rng.choice(list(chain_names))
+        db.docs[f"enso_supported_tokens/{i}"] = {
+            "chainId": int(chain_id),
+            "project": rng.choice(PROJECTS),
+            "symbol": f"a{rng.choice(SYMBOLS)}",
+            "address": f"0x{i:040x}",
+            "apy": round(rng.uniform(0, 15), 2),
+        }
+    return chain_names
+
+
+def legacy_chains_and_protocols(db, chains_service):
+    data = {}
+    for doc in db.collection("enso_supported_protocols").stream():
+        data[doc.id] = {
+            "chain_name": chains_service(method="getChainName", chainId=doc.id),
+            "protocols": doc.to_dict()["protocols"],
+        }
+    return data
+
+
+def legacy_tokens(db, chains_service, chain_id=None, project=None, symbol=None):
+    query = db.collection("enso_supported_tokens")
+    if chain_id:
+        query = query.where("chainId", "==", int(chain_id))
+    if project:
+        query = query.where("project", "==", project.lower())
+    docs = query.stream()
+    chains = legacy_chains_and_protocols(db, chains_service)
+    tokens = [
+        transform_enso_token(doc.to_dict(), chains.get(str(doc.to_dict()["chainId"]), {}).get("chain_name"))
+        for doc in docs
+        if not symbol or symbol.lower() in doc.to_dict()["symbol"].lower()
+    ]
+    tokens.sort(key=lambda token: token.get("apy", 0), reverse=True)
+    return tokens
+
+
+def quote_lookups(get_chains, get_tokens, chains_service):
+    """The catalog lookups behind defi_quote(token="USDC", from_chain="base", protocol="aave-v3")."""
+    chain_id = chains_service(method="getChainId", chainName="base")
+    tokens = get_tokens(chain_id=str(chain_id), project="aave-v3", symbol="USDC")
+    chains = get_chains()
+    assert tokens and any(data["chain_name"].lower() == "base" for data in chains.values())
+    return tokens[0]
+
+
+def run(quotes: int, catalog: bool, chains: int, tokens: int, latency_ms: float):
+    db = FakeFirestore(latency_ms=latency_ms)
+    chain_names = seed(db, chains, tokens)
+    chains_service = SimulatedChainsService(chain_names, latency_ms, memoize=catalog)
+
+    if catalog:
+        enso_catalog = EnsoCatalog(
+            load_chains=lambda: legacy_chains_and_protocols(db, chains_service),
+            load_tokens=lambda: [doc.to_dict() for doc in db.collection("enso_supported_tokens").stream()],
+        )
+        get_chains, get_tokens = enso_catalog.get_chains_and_protocols, enso_catalog.get_tokens
+        quote_lookups(get_chains, get_tokens, chains_service)  # warm the instance
+    else:
+        get_chains = lambda: legacy_chains_and_protocols(db, chains_service)  # noqa: E731
+        get_tokens = lambda **filters: legacy_tokens(db, chains_service, **filters)  # noqa: E731
+
+    db.reset_ops()
+    chains_service.requests = 0
+    start = time.perf_counter()
+    best = None
+    for _ in range(quotes):
+        best = quote_lookups(get_chains, get_tokens, chains_service)
+    elapsed = time.perf_counter() - start
+    return elapsed, db.total_ops + chains_service.requests, best["token"]["address"]
+
+
+def run_benchmark(quotes: int, chains: int, tokens: int, latency_ms: float):
+    print(
+        f"[START] {quotes} defi_quote lookups, {chains} chains, {tokens} tokens, "
+        f"{latency_ms} ms per Firestore/chains service round trip"
+    )
+    results = {
+        "before (per-call reads)": run(quotes, False, chains, tokens, latency_ms),
+        "after (warm catalog)": run(quotes, True, chains, tokens, latency_ms),
+    }
+    assert len({best for _, _, best in results.values()}) == 1, "both paths must pick the same token"
+
+    print("\n[REPORT] Enso catalog lookups")
+    for label, (elapsed, round_trips, _) in results.items():
+        print(
+            f"   {label:<26} round_trips/quote={round_trips / quotes:6.1f}  "
+            f"latency/quote={elapsed / quotes * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quotes", type=int, default=20)
+    parser.add_argument("--chains", type=int, default=12)
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    run_benchmark(args.quotes, args.chains, args.tokens, args.latency_ms)
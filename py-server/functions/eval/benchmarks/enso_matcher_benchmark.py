@@ -0,0 +1,113 @@
+"""
+Enso Matcher Benchmark.
+Runs the get_matching_defi_tokens / is_protocol_supported lookups against a large Enso
+catalog: the previous in-Python filtering (substring test on every token, then a sort) and
+protocol scan, against the EnsoCatalog indexes. Everything is in memory, no I/O is involved.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.enso_matcher_benchmark [--tokens 50000] [--chains 20] [--repeat 200]
+"""
+
+import argparse
+import random
+import time
+
+from eval.benchmarks.fake_firestore import install_stub_modules
+
+install_stub_modules()
+
+from utils.enso_catalog import EnsoCatalog  # noqa: E402
+
+BASE_SYMBOLS = ["USDC", "WETH", "USDT", "DAI", "cbBTC", "wstETH", "GHO", "USDe", "sUSDS", "EURC"]
+QUERIES = [
+    ("8453", "aave-v3", "usdc"),
+    (None, None, "weth"),
+    (None, "morpho-blue-vaults", None),
+    ("8453", None, "steth"),
+    (None, None, "usd"),
+]
+
+
+def build_catalog(token_count: int, chain_count: int, projects: int) -> EnsoCatalog:
+    rng = random.Random(11)
+    project_names = ["aave-v3", "morpho-blue-vaults", "compound-v3"] + [f"protocol-{i}-v{i % 3 + 1}" for i in range(projects)]
+    chains = {
+        str(8453 + i): {"chain_name": f"Chain{i}", "protocols": rng.sample(project_names, k=len(project_names) // 2)}
+        for i in range(chain_count)
+    }
+    token_docs = [
+        {
+            "chainId": int(rng.choice(list(chains))),
+            "project": rng.choice(project_names),
+            "symbol": f"{rng.choice(['a', 'c', 'sp', 'mw', 'f'])}{rng.choice(BASE_SYMBOLS)}{i % 97}",
+            "address": f"0x{i:040x}",
+            "apy": round(rng.uniform(0, 20), 4),
+        }
+        for i in range(token_count)
+    ]
+    return EnsoCatalog(load_chains=lambda: chains, load_tokens=lambda: token_docs)
+
+
+def scan_tokens(all_tokens, chain_id=None, project=None, symbol=None):
+    """The previous behaviour: filter every token in Python, then sort the result by APY."""
+    tokens = [
+        token
+        for token in all_tokens
+        if (not chain_id or token["chain_id"] == chain_id)
+        and (not project or token["project"] == project)
+        and (not symbol or symbol.lower() in token["token"]["symbol"].lower())
+    ]
+    tokens.sort(key=lambda token: token.get("apy", 0), reverse=True)
+    return tokens
+
+
+def scan_protocols(chains, protocol_slug):
+    protocol_slug = protocol_slug.lower()
+    for chain_data in chains.values():
+        for protocol in (p.lower() for p in chain_data["protocols"]):
+            if protocol_slug in protocol or protocol.startswith(protocol_slug):
+                return True
+    return False
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run_benchmark(token_count: int, chain_count: int, repeat: int):
+    catalog = build_catalog(token_count, chain_count, projects=200)
+    start = time.perf_counter()
+    all_tokens = catalog.get_tokens()
+    chains = catalog.get_chains_and_protocols()
+    print(
+        f"[START] {token_count} tokens, {chain_count} chains, {repeat} runs per query "
+        f"(catalog built in {(time.perf_counter() - start) * 1000:.0f} ms)"
+    )
+
+    print("\n[REPORT] Token lookups (ms per call)")
+    for chain_id, project, symbol in QUERIES:
+        expected = scan_tokens(all_tokens, chain_id, project, symbol)
+        assert catalog.get_tokens(chain_id, project, symbol) == expected, "index and scan must agree"
+        scan_ms = timed(lambda: scan_tokens(all_tokens, chain_id, project, symbol), repeat)
+        index_ms = timed(lambda: catalog.get_tokens(chain_id, project, symbol), repeat)
+        label = f"chain={chain_id} project={project} symbol={symbol}"
+        print(f"   {label:<52} matches={len(expected):>6}  scan={scan_ms:8.3f}  index={index_ms:8.3f}  x{scan_ms / index_ms:6.1f}")
+
+    print("\n[REPORT] Protocol lookups (ms per call)")
+    for slug in ("aave", "v2", "protocol-199", "uniswap"):
+        assert scan_protocols(chains, slug) == bool(catalog.find_protocols(slug))
+        scan_ms = timed(lambda: scan_protocols(chains, slug), repeat)
+        index_ms = timed(lambda: catalog.find_protocols(slug), repeat)
+        print(f"   {slug:<52} scan={scan_ms:8.3f}  index={index_ms:8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=50000)
+    parser.add_argument("--chains", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run_benchmark(args.tokens, args.chains, args.repeat)
@@ -0,0 +1,384 @@
+"""
+In-memory Firestore stand-in used by the benchmarks.
+Every operation sleeps for a configurable latency and is counted, so benchmarks can
+report round trips and wall time without touching a real project.
+"""
+
+import copy
+import itertools
+import os
+import sys
+import threading
+import time
+import types
+import uuid
+from collections import Counter
+
+
+def install_stub_modules():
+    """
+    Prepares the process so service modules can be imported offline:
+    - config.py needs the Firebase env vars to be present (empty is fine)
+    - registers placeholder Firestore sentinels when google-cloud-firestore is not installed,
+      so modules that only import constants from it can be loaded by the benchmarks.
+    - without a Firebase private key, firebase_admin (a placeholder when it is not installed)
+      hands out a FakeFirestore without latency and Google auth anonymous credentials, so
+      whole agents can be imported offline.
+    """
+    os.environ.setdefault("AGENT_FIREBASE_PRIVATE_KEY", "")
+    os.environ.setdefault("FB_SERVER_ENDPOINT", "http://localhost:5001")
+    try:
+        import google.cloud.firestore_v1  # noqa: F401
+    except ImportError:
+        fake_firestore_v1 = _placeholder_module("google.cloud.firestore_v1")
+        fake_firestore_v1.SERVER_TIMESTAMP = object()
+        fake_firestore_v1.Increment = Increment
+        sys.modules.setdefault("google.cloud.firestore_v1", fake_firestore_v1)
+        for name in ("base_query", "base_vector_query", "vector"):
+            sys.modules.setdefault(
+                f"google.cloud.firestore_v1.{name}",
+                _placeholder_module(f"google.cloud.firestore_v1.{name}"),
+            )
+    try:
+        import firebase_admin
+        from firebase_admin import credentials, firestore
+    except ImportError:
+        firebase_admin = _placeholder_module("firebase_admin")
+        sys.modules["firebase_admin"] = firebase_admin
+        for name in ("firestore", "credentials", "auth"):
+            module = _placeholder_module(f"firebase_admin.{name}")
+            setattr(firebase_admin, name, module)
+            sys.modules[f"firebase_admin.{name}"] = module
+        credentials, firestore = firebase_admin.credentials, firebase_admin.firestore
+        firestore.SERVER_TIMESTAMP = sys.modules["google.cloud.firestore_v1"].SERVER_TIMESTAMP
+        firestore.Increment = Increment
+    if not os.environ["AGENT_FIREBASE_PRIVATE_KEY"]:
+        # No service account offline, utils.firebase gets a FakeFirestore without latency
+        firebase_admin.get_app = lambda *args, **kwargs: object()
+        credentials.Certificate = lambda *args, **kwargs: object()
+        firestore.client = lambda *args, **kwargs: FakeFirestore(latency_ms=0)
+    try:
+        import google.auth
+        from google.auth.credentials import AnonymousCredentials
+    except ImportError:
+        pass
+    else:
+        if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
+            # The Cloud Trace exporter looks up credentials when services.tracing is imported
+            google.auth.default = lambda *args, **kwargs: (AnonymousCredentials(), "benchmark")
+
+
+def _placeholder_module(name: str) -> types.ModuleType:
+    """A module whose every missing attribute is a placeholder class of that name."""
+    module = types.ModuleType(name)
+    module.__getattr__ = lambda attr: (
+        _raise_attribute_error(attr)
+        if attr.startswith("__")
+        else type(attr, (), {"__init__": lambda self, *args, **kwargs: None})
+    )
+    return module
+
+
+def _raise_attribute_error(attr: str):
+    raise AttributeError(attr)
+
+
+class Increment:
+    """Placeholder for firestore.Increment when google-cloud-firestore is not installed."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _is_increment(value) -> bool:
+    return type(value).__name__ == "Increment" and hasattr(value, "value")
+
+
+def _merge(target: dict, data: dict):
+    """Applies a set(..., merge=True) payload: nested maps are merged, increments are added."""
+    for field, value in data.items():
+        if isinstance(value, dict):
+            current = target.get(field)
+            target[field] = current if isinstance(current, dict) else {}
+            _merge(target[field], value)
+        elif _is_increment(value):
+            target[field] = target.get(field, 0) + value.value
+        else:
+            target[field] = value
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id: str, data: dict | None, reference: "FakeDocumentRef | None" = None):
+        self.id = doc_id
+        self._data = data
+        self.reference = reference
+        self.update_time = None
+
+    @property
+    def exists(self) -> bool:
+        return self._data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocumentRef:
+    def __init__(self, client: "FakeFirestore", path: str):
+        self.client = client
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name: str) -> "FakeCollectionRef":
+        return FakeCollectionRef(self.client, f"{self.path}/{name}")
+
+    def get(self) -> FakeSnapshot:
+        self.client._round_trip("get")
+        with self.client.lock:
+            data = copy.deepcopy(self.client.docs.get(self.path))
+            snapshot = FakeSnapshot(self.id, data, self)
+            snapshot.update_time = self.client.update_times.get(self.path)
+        return snapshot
+
+    def _check_precondition(self, option):
+        """Raises like a write whose last_update_time precondition no longer holds."""
+        if option and option.get("last_update_time") != self.client.update_times.get(self.path):
+            raise ValueError(f"Failed precondition: {self.path} was changed")
+
+    def create(self, data: dict):
+        """Fails when the document exists, like Firestore's create()."""
+        self.client._round_trip("create")
+        with self.client.lock:
+            if self.path in self.client.docs:
+                raise ValueError(f"Document already exists: {self.path}")
+            self._apply_set(data, merge=False)
+
+    def delete(self, option=None):
+        self.client._round_trip("delete")
+        with self.client.lock:
+            self._check_precondition(option)
+            self.client.docs.pop(self.path, None)
+            self.client.update_times.pop(self.path, None)
+
+    def set(self, data: dict, merge: bool = False):
+        self.client._round_trip("set")
+        self.client._wait_for_write_slot([self.path])
+        self._apply_set(data, merge)
+
+    def _apply_set(self, data: dict, merge: bool):
+        self.client.update_times[self.path] = next(self.client.clock)
+        if merge and self.path in self.client.docs:
+            _merge(self.client.docs[self.path], data)
+        else:
+            self.client.docs[self.path] = {}
+            _merge(self.client.docs[self.path], data)
+
+    def update(self, data: dict, option=None):
+        self.client._round_trip("update")
+        if self.path not in self.client.docs:
+            raise KeyError(f"No document to update: {self.path}")
+        self.client._wait_for_write_slot([self.path])
+        with self.client.lock:
+            self._check_precondition(option)
+            self.client.update_times[self.path] = next(self.client.clock)
+            # update() takes dotted field paths
+            nested = {}
+            for field_path, value in data.items():
+                target = nested
+                *parents, field = field_path.split(".")
+                for part in parents:
+                    target = target.setdefault(part, {})
+                target[field] = value
+            _merge(self.client.docs[self.path], nested)
+
+
+class FakeCollectionRef:
+    def __init__(self, client: "FakeFirestore", path: str):
+        self.client = client
+        self.path = path
+
+    def document(self, doc_id: str | None = None) -> FakeDocumentRef:
+        return FakeDocumentRef(self.client, f"{self.path}/{doc_id or uuid.uuid4().hex}")
+
+    def add(self, data: dict):
+        doc_ref = self.document()
+        doc_ref.set(data)
+        return None, doc_ref
+
+    def where(self, field: str, op: str, value) -> "FakeQuery":
+        return FakeQuery(self).where(field, op, value)
+
+    def order_by(self, field: str) -> "FakeQuery":
+        return FakeQuery(self).order_by(field)
+
+    def stream(self):
+        return FakeQuery(self).stream()
+
+
+class FakeQuery:
+    """
+    Supports the equality filters, ordering, start_after cursors and limit used by the
+    services, a stream is one round trip.
+    """
+
+    def __init__(
+        self,
+        collection: FakeCollectionRef,
+        filters: tuple = (),
+        order_field: str | None = None,
+        limit_count: int | None = None,
+        start_after_value=None,
+    ):
+        self.collection = collection
+        self.filters = filters
+        self.order_field = order_field
+        self.limit_count = limit_count
+        self.start_after_value = start_after_value
+
+    def _replace(self, **changes) -> "FakeQuery":
+        fields = {
+            "filters": self.filters,
+            "order_field": self.order_field,
+            "limit_count": self.limit_count,
+            "start_after_value": self.start_after_value,
+        }
+        return FakeQuery(self.collection, **{**fields, **changes})
+
+    def where(self, field: str, op: str, value) -> "FakeQuery":
+        if op != "==":
+            raise NotImplementedError(f"Unsupported operator: {op}")
+        return self._replace(filters=self.filters + ((field, value),))
+
+    def order_by(self, field: str) -> "FakeQuery":
+        return self._replace(order_field=field)
+
+    def start_after(self, values) -> "FakeQuery":
+        """Takes a dict of field values or a document snapshot, ties are not broken by id."""
+        if isinstance(values, FakeSnapshot):
+            values = values.to_dict()
+        return self._replace(start_after_value=values[self.order_field])
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._replace(limit_count=count)
+
+    def count(self) -> "FakeAggregationQuery":
+        return FakeAggregationQuery(self)
+
+    def stream(self):
+        client = self.collection.client
+        client._round_trip("stream")
+        prefix = f"{self.collection.path}/"
+        with client.lock:
+            matches = []
+            for path, data in client.docs.items():
+                doc_id = path[len(prefix):]
+                if not path.startswith(prefix) or "/" in doc_id:
+                    continue
+                if all(data.get(field) == value for field, value in self.filters):
+                    matches.append((doc_id, data))
+            if self.order_field:
+                matches = [match for match in matches if match[1].get(self.order_field) is not None]
+                matches.sort(key=lambda match: match[1].get(self.order_field))
+            if self.start_after_value is not None:
+                matches = [
+                    match
+                    for match in matches
+                    if match[1][self.order_field] > self.start_after_value
+                ]
+            # Only the returned documents are copied
+            matches = [(doc_id, copy.deepcopy(data)) for doc_id, data in matches[: self.limit_count]]
+        for doc_id, data in matches:
+            yield FakeSnapshot(doc_id, data, self.collection.document(doc_id))
+
+
+class FakeAggregationResult:
+    def __init__(self, value: int):
+        self.alias = "count"
+        self.value = value
+
+
+class FakeAggregationQuery:
+    """A count() over a query, get() is one round trip that returns [[result]] like Firestore."""
+
+    def __init__(self, query: FakeQuery):
+        self.query = query
+
+    def get(self):
+        return [[FakeAggregationResult(sum(1 for _ in self.query.stream()))]]
+
+
+class FakeWriteBatch:
+    """Collects set() and delete() calls and applies them with a single round trip on commit."""
+
+    def __init__(self, client: "FakeFirestore"):
+        self.client = client
+        self._writes = []
+
+    def set(self, doc_ref: FakeDocumentRef, data: dict, merge: bool = False):
+        self._writes.append((doc_ref, data, merge))
+
+    def delete(self, doc_ref: FakeDocumentRef):
+        self._writes.append((doc_ref, None, False))
+
+    def commit(self):
+        self.client._round_trip("commit")
+        self.client._wait_for_write_slot([doc_ref.path for doc_ref, _, _ in self._writes])
+        with self.client.lock:
+            for doc_ref, data, merge in self._writes:
+                if data is None:
+                    self.client.docs.pop(doc_ref.path, None)
+                    self.client.update_times.pop(doc_ref.path, None)
+                else:
+                    doc_ref._apply_set(data, merge)
+        self._writes = []
+
+
+class FakeFirestore:
+    """
+    Minimal Firestore client that simulates per-operation network latency.
+    With `max_doc_writes_per_sec`, writes to the same document are serialized at that rate,
+    like the sustained write limit of a Firestore document.
+    """
+
+    def __init__(self, latency_ms: float = 10.0, max_doc_writes_per_sec: float = 0):
+        self.latency = latency_ms / 1000
+        self.docs: dict[str, dict] = {}
+        # Stand-in for each document's update_time, checked by write_option preconditions
+        self.update_times: dict[str, int] = {}
+        self.clock = itertools.count(1)
+        self.ops = Counter()
+        self.lock = threading.Lock()
+        self.write_interval = 1 / max_doc_writes_per_sec if max_doc_writes_per_sec else 0
+        self._next_write_at: dict[str, float] = {}
+
+    def _round_trip(self, op: str):
+        with self.lock:
+            self.ops[op] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _wait_for_write_slot(self, paths: list[str]):
+        if not self.write_interval:
+            return
+        with self.lock:
+            now = time.perf_counter()
+            slot = max([now] + [self._next_write_at.get(path, now) for path in paths])
+            for path in paths:
+                self._next_write_at[path] = slot + self.write_interval
+        time.sleep(slot - now)
+
+    def collection(self, name: str) -> FakeCollectionRef:
+        return FakeCollectionRef(self, name)
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def write_option(self, **kwargs):
+        """Only the last_update_time precondition is supported, by update() and delete()."""
+        return kwargs
+
+    @property
+    def total_ops(self) -> int:
+        return sum(self.ops.values())
+
+    def reset_ops(self):
+        self.ops.clear()
@@ -0,0 +1,92 @@
+"""
+HTTP Client Benchmark.
+Sends the same sequence of tool calls to a local endpoint with the bare requests.get and
+with the shared pooled session. Opening a connection on the local server sleeps for a fixed
+"handshake" latency, standing in for the TCP + TLS setup to a remote host.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.http_client_benchmark [--calls 50] [--handshake-ms 60]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from services.http_client import PooledSession, http_stats
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = json.dumps({"price": 1.0}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HandshakeServer(ThreadingHTTPServer):
+    """Local server where every new connection costs `handshake` seconds."""
+
+    daemon_threads = True
+
+    def __init__(self, handshake: float):
+        super().__init__(("127.0.0.1", 0), KeepAliveHandler)
+        self.handshake = handshake
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        time.sleep(self.handshake)
+        super().process_request(request, client_address)
+
+
+def run_calls(get, url: str, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        get(url).raise_for_status()
+    return time.perf_counter() - start
+
+
+def run_benchmark(calls: int, handshake_ms: float):
+    server = HandshakeServer(handshake_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/getTokenPrice"
+    print(f"[START] {calls} sequential calls, {handshake_ms} ms per new connection")
+
+    bare_time = run_calls(requests.get, url, calls)
+    bare_connections = server.connections
+
+    server.connections = 0
+    http_stats.reset()
+    session = PooledSession()
+    pooled_time = run_calls(session.get, url, calls)
+    pooled_connections = server.connections
+    stats = http_stats.snapshot()["127.0.0.1"]
+    server.shutdown()
+
+    print("\n[REPORT] Outbound calls")
+    print(f"   {'before (bare requests.get)':<30} connections={bare_connections:>3}  time={bare_time * 1000:8.1f} ms")
+    print(f"   {'after (pooled session)':<30} connections={pooled_connections:>3}  time={pooled_time * 1000:8.1f} ms")
+    print(
+        f"   session stats: reuse_rate={stats['reuse_rate']}  "
+        f"avg_latency={stats['avg_latency_ms']} ms  max_latency={stats['max_latency_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--handshake-ms", type=float, default=60.0)
+    args = parser.parse_args()
+    run_benchmark(args.calls, args.handshake_ms)
@@ -0,0 +1,170 @@
+"""
+Memory Compaction Benchmark.
+Seeds a simulated `memories` collection with a year of memories per user, part of them planted
+near-duplicates of an earlier memory (distance ~0.3, under the 0.45 threshold) and part of them
+interactions nobody repeated in months, then runs MemoryCompactor and reports:
+- collection size and the latency of a top-10 search over a user's memories, before and after.
+- planted duplicates merged and distinct memories wrongly merged.
+- how many deadline-limited runs the first pass took (each resumes from the saved cursor).
+- the cost of the next pass, which only compares the memories written since.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.memory_compaction_benchmark [--users 20] [--memories 500] [--duplicates 0.2] [--deadline-sec 1]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from eval.benchmarks.fake_firestore import FakeFirestore, install_stub_modules
+
+install_stub_modules()
+
+from services.memory_compaction import MemoryCompactor  # noqa: E402
+from services.memory_index import UserMemoryIndex  # noqa: E402
+
+DIMENSIONS = 1536
+# Norm of the noise added to a memory to plant a near-duplicate of it
+DUPLICATE_NOISE = 0.3
+
+
+def unit(rows: np.ndarray) -> np.ndarray:
+    return rows / np.linalg.norm(rows, axis=-1, keepdims=True)
+
+
+def seed_user(db, user_id: str, count: int, duplicates: float, rng: np.random.Generator, now):
+    py_rng = random.Random(int(rng.integers(1 << 31)))
+    bases = []
+    for i in range(count):
+        created = now - timedelta(days=py_rng.uniform(0, 365))
+        if bases and py_rng.random() < duplicates:
+            base = py_rng.choice(bases)
+            noise = rng.standard_normal(DIMENSIONS) * DUPLICATE_NOISE / np.sqrt(DIMENSIONS)
+            embedding = base["embedding"] + noise
+            created = max(created, base["created"] + timedelta(minutes=1))
+            base_id = base["id"]
+        else:
+            embedding = unit(rng.standard_normal(DIMENSIONS))
+            base_id = f"{user_id}_m{i}"
+            bases.append({"id": base_id, "embedding": embedding, "created": created})
+        db.collection("memories").document(f"{user_id}_m{i}").set(
+            {
+                "user_id": user_id,
+                "content": f"memory {i}",
+                "items": [{"type": "interaction", "content": f"item {i}"}],
+                "type": "user_preference" if py_rng.random() < 0.3 else "interaction",
+                "timestamp": created,
+                "similarity_count": py_rng.choice([0, 0, 0, 1, 2]),
+                "embedding_field": embedding.astype(np.float32).tolist(),
+                "base_id": base_id,
+            }
+        )
+
+
+def snapshot(db, users: list[str], rng: np.random.Generator):
+    """Collection size and the mean top-10 search latency over each user's memories."""
+    docs = list(db.collection("memories").stream())
+    latencies = []
+    for user_id in users:
+        rows = [doc.to_dict() for doc in docs if doc.to_dict()["user_id"] == user_id]
+        index = UserMemoryIndex(
+            [{"id": row["base_id"]} for row in rows], [row["embedding_field"] for row in rows]
+        )
+        query = unit(rng.standard_normal(DIMENSIONS))
+        start = time.perf_counter()
+        for _ in range(20):
+            index.search(query, limit=10)
+        latencies.append((time.perf_counter() - start) / 20 * 1e6)
+    return docs, float(np.mean(latencies))
+
+
+def run_until_complete(compactor: MemoryCompactor, deadline_sec: float):
+    runs, start = 0, time.perf_counter()
+    while True:
+        runs += 1
+        result = compactor.run(deadline_seconds=deadline_sec)
+        if result["completed"]:
+            return result, runs, time.perf_counter() - start
+
+
+def run_benchmark(users: int, memories: int, duplicates: float, deadline_sec: float):
+    print(
+        f"[START] {users} users x {memories} memories, {duplicates:.0%} planted duplicates, "
+        f"runs limited to {deadline_sec}s"
+    )
+    rng = np.random.default_rng(7)
+    db = FakeFirestore(latency_ms=0)
+    now = datetime.now(timezone.utc)
+    user_ids = [f"user_{i:03d}" for i in range(users)]
+    for user_id in user_ids:
+        seed_user(db, user_id, memories, duplicates, rng, now)
+    before_docs, before_us = snapshot(db, user_ids, rng)
+    planted = sum(1 for doc in before_docs if doc.id != doc.to_dict()["base_id"])
+
+    compactor = MemoryCompactor(db, interval_seconds=0)
+    result, runs, elapsed = run_until_complete(compactor, deadline_sec)
+    after_docs, after_us = snapshot(db, user_ids, rng)
+
+    # A surviving memory is wrongly merged away when no memory of its base is left
+    surviving_bases = {doc.to_dict()["base_id"] for doc in after_docs}
+    all_bases = {doc.to_dict()["base_id"] for doc in before_docs}
+    expired_bases = {
+        doc.to_dict()["base_id"] for doc in before_docs if doc.to_dict()["type"] == "interaction"
+    }
+    lost = len(all_bases - surviving_bases - expired_bases)
+
+    print("\n[REPORT] First pass")
+    print(f"   memories        {len(before_docs):>7} -> {len(after_docs):<7}")
+    print(f"   top-10 search   {before_us:>7.0f} -> {after_us:<7.0f} us per user")
+    print(
+        f"   merged {result.get('merged', 0)} (planted {planted})  expired {result.get('expired', 0)}  "
+        f"distinct memories lost {lost}"
+    )
+    print(f"   {runs} runs, {elapsed:.1f}s in total")
+
+    # A day later: 5% new memories per user, a tenth of them duplicates
+    later = now + timedelta(days=1)
+    for user_id in user_ids:
+        for i in range(memories // 20):
+            doc_id = f"{user_id}_new{i}"
+            source = random.Random(doc_id).choice(
+                [doc for doc in after_docs if doc.to_dict()["user_id"] == user_id]
+            ).to_dict()
+            embedding = (
+                np.asarray(source["embedding_field"])
+                + rng.standard_normal(DIMENSIONS) * DUPLICATE_NOISE / np.sqrt(DIMENSIONS)
+                if i % 10 == 0
+                else unit(rng.standard_normal(DIMENSIONS))
+            )
+            db.collection("memories").document(doc_id).set(
+                {
+                    "user_id": user_id,
+                    "content": f"new memory {i}",
+                    "items": [],
+                    "type": "interaction",
+                    "timestamp": later,
+                    "similarity_count": 0,
+                    "embedding_field": embedding.astype(np.float32).tolist(),
+                    "base_id": doc_id,
+                }
+            )
+    result, runs, elapsed = run_until_complete(compactor, deadline_sec)
+    print("\n[REPORT] Next pass (incremental)")
+    print(
+        f"   compared {result.get('compared', 0)} of {result.get('memories', 0)} memories  "
+        f"merged {result.get('merged', 0)}  expired {result.get('expired', 0)}  "
+        f"{runs} runs, {elapsed:.1f}s in total"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--memories", type=int, default=500)
+    parser.add_argument("--duplicates", type=float, default=0.2)
+    parser.add_argument("--deadline-sec", type=float, default=1.0)
+    args = parser.parse_args()
+    run_benchmark(args.users, args.memories, args.duplicates, args.deadline_sec)
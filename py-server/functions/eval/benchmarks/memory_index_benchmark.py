@@ -0,0 +1,110 @@
+"""
+Memory Index Benchmark.
+Builds per-user memory indexes of 1k, 10k and 50k random text-embedding-3-small sized memories
+and measures what get_similar_memories and the record_memory dedup check pay per message:
+- load: building the index from the rows streamed from Firestore (once per user and TTL).
+- search: top-10 retrieval and the top-1 dedup check, served locally.
+- add: updating the index after a memory is written.
+Results are checked against an exact float64 search. The Firestore find_nearest round trip it
+replaces is not measured here, pass --firestore-ms to print the comparison with a known value.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.memory_index_benchmark [--sizes 1000,10000,50000] [--queries 200] [--max-mb 32]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from services.memory_index import MemoryIndexCache, MemoryIndexTooLarge
+
+DIMENSIONS = 1536
+
+
+def random_rows(count: int, rng: np.random.Generator):
+    embeddings = rng.standard_normal((count, DIMENSIONS), dtype=np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    memories = [{"id": f"memory_{i}", "content": f"memory {i}"} for i in range(count)]
+    # the loader gets plain lists from the Firestore Vector fields
+    return memories, embeddings.tolist(), embeddings
+
+
+def percentile(values: list[float], q: float) -> float:
+    return float(np.percentile(values, q))
+
+
+def run_benchmark(sizes: list[int], queries: int, max_mb: int, firestore_ms: float):
+    print(f"[START] {DIMENSIONS}-dim memories, sizes {sizes}, {queries} queries each, budget {max_mb} MB")
+    rng = np.random.default_rng(7)
+
+    print("\n[REPORT] Per-user memory index")
+    for size in sizes:
+        memories, rows, embeddings = random_rows(size, rng)
+        cache = MemoryIndexCache(
+            max_bytes=max_mb * 1024 * 1024,
+            max_rows_per_user=max_mb * 1024 * 1024 // (DIMENSIONS * 4),
+            ttl_seconds=3600,
+        )
+
+        start = time.perf_counter()
+        try:
+            index = cache.get("user", lambda user_id, limit: (memories[:limit], rows[:limit]))
+        except MemoryIndexTooLarge:
+            print(
+                f"   {size:>6} memories  {size * DIMENSIONS * 4 / 2**20:6.0f} MB > budget, "
+                "served by Firestore find_nearest"
+            )
+            # measure it anyway with an unbounded cache
+            cache = MemoryIndexCache(max_bytes=2**40, max_rows_per_user=2**31, ttl_seconds=3600)
+            start = time.perf_counter()
+            index = cache.get("user", lambda user_id, limit: (memories, rows))
+        load_ms = (time.perf_counter() - start) * 1000
+        loaded_mb = index.nbytes / 2**20
+        exact_embeddings = embeddings.astype(np.float64)
+
+        query_embeddings = embeddings[rng.integers(0, size, queries)] + rng.normal(
+            0, 0.02, (queries, DIMENSIONS)
+        ).astype(np.float32)
+        search_us, dedup_us, exact = [], [], 0
+        for query in query_embeddings:
+            start = time.perf_counter()
+            results = index.search(query, limit=10, distance_threshold=0.75)
+            search_us.append((time.perf_counter() - start) * 1e6)
+            start = time.perf_counter()
+            index.search(query, limit=1, distance_threshold=0.75)
+            dedup_us.append((time.perf_counter() - start) * 1e6)
+
+            distances = np.linalg.norm(exact_embeddings - query, axis=1)
+            expected = [f"memory_{i}" for i in np.argsort(distances)[:10] if distances[i] <= 0.75]
+            exact += [memory["id"] for memory in results] == expected
+
+        start = time.perf_counter()
+        for i in range(100):
+            cache.add("user", {"id": f"new_{i}"}, embeddings[i].tolist())
+        add_us = (time.perf_counter() - start) / 100 * 1e6
+
+        line = (
+            f"   {size:>6} memories  {loaded_mb:6.1f} MB  load={load_ms:8.1f} ms  "
+            f"top-10 p50={percentile(search_us, 50):7.0f} us p95={percentile(search_us, 95):7.0f} us  "
+            f"dedup p50={percentile(dedup_us, 50):7.0f} us  add={add_us:5.1f} us  "
+            f"exact={exact}/{queries}"
+        )
+        if firestore_ms:
+            line += f"  vs find_nearest={firestore_ms:.0f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--max-mb", type=int, default=32)
+    parser.add_argument("--firestore-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    run_benchmark(
+        [int(size) for size in args.sizes.split(",") if size],
+        args.queries,
+        args.max_mb,
+        args.firestore_ms,
+    )
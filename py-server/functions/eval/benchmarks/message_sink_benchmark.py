@@ -0,0 +1,98 @@
+"""
+Message Sink Benchmark.
+Replays a long tool run that reports progress to the chat, like get_all_active_positions_on_meteora
+(one agent thought per pool) followed by a few UI messages, against a simulated Firestore:
+- before: every thought / UI message is a blocking add() inside the tool.
+- after: the tool queues them in MessageSink and the invocation flushes before returning.
+Also checks that the chat shows the messages in the order they were emitted.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.message_sink_benchmark [--thoughts 40] [--ui-messages 5] [--work-ms 5] [--latency-ms 30]
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+from eval.benchmarks.fake_firestore import FakeFirestore, install_stub_modules
+
+install_stub_modules()
+
+from utils.message_sink import MessageSink  # noqa: E402
+
+CHAT_ID = "benchmark-chat"
+
+
+def tool_run(messages_ref, write, timestamp, thoughts: int, ui_messages: int, work_ms: float):
+    for i in range(thoughts):
+        time.sleep(work_ms / 1000)  # fetch and evaluate one pool
+        write(
+            messages_ref,
+            {"component": "agent_thought", "thought": f"Checking pool {i}", "createdAt": timestamp(), "order": i},
+        )
+    for i in range(ui_messages):
+        write(
+            messages_ref,
+            {"component": "position_card", "renderData": {"pool": i}, "createdAt": timestamp(), "order": thoughts + i},
+        )
+
+
+def chat_order(db) -> list[int]:
+    messages = [data for path, data in db.docs.items() if path.startswith(f"chats/{CHAT_ID}/")]
+    return [data["order"] for data in sorted(messages, key=lambda data: data["createdAt"])]
+
+
+def run_benchmark(thoughts: int, ui_messages: int, work_ms: float, latency_ms: float):
+    total = thoughts + ui_messages
+    print(
+        f"[START] tool run with {thoughts} thoughts + {ui_messages} UI messages, "
+        f"{work_ms} ms of work per step, {latency_ms} ms per Firestore op"
+    )
+
+    legacy_db = FakeFirestore(latency_ms)
+    start = time.perf_counter()
+    tool_run(
+        legacy_db.collection("chats").document(CHAT_ID).collection("messages"),
+        lambda messages_ref, data: messages_ref.add(data),
+        lambda: datetime.now(timezone.utc),
+        thoughts,
+        ui_messages,
+        work_ms,
+    )
+    legacy_tool = legacy_total = time.perf_counter() - start
+
+    db = FakeFirestore(latency_ms)
+    sink = MessageSink(db)
+    start = time.perf_counter()
+    tool_run(
+        db.collection("chats").document(CHAT_ID).collection("messages"),
+        sink.add,
+        sink.timestamp,
+        thoughts,
+        ui_messages,
+        work_ms,
+    )
+    sink_tool = time.perf_counter() - start
+    sink.flush()
+    sink_total = time.perf_counter() - start
+
+    print("\n[REPORT] Tool run")
+    for label, firestore, tool_time, total_time in (
+        ("before (blocking add)", legacy_db, legacy_tool, legacy_total),
+        ("after (message sink)", db, sink_tool, sink_total),
+    ):
+        in_order = chat_order(firestore) == list(range(total))
+        print(
+            f"   {label:<22} tool={tool_time * 1000:8.1f} ms  until flushed={total_time * 1000:8.1f} ms  "
+            f"round trips={firestore.total_ops:>3} {dict(firestore.ops)}  in order={in_order}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--thoughts", type=int, default=40)
+    parser.add_argument("--ui-messages", type=int, default=5)
+    parser.add_argument("--work-ms", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    args = parser.parse_args()
+    run_benchmark(args.thoughts, args.ui_messages, args.work_ms, args.latency_ms)
@@ -0,0 +1,82 @@
+"""
+Orbit RAG Index Benchmark.
+Builds the packaged index of the Orbit docs with the same chunks as index_documents (random
+text-embedding-3-small sized vectors stand in for the embeddings, no OpenAI call) and reports:
+- chunk count and file size.
+- load time, once per instance: reading the file and checking it against the docs.
+- retrieval time per question, which replaces the Firestore find_nearest round trip.
+The query embedding call is not included, it is the same for both and cached for repeated
+questions. Pass --firestore-ms to print the comparison with a known find_nearest latency.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.orbit_rag_index_benchmark [--queries 1000] [--firestore-ms 0]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from agents.orbit_rag_agent.local_index import (
+    OrbitLocalIndex,
+    doc_sources,
+    docs_fingerprint,
+    get_local_index,
+    split_text,
+)
+
+DIMENSIONS = 1536
+MODEL = "text-embedding-3-small"
+
+
+def build(path: str, rng: np.random.Generator) -> int:
+    contents, sources = [], []
+    for source in doc_sources():
+        with open(source, encoding="utf-8") as f:
+            chunks = split_text(f.read())
+        contents.extend(chunks)
+        sources.extend([os.path.basename(source)] * len(chunks))
+    embeddings = rng.standard_normal((len(contents), DIMENSIONS))
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    OrbitLocalIndex(contents, sources, embeddings, MODEL, docs_fingerprint(doc_sources())).save(path)
+    return len(contents)
+
+
+def run_benchmark(queries: int, firestore_ms: float):
+    rng = np.random.default_rng(7)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "orbit_docs.npz")
+        chunks = build(path, rng)
+        print(f"[START] {chunks} chunks from {len(doc_sources())} docs, {queries} queries")
+
+        start = time.perf_counter()
+        index = get_local_index(MODEL, path=path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        query_embeddings = rng.standard_normal((queries, DIMENSIONS)).astype(np.float32).tolist()
+        latencies = []
+        for query_embedding in query_embeddings:
+            start = time.perf_counter()
+            index.search(query_embedding, limit=10)
+            latencies.append((time.perf_counter() - start) * 1e6)
+
+        print("\n[REPORT] Local Orbit docs index")
+        print(f"   file      {os.path.getsize(path) / 1024:8.1f} KB")
+        print(f"   load      {load_ms:8.2f} ms once per instance")
+        line = (
+            f"   retrieval p50={np.percentile(latencies, 50):6.0f} us "
+            f"p95={np.percentile(latencies, 95):6.0f} us per question"
+        )
+        if firestore_ms:
+            line += f"  vs find_nearest={firestore_ms:.0f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--firestore-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    run_benchmark(args.queries, args.firestore_ms)
@@ -0,0 +1,114 @@
+"""
+Pending Events Benchmark.
+Replays a busy news cycle on the tweet listener against a simulated Firestore, every tweet needs
+the pending tweet-based events and some of them trigger one:
+- before: every tweet runs the three-filter query on rumours_events.
+- after: PendingEventsCache serves the events from memory (TTL mode here, the simulated Firestore
+  has no snapshot listener) and triggered events are invalidated right away.
+Also checks that no tweet gets an event that an earlier tweet already triggered.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.pending_events_benchmark [--tweets 200] [--events 100] [--trigger-every 10] [--latency-ms 40]
+"""
+
+import argparse
+import random
+import time
+
+from eval.benchmarks.fake_firestore import FakeFirestore
+
+from utils.pending_events import PendingEventsCache
+
+
+def pending_events_query(db):
+    return (
+        db.collection("rumours_events")
+        .where("tradeStatus", "==", "pending")
+        .where("tweetBased", "==", True)
+        .where("executionTime", "==", None)
+    )
+
+
+def legacy_get_events(db) -> list[dict]:
+    """The previous get_tweet_based_events_from_db, one query per tweet."""
+    events = []
+    for doc in pending_events_query(db).stream():
+        event_data = doc.to_dict()
+        event_data["eventId"] = doc.id
+        events.append(event_data)
+    return events
+
+
+def seed(db, events: int):
+    for i in range(events):
+        db.collection("rumours_events").document(f"event_{i:04d}").set(
+            {
+                "title": f"Event {i}",
+                "tradeStatus": "pending",
+                "tweetBased": True,
+                "executionTime": None,
+            }
+        )
+    db.reset_ops()
+
+
+def replay(db, get_events, invalidate, tweets: int, trigger_every: int, seed_value: int):
+    rng = random.Random(seed_value)
+    triggered = set()
+    stale = 0
+    read_time = 0.0
+    for i in range(tweets):
+        start = time.perf_counter()
+        events = get_events()
+        read_time += time.perf_counter() - start
+        stale += sum(1 for event in events if event["eventId"] in triggered)
+        if trigger_every and i % trigger_every == 0 and events:
+            event_id = rng.choice(events)["eventId"]
+            # what updateExecutionTimeForEvent does
+            db.collection("rumours_events").document(event_id).update({"executionTime": "now"})
+            invalidate(event_id)
+            triggered.add(event_id)
+    return read_time, stale
+
+
+def run_benchmark(tweets: int, events: int, trigger_every: int, latency_ms: float):
+    print(
+        f"[START] {tweets} tweets against {events} pending events, one trigger every "
+        f"{trigger_every} tweets, {latency_ms} ms per Firestore op"
+    )
+
+    legacy_db = FakeFirestore(latency_ms)
+    seed(legacy_db, events)
+    legacy_read, legacy_stale = replay(
+        legacy_db,
+        lambda: legacy_get_events(legacy_db),
+        lambda event_id: None,
+        tweets,
+        trigger_every,
+        7,
+    )
+
+    db = FakeFirestore(latency_ms)
+    seed(db, events)
+    cache = PendingEventsCache(lambda: pending_events_query(db), use_listener=False)
+    cached_read, cached_stale = replay(db, cache.get, cache.invalidate, tweets, trigger_every, 7)
+
+    print("\n[REPORT] Pending events reads")
+    for label, firestore, read_time, stale in (
+        ("before (query per tweet)", legacy_db, legacy_read, legacy_stale),
+        ("after (instance cache)", db, cached_read, cached_stale),
+    ):
+        print(
+            f"   {label:<26} per tweet={read_time / tweets * 1000:7.2f} ms  "
+            f"round trips={firestore.total_ops:>4} {dict(firestore.ops)}  triggered events re-read={stale}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tweets", type=int, default=200)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--trigger-every", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    run_benchmark(args.tweets, args.events, args.trigger_every, args.latency_ms)
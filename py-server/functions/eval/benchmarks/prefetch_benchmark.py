@@ -0,0 +1,97 @@
+"""
+Pre-planner Prefetch Benchmark.
+Replays the reads done between a message being created and the planner starting to stream,
+with simulated latencies per stage:
+- before: chat doc, user profile, wallets, chat messages, analytics, embedding and vector
+  search all run one after the other.
+- after: the Prefetcher starts the chat doc, profile, wallets and messages together, the
+  memory context waits only for the messages and analytics runs after the reply.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.prefetch_benchmark [--runs 5] [--scale 1.0]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from utils.prefetch import Prefetcher
+
+# Typical latencies in ms observed for each stage
+STAGE_LATENCY_MS = {
+    "chat_doc": 45,
+    "user_profile": 40,
+    "wallets": 45,
+    "messages": 70,
+    "analytics": 120,
+    "embedding": 150,
+    "vector_search": 90,
+}
+
+
+def blocking_stage(name: str, scale: float):
+    time.sleep(STAGE_LATENCY_MS[name] * scale / 1000)
+    return name
+
+
+async def async_stage(name: str, scale: float):
+    await asyncio.sleep(STAGE_LATENCY_MS[name] * scale / 1000)
+    return name
+
+
+async def sequential(scale: float) -> float:
+    start = time.perf_counter()
+    for name in ("chat_doc", "user_profile", "wallets", "messages", "analytics"):
+        blocking_stage(name, scale)
+    await async_stage("embedding", scale)
+    blocking_stage("vector_search", scale)
+    return (time.perf_counter() - start) * 1000
+
+
+async def prefetched(scale: float) -> tuple[float, dict]:
+    prefetch = Prefetcher()
+    for name in ("chat_doc", "user_profile", "wallets", "messages"):
+        prefetch.start(name, blocking_stage, name, scale)
+    prefetch.result("chat_doc")
+    prefetch.result("user_profile")
+
+    async def memory_context():
+        await prefetch.wait("messages")
+        with prefetch.stage("memory_context"):
+            await async_stage("embedding", scale)
+            await asyncio.to_thread(blocking_stage, "vector_search", scale)
+
+    memory_task = asyncio.create_task(memory_context())
+    await prefetch.wait("wallets")
+    analytics_task = asyncio.create_task(
+        asyncio.to_thread(blocking_stage, "analytics", scale)
+    )
+    await memory_task
+    first_token_ms = prefetch.elapsed_ms()
+    await analytics_task
+    return first_token_ms, prefetch.span_attributes()
+
+
+def run_benchmark(runs: int, scale: float):
+    print(f"[START] {runs} runs, stage latencies x{scale}: {STAGE_LATENCY_MS}")
+    before = [asyncio.run(sequential(scale)) for _ in range(runs)]
+    after, attributes = [], {}
+    for _ in range(runs):
+        elapsed, attributes = asyncio.run(prefetched(scale))
+        after.append(elapsed)
+
+    print("\n[REPORT] Time until the planner starts streaming")
+    print(f"   before (sequential)   median={statistics.median(before):8.1f} ms")
+    print(f"   after (prefetch)      median={statistics.median(after):8.1f} ms")
+    print("\n[REPORT] Span attributes of the last run")
+    for key, value in attributes.items():
+        print(f"   {key:<28} {value:8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0)
+    args = parser.parse_args()
+    run_benchmark(args.runs, args.scale)
@@ -0,0 +1,131 @@
+"""
+Price Service Benchmark.
+Prices the Meteora positions view (20 positions) the way get_all_active_positions_on_meteora
+used to (two blocking getTokenPrice calls per position) and with the batched, cached
+PriceService. The endpoint is simulated with a fixed latency, no network is used.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.price_service_benchmark [--positions 20] [--latency-ms 150]
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from eval.benchmarks.fake_firestore import install_stub_modules
+
+install_stub_modules()
+
+from services.prices import PriceService, PriceProviderType  # noqa: E402
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+OTHER_MINTS = [
+    "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN",
+    "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm",
+    "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+    "2zMMhcVQEXDtdE6vsFS7S7D5oUodfJHE8vd1gnBouauv",
+    "mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So",
+    "J1toso1uCk3RLmjorhTtrVwY9HJ7X8V9yYac6Y7kGCPn",
+]
+
+
+class SimulatedPriceEndpoint:
+    """Stands in for getTokenPrice: fixed latency, counts requests."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, chain_name, token_address, provider):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+        return {"price": 1.0 + len(token_address) / 100, "tokenAddress": token_address}
+
+
+def build_positions(count: int) -> list[dict]:
+    """Positions pair a few popular mints, like a real LP wallet does."""
+    random.seed(3)
+    positions = []
+    for _ in range(count):
+        token_x = random.choice(OTHER_MINTS + [SOL_MINT])
+        token_y = random.choice([USDC_MINT, SOL_MINT])
+        positions.append({"tokenXAddress": token_x, "tokenYAddress": token_y})
+    return positions
+
+
+def price_positions_legacy(positions, endpoint) -> float:
+    """Two sequential requests per position, as the loop did before."""
+    total = 0.0
+    for pos in positions:
+        x_price = float(endpoint.fetch("SOLANA", pos["tokenXAddress"], PriceProviderType.JUPITER)["price"])
+        y_price = float(endpoint.fetch("SOLANA", pos["tokenYAddress"], PriceProviderType.JUPITER)["price"])
+        total += x_price + y_price
+    return total
+
+
+def price_positions_batched(positions, price_service) -> float:
+    """One batch for all distinct mints, then in-memory lookups per position."""
+    addresses = [a for pos in positions for a in (pos["tokenXAddress"], pos["tokenYAddress"])]
+    prices = price_service.get_prices("SOLANA", addresses, PriceProviderType.JUPITER)
+    return sum(
+        float(prices[pos["tokenXAddress"]]["price"]) + float(prices[pos["tokenYAddress"]]["price"])
+        for pos in positions
+    )
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(position_count: int, latency_ms: float):
+    positions = build_positions(position_count)
+    distinct = len({a for p in positions for a in (p["tokenXAddress"], p["tokenYAddress"])})
+    print(f"[START] {position_count} positions over {distinct} distinct mints, endpoint latency {latency_ms} ms")
+
+    legacy_endpoint = SimulatedPriceEndpoint(latency_ms)
+    legacy_total, legacy_time = timed(price_positions_legacy, positions, legacy_endpoint)
+
+    endpoint = SimulatedPriceEndpoint(latency_ms)
+    price_service = PriceService()
+    price_service._fetch_price = endpoint.fetch
+    cold_total, cold_time = timed(price_positions_batched, positions, price_service)
+    cold_requests = endpoint.requests
+    warm_total, warm_time = timed(price_positions_batched, positions, price_service)
+    warm_requests = endpoint.requests - cold_requests
+
+    # Concurrent tool calls asking for the same tokens share the in-flight requests
+    endpoint_concurrent = SimulatedPriceEndpoint(latency_ms)
+    shared_service = PriceService()
+    shared_service._fetch_price = endpoint_concurrent.fetch
+    threads = [
+        threading.Thread(target=price_positions_batched, args=(positions, shared_service))
+        for _ in range(5)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    concurrent_time = time.perf_counter() - start
+
+    assert abs(legacy_total - cold_total) < 1e-9 and abs(cold_total - warm_total) < 1e-9
+
+    print("\n[REPORT] Positions view pricing")
+    print(f"   {'before (2 calls per position)':<40} requests={legacy_endpoint.requests:>3}  time={legacy_time * 1000:8.1f} ms")
+    print(f"   {'after, cold cache':<40} requests={cold_requests:>3}  time={cold_time * 1000:8.1f} ms")
+    print(f"   {'after, warm cache':<40} requests={warm_requests:>3}  time={warm_time * 1000:8.1f} ms")
+    print(f"   {'after, 5 concurrent views':<40} requests={endpoint_concurrent.requests:>3}  time={concurrent_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    args = parser.parse_args()
+    run_benchmark(args.positions, args.latency_ms)
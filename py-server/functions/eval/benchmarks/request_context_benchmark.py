@@ -0,0 +1,91 @@
+"""
+Request Context Benchmark.
+Replays the context calls of many chats on a long-lived instance (set_context_id, three
+set_request_ctx and a handful of get_request_ctx from the agents) with the previous global
+dict, which copies the context on every set and never drops a chat, and with
+RequestContextStore. Reports the memory held after each block of requests and the cost per call.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.request_context_benchmark [--requests 100000] [--chats 50000] [--gets 8]
+"""
+
+import argparse
+import contextvars
+import time
+import tracemalloc
+
+from utils.request_context import RequestContextStore
+
+
+class GlobalDictContext:
+    """The previous utils.firebase implementation."""
+
+    def __init__(self):
+        self.local_collection = {}
+
+    def start(self, key):
+        self.local_collection[key] = {"session_id": key}
+
+    def set(self, key, field, value):
+        self.local_collection[key] = {**self.local_collection[key], field: value}
+
+    def get(self, key, field):
+        return self.local_collection.get(key, {}).get(field, None)
+
+    def end(self, key):
+        self.local_collection[key] = None
+
+
+def handle_request(store, chat_id: str, gets: int, end: bool):
+    store.start(chat_id)
+    store.set(chat_id, "user_id", f"user-{chat_id}")
+    store.set(chat_id, "evm_wallet_address", "0x" + "ab" * 20)
+    store.set(chat_id, "solana_wallet_address", "So1" * 14)
+    for _ in range(gets):
+        store.get(chat_id, "user_id")
+    if end:
+        store.end(chat_id)
+
+
+def run(store, requests: int, chats: int, gets: int, end: bool, checkpoints: int = 4):
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    memory = []
+    elapsed = 0.0
+    block = requests // checkpoints
+    for checkpoint in range(checkpoints):
+        start = time.perf_counter()
+        for i in range(checkpoint * block, (checkpoint + 1) * block):
+            # every request gets its own context, like the asyncio.run of the Cloud Function handlers
+            contextvars.copy_context().run(
+                handle_request, store, f"chat-{i % chats}", gets, end
+            )
+        elapsed += time.perf_counter() - start
+        memory.append((tracemalloc.get_traced_memory()[0] - baseline) / 1024 / 1024)
+    tracemalloc.stop()
+    calls = requests * (4 + gets + int(end))
+    return memory, elapsed / calls * 1e9
+
+
+def run_benchmark(requests: int, chats: int, gets: int):
+    print(f"[START] {requests} requests over {chats} chats, {gets} context reads per request")
+    print("\n[REPORT] Memory held after each quarter of the requests, cost per context call")
+    # the previous code never removed a context, start_bot now ends its own and the other
+    # entry points rely on the LRU/TTL bound
+    for label, store, end in (
+        ("before (global dict)", GlobalDictContext(), False),
+        ("after (LRU/TTL only)", RequestContextStore(), False),
+        ("after (ended requests)", RequestContextStore(), True),
+    ):
+        memory, per_call_ns = run(store, requests, chats, gets, end)
+        growth = "  ".join(f"{mb:6.2f} MB" for mb in memory)
+        print(f"   {label:<24} {growth}   {per_call_ns:6.0f} ns/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--chats", type=int, default=50000)
+    parser.add_argument("--gets", type=int, default=8)
+    args = parser.parse_args()
+    run_benchmark(args.requests, args.chats, args.gets)
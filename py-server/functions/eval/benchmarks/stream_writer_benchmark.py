@@ -0,0 +1,149 @@
+"""
+Stream Writer Benchmark.
+Replays a recorded planner chunk stream against a fake Firestore and compares the
+per-chunk `update_message` path with the coalescing `MessageStreamWriter`.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.stream_writer_benchmark [--latency-ms 25] [--speed 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from eval.benchmarks.fake_firestore import FakeFirestore, install_stub_modules
+
+install_stub_modules()
+
+from utils.message_stream import MessageStreamWriter  # noqa: E402
+from google.cloud.firestore_v1 import SERVER_TIMESTAMP  # noqa: E402
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "fixtures", "planner_chunk_stream.json"
+)
+MESSAGE_DATA = {
+    "sender": "AI",
+    "voiceContent": "",
+    "useVoice": False,
+    "messageType": "text",
+}
+
+
+def load_chunk_stream() -> list[dict]:
+    with open(FIXTURE_PATH) as f:
+        return json.load(f)["chunks"]
+
+
+async def legacy_update_message(message_doc_ref, chat_id, user_id, data):
+    """Same read-then-write logic as the original utils.firebase.update_message."""
+    doc = message_doc_ref.get()
+    if doc.exists:
+        doc_data = doc.to_dict()
+        data["content"] = doc_data.get("content", "") + data.get("content", "")
+        message_doc_ref.update({"updatedAt": SERVER_TIMESTAMP, **data})
+    else:
+        message_doc_ref.set(
+            {
+                "chatId": chat_id,
+                "userId": user_id,
+                "createdAt": SERVER_TIMESTAMP,
+                "updatedAt": SERVER_TIMESTAMP,
+                **data,
+            }
+        )
+
+
+async def replay(chunks: list[dict], speed: float, on_chunk):
+    """
+    Feeds the chunks at their recorded pace. A chunk that arrives while the previous
+    write is still in flight waits for it, as it does when the stream loop awaits Firestore.
+    """
+    start = time.perf_counter()
+    arrival = 0.0
+    for chunk in chunks:
+        arrival += chunk["delay_ms"] / 1000 / speed
+        wait = arrival - (time.perf_counter() - start)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await on_chunk(chunk["content"])
+    return time.perf_counter() - start
+
+
+async def run_legacy(chunks, latency_ms, speed):
+    db = FakeFirestore(latency_ms=latency_ms)
+    doc_ref = db.collection("chats").document("chat").collection("messages").document("msg")
+
+    async def on_chunk(content):
+        await legacy_update_message(
+            doc_ref, "chat", "user", {**MESSAGE_DATA, "content": content}
+        )
+
+    wall_time = await replay(chunks, speed, on_chunk)
+    return db, doc_ref, wall_time
+
+
+async def run_buffered(chunks, latency_ms, speed, flush_interval):
+    db = FakeFirestore(latency_ms=latency_ms)
+    doc_ref = db.collection("chats").document("chat").collection("messages").document("msg")
+    writer = MessageStreamWriter(
+        doc_ref=doc_ref,
+        chat_id="chat",
+        user_id="user",
+        data=MESSAGE_DATA,
+        flush_interval=flush_interval,
+    )
+
+    wall_time = await replay(chunks, speed, writer.write)
+    # final flush, as done on the planner's Response
+    close_start = time.perf_counter()
+    await writer.close()
+    wall_time += time.perf_counter() - close_start
+    return db, doc_ref, wall_time
+
+
+async def run_benchmark(latency_ms: float, speed: float, flush_interval: float):
+    chunks = load_chunk_stream()
+    expected_content = "".join(c["content"] for c in chunks)
+    stream_time = sum(c["delay_ms"] for c in chunks) / 1000 / speed
+
+    print(f"[START] Replaying {len(chunks)} chunks ({len(expected_content)} chars)")
+    print(
+        f"   Firestore latency: {latency_ms} ms/op, replay speed: x{speed}, "
+        f"pure stream time: {stream_time:.2f}s"
+    )
+
+    results = {}
+    for name, runner in (
+        ("update_message (per chunk)", run_legacy(chunks, latency_ms, speed)),
+        (
+            f"MessageStreamWriter ({int(flush_interval * 1000)} ms window)",
+            run_buffered(chunks, latency_ms, speed, flush_interval),
+        ),
+    ):
+        db, doc_ref, wall_time = await runner
+        content = db.docs[doc_ref.path]["content"]
+        assert content == expected_content, f"{name} produced a different message"
+        results[name] = {
+            "ops": dict(db.ops),
+            "total_ops": db.total_ops,
+            "wall_time": wall_time,
+        }
+
+    print("\n[REPORT] Writes per message")
+    for name, result in results.items():
+        print(
+            f"   {name:<40} ops={result['total_ops']:>5} {result['ops']}  "
+            f"time to last token={result['wall_time']:.2f}s"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency-ms", type=float, default=25.0)
+    parser.add_argument("--speed", type=float, default=4.0)
+    parser.add_argument("--flush-interval", type=float, default=0.15)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.latency_ms, args.speed, args.flush_interval))
@@ -0,0 +1,122 @@
+"""
+Tweet De-duplication Benchmark.
+Replays a synthetic feed where every headline is posted once and then copied (retweets, added
+links / hashtags / emojis, quote tweets with a comment, reworded copies), mixed with headlines that
+only differ in one word from another one (another exchange, another amount), and reports:
+- the share of copies TweetDeduplicator suppresses, per kind of copy.
+- how many different headlines are wrongly suppressed.
+- the per-tweet cost of fingerprinting and comparing against windows of several sizes.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.tweet_dedup_benchmark [--copies 4] [--max-distance 3]
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from agents.event_trigger_agent.tweet_dedup import TweetDeduplicator
+
+HEADLINES = [
+    "BREAKING: Binance has been hacked, over $100M stolen from hot wallets",
+    "SEC approves the first spot Ethereum ETF applications",
+    "Fed cuts interest rates by 50 basis points",
+    "Tether pauses USDT redemptions after bank partner fails",
+    "Satoshi Nakamoto identity revealed in court documents",
+    "US CPI comes in at 2.1% for March, below expectations",
+    "China lifts its ban on cryptocurrency trading",
+    "Solana network halts block production for the third time this year",
+    "Vitalik Buterin announces the Ethereum Foundation will shut down",
+    "MicroStrategy buys another 10,000 BTC",
+    "Coinbase delists all privacy coins in the EU",
+    "El Salvador sells its entire Bitcoin reserve",
+    "BlackRock files for a spot XRP ETF",
+    "Russia and Ukraine agree to a ceasefire starting Monday",
+    "North Korea launches an intercontinental ballistic missile",
+    "Apple announces Bitcoin payments in Apple Pay",
+]
+
+# Same template, one word changed: these must NOT be suppressed
+NEAR_HEADLINES = [
+    "BREAKING: Kraken has been hacked, over $100M stolen from hot wallets",
+    "SEC rejects the first spot Ethereum ETF applications",
+    "Fed cuts interest rates by 25 basis points",
+    "UK CPI comes in at 2.1% for March, below expectations",
+    "MicroStrategy sells another 10,000 BTC",
+    "BlackRock files for a spot Solana ETF",
+]
+
+ACCOUNTS = ["whale_alert", "WatcherGuru", "tier10k", "DeItaone", "cryptonews"]
+COMMENTS = ["This is huge!", "Wow.", "Called it", "Bullish", "Here we go again"]
+
+
+def copies(headline: str, rng: random.Random, count: int) -> list[tuple[str, str]]:
+    kinds = {
+        "retweet": lambda: f"RT @{rng.choice(ACCOUNTS)}: {headline}",
+        "link": lambda: f"{headline} https://t.co/{rng.getrandbits(32):08x}",
+        "hashtag/emoji": lambda: f"🚨 {headline} #crypto #{headline.split()[1].strip(',:')}",
+        "quote": lambda: f"{rng.choice(COMMENTS)} {headline}",
+        "reworded": lambda: headline.replace("has been", "was").replace("announces", "says")
+        .replace("over", "more than").replace("another", "an additional"),
+    }
+    return [(kind, build()) for kind, build in list(kinds.items()) for _ in range(count)]
+
+
+def feed(copies_per_kind: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    originals = [("original", headline) for headline in HEADLINES]
+    duplicates = [
+        copy for headline in HEADLINES for copy in copies(headline, rng, copies_per_kind)
+    ]
+    rng.shuffle(duplicates)
+    # Originals first, the copies and the near headlines arrive afterwards
+    return originals + duplicates + [("near headline", headline) for headline in NEAR_HEADLINES]
+
+
+def run_benchmark(copies_per_kind: int, max_distance: int):
+    tweets = feed(copies_per_kind, seed=7)
+    print(
+        f"[START] {len(tweets)} tweets: {len(HEADLINES)} headlines, {copies_per_kind} copies of each "
+        f"kind per headline, {len(NEAR_HEADLINES)} near headlines, max distance {max_distance}"
+    )
+
+    deduplicator = TweetDeduplicator(max_distance=max_distance)
+    totals, suppressed = Counter(), Counter()
+    for i, (kind, text) in enumerate(tweets):
+        totals[kind] += 1
+        if deduplicator.check(f"tweet_{i}", text) is not None:
+            suppressed[kind] += 1
+
+    news = ("original", "near headline")
+    copies_total = sum(count for kind, count in totals.items() if kind not in news)
+    copies_suppressed = sum(count for kind, count in suppressed.items() if kind not in news)
+    print("\n[REPORT] Suppression")
+    for kind, count in totals.items():
+        print(f"   {kind:<14} {suppressed[kind]:>4}/{count:<4} suppressed")
+    print(
+        f"   copies suppressed: {copies_suppressed / copies_total * 100:.1f}%  "
+        f"LLM steps skipped: {sum(suppressed.values())}/{len(tweets)}  "
+        f"different news wrongly suppressed: {suppressed['original'] + suppressed['near headline']}"
+    )
+
+    print("\n[REPORT] Per-tweet overhead")
+    rng = random.Random(11)
+    for window in (100, 1000, 5000):
+        deduplicator = TweetDeduplicator(max_distance=max_distance, max_tweets=window)
+        for i in range(window):
+            deduplicator.check(f"filler_{i}", f"filler tweet {rng.getrandbits(64)} about nothing {i}")
+        texts = [text for _, text in tweets]
+        start = time.perf_counter()
+        for i, text in enumerate(texts):
+            deduplicator.check(f"timed_{i}", text)
+        per_tweet_us = (time.perf_counter() - start) / len(texts) * 1e6
+        print(f"   window={window:>5} tweets  {per_tweet_us:8.1f} us per tweet")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--max-distance", type=int, default=3)
+    args = parser.parse_args()
+    run_benchmark(args.copies, args.max_distance)
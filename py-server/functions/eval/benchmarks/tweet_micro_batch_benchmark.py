@@ -0,0 +1,122 @@
+"""
+Tweet Micro-Batching Benchmark.
+Replays a burst of tweets, each one a concurrent on_tweet_added invocation, against a simulated
+Firestore and a simulated LLM:
+- per tweet: every invocation runs the event trigger agent on its own tweet, one LLM call per
+  batch of 5 candidate events.
+- micro-batched: invocations queue their tweet in MicroBatchQueue, the lease holder waits for the
+  window and evaluates up to --batch-size tweets per LLM call.
+Reports LLM calls and how long a tweet waits until it was checked.
+
+Run from py-server/functions:
+    python -m eval.benchmarks.tweet_micro_batch_benchmark [--tweets 50] [--burst-sec 5] [--window-sec 2] [--batch-size 10] [--llm-ms 1500]
+"""
+
+import argparse
+import math
+import threading
+import time
+
+from eval.benchmarks.fake_firestore import FakeFirestore
+
+from utils.micro_batch_queue import MicroBatchQueue
+
+# Candidate events per tweet after the embedding pre-filter, and events per per-tweet LLM call
+CANDIDATES_PER_TWEET = 10
+AGENT_BATCH_SIZE = 5
+
+
+class SimulatedLLM:
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def call(self):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+
+def replay(tweets: int, burst_sec: float, handle_tweet) -> list[float]:
+    """Starts one invocation per tweet spread over the burst, returns each tweet's wait."""
+    checked_at = {}
+    arrived_at = {}
+    threads = []
+    for i in range(tweets):
+        tweet = {"id": f"tweet_{i:03d}", "text": f"Breaking news {i}"}
+        arrived_at[tweet["id"]] = time.perf_counter()
+        thread = threading.Thread(target=handle_tweet, args=(tweet, checked_at))
+        thread.start()
+        threads.append(thread)
+        time.sleep(burst_sec / tweets)
+    for thread in threads:
+        thread.join()
+    return [checked_at[tweet_id] - arrived_at[tweet_id] for tweet_id in arrived_at]
+
+
+def run_benchmark(tweets: int, burst_sec: float, window_sec: float, batch_size: int, llm_ms: float):
+    print(
+        f"[START] {tweets} tweets over {burst_sec}s, {window_sec}s window, up to {batch_size} "
+        f"tweets per call, {llm_ms} ms per LLM call"
+    )
+
+    per_tweet_llm = SimulatedLLM(llm_ms)
+
+    def per_tweet(tweet, checked_at):
+        # the agent batches run concurrently, a tweet takes one LLM round trip
+        calls = [
+            threading.Thread(target=per_tweet_llm.call)
+            for _ in range(math.ceil(CANDIDATES_PER_TWEET / AGENT_BATCH_SIZE))
+        ]
+        for call in calls:
+            call.start()
+        for call in calls:
+            call.join()
+        checked_at[tweet["id"]] = time.perf_counter()
+
+    per_tweet_waits = replay(tweets, burst_sec, per_tweet)
+
+    db = FakeFirestore(latency_ms=20)
+    batched_llm = SimulatedLLM(llm_ms)
+    queue = MicroBatchQueue(
+        db,
+        collection="event_trigger_queue",
+        lease_path="event_trigger_queue_state/drain",
+        window_seconds=window_sec,
+        batch_size=batch_size,
+    )
+
+    def micro_batched(tweet, checked_at):
+        def process(queued_tweets):
+            batched_llm.call()
+            for queued_tweet in queued_tweets:
+                checked_at[queued_tweet["id"]] = time.perf_counter()
+
+        queue.enqueue(tweet["id"], tweet)
+        queue.drain(process)
+
+    batched_waits = replay(tweets, burst_sec, micro_batched)
+
+    print("\n[REPORT] Event trigger LLM calls")
+    for label, llm, waits in (
+        ("per tweet", per_tweet_llm, per_tweet_waits),
+        ("micro-batched", batched_llm, batched_waits),
+    ):
+        waits = sorted(waits)
+        print(
+            f"   {label:<14} LLM calls={llm.calls:>4}  tweets checked={len(waits):>3}  "
+            f"wait p50={waits[len(waits) // 2]:5.2f}s  max={waits[-1]:5.2f}s"
+        )
+    print(f"   queue left empty: {not queue.next_batch()}  firestore ops: {dict(db.ops)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tweets", type=int, default=50)
+    parser.add_argument("--burst-sec", type=float, default=5.0)
+    parser.add_argument("--window-sec", type=float, default=2.0)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--llm-ms", type=float, default=1500.0)
+    args = parser.parse_args()
+    run_benchmark(args.tweets, args.burst_sec, args.window_sec, args.batch_size, args.llm_ms)
@@ -1,9 +1,11 @@
 """
 Event Trigger Agent Evaluation using objective comparison.
-Evaluates robustness and scalability of the event trigger agent.
+Evaluates robustness and scalability of the event trigger agent, and the recall of the
+embedding pre-filter with production-sized pending event lists.
 """
 
 import json
+import math
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Tuple
@@ -11,10 +13,16 @@ from utils.firebase import set_request_ctx, set_context_id, get_request_ctx
 from eval.event_trigger_agent.test_data import (
     ROBUSTNESS_TEST_CASES,
     SCALABILITY_TEST_CASES,
+    generate_distractor_events,
 )
 
 # Import the real agent
 from agents.event_trigger_agent.event_trigger_agent import call_event_trigger_agent
+from agents.event_trigger_agent.event_prefilter import EventEmbeddingIndex
+
+# Events per LLM call in call_event_trigger_agent
+AGENT_BATCH_SIZE = 5
+PREFILTER_EVENT_COUNTS = [20, 200, 2000]
 
 
 class EventTriggerAgentEval:
@@ -247,6 +255,75 @@ class EventTriggerAgentEval:
         print(f"[OK] Completed scalability evaluation: {len(results)} cases")
         return results
 
+    async def evaluate_prefilter(self) -> List[Dict]:
+        """
+        Evaluate the embedding pre-filter: for every test case with expected triggers, pad its
+        events with generated pending events and check the expected events are still among the
+        candidates sent to the LLM. Only embeddings are requested, the agent is not called.
+        """
+        print("\n[PREFILTER] Evaluating embedding pre-filter...")
+        test_cases = [
+            test_case
+            for test_case in ROBUSTNESS_TEST_CASES + SCALABILITY_TEST_CASES
+            if test_case.get("expected_triggers")
+        ]
+        index = EventEmbeddingIndex()
+        results = []
+
+        for event_count in PREFILTER_EVENT_COUNTS:
+            print(f"---- Testing with {event_count} pending events")
+            expected_total = 0
+            expected_found = 0
+            llm_calls_before = 0
+            llm_calls_after = 0
+            for test_case in test_cases:
+                events = test_case.get("events") or test_case.get("events_20", [])
+                pending = events + generate_distractor_events(
+                    max(event_count - len(events), 0)
+                )
+                try:
+                    candidates = await index.candidates(
+                        test_case["tweet"]["text"], pending
+                    )
+                except Exception as e:
+                    print(f"    [ERROR] Error pre-filtering {test_case['name']}: {e}")
+                    continue
+
+                candidate_ids = {event["eventId"] for event in candidates}
+                expected_ids = {
+                    event["eventId"] for event in test_case["expected_triggers"]
+                }
+                missed = expected_ids - candidate_ids
+                if missed:
+                    print(f"   {test_case['name']}: missed {sorted(missed)}")
+                expected_total += len(expected_ids)
+                expected_found += len(expected_ids) - len(missed)
+                llm_calls_before += math.ceil(len(pending) / AGENT_BATCH_SIZE)
+                llm_calls_after += math.ceil(len(candidates) / AGENT_BATCH_SIZE)
+
+            recall = expected_found / expected_total if expected_total else 1.0
+            calls_saved = (
+                1 - llm_calls_after / llm_calls_before if llm_calls_before else 0.0
+            )
+            print(
+                f"   Recall: {recall:.3f}, LLM calls: {llm_calls_before} -> {llm_calls_after} "
+                f"({calls_saved * 100:.1f}% saved)"
+            )
+            results.append(
+                {
+                    "event_count": event_count,
+                    "test_type": "prefilter",
+                    "cases": len(test_cases),
+                    "recall": recall,
+                    "llm_calls_before": llm_calls_before,
+                    "llm_calls_after": llm_calls_after,
+                    "llm_calls_saved": calls_saved,
+                }
+            )
+
+        print(f"[OK] Completed pre-filter evaluation: {len(results)} event counts")
+        return results
+
     async def run_full_evaluation(self) -> Dict:
         """
         Run the complete evaluation including robustness and scalability.
@@ -256,6 +333,7 @@ class EventTriggerAgentEval:
         # Run evaluations
         robustness_results = await self.evaluate_robustness()
         scalability_results = await self.evaluate_scalability()
+        prefilter_results = await self.evaluate_prefilter()
 
         # Calculate summary statistics
         total_successfull_cases = 0
@@ -284,6 +362,7 @@ class EventTriggerAgentEval:
             "evaluation_date": datetime.now().isoformat(),
             "robustness_results": robustness_results,
             "scalability_results": scalability_results,
+            "prefilter_results": prefilter_results,
             "summary": {
                 "total_robustness_cases": len(robustness_results),
                 "total_scalability_cases": len(scalability_results),
@@ -342,6 +421,16 @@ Event Trigger Agent Evaluation Report
                     else:
                         report += f"  {event_count} events: ERROR\n"
 
+        report += f"""
+[PREFILTER] EMBEDDING PRE-FILTER RESULTS:
+"""
+        for result in results.get("prefilter_results", []):
+            report += (
+                f"  {result['event_count']} pending events: R:{result['recall']:.3f}, "
+                f"LLM calls {result['llm_calls_before']} -> {result['llm_calls_after']} "
+                f"({result['llm_calls_saved'] * 100:.1f}% saved)\n"
+            )
+
         summary = results["summary"]
         report += f"""
 
@@ -965,3 +965,82 @@ SCALABILITY_TEST_CASES = [
         ],  # Should trigger because it happen
     },
 ]
+
+
+# ===== GENERATED PENDING EVENTS =====
+
+# Subjects and outcomes combined into plausible but unrelated pending events, used to grow the
+# pending event list to production sizes when measuring the embedding pre-filter
+_GENERATED_SUBJECTS = [
+    "Cardano",
+    "Polkadot",
+    "Avalanche",
+    "Chainlink",
+    "Litecoin",
+    "Ripple",
+    "Arbitrum",
+    "Uniswap",
+    "Aave",
+    "Apple",
+    "Nvidia",
+    "Tesla",
+    "The European Central Bank",
+    "The Bank of Japan",
+    "Brazil",
+    "Mexico",
+    "Canada",
+    "Germany",
+    "Manchester United",
+    "The Golden State Warriors",
+    "SpaceX",
+    "OpenAI",
+    "Amazon",
+    "Netflix",
+    "Taylor Swift",
+]
+
+_GENERATED_OUTCOMES = [
+    ("reaches a new all-time high", "The price closes above its previous record"),
+    ("announces a merger", "An official merger agreement is published"),
+    ("launches a mainnet upgrade", "The upgrade goes live on mainnet"),
+    ("CEO steps down", "The chief executive resigns or is replaced"),
+    ("is listed on the S&P 500", "Inclusion in the index is confirmed"),
+    ("cuts interest rates", "A rate cut is officially announced"),
+    ("wins the championship", "The final is won"),
+    ("opens a new headquarters", "A new headquarters location is inaugurated"),
+    ("releases a new product", "A new product is launched to the public"),
+    ("is fined by regulators", "A regulator announces a fine"),
+    ("hosts a national election", "Election results are announced"),
+    ("signs a trade agreement", "A bilateral trade agreement is signed"),
+]
+
+
+def generate_distractor_events(count: int) -> list[dict]:
+    """Deterministic pending events that no test tweet should trigger."""
+    events = []
+    for i in range(count):
+        subject = _GENERATED_SUBJECTS[i % len(_GENERATED_SUBJECTS)]
+        outcome, description = _GENERATED_OUTCOMES[
+            (i // len(_GENERATED_SUBJECTS)) % len(_GENERATED_OUTCOMES)
+        ]
+        round_number = i // (len(_GENERATED_SUBJECTS) * len(_GENERATED_OUTCOMES))
+        title = f"{subject} {outcome}"
+        if round_number:
+            title += f" before {2025 + round_number}"
+        events.append(
+            {
+                "eventId": f"generated_event_{i:04d}",
+                "title": title,
+                "description": description,
+                "longTrades": [],
+                "shortTrades": [],
+                "eventTime": None,
+                "closingTime": None,
+                "createdAt": datetime(2024, 1, 1),
+                "executionTime": None,
+                "executed": False,
+                "tradeStatus": "pending",
+                "tweetBased": True,
+            }
+        )
+    return events
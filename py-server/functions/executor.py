@@ -1,4 +1,3 @@
-import importlib
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.base import Response
 from autogen_agentchat.messages import TextMessage, ModelClientStreamingChunkEvent
@@ -9,59 +8,25 @@ from utils.firebase import (
     set_request_ctx,
     update_message,
     create_message_doc_id,
+    create_message_stream_writer,
     set_context_id,
+    remove_request_ctx,
     save_agent_thought,
 )
-from services.voice import encode_audio_to_base64, generate_speech_from_text
+from services.voice import encode_audio_to_base64, generate_speech_from_text_async
 from autogen_core import CancellationToken
 from services.memory_service import MemoryService
 from utils.blockchain_utils import is_evm, is_solana
 import services.analytics as analytics
 
+import asyncio
 import json
+from typing import Optional
 
 from services.tracing import tracer, set_status_error, set_status_ok, set_attributes
-
-
-# Mapping of agents to their respective modules and functions
-AGENT_MODULES = {
-    "drift_vaults_agent": (
-        "agents.drift.drift_vaults_agent",
-        "call_drift_vaults_agent",
-    ),
-    "drift_perps_agent": ("agents.drift.drift_perps_agent", "call_drift_perps_agent"),
-    "scheduler_agent": (
-        "agents.scheduler_agent.scheduler_agent",
-        "call_scheduler_agent",
-    ),
-    "dex_agent": ("agents.dex_agent.dex_agent", "call_dex_agent"),
-    "lp_specialist_agent": ("agents.liquidity_pool_agent.lp_agent", "call_lp_agent"),
-    "solana_yield_agent": (
-        "agents.solana_yield_agent.solana_yield_agent",
-        "call_solana_yield_agent",
-    ),
-    "enso_agent": ("agents.enso.enso_agent", "call_enso_agent"),
-    "copy_trading_agent": (
-        "agents.copy_trading.copy_trading_agent",
-        "call_copy_trading_agent",
-    ),
-    "transfer_assistant": (
-        "agents.unified_transfer.unified_transfer_agent",
-        "call_unified_transfer_agent",
-    ),
-    "researcher_assistant": (
-        "agents.researcher_agent.researcher_agent",
-        "call_researcher_agent",
-    ),
-    "orbit_rag_agent": (
-        "agents.orbit_rag_agent.orbit_rag_agent",
-        "call_orbit_rag_agent",
-    ),
-    "liquidation_agent": (
-        "agents.liquidation_agent.liquidation_agent",
-        "call_liquidation_agent",
-    ),
-}
+from services.http_client import report_http_stats
+from utils.prefetch import Prefetcher
+from agents.agent_registry import agent_registry, agent_tools
 
 
 # Function to call an agent
@@ -70,21 +35,14 @@ async def call_agent(agent_name: str, task: str, chat_id: str):
     Calls an agent with a specific task.
     """
     try:
-        module_function_pairs = AGENT_MODULES.get(agent_name, [])
-
-        if not isinstance(module_function_pairs, list):
-            module_function_pairs = [module_function_pairs]
-
         save_agent_thought(
             chat_id=chat_id,
             thought="Analyzing your request...",
         )
 
-        for module_name, function_name in module_function_pairs:
-            module = importlib.import_module(module_name)
-            function = getattr(module, function_name)
-            result = await function(task, chat_id, True)
-            return result
+        function = await agent_registry.resolve_async(agent_name)
+        if function is not None:
+            return await function(task, chat_id, True)
     except Exception as e:
         set_status_error(e)
         raise e
@@ -104,6 +62,18 @@ def process_chat_messages(chat_id):
     return {"chat_history": messages_list, "current_task": current_task}
 
 
+async def load_memory_context(
+    memory_service: MemoryService, user_id: str, prefetch: Prefetcher
+):
+    messages = await prefetch.wait("messages")
+    task = messages.get("current_task")
+    current_message = task[0].content if task else ""
+    with prefetch.stage("memory_context"):
+        return await memory_service.get_agent_memory_context(
+            user_id=user_id, task=current_message
+        )
+
+
 # Main bot with a single planner agent
 @tracer.start_as_current_span("start_bot")
 async def start_bot(
@@ -112,6 +82,7 @@ async def start_bot(
     integrator_id: str,
     summary: str,
     use_voice: bool = False,
+    prefetch: Optional[Prefetcher] = None,
 ):
     set_attributes(
         {
@@ -122,42 +93,54 @@ async def start_bot(
             "summary": summary,
         }
     )
-    user_wallets = get_user_wallets(user_id)
-    if not user_wallets:
-        set_status_error("No wallets found.")
-        return "No wallets found."
-    evm_wallet_address = user_wallets.get("EVM", {}).get("wallet_address")
-    sol_wallet_address = user_wallets.get("SOLANA", {}).get("wallet_address")
+    prefetch = prefetch or Prefetcher()
+    # Independent reads run concurrently, the handler may have started some of them already
+    prefetch.start("wallets", get_user_wallets, user_id)
+    prefetch.start("messages", process_chat_messages, chat_id)
 
-    if not is_evm(evm_wallet_address):
-        raise Exception("Invalid EVM wallet address.")
+    # Initialize memory service and extract information
+    memory_service = MemoryService()
+    # The memory context only depends on the current message, fetch it while wallets are checked
+    memory_context_task = asyncio.create_task(
+        load_memory_context(memory_service, user_id, prefetch)
+    )
 
-    if not is_solana(sol_wallet_address):
-        raise Exception("Invalid Solana wallet address.")
+    try:
+        user_wallets = await prefetch.wait("wallets")
+        if not user_wallets:
+            set_status_error("No wallets found.")
+            return "No wallets found."
+        evm_wallet_address = user_wallets.get("EVM", {}).get("wallet_address")
+        sol_wallet_address = user_wallets.get("SOLANA", {}).get("wallet_address")
 
-    set_context_id(chat_id)
-    set_request_ctx(parentKey=chat_id, key="user_id", value=user_id)
-    set_request_ctx(
-        parentKey=chat_id, key="evm_wallet_address", value=evm_wallet_address
-    )
-    set_request_ctx(
-        parentKey=chat_id, key="solana_wallet_address", value=sol_wallet_address
-    )
+        if not is_evm(evm_wallet_address):
+            raise Exception("Invalid EVM wallet address.")
 
-    messages = process_chat_messages(chat_id)
-    task = messages.get("current_task")
-    current_message = task[0].content if task else ""
+        if not is_solana(sol_wallet_address):
+            raise Exception("Invalid Solana wallet address.")
 
-    # Increase analytics count for 'total_messages'
-    analytics.increment_message_count(chat_id)
+        set_context_id(chat_id)
+        set_request_ctx(parentKey=chat_id, key="user_id", value=user_id)
+        set_request_ctx(
+            parentKey=chat_id, key="evm_wallet_address", value=evm_wallet_address
+        )
+        set_request_ctx(
+            parentKey=chat_id, key="solana_wallet_address", value=sol_wallet_address
+        )
 
-    # Initialize memory service and extract information
-    memory_service = MemoryService()
+        # Increase analytics count for 'total_messages' (queued, written when the invocation ends)
+        analytics.increment_message_count(chat_id)
 
-    # Get memory context for the agent
-    memory_context = await memory_service.get_agent_memory_context(
-        user_id=user_id, task=current_message
-    )
+        messages = await prefetch.wait("messages")
+        task = messages.get("current_task")
+
+        # Get memory context for the agent
+        memory_context = await memory_context_task
+    finally:
+        # A no-op once awaited, stops the lookup when a check above returns or raises
+        memory_context_task.cancel()
+
+    set_attributes(prefetch.span_attributes())
 
     # Convert memory context to JSON string
     memory_context_json = json.dumps(memory_context)
@@ -202,7 +185,7 @@ async def start_bot(
             "- If the user wants a financial advice/recommendation related to a token, trade, etc, always call the corresponding agent, and attach with the response a disclaimer that the response is not financial advice, and that the user should do their own research. But always call the corresponding agent.\n"
             "- Error handling: if any error occurs, or an assistant returns an error, explain very briefly to the user, ask him to try again changing the parameters or what he requested (if needed), or to try again later. Asking for more details is not an error.\n"
         ),
-        tools=[call_agent],
+        tools=agent_tools([call_agent]),
         reflect_on_tool_use=True,
         model_client_stream=True,
     )
@@ -222,6 +205,19 @@ async def start_bot(
             "use_voice": use_voice,
         }
     )
+    # chunks are buffered and written in coalesced windows instead of one write per chunk
+    stream_writer = create_message_stream_writer(
+        chat_id=chat_id,
+        user_id=user_id,
+        message_id=message_id,
+        data={
+            "sender": "AI",
+            "voiceContent": "",
+            "useVoice": False,
+            "messageType": "text",
+        },
+    )
+    first_token_ms = None
     try:
         # stream the messages from planner
         async for message in planner.on_messages_stream(
@@ -233,23 +229,17 @@ async def start_bot(
         ):
             # if message is a type of message chunk, write to message doc
             if isinstance(message, ModelClientStreamingChunkEvent):
-                await update_message(
-                    chat_id=chat_id,
-                    user_id=user_id,
-                    message_id=message_id,
-                    data={
-                        "content": message.content.replace("TERMINATE", ""),
-                        "sender": "AI",
-                        "voiceContent": "",
-                        "useVoice": False,
-                        "messageType": "text",
-                    },
-                )
+                if first_token_ms is None:
+                    first_token_ms = prefetch.elapsed_ms()
+                    set_attributes({"time_to_first_token_ms": first_token_ms})
+                await stream_writer.write(message.content.replace("TERMINATE", ""))
             # then we get final response, which has all the message chunks concatenated together
             # use that to create the voice message
             elif isinstance(message, Response):
-                # save the user input and output
-                await memory_service.store_message_memory(
+                # write whatever is left on the buffer before anything else
+                await stream_writer.close()
+                # queue the user input and output, recorded as a memory off the reply path
+                memory_service.enqueue_message_memory(
                     user_id=user_id,
                     content=task[0].content,
                     agent_response=message.chat_message.content.replace(
@@ -258,7 +248,7 @@ async def start_bot(
                     chat_id=chat_id,
                 )
                 if use_voice:
-                    voice_result = generate_speech_from_text(
+                    voice_result = await generate_speech_from_text_async(
                         text=message.chat_message.content.replace("TERMINATE", "")
                     )
                     encoded_voice = encode_audio_to_base64(voice_result)
@@ -279,5 +269,10 @@ async def start_bot(
     except Exception as e:
         set_status_error(e)
         raise e
+    finally:
+        # make sure a partial answer is not lost if the stream fails
+        await stream_writer.close()
+        report_http_stats()
+        remove_request_ctx(chat_id)
 
     return
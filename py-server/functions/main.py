@@ -15,13 +15,25 @@ from firebase_functions.options import MemoryOption
 from firebase_functions.scheduler_fn import on_schedule
 from firebase_functions.core import CloudEvent
 from firebase_functions.https_fn import on_request, Request, Response
-import asyncio
+import functools
+
+from services.http_client import run_async
 
 from config import (
     FIREBASE_PROJECT_ID,
     FIREBASE_PRIVATE_KEY,
     FIREBASE_CLIENT_EMAIL,
     FIREBASE_TOKEN_URI,
+    PRELOAD_AGENTS,
+    EVENT_TRIGGER_BATCH_WINDOW_SEC,
+    EVENT_TRIGGER_BATCH_SIZE,
+    MEMORY_BATCH_WINDOW_SEC,
+    MEMORY_BATCH_SIZE,
+    MEMORY_TTL_DAYS,
+    MEMORY_HALF_LIFE_DAYS,
+    MEMORY_MIN_DECAY_SCORE,
+    MEMORY_COMPACTION_INTERVAL_HOURS,
+    MEMORY_COMPACTION_MAX_ROWS_PER_USER,
 )
 
 try:
@@ -38,6 +50,31 @@ except ValueError:
     )
     app = firebase_admin.initialize_app(cred)
 
+# Entry points that delegate to the specialist agents load them while the instance warms up
+AGENT_ENTRY_POINTS = ("on_message_created", "call_orbit", "call_automated_orbit")
+if os.getenv("FUNCTION_TARGET") in AGENT_ENTRY_POINTS:
+    from agents.agent_registry import agent_registry
+
+    agent_registry.preload(PRELOAD_AGENTS)
+
+
+def flush_pending_writes(handler):
+    """Writes the queued chat messages and analytics counters before the invocation returns,
+    the instance CPU is throttled right after."""
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            from utils.firebase import flush_chat_messages
+            from services.analytics import flush_analytics
+
+            flush_chat_messages()
+            flush_analytics()
+
+    return wrapper
+
 
 ### Executor Agent Region
 @on_document_created(
@@ -47,6 +84,7 @@ except ValueError:
     min_instances=1,
     region="southamerica-east1",
 )
+@flush_pending_writes
 def on_message_created(event: Event[DocumentSnapshot]) -> None:
     try:
         from executor import start_bot
@@ -62,16 +100,43 @@ def on_message_created(event: Event[DocumentSnapshot]) -> None:
 
         chat_id = event.params["chatId"]
         if data.get("sender") == "user" and data.get("messageType") == "text":
-            chat_doc = db_get_chat_doc(chat_id=chat_id)
+            from executor import process_chat_messages
+            from utils.firebase import get_user_wallets
+            from utils.prefetch import Prefetcher
+
+            # Start every read that does not depend on the chat doc right away
+            prefetch = Prefetcher()
+            prefetch.start("chat_doc", db_get_chat_doc, chat_id=chat_id)
+            speculative_user_id = data.get("userId", "")
+            if speculative_user_id:
+                prefetch.start("user_profile", get_user_profile, speculative_user_id)
+                prefetch.start("wallets", get_user_wallets, speculative_user_id)
+            use_voice = data.get("useVoice", False)
+            needs_transcription = (
+                use_voice and data.get("voiceContent") and not data.get("content")
+            )
+            if needs_transcription:
+                prefetch.start(
+                    "transcription", transcribe_audio, data.get("voiceContent", "")
+                )
+            else:
+                prefetch.start("messages", process_chat_messages, chat_id)
+
+            chat_doc = prefetch.result("chat_doc")
             if not chat_doc:
+                prefetch.cancel()
                 return
             message_id = event.params["messageId"]
             user_id = chat_doc.get("userId", "") or data.get("userId", "")
+            if user_id != speculative_user_id or not prefetch.is_started(
+                "user_profile"
+            ):
+                prefetch.restart("user_profile", get_user_profile, user_id)
+                prefetch.restart("wallets", get_user_wallets, user_id)
             summary = chat_doc.get("summary", "")
-            use_voice = data.get("useVoice", False)
-            if use_voice and data.get("voiceContent") and not data.get("content"):
-                content = transcribe_audio(data.get("voiceContent", ""))
-                asyncio.run(
+            if needs_transcription:
+                content = prefetch.result("transcription")
+                run_async(
                     update_message(
                         chat_id=chat_id,
                         user_id=user_id,
@@ -79,18 +144,21 @@ def on_message_created(event: Event[DocumentSnapshot]) -> None:
                         data={"content": content, "sender": "user"},
                     )
                 )
+                # the chat history has to include the transcribed message
+                prefetch.start("messages", process_chat_messages, chat_id)
             # get user profile & onboarding status
-            user_profile = get_user_profile(user_id)
+            user_profile = prefetch.result("user_profile")
             onboarding_completed = user_profile.get(
                 "onboarding_completed", "NOT_ONBOARDED"
             )
 
             if not onboarding_completed or onboarding_completed != "ONBOARDED":
+                prefetch.cancel()
                 from agents.user_management.user_management_agent import (
                     call_user_management_agent,
                 )
 
-                asyncio.run(
+                run_async(
                     call_user_management_agent(
                         task="onboarding",
                         user_id=user_id,
@@ -100,13 +168,14 @@ def on_message_created(event: Event[DocumentSnapshot]) -> None:
                 )
                 return
             else:
-                asyncio.run(
+                run_async(
                     start_bot(
                         user_id=user_id,
                         chat_id=chat_id,
                         integrator_id="sphereone",
                         summary=summary,
                         use_voice=use_voice,
+                        prefetch=prefetch,
                     )
                 )
                 return
@@ -147,7 +216,7 @@ def on_message_created_summarize(event: Event[DocumentSnapshot]) -> None:
         if data.get("component", "") == "agent_thought":
             return
         # We don't need to check for user/message type as we want to summarize all messages
-        asyncio.run(summarize_chat(chat_id))
+        run_async(summarize_chat(chat_id))
     except Exception as e:
         print("Error in summarizer: ", e)
 
@@ -159,6 +228,7 @@ def on_message_created_summarize(event: Event[DocumentSnapshot]) -> None:
     memory=MemoryOption.MB_512,
     region="southamerica-east1",
 )
+@flush_pending_writes
 def on_error_message_created(event: Event[DocumentSnapshot]) -> None:
     from error_agent import generate_error_message
     from utils.firebase import db_get_chat_doc
@@ -182,7 +252,7 @@ def on_error_message_created(event: Event[DocumentSnapshot]) -> None:
 
         if not frontend_error:
             return
-        asyncio.run(
+        run_async(
             generate_error_message(
                 chat_id, user_id, chat_summary, frontend_error, use_voice
             )
@@ -194,18 +264,20 @@ def on_error_message_created(event: Event[DocumentSnapshot]) -> None:
 ### Automated Agents Chats Region
 # Conservative Chat (Stake + Lulo) - run every 1 hour
 @on_schedule(schedule="0 * * * *", memory=MemoryOption.MB_512, timeout_sec=540)
+@flush_pending_writes
 def on_conservative_agent_run(event: CloudEvent) -> None:
     try:
         from agents.conservative_agent.conservative_agent import call_conservative_agent
 
         chat_id = "conservative-chat"
-        asyncio.run(call_conservative_agent(chat_id=chat_id))
+        run_async(call_conservative_agent(chat_id=chat_id))
     except Exception as e:
         print("Error running conservative agent: ", e)
 
 
 # Degen Chat (Memecoin) - run every 15 minutes
 @on_schedule(schedule="*/30 * * * *", memory=MemoryOption.MB_512, timeout_sec=540)
+@flush_pending_writes
 def on_degen_agent_run(event: CloudEvent) -> None:
     try:
         from agents.automated_memecoin_trader.memecoin_agent import (
@@ -213,13 +285,14 @@ def on_degen_agent_run(event: CloudEvent) -> None:
         )
 
         chat_id = "degen-chat"
-        asyncio.run(call_automated_memecoin_trader_agent(chat_id=chat_id))
+        run_async(call_automated_memecoin_trader_agent(chat_id=chat_id))
     except Exception as e:
         print("Error running memecoin trader agent: ", e)
 
 
 # Risky-chat (Drift) - run every 1 hours
 @on_schedule(schedule="0 * * * *", memory=MemoryOption.MB_512, timeout_sec=540)
+@flush_pending_writes
 def on_autonomous_lulo_drift_agent_run(event: CloudEvent) -> None:
     from agents.autonomous_drift_agent.autonomous_drift_agent import (
         call_autonomous_drift_agent,
@@ -227,7 +300,7 @@ def on_autonomous_lulo_drift_agent_run(event: CloudEvent) -> None:
 
     try:
         chat_id = "risky-chat"
-        asyncio.run(call_autonomous_drift_agent(chat_id=chat_id))
+        run_async(call_autonomous_drift_agent(chat_id=chat_id))
     except Exception as e:
         print("Error running autonomous drift agent: ", e)
 
@@ -237,6 +310,7 @@ def on_autonomous_lulo_drift_agent_run(event: CloudEvent) -> None:
     memory=MemoryOption.MB_512,
     region="southamerica-east1",
 )
+@flush_pending_writes
 def call_orbit(request: Request) -> Response:
     from executor_mcp import start_chat
     from utils.firebase import verify_api_key
@@ -260,7 +334,7 @@ def call_orbit(request: Request) -> Response:
         sol_wallet_address = data.get("solWalletAddress")
         evm_wallet_address = data.get("evmWalletAddress")
 
-        result = asyncio.run(
+        result = run_async(
             start_chat(
                 user_id=user_id,
                 chat_id=chat_id,
@@ -314,6 +388,7 @@ def call_orbit(request: Request) -> Response:
     memory=MemoryOption.MB_512,
     region="southamerica-east1",
 )
+@flush_pending_writes
 def call_automated_orbit(event: CloudEvent[MessagePublishedData]) -> None:
     from automated_executor import start_automated_executor
 
@@ -333,7 +408,7 @@ def call_automated_orbit(event: CloudEvent[MessagePublishedData]) -> None:
         sol_wallet_address = data.get("solWalletAddress", "")
         evm_wallet_address = data.get("evmWalletAddress", "")
 
-        asyncio.run(
+        run_async(
             start_automated_executor(
                 user_id=user_id,
                 chat_id=chat_id,
@@ -356,12 +431,13 @@ def call_automated_orbit(event: CloudEvent[MessagePublishedData]) -> None:
     region="southamerica-east1",
     timeout_sec=540,
 )
+@flush_pending_writes
 def on_market_analysis_run(event: CloudEvent) -> None:
     from agents.researcher_agent.market_context_agent import call_market_context_agent
 
     try:
         task = "current market trends and their impacts on BTC, SOL, ETH"
-        asyncio.run(
+        run_async(
             call_market_context_agent(
                 task=task,
                 chat_id="0",
@@ -372,6 +448,91 @@ def on_market_analysis_run(event: CloudEvent) -> None:
         print("Error running market context agent: ", e)
 
 
+### Memory Pipeline Region
+# Records the messages queued by enqueue_message_memory, whichever invocation holds the drain
+# lease records the jobs of the window together. The jobs that failed stay queued for a retry
+@on_document_created(
+    document="memory_jobs/{jobId}",
+    memory=MemoryOption.MB_512,
+    region="southamerica-east1",
+    timeout_sec=540,
+)
+def on_memory_job_created(event: Event[DocumentSnapshot]) -> None:
+    from utils.firebase import db
+    from utils.micro_batch_queue import MicroBatchQueue
+    from services.memory_service import (
+        MemoryService,
+        MEMORY_QUEUE_COLLECTION,
+        MEMORY_QUEUE_LEASE,
+    )
+
+    try:
+        memory_service = MemoryService()
+        memory_queue = MicroBatchQueue(
+            db,
+            collection=MEMORY_QUEUE_COLLECTION,
+            lease_path=MEMORY_QUEUE_LEASE,
+            window_seconds=MEMORY_BATCH_WINDOW_SEC,
+            batch_size=MEMORY_BATCH_SIZE,
+        )
+        processed = memory_queue.drain(
+            lambda jobs: run_async(memory_service.store_message_memories(jobs))
+        )
+        if processed:
+            print(f"Recorded memories for {processed} queued messages")
+    except Exception as e:
+        print(f"Error recording memories: {e}")
+
+
+# Merges near-duplicate memories and expires stale interactions - runs every hour, a pass over
+# every user starts once per MEMORY_COMPACTION_INTERVAL_HOURS and resumes where the last run stopped
+@on_schedule(
+    schedule="30 * * * *",
+    memory=MemoryOption.GB_1,
+    region="southamerica-east1",
+    timeout_sec=540,
+)
+def on_memory_compaction_run(event: CloudEvent) -> None:
+    from utils.firebase import db
+    from services.memory_compaction import MemoryCompactor
+
+    try:
+        compactor = MemoryCompactor(
+            db,
+            ttl_days=MEMORY_TTL_DAYS,
+            half_life_days=MEMORY_HALF_LIFE_DAYS,
+            min_decay_score=MEMORY_MIN_DECAY_SCORE,
+            interval_seconds=MEMORY_COMPACTION_INTERVAL_HOURS * 3600,
+            max_rows_per_user=MEMORY_COMPACTION_MAX_ROWS_PER_USER,
+        )
+        # Stop early enough to save the cursor before the function times out
+        result = compactor.run(deadline_seconds=480)
+        if not result.get("skipped"):
+            print("Compacted memories: ", result)
+    except Exception as e:
+        print("Error compacting memories: ", e)
+
+
+### Analytics Region
+# Fold the global counter shards into analytics/global - run every 10 minutes
+@on_schedule(
+    schedule="*/10 * * * *",
+    memory=MemoryOption.MB_512,
+    region="southamerica-east1",
+)
+def on_analytics_rollup_run(event: CloudEvent) -> None:
+    from services.analytics import global_counters, rollup_global_analytics
+
+    # Without shards the global counters are written to analytics/global directly
+    if global_counters is None:
+        return
+    try:
+        rolled_up = rollup_global_analytics()
+        print("Rolled up global analytics: ", rolled_up)
+    except Exception as e:
+        print("Error rolling up global analytics: ", e)
+
+
 ### Tweet Cache Listener Region
 @on_document_created(
     document="twitter-feeds/{tweetId}",
@@ -379,9 +540,49 @@ def on_market_analysis_run(event: CloudEvent) -> None:
     region="southamerica-east1",
     timeout_sec=540,
 )
+@flush_pending_writes
 def on_tweet_added(event: Event[DocumentSnapshot]) -> None:
-    from utils.firebase import get_tweet_based_events_from_db
-    from agents.event_trigger_agent.event_trigger_agent import call_event_trigger_agent
+    from utils.firebase import db, get_tweet_based_events_from_db
+    from utils.micro_batch_queue import MicroBatchQueue
+    from agents.event_trigger_agent.event_trigger_agent import (
+        call_event_trigger_agent,
+        call_event_trigger_agent_batch,
+        evaluation_completed,
+    )
+    from agents.event_trigger_agent.tweet_dedup import (
+        TweetDeduplicator,
+        tweet_deduplicator,
+    )
+
+    def is_near_duplicate(tweet: dict, batch_window=None) -> bool:
+        text = tweet.get("text") or ""
+        # Tweets are recorded once evaluated, so a failed evaluation doesn't suppress the copies
+        duplicate_of = tweet_deduplicator.check(tweet["id"], text, record=False)
+        if duplicate_of is None and batch_window is not None:
+            duplicate_of = batch_window.check(tweet["id"], text)
+        if duplicate_of:
+            print(f"Skipping tweet {tweet['id']}, near-duplicate of {duplicate_of}")
+        return duplicate_of is not None
+
+    def record_evaluated(tweets: list[dict], result):
+        if evaluation_completed(result):
+            for tweet in tweets:
+                tweet_deduplicator.record(tweet["id"], tweet.get("text") or "")
+
+    def check_queued_tweets(queued: list[dict]):
+        events = get_tweet_based_events_from_db()
+        tweet_deduplicator.track_events(event["eventId"] for event in events)
+        # Copies of a tweet within the batch are only evaluated once
+        batch_window = TweetDeduplicator(max_tweets=max(len(queued), 1))
+        tweets = [tweet for tweet in queued if not is_near_duplicate(tweet, batch_window)]
+        if tweets:
+            result = run_async(
+                call_event_trigger_agent_batch(tweets=tweets, events=events)
+            )
+            record_evaluated(tweets, result)
+            if not evaluation_completed(result):
+                # The whole batch stays queued for the next drain
+                return range(len(queued))
 
     try:
         snapshot = event.data
@@ -390,13 +591,34 @@ def on_tweet_added(event: Event[DocumentSnapshot]) -> None:
 
         tweet_data = snapshot.to_dict()
 
+        if tweet_data and EVENT_TRIGGER_BATCH_WINDOW_SEC > 0:
+            # Micro-batching: queue the tweet, whichever invocation holds the drain lease
+            # checks the tweets of the window together
+            tweet_queue = MicroBatchQueue(
+                db,
+                collection="event_trigger_queue",
+                lease_path="event_trigger_queue_state/drain",
+                window_seconds=EVENT_TRIGGER_BATCH_WINDOW_SEC,
+                batch_size=EVENT_TRIGGER_BATCH_SIZE,
+            )
+            tweet_queue.enqueue(snapshot.id, {"id": snapshot.id, **tweet_data})
+            processed = tweet_queue.drain(check_queued_tweets)
+            return f"Checked {processed} queued tweets"
+
         if tweet_data:
             tweet_content = tweet_data.get("text", None)
             pending_events = get_tweet_based_events_from_db()
-            if len(pending_events) > 0 and tweet_content:
-                chat_result = asyncio.run(
+            tweet_deduplicator.track_events(event["eventId"] for event in pending_events)
+            tweet = {"id": snapshot.id, **tweet_data}
+            if (
+                len(pending_events) > 0
+                and tweet_content
+                and not is_near_duplicate(tweet)
+            ):
+                chat_result = run_async(
                     call_event_trigger_agent(tweet=tweet_data, events=pending_events)
                 )
+                record_evaluated([tweet], chat_result)
                 return chat_result
         return "No events to trigger"
 
@@ -411,6 +633,7 @@ def on_tweet_added(event: Event[DocumentSnapshot]) -> None:
     region="southamerica-east1",
     timeout_sec=540,
 )
+@flush_pending_writes
 def on_polymarket_event_added(event: Event[DocumentSnapshot]) -> None:
     from agents.polymarket_analysis_agent.polymarket_analysis_agent import (
         call_polymarket_analysis_agent,
@@ -434,7 +657,7 @@ def on_polymarket_event_added(event: Event[DocumentSnapshot]) -> None:
         }
 
         if event_data:
-            result = asyncio.run(
+            result = run_async(
                 call_polymarket_analysis_agent(
                     event_data=event_data,
                 )
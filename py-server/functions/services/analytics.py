@@ -1,6 +1,7 @@
 from utils.firebase import db, get_request_ctx
-from firebase_admin import firestore
 from firebase_admin.firestore import DocumentReference
+from services.analytics_aggregator import CounterAggregator, ShardedCounterDoc
+from config import ANALYTICS_GLOBAL_SHARDS
 
 # Collection and field constants
 ANALYTICS_COLLECTION = "analytics"
@@ -12,11 +13,17 @@ TOTAL_MESSAGES_FIELD = "total_messages"
 UPDATED_AT_FIELD = "updated_at"
 
 
+# Counters are aggregated in memory and written with batched Increment transforms
+counter_aggregator = CounterAggregator(db, updated_at_field=UPDATED_AT_FIELD)
+counter_aggregator.register_exit_flush()
+
+
 def increment_field_in_doc(
     doc_ref: DocumentReference, field: str, key: str | None = None, amount: int = 1
 ):
     """
-    Increments a field within a document. If the document does not exist, creates it.
+    Increments a field within a document. If the document does not exist, it is created by the flush.
+    The increment is queued in memory, call `flush_analytics` to write it right away.
 
     Args:
         doc_ref: Document Reference.
@@ -24,28 +31,53 @@ def increment_field_in_doc(
         key: Optional key if the field is a map (like agents_used).
         amount: Value of the increment.
     """
-    doc = doc_ref.get()
-    full_field = f"{field}.{key}" if key else field
-    if not doc.exists:
-        # Create initial document
-        doc_ref.set(
-            {
-                field: {key: amount} if key else amount,
-                UPDATED_AT_FIELD: firestore.SERVER_TIMESTAMP,
-            }
-        )
-    else:
-        updates = {
-            full_field: firestore.Increment(amount),
-            UPDATED_AT_FIELD: firestore.SERVER_TIMESTAMP,
-        }
-        doc_ref.update(updates)
+    counter_aggregator.increment(doc_ref, field, key=key, amount=amount)
+
+
+def flush_analytics():
+    """Writes the pending counters, called at the end of every invocation."""
+    return counter_aggregator.flush()
+
+
+# Every instance increments the global counters, spread them over shard docs when enabled
+global_counters = (
+    ShardedCounterDoc(
+        db,
+        db.collection(ANALYTICS_COLLECTION).document(GLOBAL_DOCUMENT),
+        shards=ANALYTICS_GLOBAL_SHARDS,
+        updated_at_field=UPDATED_AT_FIELD,
+    )
+    if ANALYTICS_GLOBAL_SHARDS > 1
+    else None
+)
+
+
+def get_global_counter_ref() -> DocumentReference:
+    """Document to increment for the global counters: a random shard, or the global doc itself."""
+    if global_counters:
+        return global_counters.shard_ref()
+    return db.collection(ANALYTICS_COLLECTION).document(GLOBAL_DOCUMENT)
+
+
+def get_global_analytics() -> dict:
+    """Global counters, including the increments not rolled up into the global doc yet."""
+    if global_counters:
+        return global_counters.read()
+    doc = db.collection(ANALYTICS_COLLECTION).document(GLOBAL_DOCUMENT).get()
+    return doc.to_dict() if doc.exists else {}
+
+
+def rollup_global_analytics() -> dict:
+    """Folds the global counter shards into the global doc, returns the rolled up totals."""
+    if not global_counters:
+        return {}
+    return global_counters.rollup()
 
 
 def increment_agent_used(agent: str, chat_id: str):
     try:
         # Global
-        global_doc_ref = db.collection(ANALYTICS_COLLECTION).document(GLOBAL_DOCUMENT)
+        global_doc_ref = get_global_counter_ref()
         increment_field_in_doc(global_doc_ref, AGENTS_USED_FIELD, key=agent)
 
         # User
@@ -65,7 +97,7 @@ def increment_agent_used(agent: str, chat_id: str):
 def increment_message_count(chat_id: str):
     try:
         # Global
-        global_doc_ref = db.collection(ANALYTICS_COLLECTION).document(GLOBAL_DOCUMENT)
+        global_doc_ref = get_global_counter_ref()
         increment_field_in_doc(global_doc_ref, TOTAL_MESSAGES_FIELD)
 
         # User
@@ -0,0 +1,204 @@
+import atexit
+import random
+import threading
+from collections import defaultdict
+
+# Firestore batches accept at most 500 writes
+MAX_BATCH_WRITES = 500
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+class CounterAggregator:
+    """
+    Write-behind aggregator for Firestore counters.
+
+    - `increment` only records the delta in memory, keyed by document and field path, so the
+      request path never waits on Firestore.
+    - `flush` writes every pending document with a single `set(..., merge=True)` of
+      `Increment` transforms in one batch: no reads, and the document is created on its
+      first write.
+    - Pending deltas are flushed on a timer, on demand at the end of an invocation and when
+      the process exits. A failed flush keeps the deltas for the next one.
+    """
+
+    def __init__(
+        self,
+        db,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        updated_at_field: str = "updated_at",
+    ):
+        self.db = db
+        self.updated_at_field = updated_at_field
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._doc_refs = {}
+        self._deltas: dict[str, dict[tuple, int]] = defaultdict(lambda: defaultdict(int))
+        self._timer = None
+        self.flushes = 0
+        self.writes = 0
+
+    def increment(self, doc_ref, field: str, key: str | None = None, amount: int = 1):
+        field_path = (field, key) if key else (field,)
+        with self._lock:
+            self._doc_refs[doc_ref.path] = doc_ref
+            self._deltas[doc_ref.path][field_path] += amount
+            if self._timer is None and self.flush_interval:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(fields) for fields in self._deltas.values())
+
+    def _take_pending(self) -> tuple[dict, dict]:
+        # The refs go with their deltas, so only documents with pending deltas are kept
+        with self._lock:
+            deltas, doc_refs = self._deltas, self._doc_refs
+            self._deltas = defaultdict(lambda: defaultdict(int))
+            self._doc_refs = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return deltas, doc_refs
+
+    def _restore(self, deltas: dict, doc_refs: dict):
+        with self._lock:
+            for path, fields in deltas.items():
+                self._doc_refs.setdefault(path, doc_refs[path])
+                for field_path, amount in fields.items():
+                    self._deltas[path][field_path] += amount
+
+    def _build_update(self, fields: dict[tuple, int], increment, server_timestamp) -> dict:
+        # set() with merge takes nested maps, dotted keys would be stored as literal field names
+        update = {self.updated_at_field: server_timestamp}
+        for field_path, amount in fields.items():
+            target = update
+            for part in field_path[:-1]:
+                target = target.setdefault(part, {})
+            target[field_path[-1]] = increment(amount)
+        return update
+
+    def flush(self):
+        """Writes every pending delta, returns the number of documents written."""
+        with self._flush_lock:
+            deltas, doc_refs = self._take_pending()
+            if not deltas:
+                return 0
+            paths = list(deltas)
+            written = 0
+            try:
+                from google.cloud.firestore_v1 import SERVER_TIMESTAMP, Increment
+
+                for start in range(0, len(paths), MAX_BATCH_WRITES):
+                    batch = self.db.batch()
+                    for path in paths[start : start + MAX_BATCH_WRITES]:
+                        batch.set(
+                            doc_refs[path],
+                            self._build_update(deltas[path], Increment, SERVER_TIMESTAMP),
+                            merge=True,
+                        )
+                    batch.commit()
+                    written = start + len(paths[start : start + MAX_BATCH_WRITES])
+            except Exception as e:
+                print("Error flushing analytics counters", e)
+                self._restore({path: deltas[path] for path in paths[written:]}, doc_refs)
+            self.flushes += 1
+            self.writes += written
+            return written
+
+    def register_exit_flush(self):
+        atexit.register(self.flush)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _add_counters(total: dict, data: dict):
+    """Adds the numeric (possibly nested) fields of `data` into `total`."""
+    for field, value in data.items():
+        if isinstance(value, dict):
+            _add_counters(total.setdefault(field, {}), value)
+        elif _is_number(value):
+            total[field] = total.get(field, 0) + value
+
+
+def _increments(counters: dict, increment, sign: int = 1) -> dict:
+    update = {}
+    for field, value in counters.items():
+        if isinstance(value, dict):
+            nested = _increments(value, increment, sign)
+            if nested:
+                update[field] = nested
+        elif value:
+            update[field] = increment(sign * value)
+    return update
+
+
+class ShardedCounterDoc:
+    """
+    A counters document split over `shards` shard documents (`<doc>/shards/<n>`), so the write
+    rate is not bound by Firestore's sustained limit of about one write per second per document.
+
+    - Writers increment a random shard (`shard_ref`), picked once per thread.
+    - `read` returns the base document plus every shard.
+    - `rollup` moves the shard totals into the base document with one atomic batch that adds
+      them to the base and subtracts them from each shard, increments that land on a shard
+      in the meantime are kept.
+    """
+
+    SHARDS_COLLECTION = "shards"
+
+    def __init__(self, db, doc_ref, shards: int, updated_at_field: str = "updated_at"):
+        self.db = db
+        self.doc_ref = doc_ref
+        self.shards = shards
+        self.updated_at_field = updated_at_field
+        self._local = threading.local()
+
+    def shard_ref(self, shard: int | None = None):
+        if shard is None:
+            # a thread sticks to one random shard, so a flush writes a single shard doc
+            shard = getattr(self._local, "shard", None)
+            if shard is None:
+                shard = self._local.shard = random.randrange(self.shards)
+        return self.doc_ref.collection(self.SHARDS_COLLECTION).document(str(shard))
+
+    def _read_shards(self) -> list:
+        return list(self.doc_ref.collection(self.SHARDS_COLLECTION).stream())
+
+    def read(self) -> dict:
+        total = {}
+        base = self.doc_ref.get()
+        if base.exists:
+            _add_counters(total, base.to_dict())
+        for snapshot in self._read_shards():
+            _add_counters(total, snapshot.to_dict() or {})
+        return total
+
+    def rollup(self) -> dict:
+        """Folds the shards into the base document, returns the totals that were moved."""
+        from google.cloud.firestore_v1 import SERVER_TIMESTAMP, Increment
+
+        moved = {}
+        batch = self.db.batch()
+        writes = 0
+        for snapshot in self._read_shards():
+            counters = {}
+            _add_counters(counters, snapshot.to_dict() or {})
+            counters.pop(self.updated_at_field, None)
+            decrement = _increments(counters, Increment, sign=-1)
+            if not decrement:
+                continue
+            batch.set(self.shard_ref(int(snapshot.id)), decrement, merge=True)
+            _add_counters(moved, counters)
+            writes += 1
+        if not writes:
+            return {}
+        update = _increments(moved, Increment)
+        update[self.updated_at_field] = SERVER_TIMESTAMP
+        batch.set(self.doc_ref, update, merge=True)
+        batch.commit()
+        return moved
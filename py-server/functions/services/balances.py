@@ -1,5 +1,5 @@
 from enum import Enum
-import requests
+from services.http_client import get_async_http_client, http_session
 from config import FIREBASE_SERVER_ENDPOINT
 
 
@@ -14,7 +14,7 @@ def get_wallet_balance(walletAddress: str, chainType: str) -> list:
     """
     try:
         params = {"walletAddress": walletAddress, "chainType": chainType.lower()}
-        response = requests.get(
+        response = http_session.get(
             f"{FIREBASE_SERVER_ENDPOINT}/getWalletBalancesForAddress", params=params
         )
         response.raise_for_status()
@@ -41,7 +41,7 @@ def get_single_token_balance(
             "chainName": chainName,
             "tokenSymbolOrAddress": tokenSymbolOrAddress,
         }
-        response = requests.get(
+        response = http_session.get(
             f"{FIREBASE_SERVER_ENDPOINT}/getTokenBalanceFromBlockchain", params=params
         )
         response.raise_for_status()
@@ -59,7 +59,68 @@ def update_balances_after_transaction(transaction_id: str):
     """
     try:
         payload = {"transactionId": transaction_id}
-        response = requests.post(
+        response = http_session.post(
+            f"{FIREBASE_SERVER_ENDPOINT}/updateBalancesAfterTransaction", json=payload
+        )
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        print(f"Error updating balances after transaction: {e}")
+        return None
+
+
+async def get_wallet_balance_async(walletAddress: str, chainType: str) -> list:
+    """
+    Async version of get_wallet_balance, for code running on the event loop.
+    """
+    try:
+        params = {"walletAddress": walletAddress, "chainType": chainType.lower()}
+        response = await get_async_http_client().get(
+            f"{FIREBASE_SERVER_ENDPOINT}/getWalletBalancesForAddress", params=params
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if "balances" in data:
+            return data["balances"]
+        else:
+            return []
+    except Exception as e:
+        print(f"Error getting wallet balances: {e}")
+        return []
+
+
+async def get_single_token_balance_async(
+    walletAddress: str, chainName: str, tokenSymbolOrAddress: str
+) -> float:
+    """
+    Async version of get_single_token_balance, for code running on the event loop.
+    """
+    try:
+        params = {
+            "walletAddress": walletAddress,
+            "chainName": chainName,
+            "tokenSymbolOrAddress": tokenSymbolOrAddress,
+        }
+        response = await get_async_http_client().get(
+            f"{FIREBASE_SERVER_ENDPOINT}/getTokenBalanceFromBlockchain", params=params
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        return data["token_balance"]
+    except Exception as e:
+        print(f"Error getting token balance: {e}")
+        return 0
+
+
+async def update_balances_after_transaction_async(transaction_id: str):
+    """
+    Async version of update_balances_after_transaction, for code running on the event loop.
+    """
+    try:
+        payload = {"transactionId": transaction_id}
+        response = await get_async_http_client().post(
             f"{FIREBASE_SERVER_ENDPOINT}/updateBalancesAfterTransaction", json=payload
         )
         response.raise_for_status()
@@ -1,5 +1,8 @@
 from enum import Enum
+import httpx
 import requests
+import threading
+from services.http_client import get_async_http_client, http_session
 from google.cloud.firestore_v1.base_query import FieldFilter
 
 from config import FIREBASE_SERVER_ENDPOINT
@@ -11,9 +14,30 @@ class ChainType(Enum):
     SOLANA = "SOLANA"
 
 
+# Methods whose answer never changes for the same params, resolved once per instance
+STATIC_CHAINS_SERVICE_METHODS = {"getChainId", "getChainName"}
+_static_responses: dict[tuple, object] = {}
+_static_responses_lock = threading.Lock()
+
+
+def _static_response_key(method: str, params: dict):
+    if method not in STATIC_CHAINS_SERVICE_METHODS:
+        return None
+    return (method, tuple(sorted((k, str(v).lower()) for k, v in params.items())))
+
+
+def _remember_static_response(key, result):
+    # Failed calls come back as {"error": ...} and are retried on the next call
+    if key is None or (isinstance(result, dict) and "error" in result):
+        return
+    with _static_responses_lock:
+        _static_responses[key] = result
+
+
 def call_chains_service(method: str, **params) -> dict:
     """
     Calls the new chains service endpoint with the given method and parameters.
+    Chain id/name lookups are answered from memory after the first successful call.
 
     Args:
         method (str): The method to call in the chains service.
@@ -22,18 +46,44 @@ def call_chains_service(method: str, **params) -> dict:
     Returns:
         dict: The response from the service.
     """
+    key = _static_response_key(method, params)
+    if key in _static_responses:
+        return _static_responses[key]
     try:
         params["method"] = method
-        response = requests.get(
+        response = http_session.get(
             f"{FIREBASE_SERVER_ENDPOINT}/callChainsService", params=params
         )
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        _remember_static_response(key, result)
+        return result
     except requests.exceptions.RequestException as e:
         print(f"Failed to call chains service: {e}")
         return {"error": "Failed to call chains service"}
 
 
+async def call_chains_service_async(method: str, **params) -> dict:
+    """
+    Async version of call_chains_service, for code running on the event loop.
+    """
+    key = _static_response_key(method, params)
+    if key in _static_responses:
+        return _static_responses[key]
+    try:
+        params["method"] = method
+        response = await get_async_http_client().get(
+            f"{FIREBASE_SERVER_ENDPOINT}/callChainsService", params=params
+        )
+        response.raise_for_status()
+        result = response.json()
+        _remember_static_response(key, result)
+        return result
+    except httpx.HTTPError as e:
+        print(f"Failed to call chains service: {e}")
+        return {"error": "Failed to call chains service"}
+
+
 def get_all_native_tokens():
     try:
         active_chains = (
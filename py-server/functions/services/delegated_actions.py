@@ -1,4 +1,6 @@
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from config import FIREBASE_SERVER_ENDPOINT
 
 
@@ -25,7 +27,7 @@ def sign_transaction(transaction, type, action, sender_wallet_address, chain=Non
             "senderWalletAddress": sender_wallet_address,
             "fromClient": False
         }
-        response = requests.post(f"{FIREBASE_SERVER_ENDPOINT}/signWithDelegatedAction", json=payload)
+        response = http_session.post(f"{FIREBASE_SERVER_ENDPOINT}/signWithDelegatedAction", json=payload)
         response.raise_for_status()
 
         return response.json().get("hash", "")
@@ -35,3 +37,28 @@ def sign_transaction(transaction, type, action, sender_wallet_address, chain=Non
     except Exception as error:
         print(f"Error with signing transactions: {error}")
         raise # raise original error
+
+
+async def sign_transaction_async(transaction, type, action, sender_wallet_address, chain=None):
+    """
+    Async version of sign_transaction, for code running on the event loop.
+    """
+    try:
+        payload = {
+            "transaction": transaction,
+            "type": type,
+            "chain": chain,
+            "action": action,
+            "senderWalletAddress": sender_wallet_address,
+            "fromClient": False
+        }
+        response = await get_async_http_client().post(f"{FIREBASE_SERVER_ENDPOINT}/signWithDelegatedAction", json=payload)
+        response.raise_for_status()
+
+        return response.json().get("hash", "")
+    except httpx.HTTPError as error:
+        print(f"Error with signing transactions due to api request: {error}")
+        raise # raise original error
+    except Exception as error:
+        print(f"Error with signing transactions: {error}")
+        raise # raise original error
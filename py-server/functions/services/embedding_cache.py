@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+# ~12 KB per text-embedding-3-small vector, so the memory tier stays around 12 MB
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    """Content hash of the text, scoped to the model that produced the embedding."""
+    return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+
+class DiskEmbeddingStore:
+    """Persistent tier keeping one raw float64 file per embedding, for local scripts and dev."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.f64")
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found = {}
+        for key in keys:
+            try:
+                with open(self._path(key), "rb") as file:
+                    found[key] = array("d", file.read()).tolist()
+            except FileNotFoundError:
+                continue
+        return found
+
+    def set_many(self, embeddings: dict[str, list[float]]):
+        for key, embedding in embeddings.items():
+            tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(array("d", embedding).tobytes())
+            os.replace(tmp_path, self._path(key))
+
+
+class FirestoreEmbeddingStore:
+    """Persistent tier shared by every instance: one document per embedding, read with get_all."""
+
+    def __init__(self, db, collection_name: str):
+        self.db = db
+        self.collection_name = collection_name
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        collection = self.db.collection(self.collection_name)
+        snapshots = self.db.get_all([collection.document(key) for key in keys])
+        found = {}
+        for snapshot in snapshots:
+            data = snapshot.to_dict() if snapshot.exists else None
+            if data and data.get("embedding") is not None:
+                found[snapshot.id] = [float(x) for x in data["embedding"]]
+        return found
+
+    def set_many(self, embeddings: dict[str, list[float]]):
+        from google.cloud.firestore_v1 import SERVER_TIMESTAMP
+        from google.cloud.firestore_v1.vector import Vector
+
+        collection = self.db.collection(self.collection_name)
+        batch = self.db.batch()
+        for key, embedding in embeddings.items():
+            batch.set(
+                collection.document(key),
+                {"embedding": Vector(embedding), "created_at": SERVER_TIMESTAMP},
+            )
+        batch.commit()
+
+
+class EmbeddingCache:
+    """
+    Content-hash keyed embedding cache.
+
+    - An in-memory LRU tier per instance, vectors are stored packed and returned as new lists.
+    - An optional persistent store (disk or Firestore) consulted on memory misses.
+    - `get_or_create` resolves many texts at once: duplicates and hits are served from the
+      cache and all the misses are sent to the embedding function in a single call.
+
+    Store failures are logged and treated as misses, they never fail the embedding request.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, store=None):
+        self.max_entries = max_entries
+        self.store = store
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, array] = OrderedDict()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[list[float]]:
+        with self._lock:
+            packed = self._entries.get(key)
+            if packed is None:
+                return None
+            self._entries.move_to_end(key)
+        return packed.tolist()
+
+    def put(self, key: str, embedding: list[float]):
+        packed = array("d", embedding)
+        with self._lock:
+            self._entries[key] = packed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def _load_from_store(self, keys: list[str]) -> dict[str, list[float]]:
+        if self.store is None or not keys:
+            return {}
+        try:
+            return await asyncio.to_thread(self.store.get_many, keys)
+        except Exception as e:
+            print(f"Error reading embeddings from the cache store: {e}")
+            return {}
+
+    async def _save_to_store(self, embeddings: dict[str, list[float]]):
+        if self.store is None or not embeddings:
+            return
+        try:
+            await asyncio.to_thread(self.store.set_many, embeddings)
+        except Exception as e:
+            print(f"Error writing embeddings to the cache store: {e}")
+
+    async def get_or_create(
+        self,
+        model: str,
+        texts: list[str],
+        create: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        """Returns the embeddings of `texts` (same order), calling `create` once for all the misses."""
+        keys = [embedding_cache_key(model, text) for text in texts]
+        resolved: dict[str, list[float]] = {}
+        for key in dict.fromkeys(keys):
+            embedding = self.get(key)
+            if embedding is not None:
+                resolved[key] = embedding
+        self.hits += len(resolved)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in resolved]
+        stored = await self._load_from_store(missing)
+        for key, embedding in stored.items():
+            self.put(key, embedding)
+        resolved.update(stored)
+        self.store_hits += len(stored)
+
+        texts_by_key = dict(zip(keys, texts))
+        to_create = [key for key in missing if key not in stored]
+        if to_create:
+            self.misses += len(to_create)
+            created = await create([texts_by_key[key] for key in to_create])
+            new_embeddings = dict(zip(to_create, created))
+            for key, embedding in new_embeddings.items():
+                self.put(key, embedding)
+            resolved.update(new_embeddings)
+            await self._save_to_store(new_embeddings)
+
+        # every caller gets its own list, even for duplicated texts
+        return [list(resolved[key]) for key in keys]
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "size": size,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
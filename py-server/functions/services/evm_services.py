@@ -1,4 +1,6 @@
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from config import FIREBASE_SERVER_ENDPOINT
 
 def call_evm_blockchains_service(method: str, **params) -> dict:
@@ -14,7 +16,7 @@ def call_evm_blockchains_service(method: str, **params) -> dict:
     """
     try:
         params["method"] = method
-        response = requests.get(
+        response = http_session.get(
             f"{FIREBASE_SERVER_ENDPOINT}/evmBlockchainsService", params=params
         )
         response.raise_for_status()
@@ -23,3 +25,20 @@ def call_evm_blockchains_service(method: str, **params) -> dict:
     except requests.exceptions.RequestException as e:
         print(f"Failed to call EVM Blockchains service: {e}")
         return {"error": "Failed to call EVM Blockchains service"}
+
+
+async def call_evm_blockchains_service_async(method: str, **params) -> dict:
+    """
+    Async version of call_evm_blockchains_service, for code running on the event loop.
+    """
+    try:
+        params["method"] = method
+        response = await get_async_http_client().get(
+            f"{FIREBASE_SERVER_ENDPOINT}/evmBlockchainsService", params=params
+        )
+        response.raise_for_status()
+
+        return response.json()
+    except httpx.HTTPError as e:
+        print(f"Failed to call EVM Blockchains service: {e}")
+        return {"error": "Failed to call EVM Blockchains service"}
@@ -0,0 +1,288 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from collections import defaultdict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from urllib.parse import urlparse
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+# Timeouts (seconds) applied when the caller doesn't pass one
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "60"))
+# Connection pools: one pool per host, with up to HTTP_POOL_MAXSIZE keep-alive connections each
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "20"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+# Retries only apply to idempotent methods, a POST that builds or signs a transaction is never replayed
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.3"))
+HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+HTTP_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class HttpStats:
+    """Per-host counters used to report connection reuse and latency."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = defaultdict(int)
+        self._new_connections = defaultdict(int)
+        self._total_latency = defaultdict(float)
+        self._max_latency = defaultdict(float)
+
+    def record_new_connection(self, host: str):
+        with self._lock:
+            self._new_connections[host] += 1
+
+    def record_request(self, host: str, elapsed: float):
+        with self._lock:
+            self._requests[host] += 1
+            self._total_latency[host] += elapsed
+            self._max_latency[host] = max(self._max_latency[host], elapsed)
+
+    def snapshot(self) -> dict:
+        """
+        Returns {host: {requests, new_connections, reuse_rate, avg_latency_ms, max_latency_ms}}.
+        reuse_rate is the share of requests that were served on an already open connection.
+        """
+        with self._lock:
+            stats = {}
+            for host, count in self._requests.items():
+                new_connections = self._new_connections.get(host, 0)
+                stats[host] = {
+                    "requests": count,
+                    "new_connections": new_connections,
+                    "reuse_rate": round(max(count - new_connections, 0) / count, 3),
+                    "avg_latency_ms": round(self._total_latency[host] / count * 1000, 1),
+                    "max_latency_ms": round(self._max_latency[host] * 1000, 1),
+                }
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._new_connections.clear()
+            self._total_latency.clear()
+            self._max_latency.clear()
+
+
+http_stats = HttpStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        http_stats.record_new_connection(self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        http_stats.record_new_connection(self.host)
+        return super()._new_conn()
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that counts the connections opened per host and times every request."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname or ""
+        start = time.perf_counter()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            http_stats.record_request(host, time.perf_counter() - start)
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session shared by every outbound client of the instance.
+
+    Connections are kept alive per host, so warm instances skip the TCP + TLS handshake.
+    A default timeout is applied to every request and idempotent requests are retried
+    with exponential backoff on connection errors and 429/502/503/504 responses.
+    Cookies are never stored, as the session is shared across users.
+    """
+
+    def __init__(
+        self,
+        timeout: tuple[float, float] = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=HTTP_IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            # Hand the last response back so callers keep using raise_for_status
+            raise_on_status=False,
+        )
+        adapter = InstrumentedHTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+http_session = PooledSession()
+
+
+class InstrumentedAsyncTransport(httpx.AsyncHTTPTransport):
+    """
+    httpx transport with the same policies as the sync session: connection errors are retried
+    for every method (nothing was sent yet), 429/502/503/504 responses only for idempotent ones.
+    New connections and request latency are recorded in the shared http_stats.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        **kwargs,
+    ):
+        super().__init__(retries=max_retries, **kwargs)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+
+        async def trace(event_name, info):
+            if event_name == "connection.connect_tcp.complete":
+                http_stats.record_new_connection(host)
+
+        request.extensions["trace"] = trace
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await super().handle_async_request(request)
+            finally:
+                http_stats.record_request(host, time.perf_counter() - start)
+
+            if (
+                request.method not in HTTP_IDEMPOTENT_METHODS
+                or response.status_code not in HTTP_RETRY_STATUSES
+                or attempt >= self.max_retries
+            ):
+                return response
+
+            await response.aclose()
+            retry_after = response.headers.get("Retry-After", "")
+            delay = (
+                float(retry_after)
+                if retry_after.isdigit()
+                else self.backoff_factor * (2**attempt)
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+class AsyncPooledClient(httpx.AsyncClient):
+    """
+    httpx.AsyncClient counterpart of PooledSession, for code running on the event loop.
+
+    Keeps the requests semantics the services rely on: redirects are followed, params with a
+    None value are dropped and cookies are never stored.
+    """
+
+    def __init__(
+        self,
+        timeout: tuple[float, float] = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+    ):
+        connect_timeout, read_timeout = timeout
+        super().__init__(
+            transport=InstrumentedAsyncTransport(
+                limits=httpx.Limits(
+                    max_connections=HTTP_POOL_CONNECTIONS * HTTP_POOL_MAXSIZE,
+                    max_keepalive_connections=HTTP_POOL_MAXSIZE,
+                ),
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            follow_redirects=True,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+
+    async def request(self, method, url, *, params=None, **kwargs):
+        if isinstance(params, dict):
+            params = {key: value for key, value in params.items() if value is not None}
+        return await super().request(method, url, params=params, **kwargs)
+
+
+# httpx clients are bound to the event loop they were first used on, and every entry point
+# runs its own loop through asyncio.run, so one client is kept per running loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncPooledClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> AsyncPooledClient:
+    """Returns the pooled async client of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = AsyncPooledClient()
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_http_client():
+    """Closes the async client of the running loop, call it before the loop is torn down."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def run_async(coro):
+    """
+    asyncio.run for the entry points: the async client of the loop is closed before the loop
+    is torn down, whichever code path used it.
+    """
+
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await close_async_http_client()
+
+    return asyncio.run(run_and_close())
+
+
+def get_http_stats() -> dict:
+    """Connection reuse rate and latency per host since the instance started."""
+    return http_stats.snapshot()
+
+
+def report_http_stats():
+    """Adds the per-host HTTP stats to the current span."""
+    from services.tracing import set_attributes
+
+    attributes = {}
+    for host, stats in get_http_stats().items():
+        for key, value in stats.items():
+            attributes[f"http.{host}.{key}"] = value
+    if attributes:
+        set_attributes(attributes)
@@ -1,6 +1,11 @@
-from config import OPENAI_API_KEY
+from config import OPENAI_API_KEY, EMBEDDING_CACHE_COLLECTION, EMBEDDING_CACHE_DIR
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from openai import AsyncOpenAI
+from services.embedding_cache import (
+    DiskEmbeddingStore,
+    EmbeddingCache,
+    FirestoreEmbeddingStore,
+)
 
 gpt_4o_client = OpenAIChatCompletionClient(
     model="gpt-4o", api_key=OPENAI_API_KEY, temperature=0.0, seed=None
@@ -12,10 +17,48 @@ gpt_4o_mini_client = OpenAIChatCompletionClient(
 # Create OpenAI client for embeddings
 openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Inputs per embeddings request, the API accepts up to 2048
+EMBEDDING_BATCH_SIZE = 512
+
+
+def _create_embedding_store():
+    if EMBEDDING_CACHE_COLLECTION:
+        from utils.firebase import db
+
+        return FirestoreEmbeddingStore(db, EMBEDDING_CACHE_COLLECTION)
+    if EMBEDDING_CACHE_DIR:
+        return DiskEmbeddingStore(EMBEDDING_CACHE_DIR)
+    return None
+
+
+embedding_cache = EmbeddingCache(store=_create_embedding_store())
+
+
+async def _request_embeddings(texts: list[str]) -> list[list[float]]:
+    embeddings = []
+    for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+        response = await openai_client.embeddings.create(
+            model=EMBEDDING_MODEL, input=texts[start : start + EMBEDDING_BATCH_SIZE]
+        )
+        embeddings.extend(
+            item.embedding for item in sorted(response.data, key=lambda item: item.index)
+        )
+    return embeddings
+
+
+async def create_embeddings(texts: list[str]) -> list[list[float]]:
+    """
+    Create embeddings for many texts using OpenAI's text-embedding-3-small model.
+    Cached texts are served from the embedding cache, the rest are batched into as few requests as possible.
+    """
+    if not texts:
+        return []
+    return await embedding_cache.get_or_create(
+        EMBEDDING_MODEL, texts, _request_embeddings
+    )
+
 
 async def create_embedding(text: str) -> list[float]:
     """Create an embedding using OpenAI's text-embedding-3-small model."""
-    response = await openai_client.embeddings.create(
-        model="text-embedding-3-small", input=text
-    )
-    return response.data[0].embedding
+    return (await create_embeddings([text]))[0]
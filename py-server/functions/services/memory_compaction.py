@@ -0,0 +1,283 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from google.cloud.firestore_v1 import Increment
+
+MEMORIES_COLLECTION = "memories"
+# Progress of the current compaction pass, and a watermark per user in its `users` collection
+COMPACTION_STATE_PATH = "memory_compaction_state/cursor"
+# Memories closer than this are the same memory, the threshold record_memory deduplicates with
+DUPLICATE_MEMORY_DISTANCE = 0.45
+# Firestore takes at most 500 writes per batch
+MAX_BATCH_WRITES = 400
+# New memories compared against the user's other memories at a time
+DISTANCE_CHUNK_ROWS = 256
+# Users with more memories are skipped, 1536 float32 dimensions take 6 KB per memory
+MAX_ROWS_PER_USER = 20000
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return None
+
+
+def decay_score(similarity_count: int, age_days: float, half_life_days: float) -> float:
+    """How much a memory is still worth: halves every `half_life_days`, repeats add to it."""
+    return (1 + similarity_count) * 0.5 ** (age_days / half_life_days)
+
+
+def _merge_items(items: List[Dict[str, Any]], other: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = {(item.get("type"), item.get("content")) for item in items}
+    merged = list(items)
+    for item in other:
+        key = (item.get("type"), item.get("content"))
+        if key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return merged
+
+
+class MemoryCompactor:
+    """
+    Scheduled compaction of the `memories` collection.
+
+    record_memory only checks the nearest memory when it writes one, so near-duplicates still
+    pile up (concurrent writes, memories just above the threshold of the one it compared to)
+    and `interaction` memories are kept forever. For each user, `compact_user`:
+
+    - merges every memory within DUPLICATE_MEMORY_DISTANCE of an older one into it: the older
+      one keeps its content and embedding and gets the duplicate's items and similarity_count
+      (plus one for the duplicate itself), the duplicate is deleted.
+    - deletes the `interaction` memories older than `ttl_days`, or whose decay score dropped
+      below `min_decay_score`. `user_preference` memories never expire.
+
+    It is incremental: the user's watermark records when they were last compacted and only the
+    memories written after it are compared, against all of the user's memories. Users with more
+    than `max_rows_per_user` memories are skipped, their embeddings would not fit the function.
+
+    `run` walks the users in user_id order and saves the last compacted user after each one,
+    so a run that reaches its deadline (or crashes) is resumed by the next one. A new pass only
+    starts `interval_seconds` after the previous one completed.
+    """
+
+    def __init__(
+        self,
+        db,
+        ttl_days: float = 180,
+        half_life_days: float = 30,
+        min_decay_score: float = 0.1,
+        interval_seconds: float = 24 * 3600,
+        max_rows_per_user: int = MAX_ROWS_PER_USER,
+    ):
+        self.db = db
+        self.ttl_days = ttl_days
+        self.half_life_days = half_life_days
+        self.min_decay_score = min_decay_score
+        self.interval_seconds = interval_seconds
+        self.max_rows_per_user = max_rows_per_user
+
+    def _state_ref(self):
+        collection, document = COMPACTION_STATE_PATH.split("/")
+        return self.db.collection(collection).document(document)
+
+    def _watermark_ref(self, user_id: str):
+        return self._state_ref().collection("users").document(user_id)
+
+    def _next_user(self, after: Optional[str]) -> Optional[str]:
+        query = self.db.collection(MEMORIES_COLLECTION).order_by("user_id")
+        if after is not None:
+            query = query.start_after({"user_id": after})
+        for doc in query.limit(1).stream():
+            return doc.to_dict().get("user_id")
+        return None
+
+    def _load(self, user_id: str, count: int):
+        """
+        The user's memories and their embeddings, each embedding is written to a float32 matrix
+        as it is read so only one copy of them is held.
+        """
+        query = self.db.collection(MEMORIES_COLLECTION).where("user_id", "==", user_id)
+        memories, matrix = [], np.zeros((0, 0), dtype=np.float32)
+        if not count:
+            return memories, matrix
+        # Memories recorded after the count are compacted on the next pass
+        for doc in query.limit(count).stream():
+            data = doc.to_dict()
+            embedding = data.pop("embedding_field", None)
+            if embedding is None:
+                continue
+            row = np.asarray(list(embedding), dtype=np.float32)
+            if not matrix.size:
+                matrix = np.zeros((count, len(row)), dtype=np.float32)
+            matrix[len(memories)] = row
+            memories.append({**data, "ref": doc.reference})
+        return memories, matrix[: len(memories)]
+
+    def _find_duplicates(self, memories, matrix, new: np.ndarray) -> Dict[int, int]:
+        """Maps each new memory that duplicates an older surviving one to that memory."""
+        norms = np.einsum("ij,ij->i", matrix, matrix)
+        duplicate_of: Dict[int, int] = {}
+        for start in range(0, len(new), DISTANCE_CHUNK_ROWS):
+            chunk = new[start : start + DISTANCE_CHUNK_ROWS]
+            squared = norms[chunk, None] + norms[None, :] - 2 * (matrix[chunk] @ matrix.T)
+            distances = np.sqrt(np.maximum(squared, 0))
+            for row, i in enumerate(chunk):
+                # Only older memories that were not merged themselves can absorb it
+                candidates = np.flatnonzero(distances[row] < DUPLICATE_MEMORY_DISTANCE)
+                candidates = [j for j in candidates if j < i and j not in duplicate_of]
+                if candidates:
+                    duplicate_of[int(i)] = int(min(candidates, key=lambda j: distances[row, j]))
+        return duplicate_of
+
+    def compact_user(self, user_id: str) -> Dict[str, int]:
+        """Merges and expires one user's memories, returns the counts."""
+        started_at = datetime.now(timezone.utc)
+        count = int(
+            self.db.collection(MEMORIES_COLLECTION)
+            .where("user_id", "==", user_id)
+            .count()
+            .get()[0][0]
+            .value
+        )
+        if count > self.max_rows_per_user:
+            print(f"Skipping the {count} memories of {user_id}, over {self.max_rows_per_user}")
+            return {"too_large": 1}
+        watermark_snapshot = self._watermark_ref(user_id).get()
+        watermark = _as_datetime(
+            (watermark_snapshot.to_dict() or {}).get("compacted_at")
+            if watermark_snapshot.exists
+            else None
+        )
+        memories, matrix = self._load(user_id, count)
+        epoch = datetime.min.replace(tzinfo=timezone.utc)
+        created = [_as_datetime(memory.get("timestamp")) or epoch for memory in memories]
+        order = sorted(range(len(memories)), key=lambda i: created[i])
+        memories = [memories[i] for i in order]
+        created = [created[i] for i in order]
+        matrix = matrix[order] if len(order) else matrix
+
+        new = np.array(
+            [i for i, at in enumerate(created) if watermark is None or at >= watermark],
+            dtype=np.int64,
+        )
+        duplicate_of = self._find_duplicates(memories, matrix, new) if len(new) else {}
+
+        # Fold the duplicates into the memory they were merged into
+        merged: Dict[int, Dict[str, Any]] = {}
+        for i in sorted(duplicate_of):
+            keeper = duplicate_of[i]
+            update = merged.setdefault(
+                keeper,
+                {
+                    "items": memories[keeper].get("items", []),
+                    "similarity_count": 0,
+                    "type": memories[keeper].get("type"),
+                    "last_updated": _as_datetime(memories[keeper].get("last_updated"))
+                    or created[keeper],
+                },
+            )
+            duplicate = memories[i]
+            update["items"] = _merge_items(update["items"], duplicate.get("items", []))
+            update["similarity_count"] += duplicate.get("similarity_count", 0) + 1
+            if duplicate.get("type") == "user_preference":
+                update["type"] = "user_preference"
+            update["last_updated"] = max(
+                update["last_updated"],
+                _as_datetime(duplicate.get("last_updated")) or created[i],
+            )
+
+        expired = set()
+        for i, memory in enumerate(memories):
+            if i in duplicate_of:
+                continue
+            update = merged.get(i, {})
+            if update.get("type", memory.get("type")) != "interaction":
+                continue
+            last_used = (
+                update.get("last_updated")
+                or _as_datetime(memory.get("last_updated"))
+                or created[i]
+            )
+            age_days = (started_at - last_used).total_seconds() / 86400
+            similarity_count = memory.get("similarity_count", 0) + update.get("similarity_count", 0)
+            if age_days > self.ttl_days or (
+                decay_score(similarity_count, age_days, self.half_life_days) < self.min_decay_score
+            ):
+                expired.add(i)
+
+        writes = [(memories[i]["ref"], None) for i in list(duplicate_of) + sorted(expired)]
+        for keeper, update in merged.items():
+            if keeper in expired:
+                continue
+            data = {**update, "similarity_count": Increment(update["similarity_count"])}
+            # Only moved forward by a duplicate used more recently, the keeper's own value may be
+            # stale and record_memory may have set a newer one since it was read
+            if update["last_updated"] <= (
+                _as_datetime(memories[keeper].get("last_updated")) or created[keeper]
+            ):
+                del data["last_updated"]
+            writes.append((memories[keeper]["ref"], data))
+        self._commit(writes)
+        # Memories written from here on are compared on the next pass
+        self._watermark_ref(user_id).set({"compacted_at": started_at})
+        return {
+            "memories": len(memories),
+            "compared": len(new),
+            "merged": len(duplicate_of),
+            "expired": len(expired),
+        }
+
+    def _commit(self, writes):
+        for start in range(0, len(writes), MAX_BATCH_WRITES):
+            batch = self.db.batch()
+            for ref, data in writes[start : start + MAX_BATCH_WRITES]:
+                if data is None:
+                    batch.delete(ref)
+                else:
+                    batch.set(ref, data, merge=True)
+            batch.commit()
+
+    def run(self, deadline_seconds: float = 480) -> Dict[str, Any]:
+        """
+        Compacts users until the pass is complete or `deadline_seconds` have passed, returns
+        the pass's totals so far and whether it completed.
+        """
+        deadline = time.monotonic() + deadline_seconds
+        snapshot = self._state_ref().get()
+        state = (snapshot.to_dict() or {}) if snapshot.exists else {}
+        completed_at = _as_datetime(state.get("completed_at"))
+        if state.get("last_user_id") is None:
+            if completed_at and (
+                datetime.now(timezone.utc) - completed_at
+            ).total_seconds() < self.interval_seconds:
+                return {**state.get("totals", {}), "completed": True, "skipped": True}
+            state = {"last_user_id": None, "totals": {}, "started_at": datetime.now(timezone.utc)}
+
+        totals = dict(state.get("totals", {}))
+        user_id = self._next_user(state["last_user_id"])
+        while user_id is not None and time.monotonic() < deadline:
+            try:
+                counts = self.compact_user(user_id)
+            except Exception as e:
+                print(f"Error compacting the memories of {user_id}: {e}")
+                counts = {"failed": 1}
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+            totals["users"] = totals.get("users", 0) + 1
+            self._state_ref().set({**state, "last_user_id": user_id, "totals": totals})
+            user_id = self._next_user(user_id)
+
+        completed = user_id is None
+        if completed:
+            self._state_ref().set(
+                {
+                    "last_user_id": None,
+                    "totals": totals,
+                    "started_at": state.get("started_at"),
+                    "completed_at": datetime.now(timezone.utc),
+                }
+            )
+        return {**totals, "completed": completed}
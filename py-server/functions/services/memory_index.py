@@ -0,0 +1,182 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Memories of a user: metadata dicts and the matching rows of embeddings, as a float32 matrix
+# or lists of floats
+MemoryRows = Tuple[List[Dict[str, Any]], Union[np.ndarray, List[List[float]]]]
+
+
+class MemoryIndexTooLarge(Exception):
+    """The user has more memories than an index may hold, search them in Firestore."""
+
+
+class UserMemoryIndex:
+    """
+    The memories of one user as a float32 embedding matrix plus their metadata.
+
+    `search` is an exact Euclidean top-k over the whole matrix, the same distance Firestore's
+    `find_nearest` with DistanceMeasure.EUCLIDEAN returns. Rows live in a buffer that grows by a
+    quarter when full, so `add` doesn't copy the matrix on every write and the spare rows stay
+    small next to the cache's byte budget.
+    """
+
+    def __init__(
+        self,
+        memories: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+        dimensions: int = 0,
+    ):
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        dimensions = matrix.shape[1] if len(memories) else dimensions
+        self._matrix = matrix.reshape(len(memories), dimensions)
+        self._norms = np.einsum("ij,ij->i", self._matrix, self._matrix)
+        self.memories = list(memories)
+        self.loaded_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.memories)
+
+    @property
+    def nbytes(self) -> int:
+        return self._matrix.nbytes + self._norms.nbytes
+
+    def add(self, memory: Dict[str, Any], embedding: List[float]):
+        row = np.asarray(embedding, dtype=np.float32)
+        size = len(self.memories)
+        if size == len(self._matrix):
+            capacity = size + max(size // 4, 16)
+            dimensions = self._matrix.shape[1] if self._matrix.shape[1] else len(row)
+            matrix = np.zeros((capacity, dimensions), dtype=np.float32)
+            norms = np.zeros(capacity, dtype=np.float32)
+            matrix[:size] = self._matrix[:size]
+            norms[:size] = self._norms[:size]
+            self._matrix, self._norms = matrix, norms
+        self._matrix[size] = row
+        self._norms[size] = row @ row
+        self.memories.append(memory)
+
+    def search(
+        self,
+        embedding: List[float],
+        limit: int = 10,
+        distance_threshold: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """The `limit` nearest memories, closest first, each with its `distance`."""
+        size = len(self.memories)
+        if not size or limit <= 0:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        # |x - q|^2 = |x|^2 + |q|^2 - 2 x.q, one matrix-vector product for the whole index
+        squared = self._norms[:size] + query @ query - 2 * (self._matrix[:size] @ query)
+        distances = np.sqrt(np.maximum(squared, 0))
+        if limit < size:
+            nearest = np.argpartition(distances, limit - 1)[:limit]
+        else:
+            nearest = np.arange(size)
+        nearest = nearest[np.argsort(distances[nearest])]
+        if distance_threshold is not None:
+            nearest = nearest[distances[nearest] <= distance_threshold]
+        return [{**self.memories[i], "distance": float(distances[i])} for i in nearest]
+
+
+class MemoryIndexCache:
+    """
+    Per-instance cache of the users' memory indexes.
+
+    - An index is loaded on first access and reloaded after `ttl_seconds`, to pick up the
+      memories recorded by other instances (the memory pipeline runs on its own function).
+    - `add` updates a loaded index in place when this instance records a memory.
+    - The least recently used users are evicted once the indexes take more than `max_bytes`.
+    - Users with more than `max_rows_per_user` memories are not indexed, the loader is asked
+      for one row more than that (or raises MemoryIndexTooLarge itself, after counting them)
+      and `get` raises MemoryIndexTooLarge (remembered for the TTL, so the load is not
+      retried on every message).
+    """
+
+    def __init__(self, max_bytes: int, max_rows_per_user: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.max_rows_per_user = max_rows_per_user
+        self.ttl_seconds = ttl_seconds
+        self._indexes: "OrderedDict[str, UserMemoryIndex]" = OrderedDict()
+        self._too_large: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self.loads = 0
+
+    def _fresh(self, user_id: str) -> Optional[UserMemoryIndex]:
+        too_large_at = self._too_large.get(user_id)
+        if too_large_at is not None and time.monotonic() - too_large_at <= self.ttl_seconds:
+            raise MemoryIndexTooLarge(user_id)
+        index = self._indexes.get(user_id)
+        if index is None or time.monotonic() - index.loaded_at > self.ttl_seconds:
+            return None
+        self._indexes.move_to_end(user_id)
+        return index
+
+    def get_loaded(self, user_id: str) -> Optional[UserMemoryIndex]:
+        """The user's index if it is loaded and fresh, without loading it."""
+        with self._lock:
+            return self._fresh(user_id)
+
+    def get(self, user_id: str, loader: Callable[[str, int], MemoryRows]) -> UserMemoryIndex:
+        """The user's index, `loader(user_id, limit)` returns at most `limit` memories."""
+        with self._lock:
+            index = self._fresh(user_id)
+            if index is not None:
+                return index
+            load_lock = self._load_locks.setdefault(user_id, threading.Lock())
+
+        # One load per user at a time, other users are not blocked by it
+        with load_lock:
+            with self._lock:
+                index = self._fresh(user_id)
+                if index is not None:
+                    return index
+            try:
+                memories, embeddings = loader(user_id, self.max_rows_per_user + 1)
+                too_large = len(memories) > self.max_rows_per_user
+            except MemoryIndexTooLarge:
+                too_large = True
+            if too_large:
+                with self._lock:
+                    self._too_large[user_id] = time.monotonic()
+                    self._indexes.pop(user_id, None)
+                raise MemoryIndexTooLarge(user_id)
+            index = UserMemoryIndex(memories, embeddings)
+            with self._lock:
+                self._too_large.pop(user_id, None)
+                self._indexes[user_id] = index
+                self._indexes.move_to_end(user_id)
+                self.loads += 1
+                self._evict()
+        return index
+
+    def _evict(self):
+        total = sum(index.nbytes for index in self._indexes.values())
+        while total > self.max_bytes and len(self._indexes) > 1:
+            _, index = self._indexes.popitem(last=False)
+            total -= index.nbytes
+
+    def add(self, user_id: str, memory: Dict[str, Any], embedding: List[float]):
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is None:
+                return
+            if len(index) >= self.max_rows_per_user:
+                # Outgrew the limit, the next access finds out it is too large
+                del self._indexes[user_id]
+                return
+            index.add(memory, embedding)
+            self._evict()
+
+    def invalidate(self, user_id: str):
+        with self._lock:
+            self._indexes.pop(user_id, None)
+            self._too_large.pop(user_id, None)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
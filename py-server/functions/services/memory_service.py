@@ -1,11 +1,50 @@
+import asyncio
 from typing import List, Dict, Any, Optional
 from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
 from google.cloud.firestore_v1.base_vector_query import DistanceMeasure
 from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud.firestore_v1.vector import Vector
-from services.llm import create_embedding
-from agents.info_extraction_agent import extract_information_agent
+from services.llm import EMBEDDING_BATCH_SIZE, create_embedding, create_embeddings
+from agents.info_extraction_agent import extract_information_batch
+from utils.firebase import message_sink
+from utils.micro_batch_queue import queue_item
+from services.memory_index import MemoryIndexCache, MemoryIndexTooLarge
+from config import (
+    MEMORY_INDEX_MAX_MB,
+    MEMORY_INDEX_MAX_ROWS_PER_USER,
+    MEMORY_INDEX_TTL_SEC,
+)
 import logging
+import numpy as np
+
+# Messages waiting to be recorded as memories, drained by on_memory_job_created
+MEMORY_QUEUE_COLLECTION = "memory_jobs"
+MEMORY_QUEUE_LEASE = "memory_jobs_state/drain"
+# text-embedding-3-small
+EMBEDDING_DIMENSIONS = 1536
+# Memories farther than this are not considered similar
+SIMILAR_MEMORY_DISTANCE = 0.75
+
+# Per-user indexes of the memories, shared by the requests handled by the instance
+memory_index = MemoryIndexCache(
+    max_bytes=MEMORY_INDEX_MAX_MB * 1024 * 1024,
+    max_rows_per_user=MEMORY_INDEX_MAX_ROWS_PER_USER,
+    ttl_seconds=MEMORY_INDEX_TTL_SEC,
+)
+
+
+def _memory_from_doc(doc_id: str, doc_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": doc_id,
+        "content": doc_data.get("content", ""),
+        "agent_response": doc_data.get("agent_response", ""),
+        "items": doc_data.get("items", []),
+        "type": doc_data.get("type", ""),
+        "reasoning": doc_data.get("reasoning"),
+        "chat_id": doc_data.get("chat_id"),
+        "user_id": doc_data.get("user_id"),
+    }
 
 
 class MemoryService:
@@ -41,14 +80,16 @@ class MemoryService:
         reasoning: Optional[str] = None,
         type: str = "interaction",
         chat_id: Optional[str] = None,
+        embedding: Optional[List[float]] = None,
     ) -> str:
         """
         Record a user memory with monitoring. Generates embedding, checks for similar memories,
         and stores the memory if it's unique enough.
         """
         try:
-            # Generate embedding for new memory
-            embedding = await self._generate_embedding(content)
+            # Generate embedding for new memory, unless it was generated in bulk
+            if embedding is None:
+                embedding = await self._generate_embedding(content)
 
             # Check for similar existing memories
             similar_memories = await self.get_similar_memories(
@@ -62,13 +103,18 @@ class MemoryService:
                 similar_memories and similar_memories[0].get("distance", 1.0) < 0.45
             ):  # Threshold for similarity
                 doc_id = similar_memories[0].get("id", None)
-                if doc_id:
-                    # Update the document and increment the similarity_count
-                    self.db.collection("memories").document(doc_id).update({
-                        "similarity_count": firestore.Increment(1),
-                        "last_updated": firestore.SERVER_TIMESTAMP,
-                    })
-                return
+                try:
+                    if doc_id:
+                        # Update the document and increment the similarity_count
+                        self.db.collection("memories").document(doc_id).update({
+                            "similarity_count": firestore.Increment(1),
+                            "last_updated": firestore.SERVER_TIMESTAMP,
+                        })
+                    return
+                except NotFound:
+                    # Merged away by the compaction job after the index was loaded, record
+                    # the memory as a new one and reload the index on the next search
+                    memory_index.invalidate(user_id)
 
             # Generate a new memory ID
             memory_id = self.db.collection("memories").document().id
@@ -90,14 +136,63 @@ class MemoryService:
 
             # Store the memory directly in the memories collection
             self.db.collection("memories").document(memory_id).set(memory_data)
+            memory_index.add(user_id, _memory_from_doc(memory_id, memory_data), embedding)
 
             return memory_id
         except Exception as e:
             self.logger.error(f"Error recording memory: {str(e)}")
             raise
 
+    def _load_user_memories(self, user_id: str, limit: int):
+        """
+        All the memories of a user with their embeddings, to build their index.
+        The memories are counted first, so a user with `limit` or more is not streamed at all,
+        and each embedding is written to a float32 matrix as it is read.
+        """
+        query = self.db.collection("memories").where(
+            filter=FieldFilter("user_id", "==", user_id)
+        )
+        count = int(query.count().get()[0][0].value)
+        if count >= limit:
+            raise MemoryIndexTooLarge(user_id)
+        matrix = np.zeros((count, EMBEDDING_DIMENSIONS), dtype=np.float32)
+        memories = []
+        if count:
+            # Memories recorded after the count are picked up by the next load
+            for doc in query.limit(count).stream():
+                doc_data = doc.to_dict()
+                embedding = doc_data.pop("embedding_field", None)
+                if embedding is None:
+                    continue
+                matrix[len(memories)] = np.asarray(list(embedding), dtype=np.float32)
+                memories.append(_memory_from_doc(doc.id, doc_data))
+        return memories, matrix[: len(memories)]
+
     async def get_similar_memories(
         self, user_id: str, embedding: List[float], limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get memories similar to the provided embedding.
+        Served from the user's in-memory index, loaded on first access. Users with too many
+        memories for an index, or a failed load, use Firestore's vector search.
+        """
+        try:
+            index = memory_index.get_loaded(user_id)
+            if index is None:
+                index = await asyncio.to_thread(
+                    memory_index.get, user_id, self._load_user_memories
+                )
+            return index.search(
+                embedding, limit=limit, distance_threshold=SIMILAR_MEMORY_DISTANCE
+            )
+        except MemoryIndexTooLarge:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error searching the memory index: {str(e)}")
+        return await self._find_nearest_memories(user_id, embedding, limit)
+
+    async def _find_nearest_memories(
+        self, user_id: str, embedding: List[float], limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Get memories similar to the provided embedding using Firestore's vector search."""
         try:
@@ -110,23 +205,17 @@ class MemoryService:
                 distance_measure=DistanceMeasure.EUCLIDEAN,
                 limit=limit,
                 distance_result_field="vector_distance",
-                distance_threshold=0.75,
+                distance_threshold=SIMILAR_MEMORY_DISTANCE,
             )
-            memories_snapshot = vector_query.get()
+            # the vector search is a blocking RPC, keep the event loop free for the other prefetch stages
+            memories_snapshot = await asyncio.to_thread(vector_query.get)
 
             memories = []
             for doc in memories_snapshot:
                 doc_data = doc.to_dict()
                 memories.append(
                     {
-                        "id": doc.id,
-                        "content": doc_data.get("content", ""),
-                        "agent_response": doc_data.get("agent_response", ""),
-                        "items": doc_data.get("items", []),
-                        "type": doc_data.get("type", ""),
-                        "reasoning": doc_data.get("reasoning"),
-                        "chat_id": doc_data.get("chat_id"),
-                        "user_id": doc_data.get("user_id"),
+                        **_memory_from_doc(doc.id, doc_data),
                         "distance": doc_data.get("vector_distance", 0.0),
                     }
                 )
@@ -157,47 +246,111 @@ class MemoryService:
             self.logger.error(f"Error getting relevant memories: {str(e)}")
             return []
 
-    async def store_message_memory(
+    def enqueue_message_memory(
         self, user_id: str, content: str, agent_response: str, chat_id: str
     ) -> None:
         """
-        Extracts key information from user messages and stores it in the memory database
-        if the message contains relevant data.
+        Queues a message to be recorded as a memory off the reply path. The job is written by
+        the message sink and the memory pipeline records it in bulk with the user's other
+        messages, see store_message_memories.
+        """
+        message_sink.set(
+            self.db.collection(MEMORY_QUEUE_COLLECTION).document(),
+            queue_item(
+                {
+                    "user_id": user_id,
+                    "content": content,
+                    "agent_response": agent_response,
+                    "chat_id": chat_id,
+                }
+            ),
+        )
 
-        Args:
-            snapshot_data: The message data from Firestore
-            chat_id: The ID of the chat
-            user_id: The ID of the user
-        """
-        # Extract information form user input
-        extracted_info = await extract_information_agent(content)
-
-        # Check if extracted_info has any items
-        has_relevant_info = len(extracted_info.items) > 0
-
-        # Record the interaction if there is content and relevant information
-        if content and has_relevant_info:
-            # Convert extracted_info to dict for storage
-            extracted_info_dict = extracted_info.dict()
-
-            memory_type = (
-                "user_preference"
-                if any(
-                    item.get("type") == "user_preference"
-                    for item in extracted_info_dict["items"]
+    async def store_message_memories(self, jobs: List[Dict[str, Any]]) -> List[int]:
+        """
+        Records a batch of queued messages as memories.
+        The extraction runs once per user for all of their messages and the embeddings of
+        the relevant messages are generated in as few requests as possible. A failed
+        extraction, embeddings request or write only fails the messages it covers.
+
+        Returns:
+            List[int]: The positions in `jobs` of the messages that could not be recorded,
+            left queued by the memory pipeline to be retried
+        """
+        positions_by_user: Dict[str, List[int]] = {}
+        for position, job in enumerate(jobs):
+            if job.get("content"):
+                positions_by_user.setdefault(job.get("user_id"), []).append(position)
+
+        # Extract information from the user inputs, one call per user
+        extractions = await asyncio.gather(
+            *(
+                extract_information_batch([jobs[position]["content"] for position in positions])
+                for positions in positions_by_user.values()
+            ),
+            return_exceptions=True,
+        )
+
+        failed: List[int] = []
+        relevant = []
+        for (user_id, positions), user_extractions in zip(
+            positions_by_user.items(), extractions
+        ):
+            if isinstance(user_extractions, Exception):
+                self.logger.error(
+                    f"Error extracting the memories of {user_id}: {str(user_extractions)}"
                 )
-                else "interaction"
+                failed.extend(positions)
+                continue
+            # Record the interaction if there is content and relevant information
+            relevant.extend(
+                (position, extracted_info)
+                for position, extracted_info in zip(positions, user_extractions)
+                if len(extracted_info.items) > 0
             )
 
-            await self.record_memory(
-                user_id=user_id,
-                content=content,
-                agent_response=agent_response,
-                items=extracted_info_dict["items"],
-                reasoning=extracted_info_dict.get("reasoning"),
-                type=memory_type,
-                chat_id=chat_id,
-            )
+        for start in range(0, len(relevant), EMBEDDING_BATCH_SIZE):
+            chunk = relevant[start : start + EMBEDDING_BATCH_SIZE]
+            try:
+                embeddings = await create_embeddings(
+                    [jobs[position]["content"] for position, _ in chunk]
+                )
+            except Exception as e:
+                self.logger.error(f"Error generating memory embeddings: {str(e)}")
+                failed.extend(position for position, _ in chunk)
+                continue
+
+            for (position, extracted_info), embedding in zip(chunk, embeddings):
+                job = jobs[position]
+                try:
+                    # Convert extracted_info to dict for storage
+                    extracted_info_dict = extracted_info.dict()
+
+                    memory_type = (
+                        "user_preference"
+                        if any(
+                            item.get("type") == "user_preference"
+                            for item in extracted_info_dict["items"]
+                        )
+                        else "interaction"
+                    )
+
+                    # One at a time, so a message is compared with the memories recorded before it
+                    await self.record_memory(
+                        user_id=job["user_id"],
+                        content=job["content"],
+                        agent_response=job.get("agent_response", ""),
+                        items=extracted_info_dict["items"],
+                        reasoning=extracted_info_dict.get("reasoning"),
+                        type=memory_type,
+                        chat_id=job.get("chat_id"),
+                        embedding=[float(x) for x in embedding],
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error storing message memory: {str(e)}")
+                    failed.append(position)
+
+        return sorted(failed)
 
     async def get_agent_memory_context(self, user_id: str, task: str) -> str:
         """
@@ -1,6 +1,17 @@
+import asyncio
+import httpx
 import requests
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
+from typing import Iterable
 from config import FIREBASE_SERVER_ENDPOINT
+from services.http_client import get_async_http_client, http_session
+
+# Prices are only reused for a short window, long enough to cover a single tool run
+PRICE_CACHE_TTL_SECONDS = 30
+MAX_CONCURRENT_PRICE_REQUESTS = 8
 
 
 class PriceProviderType(str, Enum):
@@ -8,11 +19,176 @@ class PriceProviderType(str, Enum):
     LIFI = "lifi"
 
 
+class PriceService:
+    """
+    Cached, coalescing client for the getTokenPrice endpoint.
+
+    - Successful prices are cached in memory for `ttl_seconds`, keyed by (chain, address, provider).
+    - Concurrent callers asking for the same token share a single in-flight request.
+    - `get_prices` resolves many tokens at once: cache hits are returned directly and the
+      misses are fetched concurrently, as the endpoint only accepts one token per request.
+    - The `*_async` methods share the same cache and in-flight requests, for callers on the event loop.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = PRICE_CACHE_TTL_SECONDS,
+        max_workers: int = MAX_CONCURRENT_PRICE_REQUESTS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._cache: dict[tuple, tuple[float, dict]] = {}
+        self._in_flight: dict[tuple, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prices"
+        )
+
+    @staticmethod
+    def _cache_key(
+        chain_name: str, token_address: str, provider: PriceProviderType
+    ) -> tuple:
+        # EVM addresses are case insensitive, Solana mints are not
+        address = token_address.lower() if token_address.startswith("0x") else token_address
+        return (chain_name.upper(), address, provider.value)
+
+    def _fetch_price(
+        self, chain_name: str, token_address: str, provider: PriceProviderType
+    ) -> dict:
+        try:
+            response = http_session.get(
+                f"{FIREBASE_SERVER_ENDPOINT}/getTokenPrice?tokenAddress={token_address}&chain={chain_name}&provider={provider.value}"
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"Failed to fetch token price from provider {provider.value}: {e}")
+            return {"price": 0}
+
+    async def _fetch_price_async(
+        self, chain_name: str, token_address: str, provider: PriceProviderType
+    ) -> dict:
+        try:
+            response = await get_async_http_client().get(
+                f"{FIREBASE_SERVER_ENDPOINT}/getTokenPrice?tokenAddress={token_address}&chain={chain_name}&provider={provider.value}"
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            print(f"Failed to fetch token price from provider {provider.value}: {e}")
+            return {"price": 0}
+
+    def _lookup(self, key: tuple) -> tuple[dict | None, Future | None, bool]:
+        """Returns (cached result, in-flight future, whether the caller owns the fetch)."""
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.ttl_seconds:
+                return dict(cached[1]), None, False
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                return None, in_flight, False
+            in_flight = Future()
+            self._in_flight[key] = in_flight
+            return None, in_flight, True
+
+    def _complete(self, key: tuple, in_flight: Future, result: dict = None, error: Exception = None):
+        with self._lock:
+            # Failed lookups are not cached, so the next caller retries
+            if error is None and result.get("price"):
+                self._cache[key] = (time.monotonic(), result)
+            self._in_flight.pop(key, None)
+        if error is None:
+            in_flight.set_result(result)
+        else:
+            in_flight.set_exception(error)
+
+    def get_price(
+        self, chain_name: str, token_address: str, provider: PriceProviderType
+    ) -> dict:
+        key = self._cache_key(chain_name, token_address, provider)
+        cached, in_flight, is_owner = self._lookup(key)
+        if cached is not None:
+            return cached
+        if not is_owner:
+            return dict(in_flight.result())
+
+        try:
+            result = self._fetch_price(chain_name, token_address, provider)
+        except Exception as e:
+            self._complete(key, in_flight, error=e)
+            raise
+        self._complete(key, in_flight, result=result)
+        return dict(result)
+
+    async def get_price_async(
+        self, chain_name: str, token_address: str, provider: PriceProviderType
+    ) -> dict:
+        key = self._cache_key(chain_name, token_address, provider)
+        cached, in_flight, is_owner = self._lookup(key)
+        if cached is not None:
+            return cached
+        if not is_owner:
+            return dict(await asyncio.wrap_future(in_flight))
+
+        try:
+            result = await self._fetch_price_async(chain_name, token_address, provider)
+        except BaseException as e:
+            # also release waiters when the owning task is cancelled
+            self._complete(key, in_flight, error=e)
+            raise
+        self._complete(key, in_flight, result=result)
+        return dict(result)
+
+    def get_prices(
+        self,
+        chain_name: str,
+        token_addresses: Iterable[str],
+        provider: PriceProviderType,
+    ) -> dict[str, dict]:
+        """Returns a dict of token address -> price response for all the given tokens."""
+        unique_addresses = list(dict.fromkeys(token_addresses))
+        if len(unique_addresses) <= 1:
+            return {
+                address: self.get_price(chain_name, address, provider)
+                for address in unique_addresses
+            }
+        futures = {
+            address: self._executor.submit(
+                self.get_price, chain_name, address, provider
+            )
+            for address in unique_addresses
+        }
+        return {address: future.result() for address, future in futures.items()}
+
+    async def get_prices_async(
+        self,
+        chain_name: str,
+        token_addresses: Iterable[str],
+        provider: PriceProviderType,
+    ) -> dict[str, dict]:
+        """Async version of get_prices, the misses are fetched concurrently on the event loop."""
+        unique_addresses = list(dict.fromkeys(token_addresses))
+        prices = await asyncio.gather(
+            *(
+                self.get_price_async(chain_name, address, provider)
+                for address in unique_addresses
+            )
+        )
+        return dict(zip(unique_addresses, prices))
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+price_service = PriceService()
+
+
 def get_token_price_from_provider(
     chain_name: str, token_address: str, provider: PriceProviderType
 ) -> dict:
     """
     This function fetches the token price from a provider.
+    Prices are served from the shared short-lived cache when available.
 
     Args:
         chain_name (str): The name of the chain.
@@ -33,12 +209,35 @@ def get_token_price_from_provider(
             "updatedAt": 1738277707734
         }
     """
-    try:
-        response = requests.get(
-            f"{FIREBASE_SERVER_ENDPOINT}/getTokenPrice?tokenAddress={token_address}&chain={chain_name}&provider={provider.value}"
-        )
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"Failed to fetch token price from provider {provider.value}: {e}")
-        return {"price": 0}
+    return price_service.get_price(chain_name, token_address, provider)
+
+
+def get_token_prices_from_provider(
+    chain_name: str, token_addresses: Iterable[str], provider: PriceProviderType
+) -> dict[str, dict]:
+    """
+    Fetches the prices of many tokens of the same chain at once.
+
+    Args:
+        chain_name (str): The name of the chain.
+        token_addresses (list): The addresses of the tokens, duplicates are fetched once.
+        provider (str): The name of the price provider (lifi, jupiter, decent, etc)
+
+    Returns:
+        dict: token address -> response from the provider (same shape as get_token_price_from_provider).
+    """
+    return price_service.get_prices(chain_name, token_addresses, provider)
+
+
+async def get_token_price_from_provider_async(
+    chain_name: str, token_address: str, provider: PriceProviderType
+) -> dict:
+    """Async version of get_token_price_from_provider, sharing the same cache."""
+    return await price_service.get_price_async(chain_name, token_address, provider)
+
+
+async def get_token_prices_from_provider_async(
+    chain_name: str, token_addresses: Iterable[str], provider: PriceProviderType
+) -> dict[str, dict]:
+    """Async version of get_token_prices_from_provider, sharing the same cache."""
+    return await price_service.get_prices_async(chain_name, token_addresses, provider)
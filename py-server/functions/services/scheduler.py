@@ -1,4 +1,6 @@
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from typing import Dict, TypedDict
 from config import FIREBASE_SERVER_ENDPOINT
 from datetime import datetime
@@ -30,7 +32,7 @@ class SchedulerService:
             requests.RequestException: If there is an error in the request
         """
         try:
-            response = requests.get(
+            response = http_session.get(
                 f"{self.base_url}/getUserScheduledTasks", params={"userId": user_id}
             )
             response.raise_for_status()
@@ -62,7 +64,7 @@ class SchedulerService:
         data = {"description": description, "userId": user_id, "interval": interval}
 
         try:
-            response = requests.post(f"{self.base_url}/createScheduledTask", json=data)
+            response = http_session.post(f"{self.base_url}/createScheduledTask", json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.HTTPError as e:
@@ -87,7 +89,7 @@ class SchedulerService:
         data = {"taskIds": task_ids, "userId": user_id}
 
         try:
-            response = requests.post(
+            response = http_session.post(
                 f"{self.base_url}/deleteUserScheduledTasks", json=data
             )
             response.raise_for_status()
@@ -99,5 +101,49 @@ class SchedulerService:
         except Exception as e:
             raise e
 
+    async def get_user_scheduled_tasks_async(
+        self, user_id: str
+    ) -> Dict[str, list[ScheduledTask]]:
+        """Async version of get_user_scheduled_tasks, for code running on the event loop."""
+        try:
+            response = await get_async_http_client().get(
+                f"{self.base_url}/getUserScheduledTasks", params={"userId": user_id}
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            return e.response.json()
+
+    async def schedule_new_task_async(
+        self,
+        description: str,
+        user_id: str,
+        interval: int,
+    ):
+        """Async version of schedule_new_task, for code running on the event loop."""
+        data = {"description": description, "userId": user_id, "interval": interval}
+
+        try:
+            response = await get_async_http_client().post(
+                f"{self.base_url}/createScheduledTask", json=data
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            return e.response.json()
+
+    async def delete_scheduled_tasks_async(self, task_ids: list[str] | None, user_id: str):
+        """Async version of delete_scheduled_tasks, for code running on the event loop."""
+        data = {"taskIds": task_ids, "userId": user_id}
+
+        try:
+            response = await get_async_http_client().post(
+                f"{self.base_url}/deleteUserScheduledTasks", json=data
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            return e.response.json()
+
 
 scheduler_service = SchedulerService()
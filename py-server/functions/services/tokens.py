@@ -1,4 +1,7 @@
+import json
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from typing import Optional
 from config import FIREBASE_SERVER_ENDPOINT
 
@@ -36,7 +39,7 @@ class TokenService:
 
         params = {"token": token if token else "", "chain": chain if chain else ""}
         try:
-            response = requests.get(f"{self.base_url}/supportedTokens", params=params)
+            response = http_session.get(f"{self.base_url}/supportedTokens", params=params)
             if response.status_code != 200:
                 return []
             return response.json()
@@ -46,5 +49,29 @@ class TokenService:
         ):
             return []
 
+    async def get_token_metadata_async(
+        self, token: Optional[str] = None, chain: Optional[str] = None
+    ):
+        """Async version of get_token_metadata, for code running on the event loop."""
+
+        token_list = await self.get_token_list_async(token=token, chain=chain)
+        return token_list[0] if token_list and len(token_list) > 0 else None
+
+    async def get_token_list_async(
+        self, token: Optional[str] = None, chain: Optional[str] = None
+    ) -> dict:
+        """Async version of get_token_list, for code running on the event loop."""
+
+        params = {"token": token if token else "", "chain": chain if chain else ""}
+        try:
+            response = await get_async_http_client().get(
+                f"{self.base_url}/supportedTokens", params=params
+            )
+            if response.status_code != 200:
+                return []
+            return response.json()
+        except (httpx.HTTPError, json.JSONDecodeError):
+            return []
+
 
 tokens_service = TokenService()
@@ -1,5 +1,7 @@
 from enum import Enum
+import httpx
 import requests
+from services.http_client import get_async_http_client, http_session
 from config import FIREBASE_SERVER_ENDPOINT
 
 
@@ -30,9 +32,25 @@ def save_transaction_to_db(transaction) -> dict:
         body = {
             "transactionData": transaction,
         }
-        response = requests.post(
+        response = http_session.post(
             f"{FIREBASE_SERVER_ENDPOINT}/saveTransactionOnDB", json=body
         )
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         return {"error": "Failed to call saveTransactionOnDB", "error_message": e}
+
+
+async def save_transaction_to_db_async(transaction) -> dict:
+    """
+    Async version of save_transaction_to_db, for code running on the event loop.
+    """
+    try:
+        body = {
+            "transactionData": transaction,
+        }
+        response = await get_async_http_client().post(
+            f"{FIREBASE_SERVER_ENDPOINT}/saveTransactionOnDB", json=body
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        return {"error": "Failed to call saveTransactionOnDB", "error_message": e}
@@ -1,4 +1,5 @@
-import requests, base64, io
+import base64, io
+from services.http_client import get_async_http_client, http_session
 from config import OPENAI_API_KEY
 
 def base64_to_blob(base64_string):
@@ -41,7 +42,7 @@ def transcribe_audio(base64_audio):
         files = {
             "file": ("audio.mp3", audio_data)
         }
-        response = requests.post(
+        response = http_session.post(
             "https://api.openai.com/v1/audio/transcriptions",
             headers=headers,
             data=form_data,
@@ -72,7 +73,7 @@ def generate_speech_from_text(text: str):
             "voice": "alloy",
             "instructions": "friendly, upbeat"
         }
-        response = requests.post(
+        response = http_session.post(
             "https://api.openai.com/v1/audio/speech",
             headers=headers,
             json=payload
@@ -85,3 +86,63 @@ def generate_speech_from_text(text: str):
     except Exception as e:
         print(f"Error generating speech: {str(e)}", flush=True)
         raise e
+
+async def transcribe_audio_async(base64_audio):
+    """Async version of transcribe_audio, for code running on the event loop."""
+    try:
+        audio_data = base64_to_blob(base64_audio)
+        headers = {
+            "Authorization": f"Bearer {OPENAI_API_KEY}"
+        }
+        form_data = {
+            "model": "whisper-1",
+            "language": "en"
+        }
+        files = {
+            "file": ("audio.mp3", audio_data)
+        }
+        response = await get_async_http_client().post(
+            "https://api.openai.com/v1/audio/transcriptions",
+            headers=headers,
+            data=form_data,
+            files=files
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"API request failed with status {response.status_code}")
+
+        result = response.json()
+        if not isinstance(result, dict) or "text" not in result:
+            raise ValueError(f"Unexpected API response format: {result}")
+
+        return result["text"]
+    except Exception as e:
+        print(f"Error transcribing audio: {str(e)}", flush=True)
+        raise e
+
+async def generate_speech_from_text_async(text: str):
+    """Async version of generate_speech_from_text, for code running on the event loop."""
+    try:
+        headers = {
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": "gpt-4o-mini-tts",
+            "input": text,
+            "voice": "alloy",
+            "instructions": "friendly, upbeat"
+        }
+        response = await get_async_http_client().post(
+            "https://api.openai.com/v1/audio/speech",
+            headers=headers,
+            json=payload
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"API request failed: {response.reason_phrase}")
+
+        return response.content
+    except Exception as e:
+        print(f"Error generating speech: {str(e)}", flush=True)
+        raise e
@@ -0,0 +1,117 @@
+# tests/agents/analytics/test_analytics_aggregator.py
+import sys
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from eval.benchmarks.fake_firestore import FakeFirestore
+from services.analytics_aggregator import CounterAggregator, ShardedCounterDoc
+
+
+def _global_doc(db):
+    return db.collection("analytics").document("global")
+
+
+def _counters(snapshot) -> dict:
+    data = snapshot.to_dict() or {}
+    data.pop("updated_at", None)
+    return data
+
+
+class TestCounterAggregator:
+    """Test suite for the write-behind counter aggregator"""
+
+    def test_flush_writes_one_merged_increment_per_document(self):
+        """Test that the deltas of a document are summed and written with a single set"""
+        db = FakeFirestore(latency_ms=0)
+        aggregator = CounterAggregator(db, flush_interval=0)
+        users = db.collection("analytics").document("users")
+        aggregator.increment(_global_doc(db), "total_messages")
+        aggregator.increment(_global_doc(db), "total_messages", amount=2)
+        aggregator.increment(_global_doc(db), "agents_used", key="dex_agent")
+        aggregator.increment(users, "total_messages")
+
+        assert aggregator.pending() == 3
+        assert aggregator.flush() == 2
+        assert db.ops["commit"] == 1
+        assert _counters(_global_doc(db).get()) == {
+            "total_messages": 3,
+            "agents_used": {"dex_agent": 1},
+        }
+        assert aggregator.pending() == 0
+        assert aggregator.flush() == 0
+
+    def test_failed_flush_keeps_the_deltas(self):
+        """Test that the deltas of a failed flush are added to the next one"""
+        db = FakeFirestore(latency_ms=0)
+        aggregator = CounterAggregator(db, flush_interval=0)
+        new_batch = db.batch
+
+        def failing_commit():
+            raise RuntimeError("unavailable")
+
+        def failing_batch():
+            batch = new_batch()
+            batch.commit = failing_commit
+            return batch
+
+        db.batch = failing_batch
+        aggregator.increment(_global_doc(db), "total_messages")
+        assert aggregator.flush() == 0
+        aggregator.increment(_global_doc(db), "total_messages")
+
+        db.batch = new_batch
+        assert aggregator.flush() == 1
+        assert _counters(_global_doc(db).get()) == {"total_messages": 2}
+
+
+class TestShardedCounterDoc:
+    """Test suite for the global counters split over shard documents"""
+
+    def test_threads_fan_out_over_the_shards(self):
+        """Test that shard_ref picks one of the shards and sticks to it within a thread"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        db = FakeFirestore(latency_ms=0)
+        counters = ShardedCounterDoc(db, _global_doc(db), shards=4)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            paths = set(pool.map(lambda _: counters.shard_ref().path, range(64)))
+
+        assert paths <= {f"analytics/global/shards/{shard}" for shard in range(4)}
+        assert len(paths) > 1
+        assert counters.shard_ref().path == counters.shard_ref().path
+
+    def test_read_sums_the_base_document_and_the_shards(self):
+        """Test that read adds the shard counters, nested maps included, to the base document"""
+        db = FakeFirestore(latency_ms=0)
+        counters = ShardedCounterDoc(db, _global_doc(db), shards=3)
+        _global_doc(db).set({"total_messages": 10, "agents_used": {"dex_agent": 1}})
+        counters.shard_ref(0).set({"total_messages": 2, "agents_used": {"dex_agent": 1}})
+        counters.shard_ref(2).set({"total_messages": 3, "agents_used": {"stake_agent": 4}})
+
+        assert counters.read() == {
+            "total_messages": 15,
+            "agents_used": {"dex_agent": 2, "stake_agent": 4},
+        }
+
+    def test_rollup_moves_the_shards_into_the_base_document(self):
+        """Test that rollup empties the shards into the base document and keeps the total"""
+        db = FakeFirestore(latency_ms=0)
+        counters = ShardedCounterDoc(db, _global_doc(db), shards=2)
+        _global_doc(db).set({"total_messages": 10})
+        counters.shard_ref(0).set({"total_messages": 2, "agents_used": {"dex_agent": 1}})
+        counters.shard_ref(1).set({"total_messages": 3})
+
+        assert counters.rollup() == {"total_messages": 5, "agents_used": {"dex_agent": 1}}
+        assert db.ops["commit"] == 1
+        assert _counters(_global_doc(db).get()) == {
+            "total_messages": 15,
+            "agents_used": {"dex_agent": 1},
+        }
+        assert _counters(counters.shard_ref(0).get()) == {
+            "total_messages": 0,
+            "agents_used": {"dex_agent": 0},
+        }
+        assert counters.read() == {"total_messages": 15, "agents_used": {"dex_agent": 1}}
+        assert counters.rollup() == {}
@@ -255,7 +255,7 @@ class TestGetSwapsByWalletAddress:
         mock_save_agent_thought = Mock()
         mock_save_ui_message = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_ui_message', mock_save_ui_message)
         
@@ -292,7 +292,7 @@ class TestGetSwapsByWalletAddress:
         mock_requests_get = Mock(return_value=mock_response)
         mock_save_agent_thought = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         
         result = self.get_swaps_by_wallet_address(
@@ -348,7 +348,7 @@ class TestGetSwapsByWalletAddress:
         mock_requests_get = Mock(return_value=mock_response)
         mock_save_agent_thought = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         
         result = self.get_swaps_by_wallet_address(
@@ -378,7 +378,7 @@ class TestGetSwapsByWalletAddress:
         mock_requests_get = Mock(return_value=mock_response)
         mock_save_agent_thought = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         
         result = self.get_swaps_by_wallet_address(
@@ -399,7 +399,7 @@ class TestGetSwapsByWalletAddress:
         mock_requests_get = Mock(return_value=mock_response)
         mock_save_agent_thought = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         
         result = self.get_swaps_by_wallet_address(
@@ -415,7 +415,7 @@ class TestGetSwapsByWalletAddress:
         mock_requests_get = Mock(side_effect=Exception("Network Error"))
         mock_save_agent_thought = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         
         result = self.get_swaps_by_wallet_address(
@@ -435,7 +435,7 @@ class TestGetSwapsByWalletAddress:
         mock_requests_get = Mock(return_value=mock_response)
         mock_save_agent_thought = Mock()
         
-        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.requests.get', mock_requests_get)
+        monkeypatch.setattr('agents.copy_trading.copy_trading_functions.http_session.get', mock_requests_get)
         monkeypatch.setattr('agents.copy_trading.copy_trading_functions.save_agent_thought', mock_save_agent_thought)
         
         result = self.get_swaps_by_wallet_address(
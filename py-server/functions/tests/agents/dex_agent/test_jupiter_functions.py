@@ -2,7 +2,9 @@
 import types
 import sys
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+import httpx
+import pytest
 import requests
 
 # Add the current directory to Python path so we can import the modules
@@ -356,7 +358,7 @@ class TestJupiterGetQuotes:
         mock_response.json.return_value = {"quote": "success", "amount": "100"}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.dex_agent.jupiter_functions.requests.post', return_value=mock_response):
+        with patch('agents.dex_agent.jupiter_functions.http_session.post', return_value=mock_response):
             # Test the function
             result = self.jupiter_get_quotes(
                 input_token="SOL",
@@ -387,7 +389,7 @@ class TestJupiterGetQuotes:
         mock_response.content = b"Error message"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("HTTP Error")
         
-        with patch('agents.dex_agent.jupiter_functions.requests.post', return_value=mock_response):
+        with patch('agents.dex_agent.jupiter_functions.http_session.post', return_value=mock_response):
             # Test the function
             result = self.jupiter_get_quotes(
                 input_token="SOL",
@@ -455,4 +457,105 @@ class TestJupiterGetQuotes:
         # Verify the result (negative amounts are treated as valid in Python, so this should work)
         # The function only checks for 0 or None, not negative numbers
         assert "I've initiated the quoting process for your swap" in result
-    
+
+
+def _httpx_response(status_code, **kwargs):
+    return httpx.Response(status_code, request=httpx.Request("POST", "https://mock-endpoint.com/quote"), **kwargs)
+
+
+class TestJupiterGetQuotesAsync:
+    """Test suite for jupiter_get_quotes_async, the version registered as the agent tool"""
+
+    def setup_method(self):
+        from agents.dex_agent.jupiter_functions import jupiter_get_quotes_async
+        self.jupiter_get_quotes_async = jupiter_get_quotes_async
+
+    def _mock_dependencies(self, monkeypatch):
+        async def mock_get_token_metadata_async(chain, token):
+            return mock_from_token_info if token == "SOL" else mock_to_token_info
+
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.tokens_service.get_token_metadata_async',
+                            mock_get_token_metadata_async)
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.get_request_ctx',
+                            lambda parentKey, key: mock_wallet_address if key == "solana_wallet_address" else mock_user_id)
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.save_agent_thought', lambda **kwargs: None)
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.save_ui_message', lambda **kwargs: None)
+
+    @pytest.mark.asyncio
+    async def test_successful_swap_with_frontend_quoting(self, monkeypatch):
+        """Test that frontend quoting renders the bridge component without calling the backend"""
+        self._mock_dependencies(monkeypatch)
+        client = Mock(post=AsyncMock())
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.get_async_http_client', lambda: client)
+
+        result = await self.jupiter_get_quotes_async(
+            input_token="SOL",
+            output_token="USDC",
+            amount=1.0,
+            is_usd=False,
+            chat_id="test-chat-123",
+        )
+
+        assert "I've initiated the quoting process for your swap" in result
+        client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_backend_quoting_success(self, monkeypatch):
+        """Test that backend quoting posts the quote through the async client"""
+        self._mock_dependencies(monkeypatch)
+        client = Mock(post=AsyncMock(return_value=_httpx_response(200, json={"quote": "success"})))
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.get_async_http_client', lambda: client)
+
+        result = await self.jupiter_get_quotes_async(
+            input_token="SOL",
+            output_token="USDC",
+            amount=1.0,
+            is_usd=False,
+            chat_id="test-chat-123",
+            use_frontend_quoting=False,
+        )
+
+        assert result == {"quote": "success"}
+        params = client.post.call_args.kwargs["json"]
+        assert params["fromTokenSymbolOrAddress"] == mock_from_token_info["contract_address"]
+        assert params["toTokenSymbolOrAddress"] == mock_to_token_info["contract_address"]
+
+    @pytest.mark.asyncio
+    async def test_backend_quoting_http_error(self, monkeypatch):
+        """Test that backend errors are returned with the response body"""
+        self._mock_dependencies(monkeypatch)
+        client = Mock(post=AsyncMock(return_value=_httpx_response(400, text="Error message")))
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.get_async_http_client', lambda: client)
+
+        result = await self.jupiter_get_quotes_async(
+            input_token="SOL",
+            output_token="USDC",
+            amount=1.0,
+            is_usd=False,
+            chat_id="test-chat-123",
+            use_frontend_quoting=False,
+        )
+
+        assert "There was an error building the swap quote on Solana" in result
+        assert "Error message" in result
+
+    @pytest.mark.asyncio
+    async def test_invalid_output_token(self, monkeypatch):
+        """Test that an unsupported output token is reported"""
+        self._mock_dependencies(monkeypatch)
+
+        async def mock_get_token_metadata_async(chain, token):
+            return mock_from_token_info if token == "SOL" else None
+
+        monkeypatch.setattr('agents.dex_agent.jupiter_functions.tokens_service.get_token_metadata_async',
+                            mock_get_token_metadata_async)
+
+        result = await self.jupiter_get_quotes_async(
+            input_token="SOL",
+            output_token="NOTATOKEN",
+            amount=1.0,
+            is_usd=False,
+            chat_id="test-chat-123",
+        )
+
+        assert result == "The output token NOTATOKEN is not supported. Try again with a different token."
@@ -0,0 +1,168 @@
+# tests/agents/dex_agent/test_jupiter_token_registry.py
+import sys
+import time
+from unittest.mock import Mock, patch
+import requests
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+mock_verified_tokens = [
+    {
+        "id": "So11111111111111111111111111111111111111112",
+        "name": "Wrapped SOL",
+        "symbol": "SOL",
+        "icon": "https://example.com/sol.png",
+        "decimals": 9,
+        "tags": ["verified"],
+    },
+    {
+        "id": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+        "name": "USD Coin",
+        "symbol": "USDC",
+        "icon": "https://example.com/usdc.png",
+        "decimals": 6,
+        "tags": ["verified"],
+    },
+    {
+        "id": "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm",
+        "name": "dogwifhat",
+        "symbol": "$WIF",
+        "icon": "https://example.com/wif.png",
+        "decimals": 6,
+        "tags": ["verified"],
+    },
+]
+
+mock_searched_token = {
+    "id": "2zMMhcVQEXDtdE6vsFS7S7D5oUodfJHE8vd1gnBouauv",
+    "name": "Pudgy Penguins",
+    "symbol": "PENGU",
+    "icon": "https://example.com/pengu.png",
+    "decimals": 6,
+    "tags": [],
+    "mintAuthority": None,
+}
+
+
+def _response(json_data):
+    response = Mock()
+    response.json.return_value = json_data
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestJupiterTokenRegistry:
+    """Test suite for the process-wide Jupiter token registry"""
+
+    def setup_method(self):
+        from agents.dex_agent.jupiter_token_registry import JupiterTokenRegistry
+        self.registry = JupiterTokenRegistry(ttl_seconds=60)
+
+    def test_verified_list_is_downloaded_once(self):
+        """Test that repeated lookups are served from the in-memory indexes"""
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   return_value=_response(mock_verified_tokens)) as mock_get:
+            for _ in range(5):
+                assert self.registry.get_by_symbol("usdc")["symbol"] == "USDC"
+                assert self.registry.get_by_address(mock_verified_tokens[0]["id"])["symbol"] == "SOL"
+
+        assert mock_get.call_count == 1
+
+    def test_symbol_lookup_matches_dollar_prefix(self):
+        """Test that a symbol also matches tokens listed with a '$' prefix"""
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   return_value=_response(mock_verified_tokens)):
+            token = self.registry.get_by_symbol("WIF")
+
+        assert token["symbol"] == "$WIF"
+        assert token["address"] == "EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm"
+
+    def test_symbol_lookup_returns_a_copy(self):
+        """Test that callers mutating the result don't corrupt the registry"""
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   return_value=_response(mock_verified_tokens)):
+            token = self.registry.get_by_symbol("SOL")
+            token["address"] = "native"
+            assert self.registry.get_by_symbol("SOL")["address"] == mock_verified_tokens[0]["id"]
+
+    def test_unknown_symbol_returns_none(self):
+        """Test that unknown symbols return None"""
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   return_value=_response(mock_verified_tokens)):
+            assert self.registry.get_by_symbol("NOTATOKEN") is None
+
+    def test_address_lookup_maps_to_v1_format(self):
+        """Test that address lookups keep the v1 format used by the agents"""
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   return_value=_response(mock_verified_tokens)):
+            token = self.registry.get_by_address("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+
+        assert token["address"] == "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+        assert token["decimals"] == 6
+        assert token["logoURI"] == "https://example.com/usdc.png"
+
+    def test_address_miss_falls_back_to_search_once(self):
+        """Test that addresses outside the verified list are searched and then cached"""
+        def mock_get(url, **kwargs):
+            if "tag?query=verified" in url:
+                return _response(mock_verified_tokens)
+            return _response([mock_searched_token])
+
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   side_effect=mock_get) as patched_get:
+            for _ in range(3):
+                token = self.registry.get_by_address(mock_searched_token["id"])
+                assert token["symbol"] == "PENGU"
+
+        search_calls = [c for c in patched_get.call_args_list if "search" in c.args[0]]
+        assert len(search_calls) == 1
+
+    def test_stale_list_is_served_while_refreshing(self):
+        """Test that an expired list keeps being served and is refreshed in the background"""
+        refreshed_tokens = mock_verified_tokens + [{**mock_searched_token, "symbol": "PENGU"}]
+        responses = [_response(mock_verified_tokens), _response(refreshed_tokens)]
+
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   side_effect=lambda url, **kwargs: responses.pop(0)):
+            assert self.registry.get_by_symbol("PENGU") is None
+            self.registry._loaded_at -= 120  # expire the TTL
+
+            # served from the stale list, refresh kicks off in the background
+            assert self.registry.get_by_symbol("USDC") is not None
+            for _ in range(100):
+                if self.registry.get_by_symbol("PENGU"):
+                    break
+                time.sleep(0.01)
+
+        assert self.registry.get_by_symbol("PENGU")["address"] == mock_searched_token["id"]
+
+    def test_failed_download_returns_none(self):
+        """Test that a failed download doesn't raise on symbol lookups"""
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   side_effect=requests.exceptions.ConnectionError("down")):
+            assert self.registry.get_by_symbol("SOL") is None
+            assert self.registry.get_tokens() is None
+
+    def test_searched_addresses_are_bounded_and_refreshed(self):
+        """Test that searched tokens are evicted least recently used first and on refresh"""
+        from agents.dex_agent.jupiter_token_registry import JupiterTokenRegistry
+        registry = JupiterTokenRegistry(ttl_seconds=60, max_searched=2)
+
+        def mock_get(url, **kwargs):
+            if "tag?query=verified" in url:
+                return _response(mock_verified_tokens)
+            return _response([{**mock_searched_token, "id": url.rsplit("=", 1)[-1]}])
+
+        with patch('agents.dex_agent.jupiter_token_registry.http_session.get',
+                   side_effect=mock_get) as patched_get:
+            for address in ["mint_a", "mint_b", "mint_a", "mint_c"]:
+                registry.get_by_address(address)
+            assert list(registry._searched_addresses) == ["mint_a", "mint_c"]
+
+            registry._refresh()
+            assert len(registry._searched_addresses) == 0
+            registry.get_by_address("mint_a")
+
+        search_calls = [c for c in patched_get.call_args_list if "search" in c.args[0]]
+        assert len(search_calls) == 4
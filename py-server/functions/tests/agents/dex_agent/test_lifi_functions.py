@@ -390,7 +390,7 @@ class TestLifiGetQuote:
         mock_response.json.return_value = {"quote": "success", "amount": "100"}
         mock_response.status_code = 200
         
-        with patch('agents.dex_agent.lifi_functions.requests.post', return_value=mock_response):
+        with patch('agents.dex_agent.lifi_functions.http_session.post', return_value=mock_response):
             # Test the function
             result = self.lifi_get_quote(
                 from_chain="ETHEREUM",
@@ -424,7 +424,7 @@ class TestLifiGetQuote:
         mock_response.content = b"Error message"
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("HTTP Error")
         
-        with patch('agents.dex_agent.lifi_functions.requests.post', return_value=mock_response):
+        with patch('agents.dex_agent.lifi_functions.http_session.post', return_value=mock_response):
             # Test the function
             result = self.lifi_get_quote(
                 from_chain="ETHEREUM",
@@ -192,7 +192,7 @@ class TestStakeFunctions:
         }
         mock_sanctum_response.raise_for_status.return_value = None
         
-        with patch('agents.dex_agent.stake_functions.requests.get') as mock_get:
+        with patch('agents.dex_agent.stake_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_validators_response, mock_sanctum_response]
             
             # Test the function
@@ -220,7 +220,7 @@ class TestStakeFunctions:
         mock_response.json.return_value = {"stake_pools": []}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.dex_agent.stake_functions.requests.get', return_value=mock_response):
+        with patch('agents.dex_agent.stake_functions.http_session.get', return_value=mock_response):
             # Test the function
             with pytest.raises(Exception) as exc_info:
                 self.get_stake_pools_information()
@@ -234,7 +234,7 @@ class TestStakeFunctions:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = Exception("HTTP Error")
         
-        with patch('agents.dex_agent.stake_functions.requests.get', return_value=mock_response):
+        with patch('agents.dex_agent.stake_functions.http_session.get', return_value=mock_response):
             # Test the function
             with pytest.raises(Exception) as exc_info:
                 self.get_stake_pools_information()
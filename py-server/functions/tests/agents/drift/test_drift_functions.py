@@ -1,7 +1,9 @@
 # tests/agents/drift/test_drift_functions.py
+import asyncio
 import sys
 import types
 from unittest.mock import Mock, patch
+import pytest
 from decimal import Decimal
 
 # Add the current directory to Python path so we can import the modules
@@ -257,7 +259,7 @@ class TestCheckIfUserHasDriftAccount:
         mock_response.json.return_value = True
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.drift.drift_functions.requests.get', return_value=mock_response):
+        with patch('agents.drift.drift_functions.http_session.get', return_value=mock_response):
             result = self.check_if_user_has_drift_account(
                 chat_id=mock_chat_id,
                 solana_wallet_address=mock_wallet_address
@@ -272,7 +274,7 @@ class TestCheckIfUserHasDriftAccount:
         monkeypatch.setattr('agents.drift.drift_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock HTTP request to raise an error
-        with patch('agents.drift.drift_functions.requests.get', side_effect=Exception("Network error")):
+        with patch('agents.drift.drift_functions.http_session.get', side_effect=Exception("Network error")):
             result = self.check_if_user_has_drift_account(
                 chat_id=mock_chat_id,
                 solana_wallet_address=mock_wallet_address
@@ -545,6 +547,108 @@ class TestOpenPerpsPosition:
         # Verify the result
         assert "Market INVALID not found" in result
 
+class TestOpenPerpsPositionAsync:
+    """Test suite for open_perps_position_async, the version registered as the agent tool"""
+
+    def setup_method(self):
+        from agents.drift.drift_functions import open_perps_position_async, ORDER_TYPE, POSITION_TYPE
+        self.open_perps_position_async = open_perps_position_async
+        self.ORDER_TYPE = ORDER_TYPE
+        self.POSITION_TYPE = POSITION_TYPE
+
+    def _mock_dependencies(self, monkeypatch, has_account=True, markets_valid=True):
+        started = []
+
+        async def mock_check_account(**kwargs):
+            started.append("account")
+            await asyncio.sleep(0.01)
+            started.append("account done")
+            return has_account
+
+        async def mock_is_valid_market(symbol):
+            started.append("market")
+            await asyncio.sleep(0.01)
+            started.append("market done")
+            return {"is_valid_market": markets_valid, "perp_markets": ["SOL", "BTC"]}
+
+        monkeypatch.setattr('agents.drift.drift_functions.get_request_ctx',
+                            lambda *args, **kwargs: mock_wallet_address)
+        monkeypatch.setattr('agents.drift.drift_functions.save_agent_thought', lambda **kwargs: None)
+        monkeypatch.setattr('agents.drift.drift_functions.save_ui_message', lambda **kwargs: None)
+        monkeypatch.setattr('agents.drift.drift_functions.check_if_user_has_drift_account_async', mock_check_account)
+        monkeypatch.setattr('agents.drift.drift_functions.is_valid_market_symbol_async', mock_is_valid_market)
+        return started
+
+    @pytest.mark.asyncio
+    async def test_successful_open_position_with_frontend_quoting(self, monkeypatch):
+        """Test that the account and market checks run concurrently"""
+        started = self._mock_dependencies(monkeypatch)
+
+        result = await self.open_perps_position_async(
+            symbol="SOL",
+            amount="100.0",
+            order_type=self.ORDER_TYPE.MARKET,
+            chat_id=mock_chat_id,
+            trade_direction=self.POSITION_TYPE.LONG,
+            use_frontend_quoting=True
+        )
+
+        assert "I've initiated the process to open a new position on SOL" in result
+        # both lookups were in flight before either of them finished
+        assert sorted(started[:2]) == ["account", "market"]
+
+    @pytest.mark.asyncio
+    async def test_open_position_without_drift_account(self, monkeypatch):
+        """Test opening position without drift account"""
+        self._mock_dependencies(monkeypatch, has_account=False)
+
+        result = await self.open_perps_position_async(
+            symbol="SOL",
+            amount="100.0",
+            order_type=self.ORDER_TYPE.MARKET,
+            chat_id=mock_chat_id,
+            trade_direction=self.POSITION_TYPE.LONG,
+        )
+
+        assert "You don't have a drift account" in result
+
+    @pytest.mark.asyncio
+    async def test_open_position_invalid_market(self, monkeypatch):
+        """Test opening position with invalid market"""
+        self._mock_dependencies(monkeypatch, markets_valid=False)
+
+        result = await self.open_perps_position_async(
+            symbol="INVALID",
+            amount="100.0",
+            order_type=self.ORDER_TYPE.MARKET,
+            chat_id=mock_chat_id,
+            trade_direction=self.POSITION_TYPE.LONG,
+        )
+
+        assert "Market INVALID not found" in result
+        assert "SOL, BTC" in result
+
+    @pytest.mark.asyncio
+    async def test_missing_account_is_reported_before_a_failed_market_lookup(self, monkeypatch):
+        """Test that a user without a drift account gets that message when the markets can't be fetched"""
+        self._mock_dependencies(monkeypatch, has_account=False)
+
+        async def mock_is_valid_market(symbol):
+            raise Exception("Network error")
+
+        monkeypatch.setattr('agents.drift.drift_functions.is_valid_market_symbol_async', mock_is_valid_market)
+
+        result = await self.open_perps_position_async(
+            symbol="SOL",
+            amount="100.0",
+            order_type=self.ORDER_TYPE.MARKET,
+            chat_id=mock_chat_id,
+            trade_direction=self.POSITION_TYPE.LONG,
+        )
+
+        assert "You don't have a drift account" in result
+
+
 class TestGetUserActiveOrders:
     """Test suite for get_user_active_orders function"""
     
@@ -635,7 +739,7 @@ class TestGetPerpsMarkets:
         mock_response.json.return_value = ["SOL", "BTC", "ETH", "JUP"]
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.drift.drift_functions.requests.get', return_value=mock_response):
+        with patch('agents.drift.drift_functions.http_session.get', return_value=mock_response):
             result = self.get_perps_markets(
                 chat_id=mock_chat_id,
                 use_frontend_quoting=True
@@ -651,7 +755,7 @@ class TestGetPerpsMarkets:
         monkeypatch.setattr('agents.drift.drift_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock HTTP request to raise an error
-        with patch('agents.drift.drift_functions.requests.get', side_effect=Exception("Network error")):
+        with patch('agents.drift.drift_functions.http_session.get', side_effect=Exception("Network error")):
             result = self.get_perps_markets(
                 chat_id=mock_chat_id,
                 use_frontend_quoting=True
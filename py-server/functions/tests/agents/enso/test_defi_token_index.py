@@ -0,0 +1,82 @@
+# tests/agents/enso/test_defi_token_index.py
+import hashlib
+import json
+import sys
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+mock_defi_tokens = {
+    "1": {
+        "compound-v2": [
+            {"address": "0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643", "protocolSlug": "compound-v2", "symbol": "cDAI", "decimals": 8},
+            {"address": "0x39AA39c021dfbaE8faC545936693aC917d5E7563", "protocolSlug": "compound-v2", "symbol": "cUSDC", "decimals": 8},
+        ],
+        "aave-v3": [
+            {"address": "0x018008bfb33d285247A21d44E50697654f754e63", "protocolSlug": "aave-v3", "symbol": "aEthDAI", "decimals": 18},
+        ],
+    },
+    "8453": {
+        "aave-v3": [
+            {"address": "0x4e65fE4DbA92790696d040ac24Aa414708F5c0AB", "protocolSlug": "aave-v3", "symbol": "aBasUSDC", "decimals": 6},
+        ],
+        "morpho-blue-vaults": [
+            {"address": "0xc1256Ae5FF1cf2719D4937adb3bbCCab2E00A2Ca", "protocolSlug": "morpho-blue-vaults", "symbol": "mwUSDC", "decimals": 18},
+            {"address": "0x7BfA7C4f149E7415b73bdeDfe609237e29CBF34A", "protocolSlug": "morpho-blue-vaults", "symbol": "mwUSDC", "decimals": 18},
+        ],
+    },
+}
+
+
+class TestDefiTokenIndex:
+    """Test suite for the compiled Enso defi tokens index"""
+
+    def setup_method(self):
+        from agents.enso.defi_token_index import DefiTokenIndex, compile_defi_tokens
+        self.source = json.dumps(mock_defi_tokens).encode()
+        self.index = DefiTokenIndex(compile_defi_tokens(self.source))
+
+    def test_lookup_by_chain_and_address(self):
+        """Test that address lookups are case insensitive and keep the original checksum"""
+        token = self.index.get_by_address("0x5D3A536E4D6DBD6114CC1EAD35777BAB948E3643", "1")
+        assert token == {
+            "chainId": 1,
+            "protocolSlug": "compound-v2",
+            "address": "0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643",
+            "symbol": "cDAI",
+            "decimals": 8,
+        }
+        assert self.index.get_by_address("0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643", "8453") is None
+
+    def test_lookup_by_address_on_any_chain(self):
+        """Test that the chain is optional for address lookups"""
+        assert self.index.get_by_address("0x4e65fe4dba92790696d040ac24aa414708f5c0ab")["chainId"] == 8453
+        assert self.index.get_by_address("0x0000000000000000000000000000000000000000") is None
+
+    def test_lookup_by_symbol_returns_every_match(self):
+        """Test that tokens sharing a symbol on a chain are all returned"""
+        tokens = self.index.get_by_symbol("MWUSDC", "8453")
+        assert sorted(token["address"] for token in tokens) == [
+            "0x7BfA7C4f149E7415b73bdeDfe609237e29CBF34A",
+            "0xc1256Ae5FF1cf2719D4937adb3bbCCab2E00A2Ca",
+        ]
+        assert self.index.get_by_symbol("cUSDC", "8453") == []
+        assert [token["chainId"] for token in self.index.get_by_symbol("cusdc")] == [1]
+
+    def test_header_records_the_source(self):
+        """Test that the compiled file records the JSON it was built from"""
+        assert len(self.index) == 6
+        assert self.index.protocol_count == 3
+        assert self.index.source_size == len(self.source)
+        assert self.index.source_sha256 == hashlib.sha256(self.source).digest()
+
+    def test_bundled_index_matches_the_json(self):
+        """Test that assets/defi-tokens.bin was rebuilt after the last change to defi-tokens.json"""
+        from agents.enso.defi_token_index import DEFI_TOKENS_JSON_PATH, DefiTokenIndex
+
+        with open(DEFI_TOKENS_JSON_PATH, "rb") as file:
+            source_sha256 = hashlib.sha256(file.read()).digest()
+
+        assert DefiTokenIndex.open().source_sha256 == source_sha256, (
+            "defi-tokens.bin is out of date, run: python -m agents.enso.defi_token_index"
+        )
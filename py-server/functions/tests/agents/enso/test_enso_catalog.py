@@ -0,0 +1,139 @@
+# tests/agents/enso/test_enso_catalog.py
+import sys
+import time
+from unittest.mock import Mock
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+mock_chains = {
+    "1": {"chain_name": "Ethereum", "protocols": ["aave-v3", "morpho"]},
+    "8453": {"chain_name": "Base", "protocols": ["aave-v3", "compound-v3"]},
+}
+
+mock_token_docs = [
+    {"chainId": 8453, "project": "morpho", "symbol": "mUSDC", "name": "Morpho USDC", "apy": 5.2, "address": "0xa"},
+    {"chainId": 8453, "project": "aave-v3", "symbol": "aBasUSDC", "name": "Aave USDC", "apy": 7.1, "address": "0xb"},
+    {"chainId": 1, "project": "aave-v3", "symbol": "aEthWETH", "name": "Aave WETH", "apy": 2.4, "address": "0xc"},
+    {"chainId": 8453, "project": "aave-v3", "symbol": "aBasWETH", "name": "Aave WETH", "apy": 1.3, "address": "0xd"},
+]
+
+
+class TestEnsoCatalog:
+    """Test suite for the in-process Enso catalog"""
+
+    def setup_method(self):
+        from utils.enso_catalog import EnsoCatalog
+        self.load_chains = Mock(return_value=mock_chains)
+        self.load_tokens = Mock(return_value=mock_token_docs)
+        self.catalog = EnsoCatalog(self.load_chains, self.load_tokens, ttl_seconds=60)
+
+    def test_collections_are_loaded_once(self):
+        """Test that repeated lookups are served from the in-memory indexes"""
+        for _ in range(5):
+            self.catalog.get_chains_and_protocols()
+            self.catalog.get_tokens(chain_id="8453", project="aave-v3")
+
+        assert self.load_chains.call_count == 1
+        assert self.load_tokens.call_count == 1
+
+    def test_tokens_filtered_and_sorted_by_apy(self):
+        """Test chain/project filters and APY ordering"""
+        tokens = self.catalog.get_tokens(chain_id="8453")
+        assert [t["token"]["address"] for t in tokens] == ["0xb", "0xa", "0xd"]
+
+        tokens = self.catalog.get_tokens(chain_id=8453, project="AAVE-V3")
+        assert [t["token"]["address"] for t in tokens] == ["0xb", "0xd"]
+
+        tokens = self.catalog.get_tokens(project="aave-v3")
+        assert [t["token"]["address"] for t in tokens] == ["0xb", "0xc", "0xd"]
+
+    def test_symbol_filter_is_case_insensitive_substring(self):
+        """Test that the symbol filter matches like the Firestore version did"""
+        tokens = self.catalog.get_tokens(symbol="weth")
+        assert [t["token"]["symbol"] for t in tokens] == ["aEthWETH", "aBasWETH"]
+
+    def test_tokens_use_catalog_chain_names(self):
+        """Test that tokens carry the chain name without resolving it per request"""
+        token = self.catalog.get_tokens(chain_id="1")[0]
+        assert token["chain_id"] == "1"
+        assert token["chain_name"] == "Ethereum"
+        assert token["token"]["logo_uri"] == ""
+
+    def test_chain_id_lookup_by_name_or_id(self):
+        """Test chain id resolution from either a name or an id"""
+        assert self.catalog.get_chain_id("base") == "8453"
+        assert self.catalog.get_chain_id("8453") == "8453"
+        assert self.catalog.get_chain_id("solana") is None
+
+    def test_results_do_not_share_the_index_list(self):
+        """Test that callers appending to a result don't corrupt the indexes"""
+        self.catalog.get_tokens(chain_id="1").append({"apy": 99})
+        assert len(self.catalog.get_tokens(chain_id="1")) == 1
+
+    def test_stale_catalog_is_served_while_refreshing(self):
+        """Test that an expired catalog keeps being served and is reloaded in the background"""
+        assert self.catalog.get_tokens(project="compound-v3") == []
+        self.load_tokens.return_value = mock_token_docs + [
+            {"chainId": 8453, "project": "compound-v3", "symbol": "cUSDCv3", "apy": 4.0}
+        ]
+        self.catalog.invalidate()
+
+        # the stale catalog is returned immediately, the reload runs in a background thread
+        for _ in range(100):
+            if self.catalog.get_tokens(project="compound-v3"):
+                break
+            time.sleep(0.01)
+
+        assert self.catalog.get_tokens(project="compound-v3")[0]["token"]["symbol"] == "cUSDCv3"
+        assert self.load_tokens.call_count == 2
+
+    def test_failed_initial_load_is_retried(self):
+        """Test that a failed first load is not cached"""
+        self.load_tokens.side_effect = [Exception("firestore down"), mock_token_docs]
+
+        with pytest.raises(Exception, match="firestore down"):
+            self.catalog.get_tokens()
+
+        assert len(self.catalog.get_tokens()) == 4
+
+    def test_find_protocols_orders_exact_prefix_then_contains(self):
+        """Test protocol matching from the catalog index"""
+        assert self.catalog.find_protocols("AAVE-V3") == ["aave-v3"]
+        assert self.catalog.find_protocols("v3") == ["aave-v3", "compound-v3"]
+        assert self.catalog.find_protocols("morpho") == ["morpho"]
+        assert self.catalog.find_protocols("uniswap") == []
+
+    def test_symbol_filter_combined_with_chain_and_project(self):
+        """Test that symbol and chain/project filters intersect in APY order"""
+        tokens = self.catalog.get_tokens(chain_id="8453", symbol="usdc")
+        assert [t["token"]["address"] for t in tokens] == ["0xb", "0xa"]
+
+        tokens = self.catalog.get_tokens(chain_id="8453", project="aave-v3", symbol="BasWETH")
+        assert [t["token"]["address"] for t in tokens] == ["0xd"]
+
+        assert self.catalog.get_tokens(chain_id="1", symbol="usdc") == []
+
+
+class TestSubstringIndex:
+    """Test suite for the n-gram substring index"""
+
+    def setup_method(self):
+        from utils.enso_catalog import SubstringIndex
+        self.index = SubstringIndex(["aave-v3", "aave-v2", "Compound-V3", "morpho-blue-vaults", ""])
+
+    def test_exact(self):
+        assert self.index.exact("COMPOUND-v3") == "compound-v3"
+        assert self.index.exact("aave") is None
+
+    def test_prefix(self):
+        assert self.index.prefix("aave") == ["aave-v2", "aave-v3"]
+        assert self.index.prefix("zz") == []
+
+    def test_substring_short_and_long_queries(self):
+        assert self.index.substring("v3") == {"aave-v3", "compound-v3"}
+        assert self.index.substring("blue-vault") == {"morpho-blue-vaults"}
+        # all trigrams present but not contiguous
+        assert self.index.substring("aave-v3-v2") == set()
+        assert len(self.index.substring("")) == len(self.index) == 4
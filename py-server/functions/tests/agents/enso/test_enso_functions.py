@@ -14,6 +14,12 @@ class TestIsProtocolSupported:
         """Setup method that runs before each test"""
         from agents.enso.enso_functions import is_protocol_supported
         self.is_protocol_supported = is_protocol_supported
+
+    def _use_supported_protocols(self, monkeypatch, supported_protocols):
+        """Serve protocol matches from a catalog built over the given chains"""
+        from utils.enso_catalog import EnsoCatalog
+        catalog = EnsoCatalog(load_chains=Mock(return_value=supported_protocols), load_tokens=Mock(return_value=[]))
+        monkeypatch.setattr('agents.enso.enso_functions.find_enso_supported_protocols', catalog.find_protocols)
     
     def test_exact_match(self, monkeypatch):
         """Test exact protocol match"""
@@ -26,8 +32,7 @@ class TestIsProtocolSupported:
             }
         }
         
-        mock_get_enso_supported_chains_and_protocols = Mock(return_value=mock_supported_protocols)
-        monkeypatch.setattr('agents.enso.enso_functions.get_enso_supported_chains_and_protocols', mock_get_enso_supported_chains_and_protocols)
+        self._use_supported_protocols(monkeypatch, mock_supported_protocols)
         
         result = self.is_protocol_supported("aave-v3")
         assert result is True
@@ -40,8 +45,7 @@ class TestIsProtocolSupported:
             }
         }
         
-        mock_get_enso_supported_chains_and_protocols = Mock(return_value=mock_supported_protocols)
-        monkeypatch.setattr('agents.enso.enso_functions.get_enso_supported_chains_and_protocols', mock_get_enso_supported_chains_and_protocols)
+        self._use_supported_protocols(monkeypatch, mock_supported_protocols)
         
         result = self.is_protocol_supported("aave")
         assert result is True
@@ -54,8 +58,7 @@ class TestIsProtocolSupported:
             }
         }
         
-        mock_get_enso_supported_chains_and_protocols = Mock(return_value=mock_supported_protocols)
-        monkeypatch.setattr('agents.enso.enso_functions.get_enso_supported_chains_and_protocols', mock_get_enso_supported_chains_and_protocols)
+        self._use_supported_protocols(monkeypatch, mock_supported_protocols)
         
         result = self.is_protocol_supported("v3")
         assert result is True
@@ -68,8 +71,7 @@ class TestIsProtocolSupported:
             }
         }
         
-        mock_get_enso_supported_chains_and_protocols = Mock(return_value=mock_supported_protocols)
-        monkeypatch.setattr('agents.enso.enso_functions.get_enso_supported_chains_and_protocols', mock_get_enso_supported_chains_and_protocols)
+        self._use_supported_protocols(monkeypatch, mock_supported_protocols)
         
         result = self.is_protocol_supported("aave")
         assert result is True
@@ -82,8 +84,7 @@ class TestIsProtocolSupported:
             }
         }
         
-        mock_get_enso_supported_chains_and_protocols = Mock(return_value=mock_supported_protocols)
-        monkeypatch.setattr('agents.enso.enso_functions.get_enso_supported_chains_and_protocols', mock_get_enso_supported_chains_and_protocols)
+        self._use_supported_protocols(monkeypatch, mock_supported_protocols)
         
         result = self.is_protocol_supported("uniswap")
         assert result is False
@@ -283,7 +284,7 @@ class TestDefiQuote:
         monkeypatch.setattr('agents.enso.enso_functions.is_chain_supported', mock_is_chain_supported)
         monkeypatch.setattr('agents.enso.enso_functions.get_request_ctx', mock_get_request_ctx)
         monkeypatch.setattr('agents.enso.enso_functions.save_agent_thought', mock_save_agent_thought)
-        monkeypatch.setattr('requests.post', mock_requests_post)
+        monkeypatch.setattr('agents.enso.enso_functions.http_session.post', mock_requests_post)
         
         result = self.defi_quote(
             token="USDC",
@@ -528,6 +529,24 @@ class TestGetMatchingDefiTokens:
             symbol=None
         )
 
+    def test_symbol_given_as_defi_token_address(self, monkeypatch):
+        """Test that a defi token address is resolved to its symbol and protocol offline"""
+        mock_get_enso_supported_tokens = Mock(return_value=[
+            {"token": {"address": "0xF5DCe57282A584D2746FaF1593d3121Fcac444dC"}, "apy": 4.1},
+            {"token": {"address": "0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643"}, "apy": 3.2},
+        ])
+
+        monkeypatch.setattr('agents.enso.enso_functions.get_enso_supported_tokens', mock_get_enso_supported_tokens)
+
+        result = self.get_matching_defi_tokens(symbol="0x5d3a536e4d6dbd6114cc1ead35777bab948e3643")
+
+        assert [token["token"]["address"] for token in result] == ["0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643"]
+        mock_get_enso_supported_tokens.assert_called_once_with(
+            chain_id=None,
+            project="compound-v2",
+            symbol="cDAI"
+        )
+
 
 class TestGetTokenUsdAmount:
     """Test suite for get_token_usd_amount function"""
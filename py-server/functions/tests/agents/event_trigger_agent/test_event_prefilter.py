@@ -0,0 +1,103 @@
+# tests/agents/event_trigger_agent/test_event_prefilter.py
+import sys
+
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from agents.event_trigger_agent.event_prefilter import EventEmbeddingIndex
+
+VOCABULARY = ["binance", "hack", "satoshi", "ethereum", "tether", "dogecoin"]
+
+
+def make_embed(calls):
+    async def embed(texts):
+        calls.append(list(texts))
+        return [
+            [float(text.lower().count(word)) for word in VOCABULARY] for text in texts
+        ]
+
+    return embed
+
+
+def make_event(event_id, title, description=None):
+    event = {"eventId": event_id, "title": title}
+    if description:
+        event["description"] = description
+    return event
+
+
+EVENTS = [
+    make_event("hack", "Major exchange hack", "Binance is hacked"),
+    make_event("satoshi", "Satoshi is discovered"),
+    make_event("eth", "Ethereum Foundation disappears"),
+    make_event("tether", "Tether collapses"),
+    make_event("doge", "Dogecoin reaches $1"),
+]
+
+
+@pytest.mark.asyncio
+async def test_candidates_keeps_similar_events_in_order():
+    index = EventEmbeddingIndex(make_embed([]), top_k=2)
+
+    candidates = await index.candidates("Binance hack confirmed, Tether at risk", EVENTS)
+
+    assert [event["eventId"] for event in candidates] == ["hack", "tether"]
+
+
+@pytest.mark.asyncio
+async def test_candidates_limits_to_top_k():
+    index = EventEmbeddingIndex(make_embed([]), top_k=1)
+
+    candidates = await index.candidates("Binance hack, Satoshi found", EVENTS)
+
+    assert [event["eventId"] for event in candidates] == ["hack"]
+
+
+@pytest.mark.asyncio
+async def test_candidates_many_embeds_every_text_in_one_request():
+    calls = []
+    index = EventEmbeddingIndex(make_embed(calls), top_k=2)
+    texts = ["Binance hack confirmed, Satoshi found", "Dogecoin hits $1, Tether fine"]
+
+    candidates = await index.candidates_many(texts, EVENTS)
+
+    assert calls[1:] == [texts]
+    assert [[event["eventId"] for event in events] for events in candidates] == [
+        ["hack", "satoshi"],
+        ["doge", "tether"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unrelated_events_fill_the_top_k():
+    index = EventEmbeddingIndex(make_embed([]), top_k=3)
+
+    candidates = await index.candidates("Binance hack", EVENTS)
+
+    assert len(candidates) == 3
+    assert candidates[0]["eventId"] == "hack"
+
+
+@pytest.mark.asyncio
+async def test_sync_only_embeds_new_or_changed_events():
+    calls = []
+    index = EventEmbeddingIndex(make_embed(calls))
+
+    await index.sync(EVENTS)
+    await index.sync(EVENTS)
+    changed = [*EVENTS[:4], make_event("doge", "Dogecoin and Satoshi")]
+    await index.sync(changed[1:])
+
+    assert len(calls) == 2
+    assert calls[1] == ["Dogecoin and Satoshi"]
+    assert index.event_ids == ["satoshi", "eth", "tether", "doge"]
+    assert index.matrix.shape == (4, len(VOCABULARY))
+
+
+@pytest.mark.asyncio
+async def test_candidates_without_events():
+    index = EventEmbeddingIndex(make_embed([]))
+
+    assert await index.candidates("Binance hack", []) == []
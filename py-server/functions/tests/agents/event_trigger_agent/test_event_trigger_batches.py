@@ -0,0 +1,173 @@
+# tests/agents/event_trigger_agent/test_event_trigger_batches.py
+import asyncio
+import sys
+
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+import agents.event_trigger_agent.event_trigger_agent as event_trigger_module
+
+TWEET = {"text": "Binance hacked", "author": {"username": "reporter"}, "id": "tweet_1"}
+EVENTS = [{"eventId": f"event_{i}", "title": f"Event {i}"} for i in range(12)]
+
+
+class FakeAgent:
+    def __init__(self, tracker, fail_on=None):
+        self.tracker = tracker
+        self.fail_on = fail_on
+        self.messages = []
+
+    async def on_messages(self, messages, cancellation_token):
+        self.messages.extend(messages)
+        self.tracker["running"] += 1
+        self.tracker["max_running"] = max(
+            self.tracker["max_running"], self.tracker["running"]
+        )
+        await asyncio.sleep(0.01)
+        self.tracker["running"] -= 1
+        self.tracker["history"].append(len(self.messages))
+        if self.fail_on and self.fail_on in messages[0].content:
+            raise RuntimeError("model unavailable")
+
+
+def install_fake_agent(monkeypatch, fail_on=None):
+    tracker = {"running": 0, "max_running": 0, "history": [], "agents": 0}
+
+    def create_agent(*args, **kwargs):
+        tracker["agents"] += 1
+        return FakeAgent(tracker, fail_on)
+
+    monkeypatch.setattr(event_trigger_module, "create_event_trigger_agent", create_agent)
+    return tracker
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_on_fresh_agents(monkeypatch):
+    tracker = install_fake_agent(monkeypatch)
+
+    result = await event_trigger_module.call_event_trigger_agent(
+        TWEET, EVENTS, is_evaluation=True, prefilter=False, max_concurrency=2
+    )
+
+    assert result == "I've completed the task. All the events were checked"
+    assert tracker["agents"] == 3
+    assert tracker["max_running"] == 2
+    assert tracker["history"] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_does_not_stop_the_others(monkeypatch):
+    tracker = install_fake_agent(monkeypatch, fail_on="event_5")
+
+    result = await event_trigger_module.call_event_trigger_agent(
+        TWEET, EVENTS, is_evaluation=True, prefilter=False
+    )
+
+    assert len(tracker["history"]) == 3
+    assert "1 of 3 event batches could not be checked: model unavailable" in result
+
+
+def test_concurrent_triggered_events_are_all_recorded():
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.request_context import RequestContextStore
+
+    store = RequestContextStore()
+    store.start("eval-chat")
+
+    def trigger(i):
+        # event batches run the tool from several worker threads
+        store.append("eval-chat", "triggered_events", {"eventId": f"event_{i}"})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(trigger, range(200)))
+
+    assert len(store.get("eval-chat", "triggered_events")) == 200
+
+
+class FakeEventSnapshot:
+    def __init__(self, data, update_time):
+        self.exists = data is not None
+        self.update_time = update_time
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeEventRef:
+    """An event another invocation triggers between this one's read and its write"""
+
+    def __init__(self, data, triggered_by_other=False):
+        self.data = data
+        self.version = 1
+        self.triggered_by_other = triggered_by_other
+        self.updates = []
+
+    def get(self):
+        return FakeEventSnapshot(self.data, self.version)
+
+    def update(self, data, option=None):
+        if self.triggered_by_other:
+            self.data = {**self.data, "executionTime": "earlier"}
+            self.version += 1
+        if option and option["last_update_time"] != self.version:
+            raise RuntimeError("FailedPrecondition")
+        self.updates.append(data)
+        self.data = {**self.data, **data}
+        self.version += 1
+
+
+class FakeEventsDb:
+    def __init__(self, event_ref):
+        self.event_ref = event_ref
+
+    def collection(self, name):
+        return self
+
+    def document(self, event_id):
+        return self.event_ref
+
+    def write_option(self, **kwargs):
+        return kwargs
+
+
+def trigger(monkeypatch, event_ref):
+    invalidated = []
+    monkeypatch.setattr(event_trigger_module, "db", FakeEventsDb(event_ref))
+    monkeypatch.setattr(
+        event_trigger_module.firestore, "SERVER_TIMESTAMP", "now", raising=False
+    )
+    monkeypatch.setattr(
+        event_trigger_module, "invalidate_tweet_based_event", invalidated.append
+    )
+    result = event_trigger_module.updateExecutionTimeForEvent(
+        "event_1", "Binance hacked", "reporter", "tweet_1", False, "chat"
+    )
+    return result, invalidated
+
+
+@pytest.mark.parametrize(
+    "data, triggered_by_other, expected",
+    [
+        ({"executionTime": None}, False, "updated successfully"),
+        ({"executionTime": "earlier"}, False, "Event already triggered"),
+        ({"executionTime": None}, True, "Event already triggered"),
+    ],
+)
+def test_event_is_triggered_once(monkeypatch, data, triggered_by_other, expected):
+    event_ref = FakeEventRef(data, triggered_by_other)
+
+    result, invalidated = trigger(monkeypatch, event_ref)
+
+    assert expected in result
+    assert len(event_ref.updates) == (1 if expected == "updated successfully" else 0)
+    assert invalidated == ["event_1"]
+
+
+def test_missing_event_is_not_triggered(monkeypatch):
+    result, invalidated = trigger(monkeypatch, FakeEventRef(None))
+
+    assert result == "Event not found"
+    assert invalidated == []
@@ -0,0 +1,56 @@
+# tests/agents/event_trigger_agent/test_message_sink.py
+import sys
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from eval.benchmarks.fake_firestore import FakeFirestore
+from utils.message_sink import MessageSink
+
+
+def _messages(db):
+    return db.collection("chats").document("chat_1").collection("messages")
+
+
+class TestMessageSink:
+    """Test suite for the order and the flush of the batched chat message sink"""
+
+    def test_messages_keep_their_order_across_batches(self):
+        """Test that messages split over several batches are written in the order queued"""
+        db = FakeFirestore(latency_ms=5)
+        sink = MessageSink(db, max_batch_writes=3)
+
+        refs = [
+            sink.add(_messages(db), {"i": i, "createdAt": sink.timestamp()}) for i in range(10)
+        ]
+
+        assert sink.flush()
+        assert sink.batches >= 4
+        written = sorted(refs, key=lambda ref: db.update_times[ref.path])
+        assert [ref.get().to_dict()["i"] for ref in written] == list(range(10))
+        created = [ref.get().to_dict()["createdAt"] for ref in refs]
+        assert created == sorted(created) and len(set(created)) == 10
+
+    def test_flush_waits_for_everything_queued(self):
+        """Test that flush returns once every queued write is committed"""
+        db = FakeFirestore(latency_ms=5)
+        sink = MessageSink(db, max_batch_writes=4)
+
+        for i in range(25):
+            sink.add(_messages(db), {"i": i})
+        sink.set(db.collection("chats").document("chat_1"), {"updated": True}, merge=True)
+
+        assert sink.flush()
+        assert sink.pending() == 0
+        assert len(list(_messages(db).stream())) == 25
+        assert db.collection("chats").document("chat_1").get().to_dict() == {"updated": True}
+
+    def test_flush_times_out_while_a_commit_is_in_flight(self):
+        """Test that flush reports the writes that did not complete in time"""
+        db = FakeFirestore(latency_ms=200)
+        sink = MessageSink(db)
+
+        sink.add(_messages(db), {"i": 0})
+
+        assert not sink.flush(timeout=0.01)
+        assert sink.flush()
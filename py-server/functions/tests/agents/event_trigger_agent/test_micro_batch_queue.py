@@ -0,0 +1,143 @@
+# tests/agents/event_trigger_agent/test_micro_batch_queue.py
+import sys
+from datetime import datetime, timedelta, timezone
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from eval.benchmarks.fake_firestore import FakeFirestore
+from utils import micro_batch_queue
+from utils.micro_batch_queue import MicroBatchQueue
+
+
+def _queue(db, batch_size=2):
+    return MicroBatchQueue(
+        db,
+        collection="queue",
+        lease_path="queue_state/drain",
+        window_seconds=0,
+        batch_size=batch_size,
+    )
+
+
+def _enqueue(queue, count):
+    for i in range(count):
+        queue.enqueue(f"item_{i}", {"i": i})
+
+
+def _take_over_lease(db):
+    db.collection("queue_state").document("drain").set(
+        {"owner": "other", "expiresAt": datetime.now(timezone.utc) + timedelta(minutes=2)}
+    )
+
+
+class TestMicroBatchQueue:
+    """Test suite for the lease and the deadline of the micro-batch queue drain"""
+
+    def test_drain_processes_every_item_in_batches(self):
+        """Test that the holder processes the queue in batches and frees the lease"""
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db)
+        _enqueue(queue, 5)
+        batches = []
+
+        assert queue.drain(batches.append) == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert not db.collection("queue_state").document("drain").get().exists
+
+    def test_taken_over_lease_is_not_renewed_or_released(self):
+        """Test that a drainer whose lease was taken over stops and keeps the new lease"""
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db)
+        _enqueue(queue, 5)
+        batches = []
+
+        def process(items):
+            batches.append(items)
+            _take_over_lease(db)
+
+        assert queue.drain(process) == 2
+        assert len(batches) == 1
+        lease = db.collection("queue_state").document("drain").get()
+        assert lease.to_dict()["owner"] == "other"
+        assert len(queue.next_batch()) == 2
+
+    def test_release_checks_the_owner(self):
+        """Test that release only deletes the lease of its owner"""
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db)
+        _take_over_lease(db)
+
+        queue.release("me")
+
+        assert db.collection("queue_state").document("drain").get().exists
+
+    def test_deadline_leaves_the_rest_queued(self, monkeypatch):
+        """Test that no batch starts after the deadline and the rest waits for the next drain"""
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db)
+        _enqueue(queue, 5)
+        now = [0.0]
+        monkeypatch.setattr(micro_batch_queue.time, "monotonic", lambda: now[0])
+
+        def process(items):
+            now[0] += 10
+
+        assert queue.drain(process, deadline_seconds=15) == 4
+        assert len(queue.next_batch()) == 1
+        assert not db.collection("queue_state").document("drain").get().exists
+        assert queue.drain(process, deadline_seconds=15) == 1
+
+    def test_failed_items_stay_queued_until_max_attempts(self):
+        """Test that failed items are retried by the next drains, then dropped"""
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db, batch_size=10)
+        _enqueue(queue, 3)
+        seen = []
+
+        def process(items):
+            seen.append([item["i"] for item in items])
+            return [position for position, item in enumerate(items) if item["i"] == 1]
+
+        assert queue.drain(process) == 3
+        assert [doc.to_dict()["data"]["i"] for doc in queue.next_batch()] == [1]
+        assert queue.drain(process) == 1
+        assert queue.drain(process) == 1
+        assert seen == [[0, 1, 2], [1], [1]]
+        assert queue.next_batch() == []
+
+    def test_raising_batch_is_kept_for_the_next_drain(self):
+        """Test that a batch that raises is not deleted nor retried by the same drain"""
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db)
+        _enqueue(queue, 3)
+        calls = []
+
+        def process(items):
+            calls.append(len(items))
+            raise RuntimeError("model unavailable")
+
+        assert queue.drain(process) == 3
+        assert calls == [2, 1]
+        assert len(list(db.collection("queue").stream())) == 3
+
+    def test_failed_tweet_evaluation_is_retried(self):
+        """Test that a batch whose evaluation failed is checked again by the next drain"""
+        from agents.event_trigger_agent.event_trigger_agent import evaluation_completed
+
+        db = FakeFirestore(latency_ms=0)
+        queue = _queue(db, batch_size=10)
+        _enqueue(queue, 2)
+        results = ["An error occurred: model unavailable", "I've completed the task."]
+        checked = []
+
+        def check_queued_tweets(queued):
+            checked.append(len(queued))
+            if not evaluation_completed(results.pop(0)):
+                return range(len(queued))
+
+        assert queue.drain(check_queued_tweets) == 2
+        assert len(queue.next_batch()) == 2
+        assert queue.drain(check_queued_tweets) == 2
+        assert checked == [2, 2]
+        assert queue.next_batch() == []
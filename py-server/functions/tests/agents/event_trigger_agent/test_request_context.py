@@ -0,0 +1,71 @@
+# tests/agents/event_trigger_agent/test_request_context.py
+import contextvars
+import sys
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from utils import request_context
+from utils.request_context import RequestContextStore
+
+
+def _in_new_task(function, *args):
+    """Runs `function` with its own copy of the ContextVars, like a separate request."""
+    return contextvars.copy_context().run(function, *args)
+
+
+class TestRequestContextStore:
+    """Test suite for the bounds of the request context store and the end of a request"""
+
+    def test_least_recently_used_context_is_evicted(self):
+        """Test that the store keeps at most max_contexts, dropping the least recently used"""
+        store = RequestContextStore(max_contexts=2)
+        for chat_id in ("chat_1", "chat_2"):
+            _in_new_task(store.set, chat_id, "user_id", f"user_{chat_id}")
+        # chat_1 is used again, so chat_2 is the least recently used
+        assert _in_new_task(store.get, "chat_1", "user_id") == "user_chat_1"
+
+        _in_new_task(store.set, "chat_3", "user_id", "user_chat_3")
+
+        assert len(store) == 2
+        assert _in_new_task(store.get, "chat_2", "user_id") is None
+        assert _in_new_task(store.get, "chat_1", "user_id") == "user_chat_1"
+
+    def test_context_expires_after_ttl(self, monkeypatch):
+        """Test that a context unused for ttl_seconds is gone and an access refreshes it"""
+        now = [0.0]
+        monkeypatch.setattr(request_context.time, "monotonic", lambda: now[0])
+        store = RequestContextStore(ttl_seconds=10)
+        _in_new_task(store.set, "chat_1", "user_id", "alice")
+
+        now[0] = 8
+        assert _in_new_task(store.get, "chat_1", "user_id") == "alice"
+        now[0] = 16
+        assert _in_new_task(store.get, "chat_1", "user_id") == "alice"
+        now[0] = 27
+        assert _in_new_task(store.get, "chat_1", "user_id") is None
+        assert len(store) == 0
+
+    def test_end_keeps_the_context_of_a_newer_request(self):
+        """Test that a request ending after a newer one on the same chat leaves its context"""
+        store = RequestContextStore()
+        first = contextvars.copy_context()
+        first.run(store.start, "chat_1")
+        first.run(store.set, "chat_1", "user_id", "first")
+        _in_new_task(lambda: (store.start("chat_1"), store.set("chat_1", "user_id", "second")))
+
+        first.run(store.end, "chat_1")
+
+        assert len(store) == 1
+        assert _in_new_task(store.get, "chat_1", "user_id") == "second"
+
+    def test_end_drops_the_context_of_the_request(self):
+        """Test that ending the latest request of a chat removes its context"""
+        store = RequestContextStore()
+        request = contextvars.copy_context()
+        request.run(store.start, "chat_1")
+
+        request.run(store.end, "chat_1")
+
+        assert len(store) == 0
+        assert request.run(store.get, "chat_1", "session_id") is None
@@ -0,0 +1,95 @@
+# tests/agents/event_trigger_agent/test_tweet_dedup.py
+import sys
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from agents.event_trigger_agent.tweet_dedup import (
+    TweetDeduplicator,
+    normalize_tweet_text,
+    simhash,
+)
+
+HEADLINE = "BREAKING: Binance has been hacked, over $100M stolen from hot wallets"
+
+
+def test_normalize_tweet_text_drops_retweet_links_and_mentions():
+    text = f"RT @whale_alert: {HEADLINE} https://t.co/abc123 via @cryptonews #Binance 🚨"
+
+    assert normalize_tweet_text(text) == (
+        "breaking binance has been hacked over $100m stolen from hot wallets via binance"
+    )
+    assert normalize_tweet_text("BTC at 1.5x. Wow.") == "btc at 1.5x wow"
+
+
+def test_copies_of_a_tweet_are_suppressed():
+    deduplicator = TweetDeduplicator()
+
+    assert deduplicator.check("original", HEADLINE) is None
+    assert deduplicator.check("retweet", f"RT @whale_alert: {HEADLINE}") == "original"
+    assert deduplicator.check("link", f"{HEADLINE} https://t.co/xyz") == "original"
+    assert deduplicator.suppressed == 2
+    assert len(deduplicator) == 1
+
+
+def test_different_news_is_not_suppressed():
+    deduplicator = TweetDeduplicator()
+
+    deduplicator.check("original", HEADLINE)
+
+    assert deduplicator.check("other", HEADLINE.replace("Binance", "Kraken")) is None
+    assert deduplicator.check("fed", "Fed cuts interest rates by 50 basis points") is None
+    assert len(deduplicator) == 3
+
+
+def test_tweets_leave_the_window(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        "agents.event_trigger_agent.tweet_dedup.time.monotonic", lambda: now[0]
+    )
+    deduplicator = TweetDeduplicator(window_seconds=60)
+
+    deduplicator.check("original", HEADLINE)
+    now[0] += 61
+
+    assert deduplicator.check("later", HEADLINE) is None
+    assert len(deduplicator) == 1
+
+
+def test_simhash_is_stable():
+    assert simhash(HEADLINE) == simhash(HEADLINE.upper())
+    assert simhash("") == 0
+
+
+def test_unrecorded_tweet_does_not_suppress_its_copies():
+    deduplicator = TweetDeduplicator()
+
+    assert deduplicator.check("failed", HEADLINE, record=False) is None
+    assert deduplicator.check("retry", f"RT @whale_alert: {HEADLINE}", record=False) is None
+
+    deduplicator.record("evaluated", HEADLINE)
+
+    assert deduplicator.check("copy", f"{HEADLINE} https://t.co/xyz") == "evaluated"
+
+
+def test_new_pending_events_clear_the_window():
+    deduplicator = TweetDeduplicator()
+    deduplicator.track_events(["event_1"])
+    deduplicator.record("original", HEADLINE)
+
+    deduplicator.track_events(["event_1"])
+    assert deduplicator.check("copy", HEADLINE, record=False) == "original"
+
+    deduplicator.track_events(["event_1", "event_2"])
+    assert deduplicator.check("copy", HEADLINE) is None
+
+
+def test_tweets_without_words_are_not_deduplicated():
+    deduplicator = TweetDeduplicator()
+
+    deduplicator.record("1", "@binance https://t.co/abc")
+
+    assert deduplicator.check("2", "@cz_binance https://t.co/other", record=False) is None
+    assert deduplicator.check("3", "https://t.co/xyz") is None
+    assert deduplicator.check("4", "https://t.co/xyz") is None
+    assert len(deduplicator) == 0
@@ -0,0 +1,53 @@
+# tests/agents/info_extraction_agent/test_info_extraction_agent.py
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+import agents.info_extraction_agent as info_extraction_module
+from agents.info_extraction_agent import extract_information_batch
+
+
+def install_fake_extractor(monkeypatch, response):
+    class FakeExtractor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def on_messages(self, messages, cancellation_token):
+            if isinstance(response, Exception):
+                raise response
+            return SimpleNamespace(chat_message=SimpleNamespace(content=json.dumps(response)))
+
+    monkeypatch.setattr(info_extraction_module, "AssistantAgent", FakeExtractor)
+
+
+def _result(index, content):
+    return {"index": index, "items": [{"content": content, "type": "interaction"}]}
+
+
+@pytest.mark.asyncio
+async def test_batch_results_are_mapped_back_by_index(monkeypatch):
+    install_fake_extractor(
+        monkeypatch,
+        {"results": [_result(2, "Bridge USDC"), _result(0, "Swap SOL"), _result(7, "Out of range")]},
+    )
+
+    extracted = await extract_information_batch(["swap", "hello", "bridge"])
+
+    assert [[item.content for item in info.items] for info in extracted] == [
+        ["Swap SOL"],
+        [],
+        ["Bridge USDC"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_extraction_raises(monkeypatch):
+    install_fake_extractor(monkeypatch, RuntimeError("model unavailable"))
+
+    with pytest.raises(RuntimeError):
+        await extract_information_batch(["swap", "bridge"])
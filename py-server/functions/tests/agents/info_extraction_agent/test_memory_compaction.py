@@ -0,0 +1,79 @@
+# tests/agents/info_extraction_agent/test_memory_compaction.py
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from eval.benchmarks.fake_firestore import FakeFirestore
+from services.memory_compaction import MemoryCompactor
+
+NOW = datetime.now(timezone.utc)
+
+
+def _seed(db, doc_id, created_days_ago, last_updated_days_ago):
+    db.collection("memories").document(doc_id).set(
+        {
+            "user_id": "alice",
+            "content": doc_id,
+            "type": "user_preference",
+            "items": [],
+            "timestamp": NOW - timedelta(days=created_days_ago),
+            "last_updated": NOW - timedelta(days=last_updated_days_ago),
+            "similarity_count": 0,
+            "embedding_field": [1.0, 0.0, 0.0],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "duplicate_last_updated_days_ago, expected_days_ago", [(5, 0), (-1, -1)]
+)
+def test_merge_does_not_overwrite_a_newer_last_updated(
+    duplicate_last_updated_days_ago, expected_days_ago
+):
+    db = FakeFirestore(latency_ms=0)
+    _seed(db, "keeper", created_days_ago=10, last_updated_days_ago=1)
+    _seed(db, "duplicate", created_days_ago=5, last_updated_days_ago=duplicate_last_updated_days_ago)
+    compactor = MemoryCompactor(db)
+    commit = compactor._commit
+
+    def commit_after_a_new_repeat(writes):
+        # record_memory hits the keeper after the compactor read it
+        db.collection("memories").document("keeper").update({"last_updated": NOW})
+        commit(writes)
+
+    compactor._commit = commit_after_a_new_repeat
+
+    assert compactor.compact_user("alice")["merged"] == 1
+
+    keeper = db.collection("memories").document("keeper").get().to_dict()
+    assert keeper["last_updated"] == NOW - timedelta(days=expected_days_ago)
+    assert keeper["similarity_count"] == 1
+    assert not db.collection("memories").document("duplicate").get().exists
+
+
+def test_users_over_the_row_limit_are_skipped():
+    db = FakeFirestore(latency_ms=0)
+    for i in range(3):
+        _seed(db, f"memory_{i}", created_days_ago=3 - i, last_updated_days_ago=0)
+    compactor = MemoryCompactor(db, max_rows_per_user=2)
+
+    assert compactor.compact_user("alice") == {"too_large": 1}
+    assert len(list(db.collection("memories").stream())) == 3
+    assert not compactor._watermark_ref("alice").get().exists
+
+
+def test_load_writes_the_embeddings_into_one_matrix():
+    db = FakeFirestore(latency_ms=0)
+    for i in range(3):
+        _seed(db, f"memory_{i}", created_days_ago=3 - i, last_updated_days_ago=0)
+    db.collection("memories").document("memory_1").update({"embedding_field": None})
+
+    memories, matrix = MemoryCompactor(db)._load("alice", 3)
+
+    assert [memory["content"] for memory in memories] == ["memory_0", "memory_2"]
+    assert matrix.shape == (2, 3) and matrix.dtype == np.float32
@@ -0,0 +1,167 @@
+# tests/agents/info_extraction_agent/test_memory_service.py
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+from agents.info_extraction_agent import ExtractedInformation
+import services.memory_service as memory_service_module
+from services.memory_index import MemoryIndexCache, MemoryIndexTooLarge
+
+
+def _job(user_id, content):
+    return {"user_id": user_id, "content": content, "agent_response": "", "chat_id": "chat"}
+
+
+def _extracted(content):
+    return ExtractedInformation(items=[{"content": content, "type": "interaction"}])
+
+
+@pytest.mark.asyncio
+async def test_store_message_memories_returns_only_the_failed_jobs(monkeypatch):
+    async def extract(texts):
+        if "fails" in texts[0]:
+            raise RuntimeError("model unavailable")
+        return [_extracted(text) for text in texts]
+
+    async def embed(texts):
+        return [[0.0, 1.0] for _ in texts]
+
+    recorded = []
+
+    async def record_memory(**memory):
+        if memory["content"] == "write fails":
+            raise RuntimeError("deadline exceeded")
+        recorded.append(memory["content"])
+
+    monkeypatch.setattr(memory_service_module, "extract_information_batch", extract)
+    monkeypatch.setattr(memory_service_module, "create_embeddings", embed)
+    service = memory_service_module.MemoryService()
+    monkeypatch.setattr(service, "record_memory", record_memory)
+
+    failed = await service.store_message_memories(
+        [
+            _job("alice", "swap SOL"),
+            _job("bob", "fails to extract"),
+            _job("alice", "write fails"),
+            _job("bob", "bridge USDC"),
+            _job("carol", ""),
+        ]
+    )
+
+    assert failed == [1, 2, 3]
+    assert recorded == ["swap SOL"]
+
+
+class FakeMemoriesQuery:
+    def __init__(self, docs):
+        self.docs = docs
+        self.streamed = 0
+
+    def where(self, filter):
+        return self
+
+    def count(self):
+        return SimpleNamespace(get=lambda: [[SimpleNamespace(value=len(self.docs))]])
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    def stream(self):
+        for doc_id, data in self.docs:
+            self.streamed += 1
+            yield SimpleNamespace(id=doc_id, to_dict=lambda data=data: dict(data))
+
+
+def _memories_service(monkeypatch, docs):
+    query = FakeMemoriesQuery(docs)
+    monkeypatch.setattr(memory_service_module, "FieldFilter", lambda *args: args)
+    service = memory_service_module.MemoryService()
+    service.db = SimpleNamespace(collection=lambda name: query)
+    return service, query
+
+
+def _memory_doc(i, embedding=True):
+    data = {"user_id": "alice", "content": f"memory {i}"}
+    if embedding:
+        data["embedding_field"] = [float(i)] * memory_service_module.EMBEDDING_DIMENSIONS
+    return f"memory_{i}", data
+
+
+def test_memories_are_loaded_as_float32_rows(monkeypatch):
+    service, _ = _memories_service(
+        monkeypatch, [_memory_doc(1), _memory_doc(2, embedding=False), _memory_doc(3)]
+    )
+
+    memories, matrix = service._load_user_memories("alice", limit=10)
+
+    assert [memory["id"] for memory in memories] == ["memory_1", "memory_3"]
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (2, memory_service_module.EMBEDDING_DIMENSIONS)
+    assert matrix[1, 0] == 3.0
+
+
+def test_users_with_too_many_memories_are_counted_not_streamed(monkeypatch):
+    service, query = _memories_service(monkeypatch, [_memory_doc(i) for i in range(3)])
+    cache = MemoryIndexCache(max_bytes=2**30, max_rows_per_user=2, ttl_seconds=60)
+
+    with pytest.raises(MemoryIndexTooLarge):
+        cache.get("alice", service._load_user_memories)
+
+    assert query.streamed == 0
+    with pytest.raises(MemoryIndexTooLarge):
+        cache.get_loaded("alice")
+
+
+class FakeMemoryRef:
+    def __init__(self, db, doc_id):
+        self.db = db
+        self.id = doc_id
+
+    def update(self, data):
+        if self.id not in self.db.docs:
+            raise memory_service_module.NotFound(self.id)
+        self.db.docs[self.id].update(data)
+
+    def set(self, data):
+        self.db.docs[self.id] = data
+
+
+class FakeMemoriesDb:
+    def __init__(self):
+        self.docs = {}
+
+    def collection(self, name):
+        return self
+
+    def document(self, doc_id="new_memory"):
+        return FakeMemoryRef(self, doc_id)
+
+
+@pytest.mark.asyncio
+async def test_memory_merged_away_by_compaction_is_recorded_again(monkeypatch):
+    async def similar_memories(**kwargs):
+        # Still served by the index, deleted by the compaction job
+        return [{"id": "merged_memory", "distance": 0.1}]
+
+    service = memory_service_module.MemoryService()
+    service.db = FakeMemoriesDb()
+    monkeypatch.setattr(service, "get_similar_memories", similar_memories)
+    monkeypatch.setattr(memory_service_module.firestore, "Increment", lambda value: value, raising=False)
+    monkeypatch.setattr(memory_service_module.firestore, "SERVER_TIMESTAMP", "now", raising=False)
+
+    memory_id = await service.record_memory(
+        user_id="alice",
+        content="swap SOL",
+        agent_response="",
+        items=[],
+        embedding=[0.0, 1.0],
+    )
+
+    assert memory_id == "new_memory"
+    assert service.db.docs["new_memory"]["content"] == "swap SOL"
@@ -525,6 +525,33 @@ class TestGetTokenPrice:
         assert result == 100.50
         assert isinstance(result, float)
 
+
+class TestGetTokenPrices:
+    """Test suite for get_token_prices function"""
+
+    def setup_method(self):
+        """Setup method that runs before each test"""
+        from agents.liquidity_pool_agent.lp_specialist_functions import get_token_prices
+        self.get_token_prices = get_token_prices
+
+    def test_successful_get_token_prices(self, monkeypatch):
+        """Test batch token price retrieval"""
+        requested = []
+
+        def mock_get_prices(chain, addresses, provider):
+            requested.append((chain, list(addresses)))
+            return {address: {"price": "2.5"} for address in addresses}
+
+        monkeypatch.setattr('agents.liquidity_pool_agent.lp_specialist_functions.prices_service.get_token_prices_from_provider',
+                            mock_get_prices)
+
+        # Test the function
+        result = self.get_token_prices(["mintA", "mintB"])
+
+        # Verify the result
+        assert result == {"mintA": 2.5, "mintB": 2.5}
+        assert requested == [("SOLANA", ["mintA", "mintB"])]
+
 class TestGetAllActivePositionsOnMeteora:
     """Test suite for get_all_active_positions_on_meteora function"""
     
@@ -548,8 +575,8 @@ class TestGetAllActivePositionsOnMeteora:
                             lambda **kwargs: [mock_position])
         monkeypatch.setattr('agents.liquidity_pool_agent.lp_specialist_functions.get_jupiter_token_by_address', 
                             lambda token_address: mock_token_a_info if token_address == mock_token_a_info["address"] else mock_token_b_info)
-        monkeypatch.setattr('agents.liquidity_pool_agent.lp_specialist_functions.get_token_price', 
-                            lambda *args, **kwargs: 100.0 if args[0] == mock_token_a_info["address"] else 1.0)
+        monkeypatch.setattr('agents.liquidity_pool_agent.lp_specialist_functions.get_token_prices', 
+                            lambda addresses: {address: 100.0 if address == mock_token_a_info["address"] else 1.0 for address in addresses})
         
         # Test the function
         result = self.get_all_active_positions_on_meteora(
@@ -0,0 +1,102 @@
+# tests/agents/orbit_rag_agent/test_embeddings.py
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+
+def _embeddings_response(texts):
+    # deliberately out of order, the API returns an index per input
+    data = [
+        SimpleNamespace(index=i, embedding=[float(len(text)), float(i)])
+        for i, text in enumerate(texts)
+    ]
+    return SimpleNamespace(data=list(reversed(data)))
+
+
+class TestCreateEmbeddings:
+    """Test suite for the cached embeddings API used by the memory, similarity and RAG services"""
+
+    def setup_method(self):
+        import services.llm as llm
+        from services.embedding_cache import EmbeddingCache
+        self.llm = llm
+        self.cache = EmbeddingCache(max_entries=3)
+        self.create = AsyncMock(side_effect=lambda model, input: _embeddings_response(input))
+
+    def _patch(self, monkeypatch):
+        monkeypatch.setattr(self.llm, 'embedding_cache', self.cache)
+        monkeypatch.setattr(self.llm.openai_client.embeddings, 'create', self.create)
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_embedded_once(self, monkeypatch):
+        """Test that the same text only hits OpenAI once"""
+        self._patch(monkeypatch)
+
+        first = await self.llm.create_embedding("Will BTC hit 100k?")
+        second = await self.llm.create_embedding("Will BTC hit 100k?")
+
+        assert first == second
+        assert first is not second
+        assert self.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_only_misses_in_one_request(self, monkeypatch):
+        """Test that the batch API dedupes, keeps the input order and sends one request"""
+        self._patch(monkeypatch)
+        await self.llm.create_embedding("b")
+
+        embeddings = await self.llm.create_embeddings(["a", "b", "ccc", "a"])
+
+        assert embeddings[0] == embeddings[3]
+        assert [e[0] for e in embeddings] == [1.0, 1.0, 3.0, 1.0]
+        assert self.create.await_count == 2
+        assert self.create.await_args.kwargs["input"] == ["a", "ccc"]
+        assert self.cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self, monkeypatch):
+        """Test that the memory tier is bounded"""
+        self._patch(monkeypatch)
+        await self.llm.create_embeddings(["a", "b", "c"])
+        await self.llm.create_embedding("a")  # a is now the most recent
+        await self.llm.create_embedding("d")  # evicts b
+
+        self.create.reset_mock()
+        await self.llm.create_embeddings(["a", "c", "d"])
+        assert self.create.await_count == 0
+        await self.llm.create_embedding("b")
+        assert self.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_store_survives_a_new_instance(self, monkeypatch, tmp_path):
+        """Test that the persistent tier serves embeddings after a cold start"""
+        from services.embedding_cache import DiskEmbeddingStore, EmbeddingCache
+        self.cache = EmbeddingCache(store=DiskEmbeddingStore(str(tmp_path)))
+        self._patch(monkeypatch)
+        created = await self.llm.create_embeddings(["orbit", "tokenomics"])
+
+        # new instance, empty memory tier
+        self.cache = EmbeddingCache(store=DiskEmbeddingStore(str(tmp_path)))
+        self._patch(monkeypatch)
+        self.create.reset_mock()
+
+        assert await self.llm.create_embeddings(["tokenomics", "orbit"]) == created[::-1]
+        assert self.create.await_count == 0
+        assert self.cache.stats()["store_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_store_errors_fall_back_to_openai(self, monkeypatch):
+        """Test that a failing persistent tier never fails the embedding"""
+        from services.embedding_cache import EmbeddingCache
+        store = Mock()
+        store.get_many.side_effect = Exception("firestore down")
+        store.set_many.side_effect = Exception("firestore down")
+        self.cache = EmbeddingCache(store=store)
+        self._patch(monkeypatch)
+
+        assert await self.llm.create_embedding("abc") == [3.0, 0.0]
+        assert self.create.await_count == 1
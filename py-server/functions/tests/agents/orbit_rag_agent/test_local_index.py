@@ -0,0 +1,162 @@
+# tests/agents/orbit_rag_agent/test_local_index.py
+import sys
+import numpy as np
+import pytest
+
+# Add the current directory to Python path so we can import the modules
+sys.path.insert(0, '.')
+
+
+def _index(local_index, model="text-embedding-3-small", fingerprint=None):
+    return local_index.OrbitLocalIndex(
+        contents=["Orbit supports Solana", "ORBT total supply", "Q1 roadmap"],
+        sources=["supported_networks.txt", "tokenomics.txt", "roadmap.txt"],
+        embeddings=np.eye(3, 4),
+        model=model,
+        fingerprint=fingerprint or local_index.docs_fingerprint(local_index.doc_sources()),
+    )
+
+
+class TestOrbitLocalIndex:
+    """Test suite for the packaged in-process index of the Orbit docs"""
+
+    def setup_method(self):
+        from agents.orbit_rag_agent import local_index
+        self.local_index = local_index
+
+    def test_search_ranks_by_euclidean_distance(self):
+        """Test that the closest chunks come first and the limit is applied"""
+        index = _index(self.local_index)
+
+        assert index.search([0.1, 0.9, 0.2, 0.0], limit=2) == [
+            "ORBT total supply",
+            "Q1 roadmap",
+        ]
+        assert index.search([1.0, 0.0, 0.0, 0.0], limit=10)[0] == "Orbit supports Solana"
+
+    def test_save_and_load_round_trip(self, tmp_path, monkeypatch):
+        """Test that a saved index loads once and answers like the original"""
+        monkeypatch.setattr(self.local_index, "_local_indexes", {})
+        path = str(tmp_path / "orbit_docs.npz")
+        _index(self.local_index).save(path)
+
+        loaded = self.local_index.get_local_index("text-embedding-3-small", path=path)
+
+        assert loaded.contents[1] == "ORBT total supply"
+        assert loaded.search([0.0, 0.0, 1.0, 0.0], limit=1) == ["Q1 roadmap"]
+        assert self.local_index.get_local_index("text-embedding-3-small", path=path) is loaded
+
+    @pytest.mark.parametrize(
+        "model, fingerprint",
+        [("text-embedding-ada-002", None), ("text-embedding-3-small", "stale")],
+    )
+    def test_mismatched_index_is_ignored(self, tmp_path, monkeypatch, model, fingerprint):
+        """Test that an index of another model or of older docs falls back to Firestore"""
+        monkeypatch.setattr(self.local_index, "_local_indexes", {})
+        path = str(tmp_path / "orbit_docs.npz")
+        _index(self.local_index, model=model, fingerprint=fingerprint).save(path)
+
+        assert self.local_index.get_local_index("text-embedding-3-small", path=path) is None
+
+    def test_missing_index_is_ignored(self, tmp_path, monkeypatch):
+        """Test that no packaged file means no local index"""
+        monkeypatch.setattr(self.local_index, "_local_indexes", {})
+
+        assert self.local_index.get_local_index(
+            "text-embedding-3-small", path=str(tmp_path / "missing.npz")
+        ) is None
+
+
+class TestPlanReindex:
+    """Test suite for the incremental re-indexing plan of the Orbit docs"""
+
+    def setup_method(self):
+        from agents.orbit_rag_agent import local_index
+        self.local_index = local_index
+
+    def _write_docs(self, tmp_path, **docs):
+        paths = []
+        for name, text in docs.items():
+            path = tmp_path / f"{name}.txt"
+            path.write_text(text, encoding="utf-8")
+            paths.append(str(path))
+        return paths
+
+    def test_chunk_ids_are_deterministic(self, tmp_path):
+        """Test that the same docs give the same ids and another model gives other ids"""
+        sources = self._write_docs(tmp_path, orbit="Orbit is an agent. " * 30)
+
+        first = self.local_index.chunk_documents(sources, "text-embedding-3-small")
+        second = self.local_index.chunk_documents(sources, "text-embedding-3-small")
+        other_model = self.local_index.chunk_documents(sources, "text-embedding-3-large")
+
+        assert list(first) == list(second)
+        assert not set(first) & set(other_model)
+        assert first[next(iter(first))]["metadata"] == {
+            "source": "orbit.txt",
+            "category": "orbit",
+            "chunk_index": 0,
+        }
+
+    def test_unchanged_docs_need_no_embeddings(self, tmp_path):
+        """Test that re-indexing the same docs keeps every chunk"""
+        sources = self._write_docs(tmp_path, orbit="a" * 450, roadmap="b" * 150)
+        chunks = self.local_index.chunk_documents(sources, "model")
+
+        indexed = {key: dict(chunk) for key, chunk in chunks.items()}
+
+        plan = self.local_index.plan_reindex(chunks, indexed)
+
+        assert plan == {"added": [], "kept": list(chunks), "moved": [], "removed": []}
+
+    def test_edited_doc_only_reembeds_its_changed_chunks(self, tmp_path):
+        """Test that only the changed chunks are added and their old versions removed"""
+        sources = self._write_docs(
+            tmp_path, orbit="a" * 400 + "c" * 100, roadmap="b" * 150
+        )
+        before = self.local_index.chunk_documents(sources, "model")
+        (tmp_path / "orbit.txt").write_text("a" * 400 + "d" * 100, encoding="utf-8")
+        after = self.local_index.chunk_documents(sources, "model")
+
+        plan = self.local_index.plan_reindex(after, before)
+
+        assert [after[key]["content"] for key in plan["added"]] == ["d" * 100]
+        assert [before[key]["content"] for key in plan["removed"]] == ["c" * 100]
+        assert len(plan["kept"]) == 2
+
+    def test_orphans_and_moved_chunks(self, tmp_path):
+        """Test that chunks of deleted docs are removed and shifted chunks only move"""
+        sources = self._write_docs(tmp_path, orbit="x" * 200 + "y" * 200, token="z" * 50)
+        before = self.local_index.chunk_documents(sources, "model")
+        (tmp_path / "orbit.txt").write_text("y" * 200, encoding="utf-8")
+        after = self.local_index.chunk_documents(sources[:1], "model")
+
+        plan = self.local_index.plan_reindex(after, before)
+
+        assert plan["added"] == []
+        assert [after[key]["content"] for key in plan["moved"]] == ["y" * 200]
+        assert sorted(before[key]["content"] for key in plan["removed"]) == ["x" * 200, "z" * 50]
+
+
+class TestIndexDocuments:
+    """Test suite for the Orbit docs indexing script"""
+
+    def setup_method(self):
+        from agents.orbit_rag_agent import index_documents
+        self.index_documents = index_documents
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("build", ["index_documents", "build_local_index"])
+    async def test_missing_source_fails_before_any_work(self, tmp_path, monkeypatch, build):
+        """Test that a missing doc stops both builds instead of deleting its chunks"""
+        def no_work(*args, **kwargs):
+            raise AssertionError("work started")
+
+        monkeypatch.setattr(self.index_documents, "chunk_documents", no_work)
+        monkeypatch.setattr(self.index_documents.firestore, "client", no_work)
+        present = tmp_path / "orbit.txt"
+        present.write_text("Orbit", encoding="utf-8")
+        missing = str(tmp_path / "roadmap.txt")
+
+        with pytest.raises(FileNotFoundError, match="roadmap.txt"):
+            await getattr(self.index_documents, build)([str(present), missing])
@@ -148,7 +148,7 @@ class TestGetCryptocurrencyById:
         mock_response = Mock()
         mock_response.json.return_value = {"data": {"1": mock_crypto_metadata}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrency_by_id(1)
         
         # Verify the result
@@ -159,7 +159,7 @@ class TestGetCryptocurrencyById:
     def test_get_cryptocurrency_by_id_http_error(self, monkeypatch):
         """Test cryptocurrency retrieval with HTTP error"""
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=requests.exceptions.RequestException("API Error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=requests.exceptions.RequestException("API Error")):
             with pytest.raises(requests.exceptions.RequestException):
                 self.get_cryptocurrency_by_id(1)
 
@@ -184,7 +184,7 @@ class TestGetCryptocurrencyBySymbol:
         mock_quote_response = Mock()
         mock_quote_response.json.return_value = {"data": {"BTC": [{"quote": {"USD": mock_crypto_info["quote"]["USD"]}}]}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_info_response, mock_quote_response]
             
             result = self.get_cryptocurrency_by_symbol("BTC", mock_chat_id)
@@ -201,7 +201,7 @@ class TestGetCryptocurrencyBySymbol:
         monkeypatch.setattr('agents.researcher_agent.functions.coinmarketcap_functions.save_ui_message', lambda **kwargs: None)
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=Exception("Network error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=Exception("Network error")):
             result = self.get_cryptocurrency_by_symbol("BTC", mock_chat_id)
         
         # Verify the result
@@ -216,7 +216,7 @@ class TestGetCryptocurrencyBySymbol:
         mock_response = Mock()
         mock_response.json.return_value = {"data": {}}  # Missing expected keys
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrency_by_symbol("INVALID", mock_chat_id)
         
         # Verify the result
@@ -246,7 +246,7 @@ class TestGetHighestCryptocurrenciesGainers:
         mock_response.json.return_value = {"data": [mock_crypto_info, mock_crypto_info]}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_highest_cryptocurrencies_gainers()
         
         # Verify the result
@@ -261,7 +261,7 @@ class TestGetHighestCryptocurrenciesGainers:
         mock_response.json.return_value = {"data": [mock_crypto_info] * 5}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_highest_cryptocurrencies_gainers(time_frame="7d", num_results=5)
         
         # Verify the result
@@ -271,7 +271,7 @@ class TestGetHighestCryptocurrenciesGainers:
     def test_get_gainers_http_error(self, monkeypatch):
         """Test gainers retrieval with HTTP error"""
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_highest_cryptocurrencies_gainers()
         
         # Verify the result
@@ -281,7 +281,7 @@ class TestGetHighestCryptocurrenciesGainers:
     def test_get_gainers_general_exception(self, monkeypatch):
         """Test gainers retrieval with general exception"""
         # Mock the HTTP request to raise a general error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=Exception("General error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=Exception("General error")):
             result = self.get_highest_cryptocurrencies_gainers()
         
         # Verify the result
@@ -325,7 +325,7 @@ class TestGetCryptocurrenciesByTags:
         mock_response.json.return_value = {"data": [mock_crypto_with_tags]}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(
                 chat_id=mock_chat_id,
                 tags=["defi"],
@@ -353,7 +353,7 @@ class TestGetCryptocurrenciesByTags:
         mock_response.json.return_value = {"data": [mock_crypto_with_tags]}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(
                 chat_id=mock_chat_id,
                 tags=["defi"],
@@ -379,7 +379,7 @@ class TestGetCryptocurrenciesByTags:
         mock_response.json.return_value = {"data": [mock_crypto_no_match]}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(
                 chat_id=mock_chat_id,
                 tags=["defi"],
@@ -392,7 +392,7 @@ class TestGetCryptocurrenciesByTags:
     def test_get_by_tags_http_error(self, monkeypatch):
         """Test cryptocurrencies retrieval with HTTP error"""
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_cryptocurrencies_by_tags(
                 chat_id=mock_chat_id,
                 tags=["defi"],
@@ -421,7 +421,7 @@ class TestGetCryptocurrenciesByTags:
         mock_response.json.return_value = {"data": [mock_crypto_with_tags]}
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(
                 chat_id=mock_chat_id,
                 tags=["defi", "gaming"],
@@ -473,7 +473,7 @@ class TestGetComprehensiveMarketData:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": mock_historical_data}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -510,7 +510,7 @@ class TestGetComprehensiveMarketData:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": mock_historical_data}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -548,7 +548,7 @@ class TestGetComprehensiveMarketData:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": mock_historical_data}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -568,7 +568,7 @@ class TestGetComprehensiveMarketData:
         monkeypatch.setattr('agents.researcher_agent.functions.coinmarketcap_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = await self.get_comprehensive_market_data(
                 chat_id=mock_chat_id,
                 detailed_response=False,
@@ -585,7 +585,7 @@ class TestGetComprehensiveMarketData:
         monkeypatch.setattr('agents.researcher_agent.functions.coinmarketcap_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise a general error
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get', side_effect=Exception("General error")):
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get', side_effect=Exception("General error")):
             result = await self.get_comprehensive_market_data(
                 chat_id=mock_chat_id,
                 detailed_response=False,
@@ -618,7 +618,7 @@ class TestGetComprehensiveMarketData:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": []}}  # Empty historical data
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -684,7 +684,7 @@ class TestMarketSentimentAnalysis:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": mock_historical_data}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -732,7 +732,7 @@ class TestMarketSentimentAnalysis:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": mock_historical_data}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -773,7 +773,7 @@ class TestMarketSentimentAnalysis:
         mock_historical_response = Mock()
         mock_historical_response.json.return_value = {"data": {"quotes": mock_historical_data}}
         
-        with patch('agents.researcher_agent.functions.coinmarketcap_functions.requests.get') as mock_get:
+        with patch('agents.researcher_agent.functions.coinmarketcap_functions.http_session.get') as mock_get:
             mock_get.side_effect = [mock_global_response, mock_solana_response, mock_historical_response]
             
             result = await self.get_comprehensive_market_data(
@@ -184,7 +184,7 @@ class TestSearchFunction:
         mock_response = Mock()
         mock_response.json.return_value = mock_serper_response
         
-        with patch('agents.researcher_agent.functions.common_functions.requests.post', return_value=mock_response) as mock_post:
+        with patch('agents.researcher_agent.functions.common_functions.http_session.post', return_value=mock_response) as mock_post:
             result = self.search("bitcoin price", timeframe=None)
         
         # Verify the result
@@ -207,7 +207,7 @@ class TestSearchFunction:
         mock_response = Mock()
         mock_response.json.return_value = mock_serper_response
         
-        with patch('agents.researcher_agent.functions.common_functions.requests.post', return_value=mock_response) as mock_post:
+        with patch('agents.researcher_agent.functions.common_functions.http_session.post', return_value=mock_response) as mock_post:
             result = self.search("bitcoin price", timeframe="day")
         
         # Verify the result
@@ -224,7 +224,7 @@ class TestSearchFunction:
         mock_response = Mock()
         mock_response.json.return_value = mock_serper_response
         
-        with patch('agents.researcher_agent.functions.common_functions.requests.post', return_value=mock_response) as mock_post:
+        with patch('agents.researcher_agent.functions.common_functions.http_session.post', return_value=mock_response) as mock_post:
             result = self.search("bitcoin price", timeframe="invalid")
         
         # Verify the result
@@ -241,7 +241,7 @@ class TestSearchFunction:
         mock_response = Mock()
         mock_response.json.return_value = mock_serper_response
         
-        with patch('agents.researcher_agent.functions.common_functions.requests.post', return_value=mock_response) as mock_post:
+        with patch('agents.researcher_agent.functions.common_functions.http_session.post', return_value=mock_response) as mock_post:
             result = self.search("bitcoin price", timeframe="WEEK")
         
         # Verify payload includes correct tbs for uppercase timeframe
@@ -153,7 +153,7 @@ class TestGetTopProtocolsByChain:
         mock_response.json.return_value = mock_protocols_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_protocols_by_chain("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -174,7 +174,7 @@ class TestGetTopProtocolsByChain:
         mock_response.json.return_value = mock_protocols_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_protocols_by_chain("Ethereum", mock_chat_id, limit=2)
         
         # Verify the result
@@ -192,7 +192,7 @@ class TestGetTopProtocolsByChain:
         mock_response.json.return_value = mock_protocols_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_protocols_by_chain("NonExistentChain", mock_chat_id)
         
         # Verify the result
@@ -204,7 +204,7 @@ class TestGetTopProtocolsByChain:
         monkeypatch.setattr('agents.researcher_agent.functions.defi_llama_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_top_protocols_by_chain("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -216,7 +216,7 @@ class TestGetTopProtocolsByChain:
         monkeypatch.setattr('agents.researcher_agent.functions.defi_llama_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise a general error
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', side_effect=Exception("General error")):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', side_effect=Exception("General error")):
             result = self.get_top_protocols_by_chain("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -233,7 +233,7 @@ class TestGetTopProtocolsByChain:
         mock_response.json.return_value = mock_protocols_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_protocols_by_chain("ethereum", mock_chat_id)  # lowercase
         
         # Verify the result
@@ -251,7 +251,7 @@ class TestGetTopProtocolsByChain:
         mock_response.json.return_value = mock_protocols_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_protocols_by_chain("Ethereum", mock_chat_id, limit=15)  # More than 10
         
         # Verify the result - should be limited to available protocols (3 in this case)
@@ -277,7 +277,7 @@ class TestGetTopChainsByTvl:
         mock_response.json.return_value = mock_chains_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_chains_by_tvl(mock_chat_id)
         
         # Verify the result
@@ -295,7 +295,7 @@ class TestGetTopChainsByTvl:
         mock_response.json.return_value = mock_chains_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_chains_by_tvl(mock_chat_id, limit=3)
         
         # Verify the result
@@ -312,7 +312,7 @@ class TestGetTopChainsByTvl:
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_chains_by_tvl(mock_chat_id)
         
         # Verify the result
@@ -324,7 +324,7 @@ class TestGetTopChainsByTvl:
         monkeypatch.setattr('agents.researcher_agent.functions.defi_llama_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_top_chains_by_tvl(mock_chat_id)
         
         # Verify the result
@@ -340,7 +340,7 @@ class TestGetTopChainsByTvl:
         mock_response.json.return_value = mock_chains_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_chains_by_tvl(mock_chat_id, limit=15)  # More than 10
         
         # Verify the result - should mention the actual available chains (5 in this case)
@@ -367,7 +367,7 @@ class TestGetTopDexsByChain:
         mock_response.json.return_value = mock_dexs_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_dexs_by_chain("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -388,7 +388,7 @@ class TestGetTopDexsByChain:
         mock_response.json.return_value = mock_dexs_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_dexs_by_chain("Ethereum", mock_chat_id, limit=1)
         
         # Verify the result
@@ -407,7 +407,7 @@ class TestGetTopDexsByChain:
         mock_response.json.return_value = mock_dexs_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_dexs_by_chain("NonExistentChain", mock_chat_id)
         
         # Verify the result
@@ -419,7 +419,7 @@ class TestGetTopDexsByChain:
         monkeypatch.setattr('agents.researcher_agent.functions.defi_llama_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_top_dexs_by_chain("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -450,7 +450,7 @@ class TestGetTopDexsByChain:
         mock_response.json.return_value = mock_dexs_incomplete
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_dexs_by_chain("Ethereum", mock_chat_id)
         
         # Verify the result - should filter out protocols without total7d
@@ -467,7 +467,7 @@ class TestGetTopDexsByChain:
         mock_response.json.return_value = mock_dexs_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_dexs_by_chain("ethereum", mock_chat_id)  # lowercase
         
         # Verify the result
@@ -494,7 +494,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -516,7 +516,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("Ethereum", mock_chat_id, limit=2)
         
         # Verify the result
@@ -535,7 +535,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("NonExistentChain", mock_chat_id)
         
         # Verify the result
@@ -552,7 +552,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("Ethereum", mock_chat_id)
         
         # Verify the result - should not include "Low TVL Pool" (50k TVL)
@@ -587,7 +587,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_with_null
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("Ethereum", mock_chat_id)
         
         # Verify the result - should filter out pools with null APY
@@ -599,7 +599,7 @@ class TestGetTopYieldsPoolsByChain:
         monkeypatch.setattr('agents.researcher_agent.functions.defi_llama_functions.save_agent_thought', lambda **kwargs: None)
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_top_yields_pools("Ethereum", mock_chat_id)
         
         # Verify the result
@@ -616,7 +616,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("ethereum", mock_chat_id)  # lowercase
         
         # Verify the result
@@ -634,7 +634,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("Polygon", mock_chat_id)
         
         # Verify the result
@@ -654,7 +654,7 @@ class TestGetTopYieldsPoolsByChain:
         mock_response.json.return_value = mock_yields_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.defi_llama_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.defi_llama_functions.http_session.get', return_value=mock_response):
             result = self.get_top_yields_pools("Ethereum", mock_chat_id, limit=15)  # More than 10
         
         # Verify the result - should be limited to available pools (3 in this case)
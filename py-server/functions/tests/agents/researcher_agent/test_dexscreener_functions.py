@@ -210,7 +210,7 @@ class TestGetTokenInfo:
         mock_response = Mock()
         mock_response.json.return_value = mock_token_info_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', return_value=mock_response):
             result = self.get_token_info("So11111111111111111111111111111111111111112")
         
         # Verify the result
@@ -222,7 +222,7 @@ class TestGetTokenInfo:
     def test_get_token_info_exception(self):
         """Test token info retrieval with exception"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("Network error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("Network error")):
             result = self.get_token_info("invalid_address")
         
         # Verify the result
@@ -251,7 +251,7 @@ class TestGetDexscreenerLatestTokens:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_latest_tokens(mock_chat_id, use_frontend_quoting=True)
         
         # Verify the result
@@ -271,7 +271,7 @@ class TestGetDexscreenerLatestTokens:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_latest_tokens(mock_chat_id, use_frontend_quoting=False)
         
         # Verify the result
@@ -315,7 +315,7 @@ class TestGetDexscreenerLatestTokens:
                     mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_latest_tokens(mock_chat_id, use_frontend_quoting=False)
         
         # Verify the result - should only include the successful token
@@ -326,7 +326,7 @@ class TestGetDexscreenerLatestTokens:
     def test_get_latest_tokens_api_error(self):
         """Test latest tokens retrieval with API error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.get_dexscreener_latest_tokens(mock_chat_id)
         
         # Verify the result
@@ -396,7 +396,7 @@ class TestGetDexscreenerLatestBoostedTokens:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_latest_boosted_tokens(mock_chat_id, use_frontend_quoting=True)
         
         # Verify the result
@@ -414,7 +414,7 @@ class TestGetDexscreenerLatestBoostedTokens:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_latest_boosted_tokens(mock_chat_id, use_frontend_quoting=False)
         
         # Verify the result
@@ -442,7 +442,7 @@ class TestGetDexscreenerLatestBoostedTokens:
     def test_get_latest_boosted_tokens_api_error(self):
         """Test latest boosted tokens retrieval with API error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.get_dexscreener_latest_boosted_tokens(mock_chat_id)
         
         # Verify the result
@@ -473,7 +473,7 @@ class TestGetDexscreenerMostBoostedTokens:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_most_boosted_tokens(mock_chat_id, use_frontend_quoting=True)
         
         # Verify the result
@@ -491,7 +491,7 @@ class TestGetDexscreenerMostBoostedTokens:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_most_boosted_tokens(mock_chat_id, use_frontend_quoting=False)
         
         # Verify the result
@@ -517,7 +517,7 @@ class TestGetDexscreenerMostBoostedTokens:
     def test_get_most_boosted_tokens_api_error(self):
         """Test most boosted tokens retrieval with API error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.get_dexscreener_most_boosted_tokens(mock_chat_id)
         
         # Verify the result
@@ -550,7 +550,7 @@ class TestGetDexscreenerTokenPairInfo:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_token_pair_info(mock_chat_id, "TEST", "SOL")
         
         # Verify the result
@@ -599,7 +599,7 @@ class TestGetDexscreenerTokenPairInfo:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_token_pair_info(mock_chat_id, "SOL", "TEST")
         
         # Verify the result - should find the reverse match
@@ -622,7 +622,7 @@ class TestGetDexscreenerTokenPairInfo:
                 mock_response.json.return_value = {"pairs": []}
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_token_pair_info(mock_chat_id, "NONEXISTENT", "TOKEN")
         
         # Verify the result
@@ -635,7 +635,7 @@ class TestGetDexscreenerTokenPairInfo:
         monkeypatch.setattr('agents.researcher_agent.functions.dexscreener_functions.get_all_native_tokens', lambda: ["SOL", "ETH", "BTC"])
         
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.get_dexscreener_token_pair_info(mock_chat_id, "TEST", "SOL")
         
         # Verify the result
@@ -666,7 +666,7 @@ class TestGetDexscreenerTokenPairInfoByChainAndTokenAddress:
                 mock_response.json.return_value = mock_token_info_response
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_token_pair_info_by_chain_and_token_address(
                 mock_chat_id, "solana", "So11111111111111111111111111111111111111112"
             )
@@ -709,7 +709,7 @@ class TestGetDexscreenerTokenPairInfoByChainAndTokenAddress:
             mock_response.json.return_value = []
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_token_pair_info_by_chain_and_token_address(
                 mock_chat_id, "solana", "invalid_address"
             )
@@ -735,7 +735,7 @@ class TestGetDexscreenerTokenPairInfoByChainAndTokenAddress:
                 mock_response.json.return_value = pairs_without_market_cap
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             result = self.get_dexscreener_token_pair_info_by_chain_and_token_address(
                 mock_chat_id, "solana", "test_address"
             )
@@ -755,7 +755,7 @@ class TestGetDexscreenerTokenPairInfoByChainAndTokenAddress:
                 return None
             return mock_response
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=mock_get):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=mock_get):
             # Mock get_token_info to return None
             with patch('agents.researcher_agent.functions.dexscreener_functions.get_token_info', return_value=None):
                 result = self.get_dexscreener_token_pair_info_by_chain_and_token_address(
@@ -769,7 +769,7 @@ class TestGetDexscreenerTokenPairInfoByChainAndTokenAddress:
     def test_get_token_pair_info_by_chain_and_address_api_error(self):
         """Test token pair info retrieval with API error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.get_dexscreener_token_pair_info_by_chain_and_token_address(
                 mock_chat_id, "solana", "test_address"
             )
@@ -917,7 +917,7 @@ class TestIsPossibleRug:
         mock_response.json.return_value = mock_rugcheck_response  # score: 1500
         mock_response.raise_for_status = Mock()
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', return_value=mock_response):
             result = self.is_possible_rug("So11111111111111111111111111111111111111112")
         
         # Verify the result
@@ -930,7 +930,7 @@ class TestIsPossibleRug:
         mock_response.json.return_value = mock_rugcheck_safe_response  # score: 500
         mock_response.raise_for_status = Mock()
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', return_value=mock_response):
             result = self.is_possible_rug("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
         
         # Verify the result
@@ -943,7 +943,7 @@ class TestIsPossibleRug:
         mock_response.json.return_value = {}  # No score field
         mock_response.raise_for_status = Mock()
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', return_value=mock_response):
             result = self.is_possible_rug("test_address")
         
         # Verify the result
@@ -952,7 +952,7 @@ class TestIsPossibleRug:
     def test_is_possible_rug_api_error(self):
         """Test rug check with API error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.is_possible_rug("test_address")
         
         # Verify the result
@@ -964,7 +964,7 @@ class TestIsPossibleRug:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
         
-        with patch('agents.researcher_agent.functions.dexscreener_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.dexscreener_functions.http_session.get', return_value=mock_response):
             result = self.is_possible_rug("invalid_address")
         
         # Verify the result
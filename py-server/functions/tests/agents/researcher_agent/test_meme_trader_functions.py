@@ -177,7 +177,7 @@ class TestGetCryptocurrenciesByTagsMeme:
         mock_response = Mock()
         mock_response.json.return_value = mock_coinmarketcap_response
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags()
         
         # Verify the result
@@ -206,7 +206,7 @@ class TestGetCryptocurrenciesByTagsMeme:
         mock_response = Mock()
         mock_response.json.return_value = mock_coinmarketcap_response
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(tags=["memes"])  # Only memes tag
         
         # Verify the result - should include all tokens with "memes" tag
@@ -219,7 +219,7 @@ class TestGetCryptocurrenciesByTagsMeme:
         mock_response = Mock()
         mock_response.json.return_value = mock_coinmarketcap_response
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(
                 tags=["memes", "solana-ecosystem"],
                 sort_by="volume_24h",
@@ -240,7 +240,7 @@ class TestGetCryptocurrenciesByTagsMeme:
         mock_response = Mock()
         mock_response.json.return_value = mock_coinmarketcap_response
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(
                 tags=["memes", "solana-ecosystem"],
                 num_results=10  # Request more than available valid tokens
@@ -260,7 +260,7 @@ class TestGetCryptocurrenciesByTagsMeme:
         mock_response = Mock()
         mock_response.json.return_value = mock_coinmarketcap_response
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_cryptocurrencies_by_tags(tags=["nonexistent-tag"])
         
         # Verify the result
@@ -270,7 +270,7 @@ class TestGetCryptocurrenciesByTagsMeme:
     def test_get_cryptocurrencies_http_error(self, monkeypatch):
         """Test cryptocurrencies retrieval with HTTP error"""
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             with pytest.raises(requests.exceptions.HTTPError):
                 self.get_cryptocurrencies_by_tags()
 
@@ -448,7 +448,7 @@ class TestGet24hPricesHistory:
         mock_response = Mock()
         mock_response.json.return_value = mock_historical_prices_response
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_24h_prices_history(1)
         
         # Verify the result
@@ -471,7 +471,7 @@ class TestGet24hPricesHistory:
         mock_response = Mock()
         mock_response.json.return_value = {"data": {}}
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_24h_prices_history(999)  # Non-existent token ID
         
         # Verify the result
@@ -484,7 +484,7 @@ class TestGet24hPricesHistory:
         mock_response = Mock()
         mock_response.json.return_value = {"data": {"1": {"quotes": []}}}
         
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', return_value=mock_response):
             result = self.get_24h_prices_history(1)
         
         # Verify the result
@@ -494,7 +494,7 @@ class TestGet24hPricesHistory:
     def test_get_prices_history_exception(self, monkeypatch):
         """Test price history retrieval with exception"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.researcher_agent.functions.meme_trader_functions.requests.get', side_effect=Exception("Network error")):
+        with patch('agents.researcher_agent.functions.meme_trader_functions.http_session.get', side_effect=Exception("Network error")):
             result = self.get_24h_prices_history(1)
         
         # Verify the result
@@ -212,7 +212,7 @@ class TestSearch:
         mock_response = Mock()
         mock_response.text = '{"organic": [{"title": "Test Result"}]}'
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.request', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.request', return_value=mock_response):
             result = self.search("bitcoin price")
         
         # Verify the result
@@ -226,7 +226,7 @@ class TestSearch:
         mock_response = Mock()
         mock_response.text = 'invalid json'
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.request', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.request', return_value=mock_response):
             with pytest.raises(Exception):  # Should raise JSON decode error
                 self.search("bitcoin price")
 
@@ -299,7 +299,7 @@ class TestGetPortfolioHistory:
         mock_response.json.return_value = mock_portfolio_data
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.post', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.post', return_value=mock_response):
             result = self.get_portfolio_history(mock_chat_id)
         
         # Verify the result
@@ -345,7 +345,7 @@ class TestGetPortfolioHistory:
                             lambda user_id: "fake-token")
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.post', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.post', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.get_portfolio_history(mock_chat_id)
         
         # Verify the result
@@ -366,7 +366,7 @@ class TestGetPortfolioHistory:
         mock_response.json.return_value = None
         mock_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.post', return_value=mock_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.post', return_value=mock_response):
             result = self.get_portfolio_history(mock_chat_id)
         
         # Verify the result
@@ -558,7 +558,7 @@ class TestAnalyzePortfolioHistory:
         mock_balances_response.json.return_value = mock_balances_data
         mock_balances_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.get', return_value=mock_balances_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.get', return_value=mock_balances_response):
             result = self.analyze_portfolio_history(mock_chat_id)
         
         # Verify the result
@@ -606,7 +606,7 @@ class TestAnalyzePortfolioHistory:
         mock_balances_response.json.return_value = mock_balances_data
         mock_balances_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.get', return_value=mock_balances_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.get', return_value=mock_balances_response):
             result = self.analyze_portfolio_history(mock_chat_id, detailed=True)
         
         # Verify the result
@@ -625,7 +625,7 @@ class TestAnalyzePortfolioHistory:
                             lambda user_id: "fake-token")
         
         # Mock the HTTP request to raise an error
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.get', side_effect=requests.exceptions.HTTPError("API Error")):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.get', side_effect=requests.exceptions.HTTPError("API Error")):
             result = self.analyze_portfolio_history(mock_chat_id)
         
         # Verify the result
@@ -646,7 +646,7 @@ class TestAnalyzePortfolioHistory:
         mock_balances_response.json.return_value = {}
         mock_balances_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.get', return_value=mock_balances_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.get', return_value=mock_balances_response):
             result = self.analyze_portfolio_history(mock_chat_id)
         
         # Verify the result - function returns error dict, not string
@@ -678,7 +678,7 @@ class TestAnalyzePortfolioHistory:
         mock_balances_response.json.return_value = mock_balances_data
         mock_balances_response.raise_for_status.return_value = None
         
-        with patch('agents.researcher_agent.functions.researcher_functions.requests.get', return_value=mock_balances_response):
+        with patch('agents.researcher_agent.functions.researcher_functions.http_session.get', return_value=mock_balances_response):
             result = self.analyze_portfolio_history(mock_chat_id)
         
         # Verify the result includes risk warning
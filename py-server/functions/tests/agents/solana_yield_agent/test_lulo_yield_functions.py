@@ -152,7 +152,7 @@ class TestLuloYieldFunctions:
         mock_response.status_code = 200
         mock_response.json.return_value = mock_account_info_response
         
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', return_value=mock_response):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', return_value=mock_response):
             result = self.fetch_account_info(mock_wallet_address, mock_chat_id)
         
         # Verify the result
@@ -165,7 +165,7 @@ class TestLuloYieldFunctions:
         mock_response.status_code = 404
         mock_response.json.return_value = {"message": "Account not found"}
         
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', return_value=mock_response):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', return_value=mock_response):
             result = self.fetch_account_info(mock_wallet_address, mock_chat_id)
         
         # Verify the error message
@@ -175,7 +175,7 @@ class TestLuloYieldFunctions:
     def test_fetch_account_info_network_error(self, monkeypatch):
         """Test account info fetching with network error"""
         # Mock the HTTP request to raise network error
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', side_effect=requests.exceptions.HTTPError("Network Error")):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', side_effect=requests.exceptions.HTTPError("Network Error")):
             result = self.fetch_account_info(mock_wallet_address, mock_chat_id)
 
         # Verify the error message
@@ -245,7 +245,7 @@ class TestLuloYieldFunctions:
         mock_response = Mock()
         mock_response.json.return_value = {"estimate": "route_data"}
         
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', return_value=mock_response):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', return_value=mock_response):
             result = self.get_route_estimate(1000, "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v", mock_wallet_address)
         
         # Verify the result
@@ -254,7 +254,7 @@ class TestLuloYieldFunctions:
     def test_get_route_estimate_error(self, monkeypatch):
         """Test route estimate with error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.get_route_estimate(1000, "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v", mock_wallet_address)
         
         # Verify the error message
@@ -266,7 +266,7 @@ class TestLuloYieldFunctions:
         mock_response = Mock()
         mock_response.json.return_value = {"accountExists": True}
         
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', return_value=mock_response):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', return_value=mock_response):
             result = self.is_account_created(mock_wallet_address)
         
         # Verify the result
@@ -278,7 +278,7 @@ class TestLuloYieldFunctions:
         mock_response = Mock()
         mock_response.json.return_value = {"accountExists": False}
         
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', return_value=mock_response):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', return_value=mock_response):
             result = self.is_account_created(mock_wallet_address)
         
         # Verify the result
@@ -287,7 +287,7 @@ class TestLuloYieldFunctions:
     def test_is_account_created_error(self, monkeypatch):
         """Test account creation check with error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.is_account_created(mock_wallet_address)
         
         # Verify the result
@@ -465,7 +465,7 @@ class TestLuloYieldFunctions:
         mock_response.raise_for_status.return_value = None
         mock_response.json.return_value = {"rates": {"token1": {"protocol1": {"rate": 8.5}}}}
         
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', return_value=mock_response):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', return_value=mock_response):
             result = self.fetch_protocol_rates_raw()
         
         # Verify the result
@@ -474,7 +474,7 @@ class TestLuloYieldFunctions:
     def test_fetch_protocol_rates_raw_error(self, monkeypatch):
         """Test protocol rates fetching with error"""
         # Mock the HTTP request to raise an exception
-        with patch('agents.solana_yield_agent.lulo_yield_functions.requests.get', side_effect=Exception("API Error")):
+        with patch('agents.solana_yield_agent.lulo_yield_functions.http_session.get', side_effect=Exception("API Error")):
             result = self.fetch_protocol_rates_raw()
         
         # Verify the result
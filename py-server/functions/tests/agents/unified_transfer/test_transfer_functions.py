@@ -122,7 +122,7 @@ class TestTransferFunctions:
         with patch('agents.unified_transfer.transfer_functions.is_evm') as mock_is_evm, \
              patch('agents.unified_transfer.transfer_functions.save_agent_thought') as mock_save_thought, \
              patch('agents.unified_transfer.transfer_functions.call_chains_service') as mock_chains, \
-             patch('agents.unified_transfer.transfer_functions.requests.post') as mock_post:
+             patch('agents.unified_transfer.transfer_functions.http_session.post') as mock_post:
             
             mock_is_evm.return_value = True
             mock_chains.side_effect = ["137", True]  # chain_id, isEvm
@@ -217,7 +217,7 @@ class TestTransferFunctions:
         with patch('agents.unified_transfer.transfer_functions.is_evm') as mock_is_evm, \
              patch('agents.unified_transfer.transfer_functions.save_agent_thought') as mock_save_thought, \
              patch('agents.unified_transfer.transfer_functions.call_chains_service') as mock_chains, \
-             patch('agents.unified_transfer.transfer_functions.requests.post') as mock_post:
+             patch('agents.unified_transfer.transfer_functions.http_session.post') as mock_post:
             
             mock_is_evm.return_value = True
             mock_chains.side_effect = ["137", True]
@@ -348,7 +348,7 @@ class TestTransferFunctions:
 
     def test_handle_create_solana_transfer_success(self, mock_context):
         """Test successful Solana transfer creation"""
-        with patch('agents.unified_transfer.transfer_functions.requests.post') as mock_post:
+        with patch('agents.unified_transfer.transfer_functions.http_session.post') as mock_post:
             
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {"success": True}
@@ -365,7 +365,7 @@ class TestTransferFunctions:
 
     def test_handle_create_solana_transfer_only_transaction(self, mock_context):
         """Test Solana transfer creation returning only transaction"""
-        with patch('agents.unified_transfer.transfer_functions.requests.post') as mock_post:
+        with patch('agents.unified_transfer.transfer_functions.http_session.post') as mock_post:
             
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {"transaction": "tx_data"}
@@ -382,7 +382,7 @@ class TestTransferFunctions:
 
     def test_handle_create_solana_transfer_http_error(self, mock_context):
         """Test Solana transfer creation with HTTP error"""
-        with patch('agents.unified_transfer.transfer_functions.requests.post') as mock_post:
+        with patch('agents.unified_transfer.transfer_functions.http_session.post') as mock_post:
             
             mock_post.return_value.status_code = 500
             mock_post.return_value.raise_for_status.side_effect = Exception("HTTP Error")
@@ -440,7 +440,7 @@ class TestTransferFunctions:
         """Test successful bridge and transfer creation"""
         with patch('agents.unified_transfer.transfer_functions.call_chains_service') as mock_chains, \
              patch('agents.unified_transfer.transfer_functions.tokens_service.get_token_metadata') as mock_token, \
-             patch('agents.unified_transfer.transfer_functions.requests.get') as mock_get, \
+             patch('agents.unified_transfer.transfer_functions.http_session.get') as mock_get, \
              patch('agents.unified_transfer.transfer_functions.call_evm_blockchains_service') as mock_evm, \
              patch('agents.unified_transfer.transfer_functions.create_evm_transfer') as mock_create_evm:
             
@@ -473,7 +473,7 @@ class TestTransferFunctions:
         """Test bridge and transfer creation with no route found"""
         with patch('agents.unified_transfer.transfer_functions.call_chains_service') as mock_chains, \
              patch('agents.unified_transfer.transfer_functions.tokens_service.get_token_metadata') as mock_token, \
-             patch('agents.unified_transfer.transfer_functions.requests.get') as mock_get:
+             patch('agents.unified_transfer.transfer_functions.http_session.get') as mock_get:
             
             mock_chains.side_effect = ["137", "139981115"]
             mock_token.side_effect = [mock_token_info, mock_solana_token_info]
@@ -517,7 +517,7 @@ class TestTransferFunctions:
         """Test bridge and transfer creation requiring allowance"""
         with patch('agents.unified_transfer.transfer_functions.call_chains_service') as mock_chains, \
              patch('agents.unified_transfer.transfer_functions.tokens_service.get_token_metadata') as mock_token, \
-             patch('agents.unified_transfer.transfer_functions.requests.get') as mock_get, \
+             patch('agents.unified_transfer.transfer_functions.http_session.get') as mock_get, \
              patch('agents.unified_transfer.transfer_functions.call_evm_blockchains_service') as mock_evm, \
              patch('agents.unified_transfer.transfer_functions.create_evm_transfer') as mock_create_evm:
             
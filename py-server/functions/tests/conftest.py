@@ -56,11 +56,21 @@ def _install_fake_google_cloud():
     fake_api_core.gapic_v1 = types.ModuleType("google.api_core.gapic_v1")
     fake_api_core.retry = types.ModuleType("google.api_core.retry")
     fake_api_core.retry.retry_base = types.ModuleType("google.api_core.retry.retry_base")
+    fake_api_core.exceptions = types.ModuleType("google.api_core.exceptions")
+    fake_api_core.exceptions.NotFound = type("NotFound", (Exception,), {})
     
     # Mock google.cloud.firestore
     fake_firestore = types.ModuleType("google.cloud.firestore_v1")
     fake_firestore.base_query = types.ModuleType("google.cloud.firestore_v1.base_query")
     fake_firestore.base_query.FieldFilter = object()
+    fake_firestore.SERVER_TIMESTAMP = object()
+    fake_firestore.Increment = type(
+        "Increment", (), {"__init__": lambda self, value: setattr(self, "value", value)}
+    )
+    fake_firestore.base_vector_query = types.ModuleType("google.cloud.firestore_v1.base_vector_query")
+    fake_firestore.base_vector_query.DistanceMeasure = types.ModuleType("DistanceMeasure")
+    fake_firestore.vector = types.ModuleType("google.cloud.firestore_v1.vector")
+    fake_firestore.vector.Vector = list
     
     # Mock opentelemetry
     fake_opentelemetry = types.ModuleType("opentelemetry")
@@ -84,8 +94,11 @@ def _install_fake_google_cloud():
     sys.modules.setdefault('google.api_core.gapic_v1', fake_api_core.gapic_v1)
     sys.modules.setdefault('google.api_core.retry', fake_api_core.retry)
     sys.modules.setdefault('google.api_core.retry.retry_base', fake_api_core.retry.retry_base)
+    sys.modules.setdefault('google.api_core.exceptions', fake_api_core.exceptions)
     sys.modules.setdefault('google.cloud.firestore_v1', fake_firestore)
     sys.modules.setdefault('google.cloud.firestore_v1.base_query', fake_firestore.base_query)
+    sys.modules.setdefault('google.cloud.firestore_v1.base_vector_query', fake_firestore.base_vector_query)
+    sys.modules.setdefault('google.cloud.firestore_v1.vector', fake_firestore.vector)
     sys.modules.setdefault('opentelemetry.exporter.cloud_trace', fake_cloud_trace)
 
 def _install_fake_services():
@@ -123,11 +136,13 @@ def _install_fake_services():
             return None
     fake_firebase.get_request_ctx = mock_get_request_ctx
     fake_firebase.set_request_ctx = lambda *a, **k: None
+    fake_firebase.append_request_ctx = lambda *a, **k: []
     fake_firebase.save_ui_message = lambda *a, **k: None
     fake_firebase.save_agent_thought = lambda *a, **k: None
     fake_firebase.db_save_pool_address_for_wallet = lambda *a, **k: None
     fake_firebase.generate_firebase_id_token = lambda *a, **k: "fake-token"
     fake_firebase.get_cached_tweets = lambda *a, **k: []
+    fake_firebase.invalidate_tweet_based_event = lambda *a, **k: None
     fake_firebase.db_get_user_open_pools = lambda *a, **k: ["pool123", "pool456"]
     fake_firebase.get_top_traders_wallets = lambda *a, **k: ['wallet1', 'wallet2', 'wallet3', 'wallet4', 'wallet5']
     fake_firebase.get_enso_supported_chains_and_protocols = lambda *a, **k: {
@@ -135,6 +150,9 @@ def _install_fake_services():
             "protocols": ["aave-v3", "morpho-blue-vaults"]
         }
     }
+    fake_firebase.find_enso_supported_protocols = lambda slug, *a, **k: [
+        protocol for protocol in ["aave-v3", "morpho-blue-vaults"] if slug.lower() in protocol
+    ]
     fake_firebase.get_enso_supported_tokens = lambda *a, **k: [
         {
                 "apy": 5.2,
@@ -156,6 +174,8 @@ def _install_fake_services():
             }
     ]
     fake_firebase.db = object()  # Mock the db object
+    fake_firebase.message_sink = types.ModuleType("message_sink")
+    fake_firebase.message_sink.set = lambda *a, **k: None
     
     # Mock config
     fake_config = types.ModuleType("config")
@@ -163,6 +183,13 @@ def _install_fake_services():
     fake_config.SOL_VALIDATORS_API_KEY = "fake-api-key-12345"
     fake_config.LULO_API_KEY = "fake-lulo-api-key-67890"
     fake_config.OPENAI_API_KEY = "fake-openai-api-key"
+    fake_config.EMBEDDING_CACHE_COLLECTION = ""
+    fake_config.EMBEDDING_CACHE_DIR = ""
+    fake_config.ANALYTICS_GLOBAL_SHARDS = 0
+    fake_config.EVENT_TRIGGER_MAX_CONCURRENCY = 4
+    fake_config.MEMORY_INDEX_MAX_MB = 32
+    fake_config.MEMORY_INDEX_MAX_ROWS_PER_USER = 2000
+    fake_config.MEMORY_INDEX_TTL_SEC = 600
     fake_config.MORALIS_API_KEY = "fake-moralis-api-key"
     fake_config.COINMARKETCAP_API_KEY = "fake-coinmarketcap-api-key"
     fake_config.SERPER_API_KEY = "fake-serper-api-key"
@@ -177,6 +204,9 @@ def _install_fake_services():
     fake_tokens = types.ModuleType("services.tokens")
     fake_tokens.tokens_service = types.ModuleType("tokens_service")
     fake_tokens.tokens_service.get_token_metadata = lambda *a, **k: None
+    async def fake_get_token_metadata_async(*a, **k):
+        return None
+    fake_tokens.tokens_service.get_token_metadata_async = fake_get_token_metadata_async
     
     # Mock services.transactions
     fake_transactions = types.ModuleType("services.transactions")
@@ -324,6 +354,12 @@ def _install_fake_services():
     # Mock services.prices
     fake_prices = types.ModuleType("services.prices")
     fake_prices.get_token_price_from_provider = lambda *a, **k: {"price": "100.0"}
+    fake_prices.get_token_prices_from_provider = lambda chain, addresses, provider: {
+        address: {"price": "100.0"} for address in addresses
+    }
+    async def fake_get_token_price_from_provider_async(*a, **k):
+        return {"price": "100.0"}
+    fake_prices.get_token_price_from_provider_async = fake_get_token_price_from_provider_async
     fake_prices.PriceProviderType = types.ModuleType("PriceProviderType")
     fake_prices.PriceProviderType.LIFI = "LIFI"
     fake_prices.PriceProviderType.JUPITER = "JUPITER"
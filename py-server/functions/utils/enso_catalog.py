@@ -0,0 +1,258 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+# Enso APYs are refreshed upstream on a schedule, a few minutes of staleness is fine
+DEFAULT_TTL_SECONDS = 10 * 60
+
+
+def transform_enso_token(token_data: dict, chain_name: Optional[str] = None) -> dict:
+    """Maps an enso_supported_tokens document to the format used by the Enso agent."""
+    chain_id_str = str(token_data.get("chainId"))
+    return {
+        "apy": token_data.get("apy", 0),
+        "tvl": token_data.get("tvl", 0),
+        "underlyingTokens": token_data.get("underlyingTokens", []),
+        "project": token_data.get("project", ""),
+        "token": {
+            "chainId": token_data.get("chainId"),
+            "chain": token_data.get("chain", ""),
+            "name": token_data.get("name", ""),
+            "symbol": token_data.get("symbol", ""),
+            "decimals": token_data.get("decimals", 18),
+            "address": token_data.get("address", ""),
+            "logo_uri": token_data.get("logoURI", ""),
+        },
+        "chain_id": chain_id_str,
+        "chain_name": chain_name or chain_id_str,
+        "updated_at": token_data.get("updated_at"),
+    }
+
+
+class SubstringIndex:
+    """
+    Case-insensitive exact, prefix and substring lookups over a set of keys.
+
+    Keys are kept sorted for prefix lookups (binary search), and every key is indexed by all
+    of its substrings of up to GRAM_SIZE characters. A substring query only verifies the keys
+    sharing all of its n-grams, instead of scanning every key.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, keys: Iterable[str]):
+        self._keys = sorted({key.lower() for key in keys if key})
+        self._grams: dict[str, set[str]] = {}
+        for key in self._keys:
+            for size in range(1, self.GRAM_SIZE + 1):
+                for start in range(len(key) - size + 1):
+                    self._grams.setdefault(key[start : start + size], set()).add(key)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def exact(self, query: str) -> Optional[str]:
+        query = query.lower()
+        position = bisect_left(self._keys, query)
+        if position < len(self._keys) and self._keys[position] == query:
+            return query
+        return None
+
+    def prefix(self, query: str) -> list[str]:
+        query = query.lower()
+        matches = []
+        for key in self._keys[bisect_left(self._keys, query) :]:
+            if not key.startswith(query):
+                break
+            matches.append(key)
+        return matches
+
+    def substring(self, query: str) -> set[str]:
+        query = query.lower()
+        if not query:
+            return set(self._keys)
+        if len(query) <= self.GRAM_SIZE:
+            return set(self._grams.get(query, ()))
+
+        postings = []
+        for start in range(len(query) - self.GRAM_SIZE + 1):
+            posting = self._grams.get(query[start : start + self.GRAM_SIZE])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return {key for key in postings[0].intersection(*postings[1:]) if query in key}
+
+
+class _CatalogSnapshot:
+    """Immutable set of indexes, swapped as a whole so readers never see a half-built catalog."""
+
+    def __init__(self, chains: dict, token_docs: list):
+        self.chains = chains
+        self.chain_id_by_name = {}
+        protocols = set()
+        for chain_id, chain_data in chains.items():
+            chain_name = str(chain_data.get("chain_name") or "").lower()
+            if chain_name:
+                self.chain_id_by_name.setdefault(chain_name, chain_id)
+            protocols.update(chain_data.get("protocols") or [])
+        self.protocols = SubstringIndex(protocols)
+
+        self.tokens = [
+            transform_enso_token(
+                token_data,
+                chains.get(str(token_data.get("chainId")), {}).get("chain_name"),
+            )
+            for token_data in token_docs
+        ]
+        self.tokens.sort(key=lambda token: token.get("apy") or 0, reverse=True)
+
+        # Indexes hold positions in self.tokens, so every list is already sorted by APY
+        self.by_chain: dict[str, list[int]] = {}
+        self.by_project: dict[str, list[int]] = {}
+        self.by_chain_project: dict[tuple[str, str], list[int]] = {}
+        self.by_symbol: dict[str, list[int]] = {}
+        # case-folded keys by position, to filter a candidate list without touching the token dicts
+        self.chain_keys = [token["chain_id"] for token in self.tokens]
+        self.project_keys = [(token["project"] or "").lower() for token in self.tokens]
+        self.symbol_keys = [(token["token"]["symbol"] or "").lower() for token in self.tokens]
+        for rank, token in enumerate(self.tokens):
+            chain_id, project = self.chain_keys[rank], self.project_keys[rank]
+            self.by_chain.setdefault(chain_id, []).append(rank)
+            self.by_project.setdefault(project, []).append(rank)
+            self.by_chain_project.setdefault((chain_id, project), []).append(rank)
+            self.by_symbol.setdefault(self.symbol_keys[rank], []).append(rank)
+        self.symbols = SubstringIndex(self.by_symbol)
+
+
+class EnsoCatalog:
+    """
+    In-process catalog of the Enso supported chains, protocols and tokens.
+
+    Both collections are read once per instance and indexed, so the Enso tools answer
+    chain, protocol and token lookups from memory instead of streaming Firestore and
+    resolving every chain name over HTTP on each call. Once the TTL expires the stale
+    catalog keeps being served while a background thread reloads it.
+
+    Returned dicts are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        load_chains: Callable[[], dict],
+        load_tokens: Callable[[], list],
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        self._load_chains = load_chains
+        self._load_tokens = load_tokens
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._refreshing = False
+        self._snapshot = _CatalogSnapshot({}, [])
+
+    def _build(self):
+        snapshot = _CatalogSnapshot(self._load_chains() or {}, self._load_tokens() or [])
+        with self._lock:
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+
+    def _refresh(self):
+        try:
+            self._build()
+        except Exception as e:
+            print(f"Error refreshing Enso catalog: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _ensure_loaded(self) -> _CatalogSnapshot:
+        if self._loaded_at is None:
+            # First access on this instance: load synchronously, concurrent callers wait for it
+            with self._load_lock:
+                if self._loaded_at is None:
+                    self._build()
+            return self._snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            is_stale = time.monotonic() - self._loaded_at >= self.ttl_seconds
+            if not is_stale or self._refreshing:
+                return snapshot
+            self._refreshing = True
+        threading.Thread(target=self._refresh, daemon=True).start()
+        return snapshot
+
+    def invalidate(self):
+        """Forces the next lookup to reload the catalog in the background."""
+        with self._lock:
+            if self._loaded_at is not None:
+                self._loaded_at -= self.ttl_seconds
+
+    def get_chains_and_protocols(self) -> dict:
+        """Returns {chain_id: {"chain_name": ..., "protocols": [...]}} for the supported chains."""
+        return self._ensure_loaded().chains
+
+    def get_chain_id(self, chain: str) -> Optional[str]:
+        """Returns the chain id for a supported chain id or chain name (case insensitive)."""
+        snapshot = self._ensure_loaded()
+        chain = str(chain)
+        if chain in snapshot.chains:
+            return chain
+        return snapshot.chain_id_by_name.get(chain.lower())
+
+    def find_protocols(self, query: str) -> list[str]:
+        """
+        Returns the supported protocol slugs matching the query (case insensitive):
+        an exact match first, then prefix matches, then the other slugs containing it.
+        """
+        protocols = self._ensure_loaded().protocols
+        exact = protocols.exact(query)
+        prefix = [slug for slug in protocols.prefix(query) if slug != exact]
+        seen = set(prefix) | {exact}
+        contains = sorted(protocols.substring(query) - seen)
+        return ([exact] if exact else []) + prefix + contains
+
+    def get_tokens(
+        self,
+        chain_id: Optional[str] = None,
+        project: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Returns the tokens matching the filters, sorted by APY (descending).
+        chain_id and project are exact matches, symbol is a case-insensitive substring match.
+        """
+        snapshot = self._ensure_loaded()
+        project = project.lower() if project else None
+        if chain_id and project:
+            ranks = snapshot.by_chain_project.get((str(chain_id), project), [])
+        elif chain_id:
+            ranks = snapshot.by_chain.get(str(chain_id), [])
+        elif project:
+            ranks = snapshot.by_project.get(project, [])
+        else:
+            ranks = None
+
+        if symbol:
+            symbols = snapshot.symbols.substring(symbol)
+            symbol_ranks = []
+            for key in symbols:
+                symbol_ranks.extend(snapshot.by_symbol[key])
+            if ranks is None or len(symbol_ranks) < len(ranks):
+                # positions are APY ranks, sorting the matched ints restores the APY order
+                symbol_ranks.sort()
+                ranks = [
+                    rank
+                    for rank in symbol_ranks
+                    if (not chain_id or snapshot.chain_keys[rank] == str(chain_id))
+                    and (not project or snapshot.project_keys[rank] == project)
+                ]
+            else:
+                ranks = [rank for rank in ranks if snapshot.symbol_keys[rank] in symbols]
+        elif ranks is None:
+            return list(snapshot.tokens)
+
+        return [snapshot.tokens[rank] for rank in ranks]
@@ -2,7 +2,7 @@ import firebase_admin
 from firebase_admin import firestore, credentials, auth
 from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud.firestore_v1 import SERVER_TIMESTAMP
-import requests
+from services.http_client import http_session
 import re, asyncio
 from typing import Optional, Any, Annotated
 from config import (
@@ -13,6 +13,11 @@ from config import (
     FIREBASE_API_KEY,
 )
 from datetime import datetime, timedelta, time, timezone
+from utils.message_stream import MessageStreamWriter
+from utils.enso_catalog import EnsoCatalog
+from utils.request_context import RequestContextStore
+from utils.message_sink import MessageSink
+from utils.pending_events import PendingEventsCache
 
 
 cred = credentials.Certificate(
@@ -34,7 +39,9 @@ if not firebase_admin.get_app():
 db = firestore.client()
 
 # scratchpad
-local_collection = {}
+request_contexts = RequestContextStore()
+# Agent thoughts and UI messages are written in the background with batched writes
+message_sink = MessageSink(db)
 
 
 def generate_firebase_id_token(user_id):
@@ -44,7 +51,7 @@ def generate_firebase_id_token(user_id):
     # 2. Exchange custom token for an ID token
     url = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithCustomToken?key={FIREBASE_API_KEY}"
 
-    response = requests.post(
+    response = http_session.post(
         url,
         headers={"Content-Type": "application/json"},
         json={
@@ -214,7 +221,7 @@ def db_save_message(
         "sender": sender,
         "userId": user_id,
         "messageType": message_type,
-        "createdAt": SERVER_TIMESTAMP,
+        "createdAt": message_sink.timestamp(),
         "updatedAt": SERVER_TIMESTAMP,
         "status": "pending",
         "isRead": False,
@@ -245,7 +252,7 @@ def save_ui_message(
             "sender": "ui",
             "userId": user_id,
             "renderData": renderData,
-            "createdAt": SERVER_TIMESTAMP,
+            "createdAt": message_sink.timestamp(),
             "updatedAt": SERVER_TIMESTAMP,
         }
         if metadata is not None:
@@ -262,9 +269,10 @@ def save_ui_message(
         messages_ref = chat_ref.collection("messages")
         # If it's an automated chat, update the chat_ref updatedAt field (needed on main.py when user sending a message)
         if chat_id in AUTOMATED_CHATS:
-            chat_ref.set({"updatedAt": SERVER_TIMESTAMP}, merge=True)
+            message_sink.set(chat_ref, {"updatedAt": SERVER_TIMESTAMP}, merge=True)
 
-        messages_ref.add(message_to_save)
+        # queued, written by the message sink in order with the other messages of the chat
+        message_sink.add(messages_ref, message_to_save)
     except Exception as e:
         raise e
 
@@ -301,7 +309,7 @@ async def update_message(chat_id: str, user_id: str, message_id: str, data: dict
             {
                 "chatId": chat_id,
                 "userId": user_id,
-                "createdAt": SERVER_TIMESTAMP,
+                "createdAt": message_sink.timestamp(),
                 "updatedAt": SERVER_TIMESTAMP,
                 **data,
             }
@@ -313,6 +321,28 @@ def create_message_doc_id(chat_id: str):
     return messages_ref.document().id
 
 
+def create_message_stream_writer(
+    chat_id: str, user_id: str, message_id: str, data: dict
+) -> MessageStreamWriter:
+    """
+    Returns a writer that coalesces streamed chunks for the given message doc,
+    so a streamed reply costs a handful of writes instead of a read + write per chunk.
+    """
+    message_doc_ref = (
+        db.collection("chats")
+        .document(chat_id)
+        .collection("messages")
+        .document(message_id)
+    )
+    return MessageStreamWriter(
+        doc_ref=message_doc_ref,
+        chat_id=chat_id,
+        user_id=user_id,
+        data=data,
+        created_at=message_sink.timestamp,
+    )
+
+
 # endregion
 
 
@@ -346,13 +376,14 @@ def get_top_traders_wallets():
 
 
 def set_context_id(key: str):
-    local_collection[key] = {"session_id": key}
+    """Starts a new request context for the chat."""
+    request_contexts.start(key)
     return key
 
 
 def get_context_id(parentKey: str) -> Optional[str]:
     """Safely get the current context ID."""
-    return local_collection.get(parentKey).get("session_id")
+    return request_contexts.get(parentKey, "session_id")
 
 
 def send_message(
@@ -374,7 +405,7 @@ def send_message(
             "messageType": "text",
             "status": "pending",
             "isRead": False,
-            "createdAt": SERVER_TIMESTAMP,
+            "createdAt": message_sink.timestamp(),
             "updatedAt": SERVER_TIMESTAMP,
         }
     )
@@ -382,18 +413,22 @@ def send_message(
 
 def set_request_ctx(parentKey: str, key: str, value: Any) -> Any:
     """Set a value in the request context."""
-    local_collection[parentKey] = {**local_collection[parentKey], key: value}
-    return value
+    return request_contexts.set(parentKey, key, value)
 
 
 def get_request_ctx(parentKey: str, key: str) -> Any:
     """Get a value from the request context."""
-    return local_collection.get(parentKey, {}).get(key, None)
+    return request_contexts.get(parentKey, key)
+
+
+def append_request_ctx(parentKey: str, key: str, value: Any) -> list:
+    """Append a value to a list in the request context."""
+    return request_contexts.append(parentKey, key, value)
 
 
 def remove_request_ctx(key: str) -> None:
-    """Remove a value from the request context."""
-    local_collection[key] = None
+    """Remove the request context, called when the request ends."""
+    request_contexts.end(key)
 
 
 def get_wallet_to_store_in_analytics(chat_id: str):
@@ -440,14 +475,20 @@ def save_agent_thought(chat_id: str, thought: str, isFinalThought: bool = False)
         "sender": "agent",
         "userId": user_id,
         "thought": thought,
-        "createdAt": SERVER_TIMESTAMP,
+        "createdAt": message_sink.timestamp(),
         "updatedAt": SERVER_TIMESTAMP,
         "messageType": "agent_thought",
         "metadata": {"isFinalThought": isFinalThought},
     }
 
     chat_ref = db.collection("chats").document(chat_id).collection("messages")
-    chat_ref.add(message_to_save)
+    # queued, the tool does not wait for Firestore
+    message_sink.add(chat_ref, message_to_save)
+
+
+def flush_chat_messages(timeout: float = 10.0) -> bool:
+    """Writes the queued thoughts and UI messages, called before the invocation returns."""
+    return message_sink.flush(timeout)
 
 
 def update_tx_status(transaction_id: str, status: str, signature: str):
@@ -579,34 +620,39 @@ def save_market_context(dataToSave: dict):
 
 
 # region to get events based on tweets
+def get_tweet_based_events_query():
+    """Events of the rumours_events collection that are pending, tweet based and not triggered yet"""
+    events_ref = db.collection("rumours_events")
+    return (
+        events_ref.where(filter=FieldFilter("tradeStatus", "==", "pending"))
+        .where(filter=FieldFilter("tweetBased", "==", True))
+        .where(filter=FieldFilter("executionTime", "==", None))
+    )
+
+
+# Loaded once per instance and refreshed by a snapshot listener while the instance is busy,
+# it can be stale so triggering an event re-checks it in Firestore
+pending_tweet_events = PendingEventsCache(get_tweet_based_events_query)
+
+
 def get_tweet_based_events_from_db():
     """
     Fetch all events from rumours_events collection where status is "pending" and tweetBased is true
+    Served from the instance's snapshot of the pending events, see PendingEventsCache
     """
     try:
-        # Query for events with status "pending" and tweetBased true
-        events_ref = db.collection("rumours_events")
-        query = (
-            events_ref.where(filter=FieldFilter("tradeStatus", "==", "pending"))
-            .where(filter=FieldFilter("tweetBased", "==", True))
-            .where(filter=FieldFilter("executionTime", "==", None))
-        )
-
-        # Execute the query
-        docs = query.stream()
-
-        events = []
-        for doc in docs:
-            event_data = doc.to_dict()
-            event_data["eventId"] = doc.id  # Add the document ID to the data
-            events.append(event_data)
-
-        return events
+        return pending_tweet_events.get()
 
     except Exception as e:
+        print(f"Error getting tweet based events: {e}")
         return []
 
 
+def invalidate_tweet_based_event(event_id: str):
+    """Removes a triggered event from the pending events snapshot"""
+    pending_tweet_events.invalidate(event_id)
+
+
 # endregion
 
 
@@ -692,55 +738,84 @@ async def save_polymarket_event_to_rumours_collection(
 # endregion
 
 
+def _load_enso_chains_and_protocols() -> dict:
+    """Reads the enso_supported_protocols collection and resolves the chain names."""
+    from services.chains import call_chains_service
+
+    # Use the new structure: enso_supported_protocols collection
+    enso_ref = db.collection("enso_supported_protocols")
+    docs = enso_ref.stream()
+
+    enhanced_data = {}
+
+    for doc in docs:
+        chain_id = doc.id  # Document ID is the chainId
+        data = doc.to_dict()
+
+        if data and "protocols" in data and isinstance(data["protocols"], list):
+            try:
+                # Get chain name using call_chains_service
+                chain_name = call_chains_service(
+                    method="getChainName", chainId=chain_id
+                )
+
+                enhanced_data[chain_id] = {
+                    "chain_name": chain_name,
+                    "protocols": data["protocols"],
+                }
+            except Exception as chain_error:
+                print(f"Error getting chain name for {chain_id}: {chain_error}")
+                # Fallback: use chain_id as name if service fails
+                enhanced_data[chain_id] = {
+                    "chain_name": chain_id,
+                    "protocols": data["protocols"],
+                }
+
+    return enhanced_data
+
+
+def _load_enso_supported_tokens() -> list:
+    """Reads the whole enso_supported_tokens collection, the catalog does the filtering."""
+    return [doc.to_dict() for doc in db.collection("enso_supported_tokens").stream()]
+
+
+enso_catalog = EnsoCatalog(
+    load_chains=_load_enso_chains_and_protocols,
+    load_tokens=_load_enso_supported_tokens,
+)
+
+
 def get_enso_supported_chains_and_protocols():
     """
-    Get the supported protocols for Enso from Firestore
+    Get the supported protocols for Enso, served from the in-process catalog
     Returns: dict with chainId as key and dict with chain_name and protocols as value
     Example: {"8453": {"chain_name": "Base", "protocols": ["aave-v3", "morpho-blue-vaults"]}}
     """
     try:
-        from services.chains import call_chains_service
-
-        # Use the new structure: enso_supported_protocols collection
-        enso_ref = db.collection("enso_supported_protocols")
-        docs = enso_ref.stream()
-
-        enhanced_data = {}
-
-        for doc in docs:
-            chain_id = doc.id  # Document ID is the chainId
-            data = doc.to_dict()
-
-            if data and "protocols" in data and isinstance(data["protocols"], list):
-                try:
-                    # Get chain name using call_chains_service
-                    chain_name = call_chains_service(
-                        method="getChainName", chainId=chain_id
-                    )
-
-                    enhanced_data[chain_id] = {
-                        "chain_name": chain_name,
-                        "protocols": data["protocols"],
-                    }
-                except Exception as chain_error:
-                    print(f"Error getting chain name for {chain_id}: {chain_error}")
-                    # Fallback: use chain_id as name if service fails
-                    enhanced_data[chain_id] = {
-                        "chain_name": chain_id,
-                        "protocols": data["protocols"],
-                    }
-
-        return enhanced_data
+        return enso_catalog.get_chains_and_protocols()
     except Exception as e:
         print(f"Error getting Enso supported protocols: {e}")
         return {}
 
 
+def find_enso_supported_protocols(protocol_slug: str):
+    """
+    Find the supported Enso protocols matching a slug (case-insensitive exact, prefix or substring match)
+    Returns: list of protocol slugs, exact match first
+    Example: "aave" -> ["aave-v2", "aave-v3"]
+    """
+    try:
+        return enso_catalog.find_protocols(protocol_slug)
+    except Exception as e:
+        print(f"Error finding Enso supported protocols: {e}")
+        return []
+
+
 def get_enso_supported_tokens(
     chain_id: str = None, project: str = None, symbol: str = None
 ):
     """
-    Get supported tokens from Enso Firestore database using optimized queries
+    Get supported tokens for Enso, served from the in-process catalog
 
     Args:
         chain_id (str, optional): Specific chain ID to query (e.g., "8453").
@@ -752,58 +827,7 @@ def get_enso_supported_tokens(
         Example: [{"apy": 12.35, "project": "morpho", "token": {...}, ...}, ...]
     """
     try:
-        # Build query with filters
-        tokens_ref = db.collection("enso_supported_tokens")
-        query = tokens_ref
-
-        # Apply filters
-        if chain_id:
-            query = query.where("chainId", "==", int(chain_id))
-        if project:
-            query = query.where("project", "==", project.lower())
-
-        # Execute query
-        docs = query.stream()
-        all_tokens = []
-        # Get supported protocols for chain names
-        supported_protocols = get_enso_supported_chains_and_protocols()
-
-        for doc in docs:
-            token_data = doc.to_dict()
-
-            # Apply symbol filter in Python (Firestore doesn't support case-insensitive queries)
-            if symbol and symbol.lower() not in token_data.get("symbol", "").lower():
-                continue
-
-            # Transform to expected format
-            chain_id_str = str(token_data.get("chainId"))
-            chain_data = supported_protocols.get(chain_id_str, {})
-
-            transformed_token = {
-                "apy": token_data.get("apy", 0),
-                "tvl": token_data.get("tvl", 0),
-                "underlyingTokens": token_data.get("underlyingTokens", []),
-                "project": token_data.get("project", ""),
-                "token": {
-                    "chainId": token_data.get("chainId"),
-                    "chain": token_data.get("chain", ""),
-                    "name": token_data.get("name", ""),
-                    "symbol": token_data.get("symbol", ""),
-                    "decimals": token_data.get("decimals", 18),
-                    "address": token_data.get("address", ""),
-                    "logo_uri": token_data.get("logoURI", ""),
-                },
-                "chain_id": chain_id_str,
-                "chain_name": chain_data.get("chain_name", chain_id_str),
-                "updated_at": token_data.get("updated_at"),
-            }
-
-            all_tokens.append(transformed_token)
-
-        # Sort by APY (descending)
-        all_tokens.sort(key=lambda x: x.get("apy", 0), reverse=True)
-
-        return all_tokens
+        return enso_catalog.get_tokens(chain_id=chain_id, project=project, symbol=symbol)
     except Exception as e:
         print(f"Error getting Enso supported tokens: {e}")
         return []
@@ -0,0 +1,70 @@
+import asyncio
+
+
+class IOMode:
+    """
+    Lets a tool keep a single body for its sync and its async version.
+
+    The body is written as a coroutine that does its I/O through an IOMode. SYNC_IO makes the
+    blocking calls inline, so the coroutine never suspends and `run_sync` runs it to the end
+    without an event loop. ASYNC_IO runs blocking calls in a worker thread, uses the async
+    variants of the services and runs `gather` concurrently.
+    """
+
+    def __init__(self, is_async: bool):
+        self.is_async = is_async
+
+    async def call(self, func, /, *args, **kwargs):
+        """A blocking call, made in a worker thread in async mode."""
+        if self.is_async:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    async def either(self, sync_func, async_func, /, *args, **kwargs):
+        """`sync_func(...)` in sync mode, `await async_func(...)` in async mode."""
+        if self.is_async:
+            return await async_func(*args, **kwargs)
+        return sync_func(*args, **kwargs)
+
+    def start(self, coro):
+        """Starts the coroutine in the background in async mode, in sync mode it runs when awaited."""
+        if self.is_async:
+            return asyncio.ensure_future(coro)
+        return coro
+
+    def discard(self, pending):
+        """Drops what `start` returned if it wasn't awaited, a no-op once it has been."""
+        if self.is_async:
+            pending.cancel()
+        else:
+            pending.close()
+
+    async def gather(self, *coros, return_exceptions: bool = False) -> list:
+        """asyncio.gather in async mode, the coroutines one after the other in sync mode."""
+        if self.is_async:
+            return list(await asyncio.gather(*coros, return_exceptions=return_exceptions))
+        results = []
+        for i, coro in enumerate(coros):
+            try:
+                results.append(await coro)
+            except Exception as e:
+                if not return_exceptions:
+                    for pending in coros[i + 1:]:
+                        pending.close()
+                    raise
+                results.append(e)
+        return results
+
+
+SYNC_IO = IOMode(is_async=False)
+ASYNC_IO = IOMode(is_async=True)
+
+
+def run_sync(coro):
+    """Runs a coroutine written against SYNC_IO, which completes without suspending."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("run_sync got a coroutine that awaits the event loop, use SYNC_IO")
@@ -0,0 +1,93 @@
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+# Firestore batches accept at most 500 writes
+MAX_BATCH_WRITES = 500
+DEFAULT_FLUSH_TIMEOUT = 10.0
+
+
+class MessageSink:
+    """
+    Non-blocking sink for the chat messages written by tools (agent thoughts, UI messages).
+
+    - `add` / `set` only queue the write and return, tools never wait on Firestore.
+    - A single background thread commits the queue in order with batched writes, so the
+      messages of a chat are written in the order they were queued. Whatever was queued while
+      a commit was in flight goes out together in the next batch.
+    - `flush` blocks until everything queued before the call is committed, it is called
+      before the invocation returns.
+    - `timestamp` hands out strictly increasing client timestamps: the writes of a batch share
+      one server commit time, so `createdAt` comes from here to keep the order in the chat.
+      Every message the functions write to a chat, queued here or written directly, takes
+      its `createdAt` from this clock. The user messages the app writes still get theirs
+      from Firestore's server clock.
+
+    Commit errors are logged and the batch is dropped, like a failed `add()` in a tool.
+    """
+
+    def __init__(self, db, max_batch_writes: int = MAX_BATCH_WRITES):
+        self.db = db
+        self.max_batch_writes = max_batch_writes
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._queued = 0
+        self._committed = 0
+        self._thread = None
+        self._last_timestamp = datetime.min.replace(tzinfo=timezone.utc)
+        self.batches = 0
+
+    def timestamp(self) -> datetime:
+        with self._condition:
+            now = datetime.now(timezone.utc)
+            if now <= self._last_timestamp:
+                now = self._last_timestamp + timedelta(microseconds=1)
+            self._last_timestamp = now
+            return now
+
+    def add(self, collection_ref, data: dict):
+        """Queues the equivalent of `collection_ref.add(data)`, the document id is generated locally."""
+        doc_ref = collection_ref.document()
+        self.set(doc_ref, data)
+        return doc_ref
+
+    def set(self, doc_ref, data: dict, merge: bool = False):
+        with self._condition:
+            self._queue.append((doc_ref, data, merge))
+            self._queued += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="message-sink", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue)
+                writes = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self.max_batch_writes))
+                ]
+            try:
+                batch = self.db.batch()
+                for doc_ref, data, merge in writes:
+                    batch.set(doc_ref, data, merge=merge)
+                batch.commit()
+                self.batches += 1
+            except Exception as e:
+                print(f"Error writing {len(writes)} chat messages: {e}")
+            with self._condition:
+                self._committed += len(writes)
+                self._condition.notify_all()
+
+    def pending(self) -> int:
+        with self._condition:
+            return self._queued - self._committed
+
+    def flush(self, timeout: float = DEFAULT_FLUSH_TIMEOUT) -> bool:
+        """Waits for the writes queued so far, returns False if they did not complete in time."""
+        with self._condition:
+            target = self._queued
+            return self._condition.wait_for(lambda: self._committed >= target, timeout)
@@ -0,0 +1,88 @@
+import time
+from typing import Any, Callable, Optional
+from google.cloud.firestore_v1 import SERVER_TIMESTAMP
+
+# Default coalescing window for streamed chunks
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.15
+DEFAULT_MAX_BUFFERED_CHARS = 400
+
+
+class MessageStreamWriter:
+    """
+    Accumulates streamed content for a single message doc in memory and writes it to
+    Firestore in coalesced windows, instead of a get() + update() round trip per chunk.
+
+    The buffer is flushed when `flush_interval` seconds have passed since the last write
+    or when `max_buffered_chars` new characters are pending, whichever comes first.
+    Every flush writes the full accumulated content with a single set/update, so no read
+    is ever needed. Call `close()` once the final `Response` arrives to write the tail.
+    `created_at` gives the `createdAt` of the doc on its first write, it should be the clock
+    the other messages of the chat use.
+    """
+
+    def __init__(
+        self,
+        doc_ref,
+        chat_id: str,
+        user_id: str,
+        data: Optional[dict] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_buffered_chars: int = DEFAULT_MAX_BUFFERED_CHARS,
+        clock: Callable[[], float] = time.monotonic,
+        created_at: Callable[[], Any] = lambda: SERVER_TIMESTAMP,
+    ):
+        self.doc_ref = doc_ref
+        self.chat_id = chat_id
+        self.user_id = user_id
+        self.data = data or {}
+        self.flush_interval = flush_interval
+        self.max_buffered_chars = max_buffered_chars
+        self.clock = clock
+        self.created_at = created_at
+
+        self.content = ""
+        self.pending_chars = 0
+        self.writes = 0
+        self.created = False
+        self.closed = False
+        self.last_flush_at = clock()
+
+    async def write(self, content: str) -> None:
+        """Append a streamed chunk and flush if the current window is full."""
+        if self.closed or not content:
+            return
+        self.content += content
+        self.pending_chars += len(content)
+
+        window_elapsed = self.clock() - self.last_flush_at >= self.flush_interval
+        if window_elapsed or self.pending_chars >= self.max_buffered_chars:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the accumulated content to the message doc if anything is pending."""
+        if self.pending_chars == 0:
+            return
+        if not self.created:
+            self.doc_ref.set(
+                {
+                    "chatId": self.chat_id,
+                    "userId": self.user_id,
+                    "createdAt": self.created_at(),
+                    "updatedAt": SERVER_TIMESTAMP,
+                    **self.data,
+                    "content": self.content,
+                }
+            )
+            self.created = True
+        else:
+            self.doc_ref.update({"content": self.content, "updatedAt": SERVER_TIMESTAMP})
+        self.writes += 1
+        self.pending_chars = 0
+        self.last_flush_at = self.clock()
+
+    async def close(self) -> None:
+        """Flush whatever is left in the buffer. Safe to call more than once."""
+        if self.closed:
+            return
+        await self.flush()
+        self.closed = True
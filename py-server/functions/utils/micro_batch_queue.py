@@ -0,0 +1,188 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+
+DEFAULT_LEASE_SECONDS = 120.0
+# Leaves time to finish the last batch before a 540s function timeout
+DEFAULT_DRAIN_DEADLINE_SECONDS = 480.0
+# Drains that try an item before it is dropped
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def queue_item(data: dict) -> dict:
+    """Document stored for a queued item, for callers that write it with their own writer."""
+    return {"data": data, "queuedAt": datetime.now(timezone.utc)}
+
+
+class MicroBatchQueue:
+    """
+    Firestore-backed queue that turns a burst of triggers into a few batched runs.
+
+    Every invocation `enqueue`s its item and then calls `drain`. Only the invocation that gets
+    the drain lease waits `window_seconds` for more items to arrive and then processes the queue
+    in batches of `batch_size`, oldest first. The others return right away, their items are
+    picked up by the lease holder.
+
+    - The lease is a document created with `create()`, which fails when it already exists,
+      so only one drainer runs at a time. A lease older than `lease_seconds` (a drainer that
+      crashed) can be taken over.
+    - The lease is renewed before each batch and released at the end, both with a
+      last_update_time precondition and only while it still names this drainer as its owner.
+      A drainer whose lease expired and was taken over stops without touching the new lease.
+    - Items are deleted once their batch was processed. `process` may return the positions of
+      the items it could not process, and a batch that raises fails as a whole. Failed items
+      stay queued for the next drain, which retries them first, and are dropped after
+      `max_attempts` drains.
+    - A drain reads the queue forward from its last batch, so it never retries an item it saw.
+      After releasing the lease it checks once more for items past that point, so an item
+      enqueued while the drainer was finishing is not left behind.
+    - No batch is started after `deadline_seconds`, the items left stay queued for the drainer
+      of the next trigger.
+    """
+
+    def __init__(
+        self,
+        db,
+        collection: str,
+        lease_path: str,
+        window_seconds: float,
+        batch_size: int,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        self.db = db
+        self.collection = collection
+        self.lease_path = lease_path
+        self.window_seconds = window_seconds
+        self.batch_size = max(batch_size, 1)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(max_attempts, 1)
+
+    def _queue_ref(self):
+        return self.db.collection(self.collection)
+
+    def _lease_ref(self):
+        collection, document = self.lease_path.split("/")
+        return self.db.collection(collection).document(document)
+
+    def _lease_data(self, owner: str) -> dict:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.lease_seconds)
+        return {"owner": owner, "expiresAt": expires_at}
+
+    def enqueue(self, item_id: str, data: dict):
+        self._queue_ref().document(item_id).set(queue_item(data))
+
+    def try_acquire(self, owner: str) -> bool:
+        lease_ref = self._lease_ref()
+        try:
+            lease_ref.create(self._lease_data(owner))
+            return True
+        except Exception:
+            pass
+        # Held by another drainer, unless that one crashed and its lease expired
+        snapshot = lease_ref.get()
+        expires_at = (snapshot.to_dict() or {}).get("expiresAt") if snapshot.exists else None
+        if expires_at and expires_at > datetime.now(timezone.utc):
+            return False
+        try:
+            if snapshot.exists:
+                lease_ref.delete(
+                    option=self.db.write_option(last_update_time=snapshot.update_time)
+                )
+            lease_ref.create(self._lease_data(owner))
+            return True
+        except Exception:
+            return False
+
+    def _held_lease(self, owner: str):
+        """Snapshot of the lease if `owner` still holds it, None if it was taken over."""
+        snapshot = self._lease_ref().get()
+        if snapshot.exists and (snapshot.to_dict() or {}).get("owner") == owner:
+            return snapshot
+        return None
+
+    def renew(self, owner: str) -> bool:
+        snapshot = self._held_lease(owner)
+        if snapshot is None:
+            return False
+        try:
+            self._lease_ref().update(
+                self._lease_data(owner),
+                option=self.db.write_option(last_update_time=snapshot.update_time),
+            )
+            return True
+        except Exception:
+            return False
+
+    def release(self, owner: str):
+        snapshot = self._held_lease(owner)
+        if snapshot is None:
+            return
+        try:
+            self._lease_ref().delete(
+                option=self.db.write_option(last_update_time=snapshot.update_time)
+            )
+        except Exception:
+            # Taken over since it was read, the new holder's lease stays
+            pass
+
+    def next_batch(self, after=None) -> list:
+        """The oldest items, only those queued after the `after` snapshot when it is given."""
+        query = self._queue_ref().order_by("queuedAt")
+        if after is not None:
+            query = query.start_after(after)
+        return list(query.limit(self.batch_size).stream())
+
+    def _complete(self, docs: list, failed: Iterable[int]):
+        """Deletes the processed items, failed ones are kept with one more attempt."""
+        failed = set(failed)
+        batch = self.db.batch()
+        for position, doc in enumerate(docs):
+            attempts = (doc.to_dict() or {}).get("attempts", 0) + 1
+            if position not in failed:
+                batch.delete(doc.reference)
+            elif attempts >= self.max_attempts:
+                print(f"Dropping queued item {doc.id} after {attempts} failed attempts")
+                batch.delete(doc.reference)
+            else:
+                batch.set(doc.reference, {"attempts": attempts}, merge=True)
+        batch.commit()
+
+    def drain(
+        self,
+        process: Callable[[list[dict]], Optional[Iterable[int]]],
+        deadline_seconds: float = DEFAULT_DRAIN_DEADLINE_SECONDS,
+    ) -> int:
+        """
+        Processes the queue if this invocation gets the lease, until it is empty or
+        `deadline_seconds` have passed. Returns the number of items processed (0 when another
+        invocation is draining), failed items included.
+        """
+        deadline = time.monotonic() + deadline_seconds
+        owner = uuid.uuid4().hex
+        processed = 0
+        after = None
+        while time.monotonic() < deadline and self.try_acquire(owner):
+            try:
+                time.sleep(self.window_seconds)
+                while time.monotonic() < deadline:
+                    if not self.renew(owner):
+                        print("Lost the queue drain lease, leaving the queue to its new holder")
+                        return processed
+                    docs = self.next_batch(after)
+                    if not docs:
+                        break
+                    try:
+                        failed = process([doc.to_dict()["data"] for doc in docs]) or []
+                    except Exception as e:
+                        print(f"Error processing a batch of {len(docs)} queued items: {e}")
+                        failed = range(len(docs))
+                    self._complete(docs, failed)
+                    after = docs[-1]
+                    processed += len(docs)
+            finally:
+                self.release(owner)
+            if not self.next_batch(after):
+                break
+        return processed
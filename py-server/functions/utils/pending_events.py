@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import Callable, Optional
+
+# Full reload when the cache has not been refreshed for this long, the listener misses
+# changes while the instance is idle
+DEFAULT_MAX_AGE_SECONDS = 300.0
+# Cache lifetime when no snapshot listener is running
+DEFAULT_TTL_SECONDS = 30.0
+
+
+class PendingEventsCache:
+    """
+    In-memory snapshot of the documents matched by a query, kept per instance.
+
+    - The first `get` loads the query and attaches a snapshot listener to it, after that reads
+      are served from memory.
+    - Cloud Functions throttle the CPU between invocations, so the listener only catches up
+      while the instance is handling a request and its stream can stall and reconnect. It saves
+      reloads on a busy instance, it does not keep the snapshot current: an event can still be
+      served up to `max_age_seconds` after it was triggered elsewhere. Callers that act on an
+      event must check it again when they write, as updateExecutionTimeForEvent does.
+    - Without a listener (it failed to start, or `use_listener=False`) the snapshot is reloaded
+      once it is older than `ttl_seconds`. With one, it is reloaded after `max_age_seconds`
+      without updates.
+    - `invalidate` drops an event from this instance's snapshot right away and keeps it out
+      until the query stops returning it, other instances only see it on their next update.
+    """
+
+    def __init__(
+        self,
+        query_factory: Callable,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        use_listener: bool = True,
+    ):
+        self.query_factory = query_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.use_listener = use_listener
+        self._lock = threading.Lock()
+        self._listener_lock = threading.Lock()
+        self._events: Optional[dict[str, dict]] = None
+        self._invalidated: set[str] = set()
+        self._loaded_at = 0.0
+        self._watch = None
+        self.loads = 0
+
+    @staticmethod
+    def _to_event(doc) -> dict:
+        event = doc.to_dict()
+        event["eventId"] = doc.id  # Add the document ID to the data
+        return event
+
+    def _replace(self, docs):
+        events = {doc.id: self._to_event(doc) for doc in docs}
+        with self._lock:
+            # Invalidated events stay hidden until the query no longer returns them
+            self._invalidated &= set(events)
+            for event_id in self._invalidated:
+                events.pop(event_id, None)
+            self._events = events
+            self._loaded_at = time.monotonic()
+
+    def _on_snapshot(self, docs, changes, read_time):
+        self._replace(docs)
+
+    def _start_listener(self):
+        with self._listener_lock:
+            if not self.use_listener or self._watch is not None:
+                return
+            try:
+                self._watch = self.query_factory().on_snapshot(self._on_snapshot)
+            except Exception as e:
+                print(
+                    f"Error listening to pending events, using a {self.ttl_seconds}s cache: {e}"
+                )
+                self.use_listener = False
+
+    def _is_fresh(self) -> bool:
+        if self._events is None:
+            return False
+        max_age = self.max_age_seconds if self._watch is not None else self.ttl_seconds
+        return time.monotonic() - self._loaded_at < max_age
+
+    def reload(self):
+        """Runs the query and replaces the snapshot with its result."""
+        self._replace(self.query_factory().stream())
+        self.loads += 1
+
+    def get(self) -> list[dict]:
+        """Current pending events, querying Firestore only on a cold or expired cache."""
+        with self._lock:
+            fresh = self._is_fresh()
+        if not fresh:
+            self.reload()
+        if self.use_listener and self._watch is None:
+            self._start_listener()
+        with self._lock:
+            return [dict(event) for event in (self._events or {}).values()]
+
+    def invalidate(self, event_id: str):
+        with self._lock:
+            self._invalidated.add(event_id)
+            if self._events is not None:
+                self._events.pop(event_id, None)
+
+    def close(self):
+        if self._watch is not None:
+            self._watch.unsubscribe()
+            self._watch = None
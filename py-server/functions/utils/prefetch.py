@@ -0,0 +1,80 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+# Shared by every request of the instance, each request only runs a handful of stages
+MAX_PREFETCH_WORKERS = 16
+
+_executor = ThreadPoolExecutor(
+    max_workers=MAX_PREFETCH_WORKERS, thread_name_prefix="prefetch"
+)
+
+
+class Prefetcher:
+    """
+    Runs the independent reads of a request concurrently and records how long each stage took.
+
+    Stages are started by name as soon as their inputs are known and awaited by name where
+    their result is needed, from sync code (`result`) or from the event loop (`wait`).
+    The futures are not bound to an event loop, so a prefetcher can be started by the sync
+    Cloud Function handler and handed over to the async bot.
+    """
+
+    def __init__(self):
+        self._futures: dict[str, Future] = {}
+        self.timings: dict[str, float] = {}
+        self._started_at = time.perf_counter()
+
+    def _timed(self, name: str, fn, args, kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def start(self, name: str, fn, *args, **kwargs) -> Future:
+        """Starts a blocking fetch in the background, does nothing if the stage was already started."""
+        future = self._futures.get(name)
+        if future is None:
+            future = _executor.submit(self._timed, name, fn, args, kwargs)
+            self._futures[name] = future
+        return future
+
+    def restart(self, name: str, fn, *args, **kwargs) -> Future:
+        """Replaces a stage started with inputs that turned out to be wrong."""
+        previous = self._futures.pop(name, None)
+        if previous is not None:
+            previous.cancel()
+        return self.start(name, fn, *args, **kwargs)
+
+    def is_started(self, name: str) -> bool:
+        return name in self._futures
+
+    def result(self, name: str):
+        return self._futures[name].result()
+
+    async def wait(self, name: str):
+        return await asyncio.wrap_future(self._futures[name])
+
+    @contextmanager
+    def stage(self, name: str):
+        """Records the duration of a stage that runs inline (e.g. on the event loop)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._started_at) * 1000, 1)
+
+    def span_attributes(self, prefix: str = "prefetch") -> dict:
+        attributes = {f"{prefix}.{name}_ms": ms for name, ms in self.timings.items()}
+        attributes[f"{prefix}.total_ms"] = self.elapsed_ms()
+        return attributes
+
+    def cancel(self):
+        """Drops the stages that did not start yet, e.g. when the request ends early."""
+        for future in self._futures.values():
+            future.cancel()
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Optional
+
+# A few KB per context, far more than the concurrent requests of an instance
+DEFAULT_MAX_CONTEXTS = 1024
+DEFAULT_CONTEXT_TTL = 60 * 60
+
+
+class RequestContextStore:
+    """
+    Per-request key/value context (user id, wallet addresses, ...) keyed by chat id.
+
+    - The context of the running request lives in a ContextVar, so it is task-local: every
+      `asyncio.run` invocation gets its own and it goes away when the invocation ends.
+    - Sync tools run by autogen in a thread pool do not inherit the ContextVar, so contexts
+      are also kept in a map bounded by size (LRU) and age (TTL, refreshed on every access).
+    - Values are updated in place, every operation is O(1).
+    """
+
+    def __init__(
+        self,
+        max_contexts: int = DEFAULT_MAX_CONTEXTS,
+        ttl_seconds: float = DEFAULT_CONTEXT_TTL,
+    ):
+        self.max_contexts = max_contexts
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._contexts: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._current: ContextVar[Optional[tuple[str, dict]]] = ContextVar(
+            "request_context", default=None
+        )
+
+    def _store(self, key: str, context: dict):
+        now = time.monotonic()
+        with self._lock:
+            self._contexts[key] = (now + self.ttl_seconds, context)
+            self._contexts.move_to_end(key)
+            # the least recently used contexts are first, drop them while expired or over the limit
+            while self._contexts:
+                expires_at, _ = next(iter(self._contexts.values()))
+                if len(self._contexts) <= self.max_contexts and expires_at > now:
+                    break
+                self._contexts.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        current = self._current.get()
+        if current is not None and current[0] == key:
+            return current[1]
+        now = time.monotonic()
+        with self._lock:
+            entry = self._contexts.get(key)
+            if entry is None:
+                return None
+            expires_at, context = entry
+            if expires_at <= now:
+                del self._contexts[key]
+                return None
+            self._contexts[key] = (now + self.ttl_seconds, context)
+            self._contexts.move_to_end(key)
+            return context
+
+    def start(self, key: str) -> dict:
+        """Starts a fresh context for `key` and makes it the current one."""
+        context = {"session_id": key}
+        self._current.set((key, context))
+        self._store(key, context)
+        return context
+
+    def set(self, key: str, field: str, value: Any) -> Any:
+        context = self._lookup(key)
+        if context is None:
+            context = self.start(key)
+        context[field] = value
+        return value
+
+    def get(self, key: str, field: str) -> Any:
+        context = self._lookup(key)
+        return context.get(field) if context is not None else None
+
+    def append(self, key: str, field: str, value: Any) -> list:
+        """Appends to the list in `field` in place, concurrent tool calls never lose an item."""
+        context = self._lookup(key)
+        if context is None:
+            context = self.start(key)
+        with self._lock:
+            items = context.setdefault(field, [])
+            items.append(value)
+            return items
+
+    def end(self, key: str):
+        """Drops the context of `key`, unless a newer request already replaced it."""
+        current = self._current.get()
+        own = current[1] if current is not None and current[0] == key else None
+        with self._lock:
+            entry = self._contexts.get(key)
+            if entry is not None and (own is None or entry[1] is own):
+                del self._contexts[key]
+        if own is not None:
+            self._current.set(None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._contexts)